@@ -7,16 +7,25 @@ fetching new bars from Alpaca, and storing them in S3.
 
 Now includes bad data marker support: symbols flagged by validation script
 are automatically re-fetched with full history to get adjusted prices.
+
+Full refreshes run as a three-phase pipeline (plan -> fetch -> store):
+symbols sharing a fetch range are requested from Alpaca together in
+multi-symbol bar requests, S3 reads/merges/writes run on a bounded thread
+pool, and API calls are paced by a shared token bucket instead of a fixed
+sleep. Per-phase wall times are logged and returned with the results.
 """
 
 from __future__ import annotations
 
 import time
-from datetime import UTC, datetime, timedelta
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from bad_data_marker_service import BadDataMarkerService
+from rate_limiter import TokenBucket
 from symbol_extractor import get_all_configured_symbols
 
 from the_alchemiser.shared.brokers.alpaca_manager import AlpacaManager
@@ -40,8 +49,31 @@ DEFAULT_INITIAL_LOOKBACK_DAYS = 7300
 MIN_BARS_REQUIRED = 252
 
 # Rate limiting: Alpaca allows 200 requests/minute for free tier
-# We'll be conservative with 100 requests/minute = 0.6s between requests
-API_RATE_LIMIT_DELAY = 0.6  # seconds between API calls
+# We'll be conservative with 100 requests/minute on average, allowing
+# short bursts so concurrent workers are not serialized needlessly
+API_REQUESTS_PER_MINUTE = 100
+API_BURST_SIZE = 5
+
+# Symbols per multi-symbol bar request (one request, paginated by the SDK)
+MULTI_SYMBOL_BATCH_SIZE = 50
+
+# Bars per page of an Alpaca bars response; each page is a separate API call
+ALPACA_BARS_PAGE_LIMIT = 10_000
+
+# Worker threads for fetch-range planning, API fetches, and S3 read/merge/write
+REFRESH_MAX_WORKERS = 8
+
+
+def _empty_refresh_metadata() -> dict[str, Any]:
+    """Return the per-symbol refresh metadata for a symbol with no new bars."""
+    return {
+        "new_bars": 0,
+        "bar_dates": [],
+        "adjusted": False,
+        "adjusted_dates": [],
+        "adjustment_count": 0,
+        "max_pct_change": 0.0,
+    }
 
 
 class DataRefreshService:
@@ -54,6 +86,7 @@ class DataRefreshService:
         market_data_store: S3 store for reading/writing data
         alpaca_manager: Alpaca client for fetching data
         market_data_service: Service wrapper for Alpaca data calls
+        rate_limiter: Token bucket shared by every Alpaca call this service makes
 
     """
 
@@ -87,6 +120,7 @@ class DataRefreshService:
             )
         self.alpaca_manager = alpaca_manager
         self.market_data_service = MarketDataService(alpaca_manager)
+        self.rate_limiter = TokenBucket(API_REQUESTS_PER_MINUTE / 60.0, API_BURST_SIZE)
 
         logger.info("DataRefreshService initialized")
 
@@ -174,6 +208,7 @@ class DataRefreshService:
             RuntimeError: If fetch fails after retries
 
         """
+        self.rate_limiter.acquire()
         bars_list = self.market_data_service.get_historical_bars(
             symbol=symbol,
             start_date=start_date,
@@ -190,6 +225,80 @@ class DataRefreshService:
             )
             return pd.DataFrame()
 
+        df = self._bars_to_frame(bars_list)
+
+        logger.debug(
+            "Fetched bars from Alpaca",
+            symbol=symbol,
+            rows=len(df),
+        )
+
+        return df
+
+    def _fetch_bars_batch_from_alpaca(
+        self,
+        symbols: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> dict[str, pd.DataFrame]:
+        """Fetch historical bars for several symbols in one Alpaca request.
+
+        Symbols missing from the multi-symbol response are retried one at a
+        time, so a symbol only ends up empty when the single-symbol path
+        (with its missing-data retries) also returns nothing.
+
+        Args:
+            symbols: Ticker symbols sharing the same date range
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            Dict mapping each symbol to its OHLCV DataFrame (possibly empty)
+
+        Raises:
+            RuntimeError: If the batch request fails after retries
+
+        """
+        # Long-history batches span several SDK pages, each one an API call
+        calendar_days = (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days + 1
+        expected_bars = len(symbols) * max(1, calendar_days * 5 // 7)
+        self.rate_limiter.acquire(max(1, -(-expected_bars // ALPACA_BARS_PAGE_LIMIT)))
+        bars_by_symbol = self.market_data_service.get_historical_bars_multi(
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            timeframe="1Day",
+        )
+
+        frames: dict[str, pd.DataFrame] = {}
+        for symbol in symbols:
+            bars_list = bars_by_symbol.get(symbol)
+            if bars_list:
+                frames[symbol] = self._bars_to_frame(bars_list)
+            else:
+                frames[symbol] = self._fetch_bars_from_alpaca(symbol, start_date, end_date)
+
+        logger.debug(
+            "Fetched bar batch from Alpaca",
+            symbol_count=len(symbols),
+            rows=sum(len(df) for df in frames.values()),
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        return frames
+
+    @staticmethod
+    def _bars_to_frame(bars_list: list[dict[str, Any]]) -> pd.DataFrame:
+        """Convert Alpaca bar dictionaries to an OHLCV DataFrame.
+
+        Args:
+            bars_list: Bar dictionaries from MarketDataService
+
+        Returns:
+            DataFrame with timestamp/open/high/low/close/volume columns
+
+        """
         # Convert to DataFrame
         df = pd.DataFrame(bars_list)
 
@@ -207,15 +316,56 @@ class DataRefreshService:
         # Keep only standard OHLCV columns
         required_cols = ["timestamp", "open", "high", "low", "close", "volume"]
         available_cols = [c for c in required_cols if c in df.columns]
-        df = df[available_cols]
+        return df[available_cols]
 
-        logger.debug(
-            "Fetched bars from Alpaca",
-            symbol=symbol,
-            rows=len(df),
-        )
+    def _store_new_bars(self, symbol: str, new_bars: pd.DataFrame) -> tuple[bool, dict[str, Any]]:
+        """Append fetched bars to S3 and build the refresh metadata.
 
-        return df
+        Args:
+            symbol: Ticker symbol
+            new_bars: Bars fetched from Alpaca (non-empty)
+
+        Returns:
+            Tuple of (success, metadata) as described in refresh_symbol
+
+        """
+        metadata = _empty_refresh_metadata()
+
+        # Append to existing data
+        success, adjustment_info = self.market_data_store.append_bars(symbol, new_bars)
+
+        # Only populate bar/adjustment metadata if write succeeded
+        # (avoid misleading users about data that wasn't actually persisted)
+        if success:
+            metadata["new_bars"] = len(new_bars)
+
+            # Extract bar dates if we have data
+            if not new_bars.empty and "timestamp" in new_bars.columns:
+                # Convert timestamps to dates, get unique values, and sort them
+                bar_dates = pd.to_datetime(new_bars["timestamp"]).dt.strftime("%Y-%m-%d").unique()
+                metadata["bar_dates"] = sorted(bar_dates.tolist())
+
+        if success and adjustment_info and adjustment_info.adjustment_count > 0:
+            metadata["adjusted"] = True
+            metadata["adjusted_dates"] = adjustment_info.adjusted_dates
+            metadata["adjustment_count"] = adjustment_info.adjustment_count
+            metadata["max_pct_change"] = adjustment_info.max_pct_change
+
+        if success:
+            logger.info(
+                "Successfully refreshed symbol",
+                symbol=symbol,
+                new_bars=len(new_bars),
+                adjusted=metadata["adjusted"],
+                adjustment_count=metadata["adjustment_count"],
+            )
+        else:
+            logger.error(
+                "Failed to store bars",
+                symbol=symbol,
+            )
+
+        return success, metadata
 
     def refresh_symbol(self, symbol: str) -> tuple[bool, dict[str, Any]]:
         """Refresh data for a single symbol.
@@ -233,22 +383,13 @@ class DataRefreshService:
             - 'max_pct_change': maximum percentage change detected
 
         """
-        metadata: dict[str, Any] = {
-            "new_bars": 0,
-            "bar_dates": [],
-            "adjusted": False,
-            "adjusted_dates": [],
-            "adjustment_count": 0,
-            "max_pct_change": 0.0,
-        }
-
         try:
             # Calculate what needs to be fetched
             fetch_range = self._calculate_fetch_range(symbol)
 
             if fetch_range is None:
                 # No update needed
-                return True, metadata
+                return True, _empty_refresh_metadata()
 
             start_date, end_date = fetch_range
 
@@ -262,45 +403,9 @@ class DataRefreshService:
                     start_date=start_date,
                     end_date=end_date,
                 )
-                return True, metadata  # Not an error, just no data
-
-            # Append to existing data
-            success, adjustment_info = self.market_data_store.append_bars(symbol, new_bars)
-
-            # Only populate bar/adjustment metadata if write succeeded
-            # (avoid misleading users about data that wasn't actually persisted)
-            if success:
-                metadata["new_bars"] = len(new_bars)
-
-                # Extract bar dates if we have data
-                if not new_bars.empty and "timestamp" in new_bars.columns:
-                    # Convert timestamps to dates, get unique values, and sort them
-                    bar_dates = (
-                        pd.to_datetime(new_bars["timestamp"]).dt.strftime("%Y-%m-%d").unique()
-                    )
-                    metadata["bar_dates"] = sorted(bar_dates.tolist())
-
-            if success and adjustment_info and adjustment_info.adjustment_count > 0:
-                metadata["adjusted"] = True
-                metadata["adjusted_dates"] = adjustment_info.adjusted_dates
-                metadata["adjustment_count"] = adjustment_info.adjustment_count
-                metadata["max_pct_change"] = adjustment_info.max_pct_change
-
-            if success:
-                logger.info(
-                    "Successfully refreshed symbol",
-                    symbol=symbol,
-                    new_bars=len(new_bars),
-                    adjusted=metadata["adjusted"],
-                    adjustment_count=metadata["adjustment_count"],
-                )
-            else:
-                logger.error(
-                    "Failed to store bars",
-                    symbol=symbol,
-                )
+                return True, _empty_refresh_metadata()  # Not an error, just no data
 
-            return success, metadata
+            return self._store_new_bars(symbol, new_bars)
 
         except Exception as e:
             logger.error(
@@ -309,24 +414,56 @@ class DataRefreshService:
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            return False, metadata
+            return False, _empty_refresh_metadata()
 
-    def refresh_all_symbols(self) -> dict[str, Any]:
+    def refresh_all_symbols(self, *, batched: bool = True) -> dict[str, Any]:
         """Refresh data for all configured symbols.
 
+        The batched pipeline runs in three phases, each timed:
+
+        1. plan: compute every symbol's fetch range (S3 metadata reads) on
+           the thread pool, then group symbols by identical range.
+        2. fetch: one multi-symbol Alpaca request per group of up to
+           MULTI_SYMBOL_BATCH_SIZE symbols, issued concurrently under the
+           shared rate limiter.
+        3. store: read/merge/write each symbol's parquet on the thread pool.
+
+        Args:
+            batched: Use the batched pipeline; False falls back to refreshing
+                symbols one at a time via refresh_symbol
+
         Returns:
             Dict with keys:
             - 'results': Dict mapping symbol to success status
             - 'adjustments': Dict mapping symbol to adjustment metadata
             - 'symbols_adjusted': List of symbols with detected adjustments
             - 'all_metadata': Dict mapping symbol to full metadata (including bar counts/dates)
+            - 'phase_timings': Wall-clock seconds per phase (plan, fetch,
+              store, total) and seconds spent waiting on the rate limiter
 
         """
-        symbols = self._get_symbols_to_refresh()
+        symbols = sorted(self._get_symbols_to_refresh())
 
         logger.info(
             "Starting full data refresh",
             symbol_count=len(symbols),
+            batched=batched,
+        )
+
+        started = time.perf_counter()
+        wait_before = self.rate_limiter.total_wait_seconds
+
+        # One manifest write for the whole refresh instead of one per symbol
+        with self.market_data_store.batched_manifest_updates():
+            if batched:
+                outcomes, phase_timings = self._refresh_symbols_batched(symbols)
+            else:
+                outcomes = {symbol: self.refresh_symbol(symbol) for symbol in symbols}
+                phase_timings = {}
+
+        phase_timings["total"] = round(time.perf_counter() - started, 3)
+        phase_timings["rate_limit_wait"] = round(
+            self.rate_limiter.total_wait_seconds - wait_before, 3
         )
 
         results: dict[str, bool] = {}
@@ -334,8 +471,8 @@ class DataRefreshService:
         symbols_adjusted: list[str] = []
         all_metadata: dict[str, dict[str, Any]] = {}
 
-        for i, symbol in enumerate(sorted(symbols)):
-            success, metadata = self.refresh_symbol(symbol)
+        for symbol in symbols:
+            success, metadata = outcomes[symbol]
             results[symbol] = success
             all_metadata[symbol] = metadata
 
@@ -344,10 +481,6 @@ class DataRefreshService:
                 adjustments[symbol] = metadata
                 symbols_adjusted.append(symbol)
 
-            # Rate limiting: pause between API calls (skip after last symbol)
-            if i < len(symbols) - 1:
-                time.sleep(API_RATE_LIMIT_DELAY)
-
         # Summary logging
         success_count = sum(results.values())
         failure_count = len(results) - success_count
@@ -360,6 +493,7 @@ class DataRefreshService:
             adjusted_count=len(symbols_adjusted),
             failed_symbols=[s for s, ok in results.items() if not ok],
             adjusted_symbols=symbols_adjusted,
+            phase_timings=phase_timings,
         )
 
         return {
@@ -367,8 +501,148 @@ class DataRefreshService:
             "adjustments": adjustments,
             "symbols_adjusted": symbols_adjusted,
             "all_metadata": all_metadata,
+            "phase_timings": phase_timings,
         }
 
+    def _refresh_symbols_batched(
+        self, symbols: list[str]
+    ) -> tuple[dict[str, tuple[bool, dict[str, Any]]], dict[str, float]]:
+        """Run the plan/fetch/store pipeline over symbols.
+
+        Failures are isolated per symbol (plan, store) or per batch (fetch):
+        affected symbols are reported as failed and the rest continue.
+
+        Args:
+            symbols: Ticker symbols to refresh
+
+        Returns:
+            Tuple of (outcomes, phase_timings) where outcomes maps each symbol
+            to (success, metadata) as returned by refresh_symbol
+
+        """
+        outcomes: dict[str, tuple[bool, dict[str, Any]]] = {}
+        timings: dict[str, float] = {}
+
+        # boto3 clients are thread-safe but their lazy creation is not
+        _ = self.market_data_store.s3_client
+
+        with ThreadPoolExecutor(max_workers=REFRESH_MAX_WORKERS) as pool:
+            # Phase 1: plan fetch ranges and group symbols sharing a range
+            phase_start = time.perf_counter()
+            groups: defaultdict[tuple[str, str], list[str]] = defaultdict(list)
+            plans = zip(symbols, pool.map(self._plan_fetch, symbols), strict=True)
+            for symbol, (ok, fetch_range) in plans:
+                if not ok:
+                    outcomes[symbol] = (False, _empty_refresh_metadata())
+                elif fetch_range is None:
+                    outcomes[symbol] = (True, _empty_refresh_metadata())
+                else:
+                    groups[fetch_range].append(symbol)
+            timings["plan"] = round(time.perf_counter() - phase_start, 3)
+
+            # Phase 2: multi-symbol fetches, rate limited across workers
+            phase_start = time.perf_counter()
+            batches = [
+                (group[i : i + MULTI_SYMBOL_BATCH_SIZE], start_date, end_date)
+                for (start_date, end_date), group in sorted(groups.items())
+                for i in range(0, len(group), MULTI_SYMBOL_BATCH_SIZE)
+            ]
+            fetched: dict[str, pd.DataFrame] = {}
+            for frames in pool.map(lambda batch: self._fetch_batch(*batch), batches):
+                fetched.update(frames)
+            timings["fetch"] = round(time.perf_counter() - phase_start, 3)
+
+            for batch_symbols, start_date, end_date in batches:
+                for symbol in batch_symbols:
+                    bars = fetched.get(symbol)
+                    if bars is None:
+                        outcomes[symbol] = (False, _empty_refresh_metadata())
+                    elif bars.empty:
+                        logger.warning(
+                            "No new bars available",
+                            symbol=symbol,
+                            start_date=start_date,
+                            end_date=end_date,
+                        )
+                        outcomes[symbol] = (True, _empty_refresh_metadata())
+
+            # Phase 3: S3 read/merge/write per symbol
+            phase_start = time.perf_counter()
+            to_store = [(symbol, bars) for symbol, bars in fetched.items() if not bars.empty]
+            stored = pool.map(lambda item: self._store_bars_safely(*item), to_store)
+            for (symbol, _bars), outcome in zip(to_store, stored, strict=True):
+                outcomes[symbol] = outcome
+            timings["store"] = round(time.perf_counter() - phase_start, 3)
+
+        logger.info(
+            "Batched refresh phases complete",
+            symbols=len(symbols),
+            fetch_groups=len(groups),
+            fetch_requests=len(batches),
+            symbols_with_new_bars=len(to_store),
+            **timings,
+        )
+
+        return outcomes, timings
+
+    def _plan_fetch(self, symbol: str) -> tuple[bool, tuple[str, str] | None]:
+        """Compute a symbol's fetch range without raising.
+
+        Returns:
+            Tuple of (ok, fetch_range); ok is False when metadata lookup failed
+
+        """
+        try:
+            return True, self._calculate_fetch_range(symbol)
+        except Exception as e:
+            logger.error(
+                "Error refreshing symbol",
+                symbol=symbol,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return False, None
+
+    def _fetch_batch(
+        self, symbols: list[str], start_date: str, end_date: str
+    ) -> dict[str, pd.DataFrame]:
+        """Fetch one batch without raising; failed batches return no frames.
+
+        Returns:
+            Dict mapping symbol to fetched bars (empty dict on failure)
+
+        """
+        try:
+            return self._fetch_bars_batch_from_alpaca(symbols, start_date, end_date)
+        except Exception as e:
+            logger.error(
+                "Error fetching bar batch",
+                symbols=symbols,
+                start_date=start_date,
+                end_date=end_date,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return {}
+
+    def _store_bars_safely(self, symbol: str, bars: pd.DataFrame) -> tuple[bool, dict[str, Any]]:
+        """Store bars for one symbol without raising.
+
+        Returns:
+            Tuple of (success, metadata) as described in refresh_symbol
+
+        """
+        try:
+            return self._store_new_bars(symbol, bars)
+        except Exception as e:
+            logger.error(
+                "Error refreshing symbol",
+                symbol=symbol,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return False, _empty_refresh_metadata()
+
     def process_bad_data_markers(
         self,
         lookback_days: int = DEFAULT_INITIAL_LOOKBACK_DAYS,
@@ -430,6 +704,7 @@ class DataRefreshService:
             - 'adjustments': Dict mapping symbol to adjustment metadata
             - 'symbols_adjusted': List of symbols with detected adjustments
             - 'all_metadata': Dict mapping symbol to full metadata (including bar counts/dates)
+            - 'phase_timings': Per-phase wall-clock seconds of the incremental refresh
 
         """
         results_dict: dict[str, bool] = {}
@@ -474,6 +749,7 @@ class DataRefreshService:
             "adjustments": adjustments_dict,
             "symbols_adjusted": symbols_adjusted_list,
             "all_metadata": all_metadata_dict,
+            "phase_timings": refresh_data.get("phase_timings", {}),
         }
 
     def seed_initial_data(
@@ -505,43 +781,30 @@ class DataRefreshService:
 
         results: dict[str, bool] = {}
         sorted_symbols = sorted(symbols)
-
-        for i, symbol in enumerate(sorted_symbols):
-            try:
-                # Fetch from Alpaca
-                bars = self._fetch_bars_from_alpaca(symbol, start_date, end_date)
-
-                if bars.empty:
-                    logger.warning(
-                        "No data available for symbol",
-                        symbol=symbol,
-                    )
-                    results[symbol] = False
-                    continue
-
-                # Write to S3
-                success = self.market_data_store.write_symbol_data(symbol, bars)
-                results[symbol] = success
-
-                if success:
-                    logger.info(
-                        "Seeded symbol",
-                        symbol=symbol,
-                        bars=len(bars),
-                        progress=f"{i + 1}/{len(sorted_symbols)}",
-                    )
-
-            except Exception as e:
-                logger.error(
-                    "Error seeding symbol",
-                    symbol=symbol,
-                    error=str(e),
+        batches = [
+            sorted_symbols[i : i + MULTI_SYMBOL_BATCH_SIZE]
+            for i in range(0, len(sorted_symbols), MULTI_SYMBOL_BATCH_SIZE)
+        ]
+
+        # boto3 clients are thread-safe but their lazy creation is not
+        _ = self.market_data_store.s3_client
+
+        with (
+            self.market_data_store.batched_manifest_updates(),
+            ThreadPoolExecutor(max_workers=REFRESH_MAX_WORKERS) as pool,
+        ):
+            # Every symbol shares the same range, so fetch in multi-symbol
+            # batches and write each batch while the next one downloads
+            fetches = pool.map(
+                lambda batch: self._fetch_batch(batch, start_date, end_date), batches
+            )
+            for batch, frames in zip(batches, fetches, strict=True):
+                writes = pool.map(self._seed_symbol, batch, [frames.get(s) for s in batch])
+                results.update(zip(batch, writes, strict=True))
+                logger.info(
+                    "Seeded batch",
+                    progress=f"{len(results)}/{len(sorted_symbols)}",
                 )
-                results[symbol] = False
-
-            # Rate limiting: pause between API calls (skip after last symbol)
-            if i < len(sorted_symbols) - 1:
-                time.sleep(API_RATE_LIMIT_DELAY)
 
         # Summary
         success_count = sum(results.values())
@@ -553,3 +816,43 @@ class DataRefreshService:
         )
 
         return results
+
+    def _seed_symbol(self, symbol: str, bars: pd.DataFrame | None) -> bool:
+        """Write a symbol's full history to S3 without raising.
+
+        Args:
+            symbol: Ticker symbol
+            bars: Fetched bars, or None if the symbol's batch failed
+
+        Returns:
+            True if the data was written
+
+        """
+        if bars is None:
+            return False
+
+        if bars.empty:
+            logger.warning(
+                "No data available for symbol",
+                symbol=symbol,
+            )
+            return False
+
+        try:
+            # Write to S3
+            success = self.market_data_store.write_symbol_data(symbol, bars)
+        except Exception as e:
+            logger.error(
+                "Error seeding symbol",
+                symbol=symbol,
+                error=str(e),
+            )
+            return False
+
+        if success:
+            logger.info(
+                "Seeded symbol",
+                symbol=symbol,
+                bars=len(bars),
+            )
+        return success
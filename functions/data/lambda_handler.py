@@ -310,6 +310,7 @@ def _handle_scheduled_refresh(event: dict[str, Any]) -> dict[str, Any]:
         adjustments_dict: dict[str, dict[str, Any]] = {}
         symbols_adjusted_list: list[str] = []
         all_metadata_dict: dict[str, dict[str, Any]] = {}
+        phase_timings: dict[str, float] = {}
 
         if full_seed:
             # Full seed: download complete historical data for all symbols
@@ -360,6 +361,7 @@ def _handle_scheduled_refresh(event: dict[str, Any]) -> dict[str, Any]:
             adjustments_dict = refresh_data["adjustments"]
             symbols_adjusted_list = refresh_data["symbols_adjusted"]
             all_metadata_dict = refresh_data.get("all_metadata", {})
+            phase_timings = refresh_data.get("phase_timings", {})
 
         # Calculate statistics
         total = len(results_dict)
@@ -411,6 +413,7 @@ def _handle_scheduled_refresh(event: dict[str, Any]) -> dict[str, Any]:
                 "adjusted_count": len(symbols_adjusted_list),
                 "adjusted_symbols": symbols_adjusted_list,
                 "duration_seconds": duration,
+                "phase_timings": phase_timings,
             },
         )
 
@@ -482,6 +485,7 @@ def _handle_scheduled_refresh(event: dict[str, Any]) -> dict[str, Any]:
             "correlation_id": correlation_id,
             "total_symbols": total,
             "refreshed": success_count,
+            "phase_timings": phase_timings,
         }
 
         if failed_count > 0:
@@ -0,0 +1,89 @@
+"""Business Unit: data | Status: current.
+
+Token-bucket rate limiter for Alpaca data API calls.
+
+Replaces a fixed sleep between requests: callers may burst up to the bucket
+capacity, after which requests are admitted at the steady refill rate.
+Thread-safe, so concurrent fetch workers share one budget.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Attributes:
+        rate_per_second: Tokens added per second (steady-state request rate)
+        capacity: Maximum tokens held (burst size)
+
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate_per_second: Refill rate in tokens per second (must be positive)
+            capacity: Burst size in tokens (must be at least 1)
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+
+        Raises:
+            ValueError: If rate_per_second or capacity is not positive
+
+        """
+        if rate_per_second <= 0:
+            raise ValueError(f"rate_per_second must be positive, got {rate_per_second}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.total_wait_seconds = 0.0
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens (possibly going negative) and return the wait owed."""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self.rate_per_second
+            self.total_wait_seconds += wait
+            return wait
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until the requested tokens are available.
+
+        Reservations are made under the lock and waited out after releasing
+        it, so concurrent callers queue fairly without holding each other up.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            Seconds spent waiting
+
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
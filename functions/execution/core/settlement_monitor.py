@@ -6,10 +6,11 @@ This module provides event-driven settlement monitoring that tracks sell order c
 and buying power release to coordinate sell-first, buy-second execution workflows.
 
 Key Features:
-- Async settlement monitoring with configurable polling intervals
+- Orders are awaited concurrently on the shared order-update dispatcher, so
+  settlement is seen at TradingStream push latency; REST polling happens only
+  while the stream is stale
 - Event emission for order settlement completion
 - Buying power calculation and release tracking
-- Integration with existing AlpacaManager polling infrastructure
 - Proper correlation ID tracking for execution workflow coordination
 """
 
@@ -38,6 +39,7 @@ from the_alchemiser.shared.services.buying_power_service import BuyingPowerServi
 
 if TYPE_CHECKING:
     from the_alchemiser.shared.brokers.alpaca_manager import AlpacaManager
+    from the_alchemiser.shared.services.order_update_dispatcher import OrderUpdate
 
 logger = get_logger(__name__)
 
@@ -60,7 +62,8 @@ class SettlementMonitor:
         Args:
             alpaca_manager: Alpaca broker manager for order status checking
             event_bus: Event bus for emitting settlement events (optional)
-            polling_interval_seconds: How often to check order status (must be positive)
+            polling_interval_seconds: How often to poll order status while the
+                TradingStream is stale (must be positive)
             max_wait_seconds: Maximum time to wait for settlement (must be positive)
 
         Raises:
@@ -129,12 +132,15 @@ class SettlementMonitor:
         start_time = datetime.now(UTC)
 
         try:
-            # Monitor each sell order for completion
-            for order_id in sell_order_ids:
-                settlement_result = await self._monitor_single_order_settlement(
-                    order_id, correlation_id
+            # Monitor all sell orders concurrently
+            results = await asyncio.gather(
+                *(
+                    self._monitor_single_order_settlement(order_id, correlation_id)
+                    for order_id in sell_order_ids
                 )
+            )
 
+            for order_id, settlement_result in zip(sell_order_ids, results, strict=True):
                 if settlement_result:
                     settled_orders.append(order_id)
                     settlement_details[order_id] = settlement_result
@@ -270,6 +276,27 @@ class SettlementMonitor:
 
         return is_available, actual_buying_power
 
+    async def _wait_for_terminal_update(self, order_id: str) -> OrderUpdate | None:
+        """Wait up to max_wait_seconds for an order to reach a terminal state.
+
+        Args:
+            order_id: Order ID to wait for
+
+        Returns:
+            The terminal order update, or None on timeout
+
+        """
+        dispatcher = await asyncio.to_thread(self.alpaca_manager.get_order_update_dispatcher)
+        update = await dispatcher.wait_for_terminal(
+            order_id,
+            self.max_wait_seconds,
+            poll=self.alpaca_manager.get_order_update,
+            poll_interval_seconds=self.polling_interval,
+        )
+        if update is None or not update.is_terminal:
+            return None
+        return update
+
     async def _monitor_single_order_settlement(
         self, order_id: str, correlation_id: str
     ) -> SettlementDetails | None:
@@ -283,62 +310,49 @@ class SettlementMonitor:
             Settlement details if order completed, None if timed out
 
         """
-        start_time = datetime.now(UTC)
-
-        while (datetime.now(UTC) - start_time).total_seconds() < self.max_wait_seconds:
-            try:
-                # Check order status using existing AlpacaManager method
-                order_status = self.alpaca_manager._check_order_completion_status(order_id)
-
-                if order_status in ["FILLED", "CANCELED", "REJECTED", "EXPIRED"]:
-                    # Order reached final state, get full order details
-                    order_details = await self._get_order_settlement_details(order_id)
-
-                    if order_details and order_status == "FILLED" and self.event_bus:
-                        settlement_event = OrderSettlementCompleted(
-                            correlation_id=correlation_id,
-                            causation_id=correlation_id,
-                            event_id=self._generate_event_id(),
-                            timestamp=datetime.now(UTC),
-                            source_module=MODULE_NAME,
-                            order_id=order_id,
-                            symbol=order_details.symbol,
-                            side=order_details.side,
-                            settled_quantity=order_details.settled_quantity,
-                            settlement_price=order_details.settlement_price,
-                            settled_value=order_details.settled_value,
-                            buying_power_released=(
-                                order_details.settled_value
-                                if order_details.side == "SELL"
-                                else Decimal("0")
-                            ),
-                            original_correlation_id=correlation_id,
-                        )
-                        self.event_bus.publish(settlement_event)
+        update = await self._wait_for_terminal_update(order_id)
+        if update is None:
+            logger.warning(
+                "⏰ Settlement monitoring timeout",
+                order_id=order_id,
+                correlation_id=correlation_id,
+                module=MODULE_NAME,
+            )
+            return None
 
-                    return order_details
+        # Order reached final state, get full order details
+        order_details = await self._get_order_settlement_details(order_id)
 
-                # Wait before next check
-                await asyncio.sleep(self.polling_interval)
+        if order_details and update.status == "filled" and self.event_bus:
+            settlement_event = OrderSettlementCompleted(
+                correlation_id=correlation_id,
+                causation_id=correlation_id,
+                event_id=self._generate_event_id(),
+                timestamp=datetime.now(UTC),
+                source_module=MODULE_NAME,
+                order_id=order_id,
+                symbol=order_details.symbol,
+                side=order_details.side,
+                settled_quantity=order_details.settled_quantity,
+                settlement_price=order_details.settlement_price,
+                settled_value=order_details.settled_value,
+                buying_power_released=(
+                    order_details.settled_value if order_details.side == "SELL" else Decimal("0")
+                ),
+                original_correlation_id=correlation_id,
+            )
+            self.event_bus.publish(settlement_event)
 
-            except (DataProviderError, TradingClientError) as e:
-                logger.warning(
-                    "Error checking order status, retrying",
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    order_id=order_id,
-                    correlation_id=correlation_id,
-                    module=MODULE_NAME,
-                )
-                await asyncio.sleep(self.polling_interval)
+        return order_details
 
-        logger.warning(
-            "⏰ Settlement monitoring timeout",
-            order_id=order_id,
-            correlation_id=correlation_id,
-            module=MODULE_NAME,
-        )
-        return None
+    async def _settled_sell_value(self, order_id: str) -> Decimal:
+        """Wait for an order to settle and return the buying power it released."""
+        if await self._wait_for_terminal_update(order_id) is None:
+            return Decimal("0")
+        settlement_details = await self._get_order_settlement_details(order_id)
+        if settlement_details and settlement_details.side == "SELL":
+            return settlement_details.settled_value
+        return Decimal("0")
 
     async def _get_order_settlement_details(self, order_id: str) -> SettlementDetails | None:
         """Get detailed settlement information for a completed order.
@@ -418,34 +432,30 @@ class SettlementMonitor:
             module=MODULE_NAME,
         )
 
-        start_time = datetime.now(UTC)
         accumulated_buying_power = Decimal("0")
-        seen_orders: set[str] = set()  # Track processed orders to avoid double-counting
-
-        while (datetime.now(UTC) - start_time).total_seconds() < self.max_wait_seconds:
-            for order_id in sell_order_ids:
-                # Skip if already counted
-                if order_id in seen_orders:
-                    continue
-
-                settlement_details = await self._get_order_settlement_details(order_id)
-
-                if settlement_details and settlement_details.side == "SELL":
-                    settled_value = settlement_details.settled_value
-                    accumulated_buying_power += settled_value
-                    seen_orders.add(order_id)  # Mark as processed
-
-            if accumulated_buying_power >= target_buying_power:
-                logger.info(
-                    "✅ Buying power threshold reached",
-                    accumulated_buying_power=str(accumulated_buying_power),
-                    target_buying_power=str(target_buying_power),
-                    correlation_id=correlation_id,
-                    module=MODULE_NAME,
-                )
-                return True
+        pending = {
+            asyncio.create_task(self._settled_sell_value(order_id)) for order_id in sell_order_ids
+        }
 
-            await asyncio.sleep(self.polling_interval)
+        try:
+            # Count each order once, as soon as it settles
+            while accumulated_buying_power < target_buying_power and pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    accumulated_buying_power += task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if accumulated_buying_power >= target_buying_power:
+            logger.info(
+                "✅ Buying power threshold reached",
+                accumulated_buying_power=str(accumulated_buying_power),
+                target_buying_power=str(target_buying_power),
+                correlation_id=correlation_id,
+                module=MODULE_NAME,
+            )
+            return True
 
         logger.warning(
             "⏰ Buying power threshold timeout",
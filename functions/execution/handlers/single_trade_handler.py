@@ -57,6 +57,10 @@ from the_alchemiser.shared.schemas.trade_message import TradeMessage
 from the_alchemiser.shared.services.execution_run_service import (
     ExecutionRunService,
 )
+from the_alchemiser.shared.services.sqs_batch_enqueue import (
+    TradeQueueEntry,
+    enqueue_trade_messages,
+)
 
 if TYPE_CHECKING:
     from core.executor import Executor
@@ -639,30 +643,30 @@ class SingleTradeHandler:
                 )
                 return
 
-            enqueued_trade_ids = []
-            for trade in buy_trades:
-                try:
-                    sqs_client.send_message(
-                        QueueUrl=queue_url,
-                        MessageBody=trade["message_body"],
-                        MessageDeduplicationId=trade["trade_id"],  # Exactly-once per trade
-                        MessageGroupId=trade["symbol"],  # Parallel execution across symbols
-                        MessageAttributes={
-                            "RunId": {"DataType": "String", "StringValue": run_id},
-                            "TradeId": {"DataType": "String", "StringValue": trade["trade_id"]},
-                            "Phase": {"DataType": "String", "StringValue": "BUY"},
-                        },
-                    )
-                    enqueued_trade_ids.append(trade["trade_id"])
-                except Exception as e:
-                    self.logger.error(
-                        f"Failed to enqueue BUY trade {trade['trade_id']}: {e}",
-                        extra={
-                            "run_id": run_id,
-                            "trade_id": trade["trade_id"],
-                            "error": str(e),
-                        },
+            result = enqueue_trade_messages(
+                sqs_client,
+                queue_url,
+                [
+                    TradeQueueEntry(
+                        trade_id=trade["trade_id"],
+                        message_body=trade["message_body"],
+                        group_id=trade["symbol"],
+                        run_id=run_id,
+                        phase="BUY",
                     )
+                    for trade in buy_trades
+                ],
+            )
+            enqueued_trade_ids = result.enqueued
+            for trade_id, error in result.failed.items():
+                self.logger.error(
+                    f"Failed to enqueue BUY trade {trade_id}: {error}",
+                    extra={
+                        "run_id": run_id,
+                        "trade_id": trade_id,
+                        "error": error,
+                    },
+                )
 
             # Mark enqueued trades as PENDING
             if enqueued_trade_ids:
@@ -675,6 +679,7 @@ class SingleTradeHandler:
                     "correlation_id": correlation_id,
                     "buy_enqueued": len(enqueued_trade_ids),
                     "buy_total": buy_total,
+                    "api_calls": result.api_calls,
                 },
             )
 
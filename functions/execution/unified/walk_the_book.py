@@ -6,7 +6,8 @@ Implements a clear, testable strategy for placing limit orders that progressivel
 move toward market price before finally using a market order.
 
 Key features:
-- Uses WebSocket for real-time order status updates (with polling fallback)
+- Waits on the shared order-update dispatcher: fills arrive at stream push
+  latency, with REST polling only while the TradingStream is stale
 - Properly tracks partial fills across steps
 - Only orders remaining quantity when moving to next step
 """
@@ -25,6 +26,9 @@ from the_alchemiser.shared.logging import get_logger
 if TYPE_CHECKING:
     from the_alchemiser.shared.brokers.alpaca_manager import AlpacaManager
     from the_alchemiser.shared.schemas.execution_report import ExecutedOrder
+    from the_alchemiser.shared.services.order_update_dispatcher import (
+        OrderUpdateDispatcher,
+    )
 
     from .order_intent import OrderIntent
     from .quote_service import QuoteResult
@@ -42,6 +46,8 @@ MINIMUM_VALID_PRICE = Decimal("0.01")
 
 # Terminal states for orders
 TERMINAL_ORDER_STATUSES = {"FILLED", "CANCELED", "CANCELLED", "REJECTED", "EXPIRED"}
+# Terminal states that confirm a cancellation request took effect
+CANCELLATION_TERMINAL_STATUSES = {"CANCELED", "CANCELLED", "EXPIRED", "REJECTED"}
 
 
 class OrderTerminalStateResult(TypedDict):
@@ -157,6 +163,7 @@ class WalkTheBookStrategy:
         step_wait_seconds: float = DEFAULT_STEP_WAIT_SECONDS,
         market_order_wait_seconds: float = DEFAULT_MARKET_ORDER_WAIT_SECONDS,
         price_steps: list[float] | None = None,
+        order_updates: OrderUpdateDispatcher | None = None,
     ) -> None:
         """Initialize walk-the-book strategy.
 
@@ -165,9 +172,12 @@ class WalkTheBookStrategy:
             step_wait_seconds: How long to wait at each price step (default: 10s)
             market_order_wait_seconds: How long to wait for market order fill (default: 30s)
             price_steps: Custom price progression steps (default: [0.50, 0.75, 0.95])
+            order_updates: Order-update dispatcher (default: the alpaca_manager's,
+                resolved on first wait)
 
         """
         self.alpaca_manager = alpaca_manager
+        self._order_updates = order_updates
         self.step_wait_seconds = step_wait_seconds
         self.market_order_wait_seconds = market_order_wait_seconds
         self.price_steps = price_steps or PRICE_STEPS
@@ -760,6 +770,17 @@ class WalkTheBookStrategy:
                 status=None,
             )
 
+    async def _get_order_updates(self) -> OrderUpdateDispatcher:
+        """Order-update dispatcher (starts the account's TradingStream on first use).
+
+        Starting the stream blocks, so the first lookup runs in a worker thread.
+        """
+        if self._order_updates is None:
+            self._order_updates = await asyncio.to_thread(
+                self.alpaca_manager.get_order_update_dispatcher
+            )
+        return self._order_updates
+
     async def _wait_for_order_terminal_state(
         self,
         order_id: str,
@@ -767,11 +788,12 @@ class WalkTheBookStrategy:
         *,
         correlation_id: str | None = None,
     ) -> OrderTerminalStateResult:
-        """Wait for an order to reach a terminal state using WebSocket + polling fallback.
+        """Wait for an order to reach a terminal state via the order-update dispatcher.
 
-        This is the CORRECT way to wait for fills - uses the existing WebSocket
-        infrastructure that properly handles partial fills and waits for complete
-        terminal state (FILLED, CANCELED, REJECTED, EXPIRED).
+        Returns as soon as the TradingStream pushes a terminal update (FILLED,
+        CANCELED, REJECTED, EXPIRED); partial fills keep waiting. REST polling
+        only happens while the stream is stale. If the order is still open at
+        the deadline, one REST status check supplies the final snapshot.
 
         Args:
             order_id: Order ID to monitor
@@ -787,27 +809,30 @@ class WalkTheBookStrategy:
 
         """
         logger.debug(
-            "Waiting for order to reach terminal state via WebSocket",
+            "Waiting for order to reach terminal state via order updates",
             order_id=order_id,
             max_wait_seconds=max_wait_seconds,
             correlation_id=correlation_id,
         )
 
         try:
-            # Use WebSocket-based waiting with polling fallback
-            ws_result = await asyncio.to_thread(
-                self.alpaca_manager.wait_for_order_completion,
-                [order_id],
-                int(max_wait_seconds),
+            update = await (await self._get_order_updates()).wait_for_terminal(
+                order_id,
+                max_wait_seconds,
+                poll=self.alpaca_manager.get_order_update,
             )
 
-            # Check if our order completed
-            order_completed = order_id in ws_result.completed_order_ids
-
-            # Fetch final order state
-            final_status = await self._check_order_status(order_id)
+            if update is not None and update.is_terminal and update.status is not None:
+                final_status = OrderStatusResult(
+                    filled_quantity=update.filled_qty,
+                    avg_fill_price=update.filled_avg_price,
+                    status=update.status.upper(),
+                )
+            else:
+                # Still open at the deadline: take an authoritative snapshot
+                final_status = await self._check_order_status(order_id)
 
-            is_terminal = order_completed or final_status["status"] in TERMINAL_ORDER_STATUSES
+            is_terminal = final_status["status"] in TERMINAL_ORDER_STATUSES
 
             logger.info(
                 "Order terminal state check complete",
@@ -815,7 +840,7 @@ class WalkTheBookStrategy:
                 is_terminal=is_terminal,
                 status=final_status["status"],
                 filled_quantity=str(final_status["filled_quantity"]),
-                ws_status=ws_result.status.value if ws_result.status else None,
+                update_event=update.event if update else None,
                 correlation_id=correlation_id,
             )
 
@@ -901,46 +926,33 @@ class WalkTheBookStrategy:
         try:
             await asyncio.to_thread(self.alpaca_manager.cancel_order, order_id)
 
-            # Wait for cancellation confirmation with exponential backoff
-            timeout = DEFAULT_CANCELLATION_TIMEOUT_SECONDS
-            check_interval = 0.1  # Start with 100ms
-            max_interval = 1.0  # Cap at 1 second
-            elapsed = 0.0
-
-            while elapsed < timeout:
-                try:
-                    result = self.alpaca_manager.get_order_execution_result(order_id)
-                    status = result.status if result else None
-                    if status and status.upper() in [
-                        "CANCELED",
-                        "CANCELLED",
-                        "EXPIRED",
-                        "REJECTED",
-                    ]:
-                        logger.debug(
-                            "Order cancellation confirmed",
-                            order_id=order_id,
-                            correlation_id=correlation_id,
-                        )
-                        return True
-                except Exception as e:
-                    # Order might be in transition, continue waiting
+            # The cancel (or a racing fill) arrives as a terminal order update
+            update = await (await self._get_order_updates()).wait_for_terminal(
+                order_id,
+                DEFAULT_CANCELLATION_TIMEOUT_SECONDS,
+                poll=self.alpaca_manager.get_order_update,
+            )
+            if update is not None and update.is_terminal:
+                status = (update.status or update.event).upper()
+                if status in CANCELLATION_TERMINAL_STATUSES:
                     logger.debug(
-                        "Error checking order status during cancellation, will retry",
+                        "Order cancellation confirmed",
                         order_id=order_id,
-                        error=str(e),
                         correlation_id=correlation_id,
                     )
-
-                await asyncio.sleep(check_interval)
-                elapsed += check_interval
-                # Exponential backoff: double interval up to max
-                check_interval = min(check_interval * 2, max_interval)
+                    return True
+                logger.info(
+                    "Order reached terminal state before cancellation",
+                    order_id=order_id,
+                    status=status,
+                    correlation_id=correlation_id,
+                )
+                return False
 
             logger.warning(
                 "Order cancellation not confirmed within timeout",
                 order_id=order_id,
-                timeout=timeout,
+                timeout=DEFAULT_CANCELLATION_TIMEOUT_SECONDS,
                 correlation_id=correlation_id,
             )
             return False
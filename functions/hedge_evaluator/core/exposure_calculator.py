@@ -4,25 +4,33 @@ Portfolio exposure calculator for hedge sizing.
 
 Calculates beta-adjusted portfolio exposure metrics used
 to determine appropriate hedge sizing.
+
+Rolling beta and correlation read daily closes from the S3 parquet
+MarketDataStore (the datalake the strategy workers use), fetching from
+Alpaca only the symbols the store does not hold, and compute every
+statistic in one vectorized pass (see options.exposure_stats).
 """
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+import numpy as np
+import pandas as pd
+
 from the_alchemiser.shared.logging import get_logger
 from the_alchemiser.shared.options.constants import HEDGE_ETFS
-from the_alchemiser.shared.options.utils import (
-    calculate_rolling_beta,
-    calculate_rolling_correlation,
-)
+from the_alchemiser.shared.options.exposure_stats import rolling_benchmark_stats
 
 from .sector_mapper import SectorExposure
 
 if TYPE_CHECKING:
     from the_alchemiser.shared.config.container import ApplicationContainer
+    from the_alchemiser.shared.data_v2.market_data_store import MarketDataStore
 
 logger = get_logger(__name__)
 
@@ -59,17 +67,22 @@ class ExposureCalculator:
     def __init__(
         self,
         container: ApplicationContainer | None = None,
+        market_data_store: MarketDataStore | None = None,
     ) -> None:
         """Initialize exposure calculator.
 
         Args:
             container: Optional DI container for accessing AlpacaManager
-                for historical data. If not provided, will fall back to
-                static betas from HEDGE_ETFS.
+                for historical data. If neither it nor a market data store is
+                available, will fall back to static betas from HEDGE_ETFS.
+            market_data_store: S3 parquet store for daily closes. If None, one
+                is created on first use when MARKET_DATA_BUCKET is set.
 
         """
         self._hedge_etfs = HEDGE_ETFS
         self._container = container
+        self._market_data_store = market_data_store
+        self._store_resolved = market_data_store is not None
 
     def calculate_exposure(
         self,
@@ -193,7 +206,7 @@ class ExposureCalculator:
         return Decimal("1.0")
 
     # Constants for rolling metrics calculation
-    # We need ~90 trading days for correlation. Calculation for calendar days buffer:
+    # Alpaca fallback: ~90 trading days for correlation. Calendar days buffer:
     # - 90 trading days minimum + 5 buffer = 95 trading days target
     # - ~38 weekend days per 130 calendar days
     # - Up to 12 US market holidays in worst-case periods (Q4/Q1 has 6+ holidays)
@@ -202,6 +215,10 @@ class ExposureCalculator:
     _MIN_TRADING_DAYS_REQUIRED = 90  # For 90-day correlation window
     _BETA_WINDOW = 60
     _CORRELATION_WINDOW = 90
+    # Closes read per symbol: one more than the returns needed, plus a
+    # buffer for sector ETFs missing a day the benchmarks have
+    _CLOSES_TO_READ = _MIN_TRADING_DAYS_REQUIRED + 10
+    _BENCHMARKS = ("SPY", "QQQ")
 
     def _calculate_rolling_metrics(
         self,
@@ -210,8 +227,8 @@ class ExposureCalculator:
         """Calculate rolling beta and correlation to SPY and QQQ.
 
         Orchestrates the rolling metrics calculation by:
-        1. Fetching benchmark returns (SPY, QQQ)
-        2. Building weighted portfolio returns from sector exposures
+        1. Loading daily closes for the benchmarks and every sector ETF
+        2. Aligning them by date and weighting sectors by exposure
         3. Computing rolling beta (60-day) and correlation (90-day) statistics
 
         Args:
@@ -221,11 +238,6 @@ class ExposureCalculator:
             Tuple of (beta_to_spy, beta_to_qqq, correlation_spy, correlation_qqq)
 
         """
-        # If container not available, fall back to static betas
-        if self._container is None:
-            logger.info("Container not available, using static betas")
-            return self._static_fallback_metrics()
-
         try:
             # Calculate total portfolio value for weighting
             total_value = sum((exp.total_value for exp in sector_exposures.values()), Decimal("0"))
@@ -234,20 +246,16 @@ class ExposureCalculator:
                 logger.warning("Zero total portfolio value, cannot calculate rolling metrics")
                 return self._static_fallback_metrics()
 
-            # Fetch benchmark returns
-            spy_returns, qqq_returns = self._get_benchmark_returns()
-            if spy_returns is None or qqq_returns is None:
+            if self._container is None and self._get_market_data_store() is None:
+                logger.info("No historical data source available, using static betas")
                 return self._static_fallback_metrics()
 
-            # Build weighted portfolio returns
-            portfolio_returns = self._build_weighted_portfolio_returns(
-                sector_exposures, total_value
-            )
-            if not portfolio_returns:
+            closes = self._load_daily_closes([*self._BENCHMARKS, *sector_exposures])
+            if any(benchmark not in closes for benchmark in self._BENCHMARKS):
+                logger.warning("Benchmark closes unavailable, using static betas")
                 return self._static_fallback_metrics()
 
-            # Compute rolling statistics
-            return self._compute_rolling_stats(portfolio_returns, spy_returns, qqq_returns)
+            return self._compute_rolling_stats(closes, sector_exposures, total_value)
 
         except Exception as e:
             logger.warning(
@@ -272,23 +280,86 @@ class ExposureCalculator:
             Decimal("0.0"),  # correlation_qqq (unknown)
         )
 
-    def _fetch_daily_returns(self, symbol: str) -> list[Decimal]:
-        """Fetch daily returns for a symbol using AlpacaManager.
+    def _get_market_data_store(self) -> MarketDataStore | None:
+        """Return the parquet market data store, creating it on first use."""
+        if not self._store_resolved:
+            self._store_resolved = True
+            if os.environ.get("MARKET_DATA_BUCKET"):
+                try:
+                    from the_alchemiser.shared.data_v2.market_data_store import (
+                        MarketDataStore,
+                    )
+
+                    self._market_data_store = MarketDataStore()
+                except Exception as e:
+                    logger.warning("Market data store unavailable", error=str(e))
+        return self._market_data_store
+
+    def _load_daily_closes(self, symbols: list[str]) -> dict[str, pd.Series]:
+        """Load recent daily closes, indexed by UTC date.
+
+        Reads the parquet store first (all symbols fetched concurrently) and
+        falls back to Alpaca per symbol the store does not have.
+
+        Args:
+            symbols: Symbols to load
+
+        Returns:
+            Symbol -> close Series for every symbol with data
+
+        """
+        closes: dict[str, pd.Series] = {}
+        store = self._get_market_data_store()
+        if store is not None:
+            rows = self._CLOSES_TO_READ
+            store.download_to_cache(symbols, tail_rows=dict.fromkeys(symbols, rows))
+            for symbol in symbols:
+                try:
+                    df = store.read_symbol_tail(symbol, rows)
+                except Exception as e:
+                    logger.warning("Failed to read closes from store", symbol=symbol, error=str(e))
+                    continue
+                if df is not None and not df.empty and "timestamp" in df.columns:
+                    closes[symbol] = _daily_close_series(df["timestamp"], df["close"]).iloc[-rows:]
+
+        missing = [symbol for symbol in symbols if symbol not in closes]
+        if missing and self._container is not None:
+            logger.info("Fetching closes missing from the store from Alpaca", symbols=missing)
+            for symbol in missing:
+                try:
+                    series = self._fetch_alpaca_closes(symbol)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to fetch closes from Alpaca, skipping",
+                        symbol=symbol,
+                        error=str(e),
+                    )
+                    continue
+                if series is not None:
+                    closes[symbol] = series
+
+        logger.debug(
+            "Loaded daily closes",
+            requested=len(symbols),
+            loaded=len(closes),
+        )
+        return closes
+
+    def _fetch_alpaca_closes(self, symbol: str) -> pd.Series | None:
+        """Fetch recent daily closes for a symbol using AlpacaManager.
 
         Args:
             symbol: Stock symbol (e.g., SPY, QQQ)
 
         Returns:
-            List of daily returns as Decimals
+            Close Series indexed by UTC date, or None if there are no bars
 
         Raises:
             Exception: If AlpacaManager call fails
 
         """
-        from datetime import UTC, datetime, timedelta
-
         if self._container is None:
-            return []
+            return None
 
         alpaca = self._container.infrastructure.alpaca_manager()
 
@@ -301,157 +372,83 @@ class ExposureCalculator:
             end_date.strftime("%Y-%m-%d"),
             "1Day",
         )
-
-        # Calculate returns from bars (uses SDK field names: open, high, low, close)
-        returns: list[Decimal] = []
-        for i in range(1, len(bars)):
-            prev_close = Decimal(str(bars[i - 1]["close"]))
-            curr_close = Decimal(str(bars[i]["close"]))
-            if prev_close > 0:
-                returns.append((curr_close - prev_close) / prev_close)
-
-        logger.debug(
-            "Fetched daily returns",
-            symbol=symbol,
-            bar_count=len(bars),
-            return_count=len(returns),
+        if not bars:
+            return None
+        return _daily_close_series(
+            pd.Series([bar["timestamp"] for bar in bars]),
+            pd.Series([float(bar["close"]) for bar in bars]),
         )
 
-        return returns
-
-    def _get_benchmark_returns(
-        self,
-    ) -> tuple[list[Decimal] | None, list[Decimal] | None]:
-        """Fetch daily returns for SPY and QQQ benchmarks.
-
-        Fetches enough calendar days to ensure we have sufficient trading days
-        for both 60-day beta and 90-day correlation calculations.
-
-        Returns:
-            Tuple of (spy_returns, qqq_returns), or (None, None) if insufficient data
-
-        """
-        if self._container is None:
-            return None, None
-
-        logger.info("Fetching benchmark returns")
-        try:
-            spy_returns = self._fetch_daily_returns("SPY")
-            qqq_returns = self._fetch_daily_returns("QQQ")
-        except Exception as e:
-            logger.error(
-                "Failed to fetch benchmark returns",
-                error=str(e),
-            )
-            return None, None
-
-        if (
-            len(spy_returns) < self._MIN_TRADING_DAYS_REQUIRED
-            or len(qqq_returns) < self._MIN_TRADING_DAYS_REQUIRED
-        ):
-            logger.warning(
-                "Insufficient benchmark returns",
-                spy_count=len(spy_returns),
-                qqq_count=len(qqq_returns),
-                required=self._MIN_TRADING_DAYS_REQUIRED,
-            )
-            return None, None
-
-        return spy_returns, qqq_returns
-
-    def _build_weighted_portfolio_returns(
+    def _compute_rolling_stats(
         self,
+        closes: dict[str, pd.Series],
         sector_exposures: dict[str, SectorExposure],
         total_value: Decimal,
-    ) -> list[Decimal]:
-        """Build weighted portfolio returns from sector ETF exposures.
+    ) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+        """Compute rolling beta and correlation metrics for the portfolio.
+
+        Sector closes are aligned to the benchmark trading days. A sector
+        missing any day of the correlation window is left out, and its
+        weight contributes no return (as when its data cannot be fetched).
 
         Args:
+            closes: Symbol -> daily close Series (benchmarks included)
             sector_exposures: Exposure by sector ETF
             total_value: Total portfolio value for weight calculation
 
         Returns:
-            List of weighted portfolio daily returns
+            Tuple of (beta_to_spy, beta_to_qqq, correlation_spy, correlation_qqq)
 
         """
-        if self._container is None:
-            return []
-
-        portfolio_returns: list[Decimal] = []
+        benchmarks = list(self._BENCHMARKS)
+        frame = pd.concat({symbol: closes[symbol] for symbol in benchmarks}, axis=1).dropna()
+        frame = frame.iloc[-(self._CORRELATION_WINDOW + 1) :]
 
+        sectors: list[str] = []
+        weights: list[float] = []
         for sector_symbol, exposure in sector_exposures.items():
-            weight = exposure.total_value / total_value
-
-            logger.debug(
-                "Fetching sector returns",
-                sector=sector_symbol,
-                weight=str(weight),
-            )
-
-            try:
-                sector_returns = self._fetch_daily_returns(sector_symbol)
-
-                # Initialize portfolio returns list if empty
-                if not portfolio_returns:
-                    portfolio_returns = [Decimal("0")] * len(sector_returns)
-
-                # Add weighted sector returns to portfolio
-                for i, ret in enumerate(sector_returns):
-                    if i < len(portfolio_returns):
-                        portfolio_returns[i] += ret * weight
-
-            except Exception as sector_error:
+            series = closes.get(sector_symbol)
+            aligned = series.reindex(frame.index) if series is not None else None
+            if aligned is None or aligned.isna().any():
                 logger.warning(
-                    "Failed to fetch sector returns, skipping",
+                    "Sector closes incomplete for the window, skipping",
                     sector=sector_symbol,
-                    error=str(sector_error),
                 )
                 continue
+            frame[sector_symbol] = aligned
+            sectors.append(sector_symbol)
+            weights.append(float(exposure.total_value / total_value))
 
-        if not portfolio_returns:
+        if not sectors:
             logger.warning("No sector returns available for portfolio calculation")
+            return self._static_fallback_metrics()
 
-        return portfolio_returns
-
-    def _compute_rolling_stats(
-        self,
-        portfolio_returns: list[Decimal],
-        spy_returns: list[Decimal],
-        qqq_returns: list[Decimal],
-    ) -> tuple[Decimal, Decimal, Decimal, Decimal]:
-        """Compute rolling beta and correlation metrics for the portfolio.
-
-        Args:
-            portfolio_returns: Weighted portfolio daily returns
-            spy_returns: SPY benchmark daily returns
-            qqq_returns: QQQ benchmark daily returns
-
-        Returns:
-            Tuple of (beta_to_spy, beta_to_qqq, correlation_spy, correlation_qqq)
-
-        """
-        # Calculate betas (60-day window)
-        beta_to_spy = calculate_rolling_beta(
-            portfolio_returns, spy_returns, window=self._BETA_WINDOW
-        )
-        beta_to_qqq = calculate_rolling_beta(
-            portfolio_returns, qqq_returns, window=self._BETA_WINDOW
-        )
-
-        # Calculate correlations (90-day window)
-        correlation_spy = calculate_rolling_correlation(
-            portfolio_returns, spy_returns, window=self._CORRELATION_WINDOW
-        )
-        correlation_qqq = calculate_rolling_correlation(
-            portfolio_returns, qqq_returns, window=self._CORRELATION_WINDOW
+        stats = rolling_benchmark_stats(
+            frame[benchmarks + sectors].to_numpy(dtype=np.float64),
+            benchmarks,
+            np.asarray(weights, dtype=np.float64),
+            beta_window=self._BETA_WINDOW,
+            correlation_window=self._CORRELATION_WINDOW,
         )
+        if stats is None:
+            return self._static_fallback_metrics()
 
+        spy, qqq = stats
         logger.info(
             "Calculated rolling metrics",
-            beta_to_spy=str(beta_to_spy),
-            beta_to_qqq=str(beta_to_qqq),
-            correlation_spy=str(correlation_spy),
-            correlation_qqq=str(correlation_qqq),
+            beta_to_spy=str(spy.beta),
+            beta_to_qqq=str(qqq.beta),
+            correlation_spy=str(spy.correlation),
+            correlation_qqq=str(qqq.correlation),
+            sector_count=len(sectors),
         )
 
-        return beta_to_spy, beta_to_qqq, correlation_spy, correlation_qqq
+        return spy.beta, qqq.beta, spy.correlation, qqq.correlation
+
+
+def _daily_close_series(timestamps: pd.Series, close: pd.Series) -> pd.Series:
+    """Index closes by UTC calendar date, oldest first, one bar per day."""
+    index = pd.to_datetime(timestamps, utc=True).dt.normalize()
+    series = pd.Series(close.to_numpy(dtype=np.float64), index=pd.DatetimeIndex(index))
+    series = series[~series.index.duplicated(keep="last")]
+    return series.sort_index()
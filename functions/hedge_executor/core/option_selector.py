@@ -4,10 +4,15 @@ Option contract selector for hedge execution.
 
 Queries option chains and selects optimal contracts based on
 delta targets, DTE requirements, and liquidity filters.
+
+Chains come from OptionChainSnapshots (paginated, quoted, cached for the
+run), and liquidity filtering and delta/expiry/spread scoring run over the
+chain's ChainColumns rather than contract by contract in Decimal.
 """
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
@@ -16,6 +21,7 @@ from the_alchemiser.shared.errors import TradingClientError
 from the_alchemiser.shared.errors.exceptions import NoLiquidContractsError
 from the_alchemiser.shared.logging import get_logger
 from the_alchemiser.shared.options.adapters import AlpacaOptionsAdapter
+from the_alchemiser.shared.options.chain_snapshot import ChainColumns, OptionChainSnapshots
 from the_alchemiser.shared.options.constants import (
     LIMIT_PRICE_DISCOUNT_FACTOR,
     LIQUIDITY_FILTERS,
@@ -62,14 +68,21 @@ class OptionSelector:
     - Liquidity (open interest, bid-ask spread)
     """
 
-    def __init__(self, options_adapter: AlpacaOptionsAdapter) -> None:
+    def __init__(
+        self,
+        options_adapter: AlpacaOptionsAdapter,
+        chain_snapshots: OptionChainSnapshots | None = None,
+    ) -> None:
         """Initialize option selector.
 
         Args:
             options_adapter: Alpaca options API adapter
+            chain_snapshots: Shared option chain cache (default: a new one
+                over ``options_adapter``)
 
         """
         self._adapter = options_adapter
+        self._chains = chain_snapshots or OptionChainSnapshots(options_adapter)
         self._template = TAIL_HEDGE_TEMPLATE
         self._filters = LIQUIDITY_FILTERS
         self._tenor_selector = TenorSelector()
@@ -150,15 +163,14 @@ class OptionSelector:
         strike_min = underlying_price * STRIKE_MIN_OTM_RATIO
 
         try:
-            # Query option chain
-            contracts = self._adapter.get_option_chain(
-                underlying_symbol=underlying_symbol,
+            # Query option chain (all pages, quoted, shared across selections this run)
+            contracts = self._chains.get_chain(
+                underlying_symbol,
                 expiration_date_gte=min_expiry,
                 expiration_date_lte=max_expiry,
                 strike_price_gte=strike_min,
                 strike_price_lte=strike_max,
                 option_type=OptionType.PUT,
-                limit=200,
             )
 
             if not contracts:
@@ -173,69 +185,9 @@ class OptionSelector:
                 # Caller can decide whether to fail closed or retry
                 return None
 
-            # Pre-filter by DTE before fetching quotes (reduce quote API calls)
-            dte_filtered = [
-                c
-                for c in contracts
-                if self._filters.min_dte <= c.days_to_expiry <= effective_max_dte
-            ]
-
-            if not dte_filtered:
-                logger.warning(
-                    "No contracts in DTE range",
-                    underlying=underlying_symbol,
-                    min_dte=self._filters.min_dte,
-                    max_dte=self._filters.max_dte,
-                )
-                return None
-
-            # Fetch quotes for filtered contracts (contracts endpoint doesn't return quotes)
-            symbols = [c.symbol for c in dte_filtered]
-            quotes = self._adapter.get_option_quotes_batch(symbols)
-
-            # Enrich contracts with quote data
-            enriched_contracts = []
-            for contract in dte_filtered:
-                quote = quotes.get(contract.symbol)
-                if quote:
-                    # Create new contract with quote data
-                    enriched = OptionContract(
-                        symbol=contract.symbol,
-                        underlying_symbol=contract.underlying_symbol,
-                        option_type=contract.option_type,
-                        strike_price=contract.strike_price,
-                        expiration_date=contract.expiration_date,
-                        bid_price=quote.get("bid_price"),
-                        ask_price=quote.get("ask_price"),
-                        last_price=contract.last_price,
-                        volume=contract.volume,
-                        open_interest=contract.open_interest,
-                        delta=contract.delta,
-                        gamma=contract.gamma,
-                        theta=contract.theta,
-                        vega=contract.vega,
-                        implied_volatility=contract.implied_volatility,
-                    )
-                    enriched_contracts.append(enriched)
-                else:
-                    # Keep original contract (may fail liquidity filter)
-                    enriched_contracts.append(contract)
-
-            logger.info(
-                "Enriched contracts with quotes",
-                underlying=underlying_symbol,
-                total_contracts=len(dte_filtered),
-                contracts_with_quotes=len(quotes),
-            )
-
-            contracts = enriched_contracts
-
-            if not contracts:
-                return None
-
             # Filter and score contracts
             best_contract = self._find_best_contract(
-                contracts=contracts,
+                columns=ChainColumns.from_contracts(contracts),
                 target_delta=target_delta,
                 target_expiry=target_expiry,
                 underlying_price=underlying_price,
@@ -283,7 +235,7 @@ class OptionSelector:
 
     def _find_best_contract(
         self,
-        contracts: list[OptionContract],
+        columns: ChainColumns,
         target_delta: Decimal,
         target_expiry: date,
         underlying_price: Decimal,
@@ -294,7 +246,7 @@ class OptionSelector:
         otherwise falls back to delta/expiry scoring.
 
         Args:
-            contracts: List of option contracts
+            columns: Option chain as selection columns
             target_delta: Target delta (positive, e.g., 0.15)
             target_expiry: Target expiration date
             underlying_price: Current underlying price
@@ -305,29 +257,29 @@ class OptionSelector:
         """
         # First pass: try with full filters
         best_contract = self._select_best_contract(
-            contracts, target_delta, target_expiry, underlying_price, skip_oi_filter=False
+            columns, target_delta, target_expiry, underlying_price, skip_oi_filter=False
         )
 
         if best_contract is not None:
             return best_contract
 
         # Check if ALL contracts have 0 open_interest (paper API limitation)
-        all_zero_oi = all(c.open_interest == 0 for c in contracts)
-        if all_zero_oi and contracts:
+        all_zero_oi = not any(columns.open_interest)
+        if all_zero_oi and len(columns):
             logger.warning(
                 "All contracts have 0 open_interest, skipping OI filter (paper API)",
-                contracts_count=len(contracts),
+                contracts_count=len(columns),
             )
             # Second pass: retry without OI filter for paper trading
             best_contract = self._select_best_contract(
-                contracts, target_delta, target_expiry, underlying_price, skip_oi_filter=True
+                columns, target_delta, target_expiry, underlying_price, skip_oi_filter=True
             )
 
         return best_contract
 
     def _select_best_contract(
         self,
-        contracts: list[OptionContract],
+        columns: ChainColumns,
         target_delta: Decimal,
         target_expiry: date,
         underlying_price: Decimal,
@@ -340,7 +292,7 @@ class OptionSelector:
         otherwise falls back to delta/expiry scoring.
 
         Args:
-            contracts: List of option contracts
+            columns: Option chain as selection columns
             target_delta: Target delta
             target_expiry: Target expiration date
             underlying_price: Current underlying price
@@ -351,29 +303,27 @@ class OptionSelector:
 
         """
         # Filter by liquidity first
-        liquid_contracts = [
-            c for c in contracts if self._passes_liquidity_filter(c, skip_oi_filter=skip_oi_filter)
-        ]
+        liquid = self._liquid_rows(columns, skip_oi_filter=skip_oi_filter)
 
-        if not liquid_contracts:
+        if not liquid:
             return None
 
         # Try convexity-based selection if gamma data available
         convexity_metrics = []
-        for contract in liquid_contracts:
+        for row in liquid:
             metrics = self._convexity_selector.calculate_convexity_metrics(
-                contract, underlying_price
+                columns.contracts[row], underlying_price
             )
             if metrics is not None:
                 convexity_metrics.append(metrics)
 
         # If we have sufficient convexity data, use it
         # Require non-empty AND at least half of contracts have gamma data
-        min_required = max(1, len(liquid_contracts) // 2)
+        min_required = max(1, len(liquid) // 2)
         if convexity_metrics and len(convexity_metrics) >= min_required:
             logger.info(
                 "Using convexity-based selection",
-                total_contracts=len(liquid_contracts),
+                total_contracts=len(liquid),
                 with_convexity=len(convexity_metrics),
             )
 
@@ -390,111 +340,99 @@ class OptionSelector:
         # Fallback: traditional delta/expiry scoring
         logger.info(
             "Using traditional delta/expiry scoring",
-            total_contracts=len(liquid_contracts),
+            total_contracts=len(liquid),
             with_convexity=len(convexity_metrics),
         )
 
-        best_contract: OptionContract | None = None
-        best_score = Decimal("999999")
+        scores = self._score_rows(columns, liquid, target_delta, target_expiry)
+        # First lowest score wins ties
+        best_row = liquid[min(range(len(scores)), key=scores.__getitem__)]
+        return columns.contracts[best_row]
 
-        for contract in liquid_contracts:
-            # Score contract (lower is better)
-            score = self._score_contract(contract, target_delta, target_expiry)
+    def _liquid_rows(self, columns: ChainColumns, *, skip_oi_filter: bool = False) -> list[int]:
+        """Return the rows that pass liquidity requirements.
 
-            if score < best_score:
-                best_score = score
-                best_contract = contract
-
-        return best_contract
-
-    def _passes_liquidity_filter(
-        self, contract: OptionContract, *, skip_oi_filter: bool = False
-    ) -> bool:
-        """Check if contract passes liquidity requirements.
+        A row passes when it has both bid and ask, open interest (unless
+        skipped) and volume at the minimums, a mid price at the minimum,
+        spread within the percentage and absolute caps, and DTE in range.
 
         Args:
-            contract: Option contract to check
+            columns: Option chain as selection columns
             skip_oi_filter: Skip open interest check (for paper API)
 
         Returns:
-            True if contract passes all liquidity filters
+            Indices of passing rows, in chain order
 
         """
-        # Check open interest (skip if OI data unavailable in paper API)
-        if not skip_oi_filter and contract.open_interest < self._filters.min_open_interest:
-            return False
-
-        # Check volume
-        if contract.volume < self._filters.min_volume:
-            return False
-
-        # Check mid price minimum (avoid penny options)
-        mid_price = contract.mid_price
-        if mid_price is None or mid_price < self._filters.min_mid_price:
-            return False
-
-        # Check bid-ask spread (percentage)
-        spread_pct = contract.spread_pct
-        if spread_pct is not None and spread_pct > self._filters.max_spread_pct:
-            return False
-
-        # Check absolute bid-ask spread
-        if contract.bid_price is not None and contract.ask_price is not None:
-            spread_absolute = contract.ask_price - contract.bid_price
-            if spread_absolute > self._filters.max_spread_absolute:
-                return False
-
-        # Check DTE
-        dte = contract.days_to_expiry
-        if dte < self._filters.min_dte or dte > self._filters.max_dte:
-            return False
-
-        # Must have bid and ask
-        return contract.bid_price is not None and contract.ask_price is not None
+        filters = self._filters
+        min_oi = 0 if skip_oi_filter else filters.min_open_interest
+        min_mid = float(filters.min_mid_price)
+        max_spread_pct = float(filters.max_spread_pct)
+        max_spread_abs = float(filters.max_spread_absolute)
+
+        # NaN mid/spread (no two-sided quote) fail the comparisons below, so
+        # such rows drop out with no separate check
+        return [
+            row
+            for row, (oi, volume, mid, spread, spread_pct, dte) in enumerate(
+                zip(
+                    columns.open_interest,
+                    columns.volume,
+                    columns.mid,
+                    columns.spread,
+                    columns.spread_pct,
+                    columns.dte,
+                    strict=True,
+                )
+            )
+            if oi >= min_oi
+            and volume >= filters.min_volume
+            and mid >= min_mid
+            and not spread_pct > max_spread_pct
+            and spread <= max_spread_abs
+            and filters.min_dte <= dte <= filters.max_dte
+        ]
 
-    def _score_contract(
-        self,
-        contract: OptionContract,
+    @staticmethod
+    def _score_rows(
+        columns: ChainColumns,
+        rows: list[int],
         target_delta: Decimal,
         target_expiry: date,
-    ) -> Decimal:
-        """Score contract based on how well it matches targets.
+    ) -> list[float]:
+        """Score rows based on how well they match targets.
 
         Lower score is better. Considers:
-        - Delta deviation from target
-        - Expiry deviation from target
-        - Spread (tighter is better)
+        - Delta deviation from target (x100; a flat 10 without delta data)
+        - Expiry deviation from target (days)
+        - Spread (x50 of spread percentage; tighter is better)
 
         Args:
-            contract: Option contract to score
+            columns: Option chain as selection columns
+            rows: Rows to score
             target_delta: Target delta
             target_expiry: Target expiration date
 
         Returns:
-            Score (lower is better)
+            Score per row, in ``rows`` order
 
         """
-        score = Decimal("0")
-
-        # Delta deviation (weighted heavily)
-        if contract.delta is not None:
-            delta_diff = abs(abs(contract.delta) - target_delta)
-            score += delta_diff * 100
-        else:
-            # Estimate delta from strike/price if not available
-            # Penalize contracts without delta data
-            score += Decimal("10")
-
-        # Expiry deviation (days)
-        expiry_diff = abs((contract.expiration_date - target_expiry).days)
-        score += Decimal(str(expiry_diff))
-
-        # Spread penalty
-        spread_pct = contract.spread_pct
-        if spread_pct is not None:
-            score += spread_pct * 50
-
-        return score
+        target = float(target_delta)
+        target_ordinal = target_expiry.toordinal()
+        abs_delta = columns.abs_delta
+        expiry = columns.expiry_ordinal
+        spread_pct = columns.spread_pct
+
+        scores = []
+        for row in rows:
+            delta = abs_delta[row]
+            spread = spread_pct[row]
+            scores.append(
+                (10.0 if math.isnan(delta) else abs(delta - target) * 100)
+                + abs(expiry[row] - target_ordinal)
+                + (0.0 if math.isnan(spread) else spread * 50)
+            )
+        return scores
 
     def _build_selected_option(
         self,
@@ -647,14 +585,13 @@ class OptionSelector:
 
         try:
             # Query option chain (same for both legs)
-            contracts = self._adapter.get_option_chain(
-                underlying_symbol=underlying_symbol,
+            contracts = self._chains.get_chain(
+                underlying_symbol,
                 expiration_date_gte=min_expiry,
                 expiration_date_lte=max_expiry,
                 strike_price_gte=strike_min,
                 strike_price_lte=strike_max,
                 option_type=OptionType.PUT,
-                limit=200,
             )
 
             if not contracts:
@@ -666,60 +603,12 @@ class OptionSelector:
                 )
                 return None
 
-            # Pre-filter by DTE
-            dte_filtered = [
-                c
-                for c in contracts
-                if self._filters.min_dte <= c.days_to_expiry <= self._filters.max_dte
-            ]
-
-            if not dte_filtered:
-                logger.warning(
-                    "No contracts in DTE range for spread",
-                    underlying=underlying_symbol,
-                    min_dte=self._filters.min_dte,
-                    max_dte=self._filters.max_dte,
-                )
-                return None
-
-            # Fetch quotes for filtered contracts
-            symbols = [c.symbol for c in dte_filtered]
-            quotes = self._adapter.get_option_quotes_batch(symbols)
-
-            # Enrich contracts with quote data
-            enriched_contracts = []
-            for contract in dte_filtered:
-                quote = quotes.get(contract.symbol)
-                if quote:
-                    enriched = OptionContract(
-                        symbol=contract.symbol,
-                        underlying_symbol=contract.underlying_symbol,
-                        option_type=contract.option_type,
-                        strike_price=contract.strike_price,
-                        expiration_date=contract.expiration_date,
-                        bid_price=quote.get("bid_price"),
-                        ask_price=quote.get("ask_price"),
-                        last_price=contract.last_price,
-                        volume=contract.volume,
-                        open_interest=contract.open_interest,
-                        delta=contract.delta,
-                        gamma=contract.gamma,
-                        theta=contract.theta,
-                        vega=contract.vega,
-                        implied_volatility=contract.implied_volatility,
-                    )
-                    enriched_contracts.append(enriched)
-                else:
-                    enriched_contracts.append(contract)
-
-            contracts = enriched_contracts
-
-            if not contracts:
-                return None
+            # Columns are built once and scored for both legs
+            columns = ChainColumns.from_contracts(contracts)
 
             # Select long leg (higher delta, e.g., 30-delta)
             long_leg = self._find_best_contract(
-                contracts=contracts,
+                columns=columns,
                 target_delta=long_delta,
                 target_expiry=target_expiry,
                 underlying_price=underlying_price,
@@ -743,7 +632,7 @@ class OptionSelector:
 
             # Select short leg (lower delta, e.g., 10-delta)
             short_leg = self._find_best_contract(
-                contracts=contracts,
+                columns=columns,
                 target_delta=short_delta,
                 target_expiry=target_expiry,
                 underlying_price=underlying_price,
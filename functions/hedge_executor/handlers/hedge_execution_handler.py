@@ -32,6 +32,7 @@ from the_alchemiser.shared.options.adapters import (
     HedgeHistoryRepository,
     HedgePositionsRepository,
 )
+from the_alchemiser.shared.options.chain_snapshot import OptionChainSnapshots
 from the_alchemiser.shared.options.constants import MAX_SINGLE_POSITION_PCT
 from the_alchemiser.shared.options.kill_switch_service import KillSwitchService
 from the_alchemiser.shared.options.marketability_pricing import OrderSide
@@ -81,7 +82,10 @@ class HedgeExecutionHandler:
             paper=paper,
         )
 
-        self._option_selector = OptionSelector(self._options_adapter)
+        # One chain snapshot cache per run: every selection on an underlying
+        # reuses the first paginated, quoted chain fetch
+        self._option_chains = OptionChainSnapshots(self._options_adapter)
+        self._option_selector = OptionSelector(self._options_adapter, self._option_chains)
         self._execution_service = OptionsExecutionService(self._options_adapter)
 
         # Initialize DynamoDB repository for hedge positions
@@ -144,9 +144,11 @@ class StrategyRebalancer:
                 },
             )
 
-            # Step 2: Get current prices for target symbols
+            # Step 2: Get current prices for target symbols (one snapshot per run)
             target_symbols = list(target_weights.keys())
-            prices_float = self._alpaca_manager.get_current_prices(target_symbols)
+            prices_float = self._alpaca_manager.get_current_prices(
+                target_symbols, run_id=correlation_id
+            )
             current_prices = {
                 symbol: Decimal(str(price)) for symbol, price in prices_float.items() if price > 0
             }
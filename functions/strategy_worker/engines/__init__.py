@@ -10,6 +10,7 @@ from __future__ import annotations
 
 # Strategy engines are available via submodules:
 # - dsl: DSL-based strategy engine (Clojure-style strategy files)
+# - backtest: Vectorized whole-history backtest of parsed DSL strategies
 # Future engines (not yet implemented):
 # - nuclear: Nuclear energy trading strategy
 # - klm: KLM strategy variants
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""Business Unit: strategy | Status: current.
+
+Vectorized backtest engine for DSL strategies.
+
+Evaluates a parsed strategy across its whole date range in one pass and
+returns daily target weights plus the resulting equity curve.
+"""
+
+from __future__ import annotations
+
+from engines.backtest.vectorized_engine import BacktestResult, VectorizedBacktestEngine
+
+__all__ = [
+    "BacktestResult",
+    "VectorizedBacktestEngine",
+]
@@ -0,0 +1,92 @@
+"""Business Unit: strategy | Status: current.
+
+Parity tests for the vectorized backtest engine.
+
+Bundled strategies are backtested over synthetic data, and the weights
+decided on sampled dates are compared with DslEvaluator evaluating the
+same strategy as of that date:
+- Conditional strategies (if / comparisons over indicators)
+- Asset-mode filters and weight-inverse-volatility
+- Portfolio-mode filters over nested groups, including reused group names
+- Dates the evaluator cannot allocate are invalid in the backtest
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from importlib import resources
+
+import pandas as pd
+import pytest
+from engines.backtest import VectorizedBacktestEngine
+from engines.dsl.dsl_evaluator import DslEvaluator
+from engines.dsl.operators import group_scheduler
+from engines.dsl.sexpr_parser import SexprParser
+from engines.dsl.tests.synthetic_market_data import synthetic_adapter
+from engines.dsl.types import DslEvaluationError
+from indicators.indicator_service import IndicatorService
+
+from the_alchemiser.shared.schemas.ast_node import ASTNode
+
+# Calendar days backtested, and every how many decision dates the evaluator checks
+BACKTEST_DAYS = 42
+SAMPLE_EVERY = 6
+
+STRATEGIES = [
+    "ftlt/holy_grail.clj",
+    "ftlt/tqqq_ftlt.clj",
+    "kmlm_switcher.clj",
+    "gold_and_miners.clj",
+    "defence.clj",
+    "hedged_sector_rotator.clj",
+]
+
+
+def _parse(strategy: str) -> ASTNode:
+    source = resources.files("the_alchemiser.shared.strategies").joinpath(strategy)
+    return SexprParser().parse(source.read_text(encoding="utf-8"))
+
+
+def _evaluator_weights(
+    evaluator: DslEvaluator, service: IndicatorService, ast: ASTNode, day: date
+) -> dict[str, float] | None:
+    service.as_of_date = day
+    try:
+        allocation, _ = evaluator.evaluate(ast, "backtest-parity")
+    except DslEvaluationError:
+        return None
+    return {symbol: float(w) for symbol, w in allocation.target_weights.items() if w > 0}
+
+
+def _backtest_weights(row: pd.Series) -> dict[str, float] | None:
+    if row.isna().all():
+        return None
+    return {str(symbol): float(w) for symbol, w in row.items() if w > 0}
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_backtest_matches_evaluator(strategy: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Group scoring stays in-process and sequential
+    monkeypatch.delenv("GROUP_HISTORY_TABLE", raising=False)
+    monkeypatch.setattr(group_scheduler, "GROUP_SCHEDULER_PROCESSES", False)
+    ast = _parse(strategy)
+    adapter = synthetic_adapter()
+
+    result = VectorizedBacktestEngine(adapter).run(
+        ast, start=date.today() - timedelta(days=BACKTEST_DAYS)
+    )
+
+    service = IndicatorService(adapter)
+    evaluator = DslEvaluator(service)
+    sampled = result.weights.index[::SAMPLE_EVERY]
+    assert len(sampled) >= 4
+    for timestamp in sampled:
+        day = timestamp.date()
+        expected = _evaluator_weights(evaluator, service, ast, day)
+        actual = _backtest_weights(result.weights.loc[timestamp])
+        if expected is None or actual is None:
+            assert expected == actual, day
+            continue
+        assert actual.keys() == expected.keys(), day
+        for symbol, weight in expected.items():
+            assert actual[symbol] == pytest.approx(weight, abs=1e-9), (day, symbol)
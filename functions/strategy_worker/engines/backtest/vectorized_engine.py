@@ -0,0 +1,1191 @@
+#!/usr/bin/env python3
+"""Business Unit: strategy | Status: current.
+
+Vectorized whole-history backtest engine for DSL strategies.
+
+The live evaluator answers "what does this strategy hold on date D?" with one
+full AST walk per date, so replaying N years costs N walks plus N rounds of
+indicator lookups. This engine walks the AST once for the whole date range:
+
+- every indicator the AST references is computed once per
+  (symbol, indicator, params) as a float64 array aligned to a shared
+  trading-day axis (NaN where the live operator would raise);
+- comparisons become masks over that axis, ``if`` selects between the two
+  branches with the mask, and ``weight-*``/``filter``/``group`` nodes become
+  per-symbol weight columns over the same axis;
+- filters over named groups score each group from its backtested daily
+  return stream, using the same metric formulas as in-process group scoring.
+
+Operator semantics follow engines.dsl.operators. Differences that come from
+evaluating every date at once:
+
+- both branches of an ``if`` are evaluated; the mask picks per date;
+- a date on which the live evaluator would raise (missing data, no valid
+  weights) is marked invalid rather than aborting the run, and the
+  previous valid allocation is held through it;
+- indicators use each symbol's full close history (the live service caps
+  non-recursive indicators to a lookback period relative to today);
+- group scores use the whole backtested return stream, not the DynamoDB
+  group cache or its bounded in-process replay window.
+
+scripts/backtest_strategy.py runs the engine (``--verify-every`` checks
+sampled dates against DslEvaluator); engines/backtest/tests/test_parity.py
+holds bundled strategies to the evaluator's weights.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+from functools import partial
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from engines.dsl.operators.control_flow import create_indicator_with_symbol
+from engines.dsl.types import DslEvaluationError
+from errors import MarketDataError
+from indicators.indicators import TechnicalIndicators
+
+from the_alchemiser.shared.logging import get_logger
+from the_alchemiser.shared.schemas.ast_node import ASTNode
+from the_alchemiser.shared.types.market_data_port import (
+    ColumnarMarketDataPort,
+    MarketDataPort,
+)
+from the_alchemiser.shared.value_objects.symbol import Symbol
+
+logger = get_logger(__name__)
+
+type FloatArray = npt.NDArray[np.float64]
+type BoolArray = npt.NDArray[np.bool_]
+
+# Calendar days of history evaluated before the requested start date so that
+# group return streams (used by portfolio-mode filters) are warm on day one.
+DEFAULT_WARMUP_DAYS = 365
+
+# Annualisation factor used by group stdev-return scoring (matches group_scoring).
+_ANNUALISATION_SQRT_252 = 15.8745078664
+
+# Same floor the live inverse-volatility operator applies to the weight total.
+_MIN_TOTAL_INVERSE = 1e-10
+
+# DSL indicator operator -> (TechnicalIndicators method, ((dsl key, method kwarg, default), ...))
+_INDICATOR_SPECS: dict[str, tuple[str, tuple[tuple[str, str, int], ...]]] = {
+    "rsi": ("rsi", (("window", "window", 14),)),
+    "moving-average-price": ("moving_average", (("window", "window", 200),)),
+    "moving-average-return": ("moving_average_return", (("window", "window", 21),)),
+    "cumulative-return": ("cumulative_return", (("window", "window", 60),)),
+    "exponential-moving-average-price": (
+        "exponential_moving_average",
+        (("window", "window", 12),),
+    ),
+    "stdev-return": ("stdev_return", (("window", "window", 6),)),
+    "stdev-price": ("stdev_price", (("window", "window", 6),)),
+    "max-drawdown": ("max_drawdown", (("window", "window", 60),)),
+    "percentage-price-oscillator": (
+        "percentage_price_oscillator",
+        (("short-window", "short_window", 12), ("long-window", "long_window", 26)),
+    ),
+    "percentage-price-oscillator-signal": (
+        "percentage_price_oscillator_signal",
+        (
+            ("short-window", "short_window", 12),
+            ("long-window", "long_window", 26),
+            ("smooth-window", "smooth_window", 9),
+        ),
+    ),
+}
+
+# Filter metrics that portfolio-mode scoring computes from a group's return stream
+_GROUP_METRICS: dict[str, str] = {
+    "moving-average-return": "moving_average_return",
+    "cumulative-return": "cumulative_return",
+    "stdev-return": "stdev_return",
+    "max-drawdown": "max_drawdown",
+    "rsi": "rsi",
+}
+
+_COMPARISONS: dict[str, Callable[[FloatArray, FloatArray], BoolArray]] = {
+    ">": np.greater,
+    "<": np.less,
+    ">=": np.greater_equal,
+    "<=": np.less_equal,
+    "=": np.equal,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _Portfolio:
+    """Weights over the date axis, the vectorized PortfolioFragment.
+
+    Attributes:
+        weights: Symbol -> weight per date (0.0 where not held)
+        valid: False on dates where the live evaluator would have raised
+        name: Group name, used by portfolio-mode filter scoring
+        kind: "asset" for a bare symbol (per date), "group" for a named
+            group, "fragment" for any other operator result
+
+    """
+
+    weights: dict[str, FloatArray]
+    valid: BoolArray
+    name: str | None = None
+    kind: Literal["asset", "group", "fragment"] = "fragment"
+
+    def total(self, size: int) -> FloatArray:
+        """Return the per-date sum of weights."""
+        total: FloatArray = np.zeros(size)
+        for column in self.weights.values():
+            total = total + column
+        return total
+
+    def normalized(self, size: int) -> _Portfolio:
+        """Return a copy whose nonzero rows sum to 1."""
+        total = self.total(size)
+        scale = np.divide(1.0, total, out=np.zeros(size), where=total > 0)
+        return replace(self, weights={sym: w * scale for sym, w in self.weights.items()})
+
+
+type _Value = float | str | FloatArray | _Portfolio | list[_Value] | dict[str, _Value] | None
+
+
+@dataclass(frozen=True, slots=True)
+class _History:
+    """One symbol's close history aligned to the run's date axis.
+
+    Attributes:
+        prices: Closes oldest first
+        lengths: Per axis date, the number of bars on or before that date
+            (the length of the prefix the live service would see)
+
+    """
+
+    prices: pd.Series
+    lengths: npt.NDArray[np.int64]
+
+
+@dataclass(frozen=True, slots=True)
+class BacktestResult:
+    """Output of a vectorized backtest.
+
+    Attributes:
+        weights: Daily target weights (dates x symbols), decided at each
+            date's close; NaN rows are dates the strategy could not evaluate
+        returns: Daily portfolio returns from holding the previous close's
+            weights, net of turnover costs
+        equity: Equity curve starting at the initial capital
+        invalid_dates: Dates whose allocation could not be evaluated (the
+            previous allocation was held through them)
+        elapsed_seconds: Wall-clock time of the run
+
+    """
+
+    weights: pd.DataFrame
+    returns: pd.Series
+    equity: pd.Series
+    invalid_dates: list[date] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def strategy_days(self) -> int:
+        """Number of dates evaluated."""
+        return len(self.weights)
+
+    @property
+    def strategy_days_per_second(self) -> float:
+        """Evaluation throughput."""
+        if self.elapsed_seconds <= 0:
+            return float("inf")
+        return self.strategy_days / self.elapsed_seconds
+
+    def summary(self) -> dict[str, float]:
+        """Summarize the equity curve.
+
+        Returns:
+            Total and annualized return, annualized volatility, Sharpe ratio
+            (zero risk-free rate), max drawdown (all as fractions), and the
+            number of invalid dates
+
+        """
+        if self.equity.empty:
+            return {}
+        total_return = float(self.equity.iloc[-1] / self.equity.iloc[0] - 1.0)
+        years = max(len(self.returns) - 1, 1) / 252.0
+        annualized_return = (1.0 + total_return) ** (1.0 / years) - 1.0
+        daily = self.returns.iloc[1:]
+        volatility = float(daily.std(ddof=0) * math.sqrt(252)) if len(daily) else 0.0
+        sharpe = (
+            float(daily.mean() / daily.std(ddof=0) * math.sqrt(252))
+            if len(daily) and daily.std(ddof=0) > 0
+            else 0.0
+        )
+        drawdown = 1.0 - self.equity / self.equity.cummax()
+        return {
+            "total_return": total_return,
+            "annualized_return": annualized_return,
+            "annualized_volatility": volatility,
+            "sharpe": sharpe,
+            "max_drawdown": float(drawdown.max()),
+            "invalid_days": float(len(self.invalid_dates)),
+        }
+
+
+class VectorizedBacktestEngine:
+    """Evaluate a DSL strategy over a date range as arrays.
+
+    Close histories and full-history indicator series are cached on the
+    engine, so running many strategies (or date ranges) over the same
+    universe reuses them.
+    """
+
+    def __init__(self, market_data_service: MarketDataPort) -> None:
+        """Initialize the engine.
+
+        Args:
+            market_data_service: Source of daily bars; columnar ports are
+                read as float64 close arrays without BarModel materialization
+
+        """
+        self.market_data_service = market_data_service
+        self.technical_indicators = TechnicalIndicators()
+        self._closes: dict[str, tuple[npt.NDArray[np.datetime64], FloatArray]] = {}
+        self._full_series: dict[tuple[str, str, tuple[tuple[str, int], ...]], FloatArray] = {}
+        # Per-run state (reset by run())
+        self._dates: npt.NDArray[np.datetime64] = np.array([], dtype="datetime64[D]")
+        self._histories: dict[str, _History] = {}
+        self._aligned: dict[tuple[str, str, tuple[tuple[str, int], ...]], FloatArray] = {}
+        self._bar_returns: dict[str, FloatArray] = {}
+        self._operators: dict[str, Callable[[list[ASTNode]], _Value]] = {
+            "defsymphony": self._defsymphony,
+            "if": self._if,
+            "asset": self._asset_symbol,
+            "group": self._group,
+            "weight-equal": self._weight_equal,
+            "weight-specified": self._weight_specified,
+            "weight-inverse-volatility": self._weight_inverse_volatility,
+            "filter": self._filter,
+        }
+        for name in ("select-top", "select-bottom"):
+            self._operators[name] = partial(self._selection_count, name)
+        for name in _COMPARISONS:
+            self._operators[name] = partial(self._compare, name)
+        for name in (*_INDICATOR_SPECS, "current-price"):
+            self._operators[name] = partial(self._indicator, name)
+
+    # ---------- Public API ----------
+
+    def run(
+        self,
+        ast: ASTNode,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+        initial_capital: float = 1.0,
+        cost_bps: float = 0.0,
+        warmup_days: int = DEFAULT_WARMUP_DAYS,
+    ) -> BacktestResult:
+        """Backtest a parsed strategy.
+
+        Args:
+            ast: Parsed strategy (typically a defsymphony node)
+            start: First decision date (default: first date with data)
+            end: Last decision date (default: last date with data)
+            initial_capital: Starting equity
+            cost_bps: Cost in basis points charged on each day's turnover
+            warmup_days: Calendar days evaluated before start so group
+                return streams are populated on the first decision date
+
+        Returns:
+            BacktestResult with daily weights and the equity curve
+
+        Raises:
+            DslEvaluationError: If the strategy uses an operator the engine
+                does not support, or its result can never be an allocation
+
+        """
+        started = time.perf_counter()
+        symbols = _collect_symbols(ast)
+        self._reset(symbols, start=start, end=end, warmup_days=warmup_days)
+
+        value = self._evaluate(ast)
+        if not isinstance(value, _Portfolio | str | dict):
+            raise DslEvaluationError(
+                f"Evaluation produced invalid type for allocation: {type(value).__name__}. "
+                "Expected a portfolio, weights dict, or symbol."
+            )
+        result = self._to_portfolio(value)
+        final = result.normalized(self._size)
+        valid = result.valid & (final.total(self._size) > 0)
+
+        first = 0 if start is None else int(np.searchsorted(self._dates, np.datetime64(start, "D")))
+        backtest = self._simulate(final, valid, first, initial_capital, cost_bps)
+        elapsed = time.perf_counter() - started
+        backtest = replace(backtest, elapsed_seconds=elapsed)
+        logger.info(
+            "Vectorized backtest complete",
+            strategy_days=backtest.strategy_days,
+            symbols=len(backtest.weights.columns),
+            invalid_days=len(backtest.invalid_dates),
+            elapsed_seconds=round(elapsed, 3),
+            strategy_days_per_second=round(backtest.strategy_days_per_second, 1),
+        )
+        return backtest
+
+    # ---------- Date axis and data ----------
+
+    @property
+    def _size(self) -> int:
+        return len(self._dates)
+
+    def _reset(
+        self, symbols: list[str], *, start: date | None, end: date | None, warmup_days: int
+    ) -> None:
+        """Build the run's date axis from the referenced symbols' bar dates."""
+        self._histories = {}
+        self._aligned = {}
+        self._bar_returns = {}
+        all_dates = [self._load_closes(symbol)[0] for symbol in symbols]
+        dates = (
+            np.unique(np.concatenate(all_dates))
+            if all_dates
+            else np.array([], dtype="datetime64[D]")
+        )
+        if start is not None:
+            dates = dates[dates >= np.datetime64(start - timedelta(days=warmup_days), "D")]
+        if end is not None:
+            dates = dates[dates <= np.datetime64(end, "D")]
+        if start is not None and not (dates >= np.datetime64(start, "D")).any():
+            raise DslEvaluationError(f"No market data on or after backtest start {start}")
+        if len(dates) == 0:
+            raise DslEvaluationError("No market data for any symbol referenced by the strategy")
+        self._dates = dates
+
+    def _load_closes(self, symbol: str) -> tuple[npt.NDArray[np.datetime64], FloatArray]:
+        """Fetch a symbol's full daily close history once per engine."""
+        cached = self._closes.get(symbol)
+        if cached is not None:
+            return cached
+
+        dates: npt.NDArray[np.datetime64] = np.array([], dtype="datetime64[D]")
+        closes: FloatArray = np.array([], dtype=np.float64)
+        try:
+            if isinstance(self.market_data_service, ColumnarMarketDataPort):
+                close_array = self.market_data_service.get_close_array(Symbol(symbol), period="MAX")
+                if close_array is not None:
+                    dates = close_array.timestamps.astype("datetime64[D]")
+                    closes = np.asarray(close_array.closes, dtype=np.float64)
+            else:
+                bars = self.market_data_service.get_bars(
+                    symbol=Symbol(symbol), period="MAX", timeframe="1Day"
+                )
+                dates = np.array([bar.timestamp.date() for bar in bars], dtype="datetime64[D]")
+                closes = np.array([float(bar.close) for bar in bars], dtype=np.float64)
+        except (MarketDataError, ValueError) as exc:
+            logger.warning("Backtest: no market data for symbol", symbol=symbol, error=str(exc))
+
+        self._closes[symbol] = (dates, closes)
+        return dates, closes
+
+    def _history(self, symbol: str) -> _History:
+        """Return a symbol's closes with their prefix lengths on the date axis."""
+        history = self._histories.get(symbol)
+        if history is None:
+            dates, closes = self._load_closes(symbol)
+            history = _History(
+                prices=pd.Series(closes),
+                lengths=np.searchsorted(dates, self._dates, side="right").astype(np.int64),
+            )
+            self._histories[symbol] = history
+        return history
+
+    def _indicator_array(self, symbol: str, method: str, params: dict[str, int]) -> FloatArray:
+        """Return indicator values per axis date, NaN where the live operator would raise.
+
+        Each date's value is the last point of the indicator computed over
+        the bars up to that date. Indicators are causal, so that is the
+        full-history series at the date's prefix length; prefixes no longer
+        than the windows involved are recomputed directly because the
+        indicators special-case short histories.
+        """
+        params_key = tuple(sorted(params.items()))
+        key = (symbol, method, params_key)
+        aligned = self._aligned.get(key)
+        if aligned is not None:
+            return aligned
+
+        history = self._history(symbol)
+        lengths = history.lengths
+        values = np.full(self._size, np.nan)
+        if method == "current_price":
+            closes = history.prices.to_numpy(dtype=np.float64)
+            has = lengths > 0
+            values[has] = closes[lengths[has] - 1]
+            self._aligned[key] = values
+            return values
+
+        compute: Callable[..., pd.Series] = getattr(self.technical_indicators, method)
+        try:
+            full = self._full_series.get(key)
+            if full is None:
+                full = compute(history.prices, **params).to_numpy(dtype=np.float64)
+                self._full_series[key] = full
+            has = lengths > 0
+            values[has] = full[lengths[has] - 1]
+            short = has & (lengths <= sum(params.values()))
+            for length in np.unique(lengths[short]):
+                series = compute(history.prices.iloc[: int(length)], **params)
+                values[lengths == length] = float(series.iloc[-1]) if len(series) else np.nan
+        except (MarketDataError, ValueError) as exc:
+            # The live operator raises on every date, e.g. for a non-positive window
+            logger.warning(
+                "Backtest: indicator unavailable", symbol=symbol, method=method, error=str(exc)
+            )
+            values[:] = np.nan
+        self._aligned[key] = values
+        return values
+
+    def _bar_return_array(self, symbol: str) -> FloatArray:
+        """Close-to-close return of each date's latest bar (as group scoring reads it)."""
+        cached = self._bar_returns.get(symbol)
+        if cached is not None:
+            return cached
+        history = self._history(symbol)
+        closes = history.prices.to_numpy(dtype=np.float64)
+        own = np.full(len(closes), np.nan)
+        if len(closes) > 1:
+            previous = closes[:-1]
+            own[1:] = np.divide(
+                closes[1:], previous, out=np.full(len(previous), np.nan), where=previous != 0
+            )
+            own[1:] -= 1.0
+        values = np.full(self._size, np.nan)
+        has = history.lengths > 0
+        values[has] = own[history.lengths[has] - 1]
+        self._bar_returns[symbol] = values
+        return values
+
+    # ---------- Evaluation ----------
+
+    def _evaluate(self, node: ASTNode) -> _Value:
+        """Evaluate a node over the whole date axis."""
+        if node.is_atom():
+            value = node.get_atom_value()
+            return float(value) if isinstance(value, Decimal) else value
+        if node.is_symbol():
+            return node.get_symbol_name()
+        if not node.children:
+            return []
+        if node.metadata and node.metadata.get("node_subtype") == "map":
+            return self._evaluate_map(node)
+        head = node.children[0]
+        if head.is_symbol():
+            name = head.get_symbol_name() or ""
+            return self._apply(name, node.children[1:])
+        return [self._evaluate(child) for child in node.children]
+
+    def _evaluate_map(self, node: ASTNode) -> dict[str, _Value]:
+        result: dict[str, _Value] = {}
+        it = iter(node.children)
+        for key_node, value_node in zip(it, it, strict=True):
+            key = (
+                key_node.get_symbol_name()
+                if key_node.is_symbol()
+                else str(key_node.get_atom_value())
+            ) or "unknown"
+            result[key.removeprefix(":")] = self._evaluate(value_node)
+        return result
+
+    def _apply(self, name: str, args: list[ASTNode]) -> _Value:
+        handler = self._operators.get(name)
+        if handler is None:
+            raise DslEvaluationError(
+                f"Operator '{name}' is not supported by the vectorized backtest", node_type=name
+            )
+        return handler(args)
+
+    def _defsymphony(self, args: list[ASTNode]) -> _Value:
+        if len(args) < 3:
+            raise DslEvaluationError("defsymphony requires at least 3 arguments")
+        return self._evaluate(args[2])
+
+    def _asset_symbol(self, args: list[ASTNode]) -> str:
+        if not args:
+            raise DslEvaluationError("asset requires at least 1 argument")
+        symbol = self._evaluate(args[0])
+        if not isinstance(symbol, str):
+            raise DslEvaluationError(f"Asset symbol must be string, got {type(symbol)}")
+        return symbol
+
+    def _selection_count(self, name: str, args: list[ASTNode]) -> float:
+        if not args:
+            raise DslEvaluationError(f"{name} requires at least 1 argument")
+        return float(int(_as_float(self._evaluate(args[0]))))
+
+    # ---------- Conditions ----------
+
+    def _compare(self, name: str, args: list[ASTNode]) -> _Value:
+        if len(args) != 2:
+            raise DslEvaluationError(f"{name} requires exactly 2 arguments")
+        left = self._numeric(self._evaluate(args[0]))
+        right = self._numeric(self._evaluate(args[1]))
+        if isinstance(left, float) and isinstance(right, float):
+            outcome = _COMPARISONS[name](np.array([left]), np.array([right]))
+            return 1.0 if bool(outcome[0]) else 0.0
+        left_array = np.broadcast_to(left, (self._size,))
+        right_array = np.broadcast_to(right, (self._size,))
+        known = ~(np.isnan(left_array) | np.isnan(right_array))
+        outcome = _COMPARISONS[name](left_array, right_array)
+        return np.where(known, outcome.astype(np.float64), np.nan)
+
+    def _numeric(self, value: _Value) -> float | FloatArray:
+        if isinstance(value, np.ndarray):
+            return value
+        return _as_float(value)
+
+    def _if(self, args: list[ASTNode]) -> _Value:
+        if len(args) < 2:
+            raise DslEvaluationError("if requires at least 2 arguments")
+        condition = self._evaluate(args[0])
+        else_node = args[2] if len(args) > 2 else None
+        if not isinstance(condition, np.ndarray):
+            # Date-independent condition: evaluate only the taken branch
+            if _truthy(condition):
+                return self._evaluate(args[1])
+            if else_node is None:
+                raise DslEvaluationError(
+                    "if-condition evaluated to false but no else branch provided."
+                )
+            return self._evaluate(else_node)
+
+        known = ~np.isnan(condition)
+        take_then = known & (condition != 0)
+        take_else = known & ~take_then
+        then_value = self._evaluate(args[1])
+        if else_node is None:
+            then_portfolio = self._to_portfolio(then_value)
+            return replace(then_portfolio, valid=then_portfolio.valid & take_then, name=None)
+        else_value = self._evaluate(else_node)
+
+        if _is_numeric(then_value) and _is_numeric(else_value):
+            then_numbers = np.broadcast_to(self._numeric(then_value), (self._size,))
+            else_numbers = np.broadcast_to(self._numeric(else_value), (self._size,))
+            return np.where(take_then, then_numbers, np.where(take_else, else_numbers, np.nan))
+        if isinstance(then_value, str) and then_value == else_value:
+            return then_value
+
+        then_portfolio = self._to_portfolio(then_value)
+        else_portfolio = self._to_portfolio(else_value)
+        weights: dict[str, FloatArray] = {}
+        zeros = np.zeros(self._size)
+        for symbol in {**then_portfolio.weights, **else_portfolio.weights}:
+            weights[symbol] = np.where(
+                take_then,
+                then_portfolio.weights.get(symbol, zeros),
+                np.where(take_else, else_portfolio.weights.get(symbol, zeros), 0.0),
+            )
+        valid = (take_then & then_portfolio.valid) | (take_else & else_portfolio.valid)
+        same_kind = then_portfolio.kind == else_portfolio.kind
+        same_name = then_portfolio.name == else_portfolio.name
+        return _Portfolio(
+            weights=weights,
+            valid=valid,
+            name=then_portfolio.name if same_name else None,
+            kind=then_portfolio.kind if same_kind and same_name else "fragment",
+        )
+
+    # ---------- Indicators ----------
+
+    def _indicator(self, name: str, args: list[ASTNode]) -> FloatArray:
+        if not args:
+            raise DslEvaluationError(f"{name} requires a symbol argument")
+        symbol = self._evaluate(args[0])
+        if not isinstance(symbol, str):
+            raise DslEvaluationError(f"{name} symbol must be string, got {type(symbol)}")
+        if name == "current-price":
+            return self._indicator_array(symbol, "current_price", {})
+
+        method, spec = _INDICATOR_SPECS[name]
+        params: dict[str, _Value] = {}
+        if len(args) > 1:
+            evaluated = self._evaluate(args[1])
+            if not isinstance(evaluated, dict):
+                raise DslEvaluationError(f"Parameters must be dict, got {type(evaluated)}")
+            params = evaluated
+        elif name != "rsi":
+            raise DslEvaluationError(f"{name} requires symbol and parameters")
+
+        kwargs: dict[str, int] = {}
+        for dsl_key, kwarg, default in spec:
+            try:
+                kwargs[kwarg] = int(_as_float(params.get(dsl_key, float(default))))
+            except (ValueError, OverflowError):
+                kwargs[kwarg] = default
+        return self._indicator_array(symbol, method, kwargs)
+
+    # ---------- Portfolio construction ----------
+
+    def _to_portfolio(self, value: _Value) -> _Portfolio:
+        """Coerce an evaluated value into weight columns."""
+        if isinstance(value, _Portfolio):
+            return value
+        if isinstance(value, str):
+            return self._asset(value)
+        if isinstance(value, list):
+            items = [self._to_portfolio(item) for item in _unwrap(value)] if value else []
+            return self._equal_share(items, skip_empty=False)
+        if isinstance(value, dict):
+            weights: dict[str, FloatArray] = {
+                sym: np.full(self._size, _as_float(w), dtype=np.float64)
+                for sym, w in value.items()
+                if not isinstance(w, np.ndarray)
+            }
+            return _Portfolio(weights=weights, valid=np.ones(self._size, dtype=bool))
+        raise DslEvaluationError(
+            f"Evaluation produced invalid type for allocation: {type(value).__name__}"
+        )
+
+    def _asset(self, symbol: str) -> _Portfolio:
+        return _Portfolio(
+            weights={symbol: np.ones(self._size)},
+            valid=np.ones(self._size, dtype=bool),
+            name=symbol,
+            kind="asset",
+        )
+
+    def _equal_share(self, children: list[_Portfolio], *, skip_empty: bool) -> _Portfolio:
+        """Merge normalized children, each taking an equal share per date."""
+        valid = np.ones(self._size, dtype=bool)
+        count = np.zeros(self._size)
+        normalized: list[_Portfolio] = []
+        for child in children:
+            valid &= child.valid
+            child_normalized = child.normalized(self._size)
+            normalized.append(child_normalized)
+            if skip_empty:
+                count += child.total(self._size) > 0
+            else:
+                count += 1.0
+        share = np.divide(1.0, count, out=np.zeros(self._size), where=count > 0)
+        weights: dict[str, FloatArray] = {}
+        for child in normalized:
+            for symbol, column in child.weights.items():
+                weights[symbol] = weights.get(symbol, np.zeros(self._size)) + column * share
+        if skip_empty:
+            valid &= count > 0
+        return _Portfolio(weights=weights, valid=valid)
+
+    def _group(self, args: list[ASTNode]) -> _Value:
+        if len(args) < 2:
+            raise DslEvaluationError("group requires at least 2 arguments")
+        name_value = self._evaluate(args[0])
+        group_name = name_value if isinstance(name_value, str) else str(name_value)
+        last: _Value = None
+        for expr in args[1:]:
+            last = self._evaluate(expr)
+        last = _unwrap_single(last)
+        if last is None:
+            return _Portfolio(weights={}, valid=np.ones(self._size, dtype=bool))
+        if isinstance(last, _Portfolio | str | dict):
+            return replace(self._to_portfolio(last), name=group_name, kind="group")
+        return last
+
+    def _weight_equal(self, args: list[ASTNode]) -> _Portfolio:
+        if not args:
+            raise DslEvaluationError("weight-equal requires at least one asset argument")
+        children: list[_Portfolio] = []
+        for arg in args:
+            children.extend(self._flatten(self._evaluate(arg)))
+        if not children:
+            raise DslEvaluationError("DSL weight-equal received no assets after evaluation")
+        return self._equal_share(children, skip_empty=True)
+
+    def _flatten(self, value: _Value) -> list[_Portfolio]:
+        """Split a value into weight-equal children (lists are one child per item)."""
+        if isinstance(value, _Portfolio | str):
+            return [self._to_portfolio(value)]
+        if isinstance(value, list):
+            children: list[_Portfolio] = []
+            for item in value:
+                children.extend(self._flatten(item))
+            return children
+        return []
+
+    def _weight_specified(self, args: list[ASTNode]) -> _Portfolio:
+        if len(args) < 2 or len(args) % 2:
+            raise DslEvaluationError(
+                "weight-specified requires pairs of weight and asset arguments"
+            )
+        valid = np.ones(self._size, dtype=bool)
+        weights: dict[str, FloatArray] = {}
+        for weight_node, asset_node in zip(args[::2], args[1::2], strict=True):
+            weight = self._numeric(self._evaluate(weight_node))
+            child = self._normalize_fragment(self._evaluate(asset_node))
+            valid &= child.valid & (child.total(self._size) > 0)
+            for symbol, column in child.weights.items():
+                weights[symbol] = weights.get(symbol, np.zeros(self._size)) + column * weight
+        return _Portfolio(weights=weights, valid=valid)
+
+    def _normalize_fragment(self, value: _Value) -> _Portfolio:
+        """Vectorized _normalize_fragment_weights: list items share equally."""
+        if isinstance(value, _Portfolio | str):
+            return self._to_portfolio(value).normalized(self._size)
+        if isinstance(value, list):
+            items: list[_Portfolio] = []
+            for item in value:
+                item = _unwrap_single(item)
+                if isinstance(item, _Portfolio | str):
+                    items.append(self._to_portfolio(item))
+                elif isinstance(item, list):
+                    items.append(self._normalize_fragment(item))
+            return self._equal_share(items, skip_empty=False)
+        return _Portfolio(weights={}, valid=np.ones(self._size, dtype=bool))
+
+    def _weight_inverse_volatility(self, args: list[ASTNode]) -> _Portfolio:
+        if not args:
+            raise DslEvaluationError("weight-inverse-volatility requires window and assets")
+        window = int(_as_float(self._evaluate(args[0])))
+        values = [self._evaluate(arg) for arg in args[1:]]
+        groups = _collect_groups(values)
+
+        zeros = np.zeros(self._size)
+        valid = np.ones(self._size, dtype=bool)
+        inverse_total = np.zeros(self._size)
+        if groups:
+            inverses: list[tuple[_Portfolio, FloatArray]] = []
+            for group_portfolio in groups:
+                valid &= group_portfolio.valid
+                vol_sum = np.zeros(self._size)
+                weight_sum = np.zeros(self._size)
+                for symbol, column in group_portfolio.weights.items():
+                    vol = self._volatility(symbol, window)
+                    usable = ~np.isnan(vol)
+                    vol_sum += np.where(usable, column * np.nan_to_num(vol), 0.0)
+                    weight_sum += np.where(usable, column, 0.0)
+                group_vol = np.divide(vol_sum, weight_sum, out=zeros.copy(), where=weight_sum > 0)
+                inverse = np.divide(1.0, group_vol, out=zeros.copy(), where=group_vol > 0)
+                inverses.append((group_portfolio, inverse))
+                inverse_total += inverse
+            weights: dict[str, FloatArray] = {}
+            for group_portfolio, inverse in inverses:
+                share = np.divide(inverse, inverse_total, out=zeros.copy(), where=inverse_total > 0)
+                for symbol, column in group_portfolio.weights.items():
+                    weights[symbol] = weights.get(symbol, zeros) + share * column
+        else:
+            present: dict[str, BoolArray] = {}
+            for value in values:
+                for portfolio in self._flatten(value):
+                    valid &= portfolio.valid
+                    for symbol, column in portfolio.weights.items():
+                        present[symbol] = present.get(symbol, np.zeros(self._size, dtype=bool)) | (
+                            column > 0
+                        )
+            if not present:
+                raise DslEvaluationError("DSL weight-inverse-volatility received no assets")
+            inverses_by_symbol: dict[str, FloatArray] = {}
+            for symbol, mask in present.items():
+                vol = self._volatility(symbol, window)
+                inverse = np.divide(1.0, vol, out=zeros.copy(), where=mask & (vol > 0))
+                inverses_by_symbol[symbol] = inverse
+                inverse_total += inverse
+            weights = {
+                symbol: np.divide(inverse, inverse_total, out=zeros.copy(), where=inverse_total > 0)
+                for symbol, inverse in inverses_by_symbol.items()
+            }
+        valid &= inverse_total >= _MIN_TOTAL_INVERSE
+        return _Portfolio(weights=weights, valid=valid)
+
+    def _volatility(self, symbol: str, window: int) -> FloatArray:
+        """stdev-return per date, NaN where unavailable or non-positive."""
+        vol = self._indicator_array(symbol, "stdev_return", {"window": window})
+        return np.where(vol > 0, vol, np.nan)
+
+    # ---------- Filter ----------
+
+    def _filter(self, args: list[ASTNode]) -> _Portfolio:
+        if len(args) not in (2, 3):
+            raise DslEvaluationError(
+                "filter requires 2 or 3 arguments: condition, [selection], portfolio"
+            )
+        condition = args[0]
+        selection = args[1] if len(args) == 3 else None
+        candidates_value = self._evaluate(args[2] if len(args) == 3 else args[1])
+
+        take_top = True
+        limit: int | None = None
+        if selection is not None:
+            head = selection.children[0] if selection.is_list() and selection.children else None
+            take_top = not (head is not None and head.get_symbol_name() == "select-bottom")
+            try:
+                limit = int(_as_float(self._evaluate(selection)))
+            except (ValueError, OverflowError):
+                limit = None
+
+        items = (
+            [_unwrap_single(item) for item in candidates_value]
+            if isinstance(candidates_value, list)
+            else []
+        )
+        portfolio_items = [item for item in items if isinstance(item, _Portfolio)]
+        is_portfolio_list = any(item.kind != "asset" for item in portfolio_items) and all(
+            isinstance(item, _Portfolio | str) for item in items
+        )
+        if is_portfolio_list:
+            candidates = [self._to_portfolio(item) for item in items]
+            return self._select_portfolios(candidates, condition, take_top=take_top, limit=limit)
+        return self._select_symbols(candidates_value, condition, take_top=take_top, limit=limit)
+
+    def _symbol_scores(self, condition: ASTNode, symbol: str) -> FloatArray:
+        """Per-date filter score of one symbol, NaN where it cannot be scored."""
+        try:
+            value = self._evaluate(create_indicator_with_symbol(condition, symbol))
+            return np.broadcast_to(self._numeric(value), (self._size,)).astype(np.float64)
+        except (ValueError, TypeError, DslEvaluationError) as exc:
+            logger.debug("Backtest filter: cannot score symbol", symbol=symbol, error=str(exc))
+            return np.full(self._size, np.nan)
+
+    def _select_symbols(
+        self, value: _Value, condition: ASTNode, *, take_top: bool, limit: int | None
+    ) -> _Portfolio:
+        """Asset-mode filter: rank symbols per date, equal-weight the selection."""
+        valid = np.ones(self._size, dtype=bool)
+        eligible: dict[str, BoolArray] = {}
+        for portfolio in self._flatten(value):
+            valid &= portfolio.valid
+            for symbol, column in portfolio.weights.items():
+                eligible[symbol] = eligible.get(symbol, np.zeros(self._size, dtype=bool)) | (
+                    column > 0
+                )
+        if not eligible:
+            return _Portfolio(weights={}, valid=valid)
+
+        symbols = list(eligible)
+        scores = np.column_stack([self._symbol_scores(condition, symbol) for symbol in symbols])
+        scorable = np.column_stack([eligible[symbol] for symbol in symbols]) & ~np.isnan(scores)
+        name_rank = np.argsort(np.argsort(np.array(symbols)))
+        tiebreak = np.broadcast_to(name_rank, scores.shape)
+        selected, count = _rank_select(scores, scorable, tiebreak, take_top=take_top, limit=limit)
+        share = np.divide(1.0, count, out=np.zeros(self._size), where=count > 0)
+        weights = {symbol: selected[:, i] * share for i, symbol in enumerate(symbols)}
+        return _Portfolio(weights=weights, valid=valid)
+
+    def _select_portfolios(
+        self,
+        candidates: list[_Portfolio],
+        condition: ASTNode,
+        *,
+        take_top: bool,
+        limit: int | None,
+    ) -> _Portfolio:
+        """Portfolio-mode filter: score each candidate as a unit, merge the selection."""
+        valid = np.ones(self._size, dtype=bool)
+        for candidate in candidates:
+            valid &= candidate.valid
+
+        op_name = (
+            condition.children[0].get_symbol_name()
+            if condition.is_list() and condition.children
+            else None
+        )
+        invert = op_name == "max-drawdown" and len(condition.children) < 3
+        metric = _GROUP_METRICS.get(op_name or "")
+        window = self._condition_window(condition)
+
+        symbol_scores: dict[str, FloatArray] = {}
+
+        def per_symbol(candidate: _Portfolio) -> FloatArray:
+            weighted = np.zeros(self._size)
+            weight_sum = np.zeros(self._size)
+            for symbol, column in candidate.weights.items():
+                if symbol not in symbol_scores:
+                    symbol_scores[symbol] = self._symbol_scores(condition, symbol)
+                score = -symbol_scores[symbol] if invert else symbol_scores[symbol]
+                usable = (column > 0) & ~np.isnan(score)
+                weighted += np.where(usable, column * np.nan_to_num(score), 0.0)
+                weight_sum += np.where(usable, column, 0.0)
+            mean: FloatArray = np.divide(
+                weighted, weight_sum, out=np.full(self._size, np.nan), where=weight_sum > 0
+            )
+            return mean
+
+        columns: list[FloatArray] = []
+        for candidate in candidates:
+            score = per_symbol(candidate)
+            if candidate.kind == "group" and candidate.name and metric and window:
+                group_score = self._group_metric(candidate, metric, window)
+                if invert:
+                    group_score = -group_score
+                score = np.where(np.isnan(group_score), score, group_score)
+            empty = candidate.total(self._size) <= 0
+            columns.append(np.where(empty, np.nan, score))
+        scores = np.column_stack(columns)
+
+        all_symbols = sorted({symbol for candidate in candidates for symbol in candidate.weights})
+        rank_of = {symbol: i for i, symbol in enumerate(all_symbols)}
+        tiebreak: npt.NDArray[np.int64] = np.column_stack(
+            [
+                np.min(
+                    [
+                        np.where(column > 0, rank_of[symbol], len(all_symbols))
+                        for symbol, column in candidate.weights.items()
+                    ]
+                    or [np.full(self._size, len(all_symbols))],
+                    axis=0,
+                )
+                for candidate in candidates
+            ]
+        ).astype(np.int64)
+        selected, count = _rank_select(
+            scores, ~np.isnan(scores), tiebreak, take_top=take_top, limit=limit
+        )
+        share = np.divide(1.0, count, out=np.zeros(self._size), where=count > 0)
+        weights: dict[str, FloatArray] = {}
+        for i, candidate in enumerate(candidates):
+            factor = selected[:, i] * share
+            for symbol, column in candidate.weights.items():
+                weights[symbol] = weights.get(symbol, np.zeros(self._size)) + column * factor
+        return _Portfolio(weights=weights, valid=valid)
+
+    def _condition_window(self, condition: ASTNode) -> int | None:
+        """Window parameter of a filter condition like (stdev-return {:window 10})."""
+        if not condition.is_list() or len(condition.children) < 2:
+            return None
+        try:
+            params = self._evaluate(condition.children[1])
+        except DslEvaluationError:
+            return None
+        if isinstance(params, dict) and isinstance(params.get("window"), float | int):
+            return int(_as_float(params["window"]))
+        return None
+
+    def _group_metric(self, group_portfolio: _Portfolio, metric: str, window: int) -> FloatArray:
+        """Score a group from its own daily return stream, NaN until `window` returns exist.
+
+        The return on date t is the group's last valid nonempty allocation
+        before t applied to each holding's bar return on t, weighted over the
+        holdings that have one -- the stream in-process group scoring builds
+        by replaying the group date by date.
+        """
+        size = self._size
+        signal = group_portfolio.valid & (group_portfolio.total(size) > 0)
+        last_signal = np.maximum.accumulate(np.where(signal, np.arange(size), -1))
+        held_from = np.full(size, -1)
+        held_from[1:] = last_signal[:-1]
+        has_position = held_from >= 0
+        source = np.where(has_position, held_from, 0)
+
+        weighted = np.zeros(size)
+        weight_sum = np.zeros(size)
+        for symbol, column in group_portfolio.weights.items():
+            held = np.where(has_position, column[source], 0.0)
+            bar_return = self._bar_return_array(symbol)
+            usable = (held > 0) & ~np.isnan(bar_return)
+            weighted += np.where(usable, held * np.nan_to_num(bar_return), 0.0)
+            weight_sum += np.where(usable, held, 0.0)
+        returns = np.divide(weighted, weight_sum, out=np.full(size, np.nan), where=weight_sum > 0)
+        return _rolling_group_metric(returns, metric, window)
+
+    # ---------- Simulation ----------
+
+    def _simulate(
+        self,
+        final: _Portfolio,
+        valid: BoolArray,
+        first: int,
+        initial_capital: float,
+        cost_bps: float,
+    ) -> BacktestResult:
+        """Hold each close's target weights over the next day and compound."""
+        symbols = sorted(symbol for symbol, column in final.weights.items() if column.any())
+        dates = self._dates[first:]
+        index = pd.DatetimeIndex(dates.astype("datetime64[ns]"), name="date")
+        size = len(dates)
+        targets = (
+            np.column_stack([final.weights[symbol][first:] for symbol in symbols])
+            if symbols
+            else np.zeros((size, 0))
+        )
+        row_valid = valid[first:]
+
+        # Hold the last valid allocation through invalid dates (cash before the first)
+        last_valid = np.maximum.accumulate(np.where(row_valid, np.arange(size), -1))
+        held = np.where((last_valid >= 0)[:, None], targets[np.maximum(last_valid, 0)], 0.0)
+
+        closes = (
+            np.column_stack(
+                [self._indicator_array(symbol, "current_price", {})[first:] for symbol in symbols]
+            )
+            if symbols
+            else np.zeros((size, 0))
+        )
+        asset_returns = np.zeros_like(closes)
+        if size > 1:
+            asset_returns[1:] = np.nan_to_num(closes[1:] / closes[:-1] - 1.0)
+
+        daily = np.zeros(size)
+        if size > 1:
+            daily[1:] = np.sum(held[:-1] * asset_returns[1:], axis=1)
+        turnover = np.abs(np.diff(held, axis=0, prepend=np.zeros((1, len(symbols))))).sum(axis=1)
+        daily -= turnover * cost_bps / 10_000.0
+        equity = initial_capital * np.cumprod(1.0 + daily)
+
+        weights_frame = pd.DataFrame(targets, index=index, columns=symbols)
+        weights_frame.loc[~row_valid, :] = np.nan
+        invalid_dates = [pd.Timestamp(d).date() for d in dates[~row_valid]]
+        return BacktestResult(
+            weights=weights_frame,
+            returns=pd.Series(daily, index=index, name="return"),
+            equity=pd.Series(equity, index=index, name="equity"),
+            invalid_dates=invalid_dates,
+        )
+
+
+# ---------- Helpers ----------
+
+
+def _as_float(value: object) -> float:
+    """Coerce a scalar DSL value to float (non-numeric values count as 0, as in as_decimal)."""
+    if isinstance(value, bool):
+        return 1.0 if value else 0.0
+    if isinstance(value, int | float):
+        return float(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(Decimal(value))
+        except InvalidOperation:
+            return 0.0
+    return 0.0
+
+
+def _is_numeric(value: _Value) -> bool:
+    return isinstance(value, float | int | np.ndarray)
+
+
+def _truthy(value: _Value) -> bool:
+    if isinstance(value, float):
+        return not math.isnan(value) and value != 0.0
+    return bool(value)
+
+
+def _unwrap_single(value: _Value) -> _Value:
+    """Unwrap single-element lists (syntax artifacts like [[group]])."""
+    while isinstance(value, list) and len(value) == 1:
+        value = value[0]
+    return value
+
+
+def _unwrap(values: list[_Value]) -> list[_Value]:
+    return [_unwrap_single(value) for value in values]
+
+
+def _collect_groups(values: list[_Value]) -> list[_Portfolio]:
+    """Grouped-mode children of weight-inverse-volatility, or [] for flat mode."""
+    groups: list[_Portfolio] = []
+    for value in values:
+        value = _unwrap_single(value)
+        items = value if isinstance(value, list) else [value]
+        for item in items:
+            item = _unwrap_single(item)
+            if not isinstance(item, _Portfolio) or item.kind == "asset":
+                return []
+            groups.append(item)
+    return groups
+
+
+def _collect_symbols(ast: ASTNode) -> list[str]:
+    """Symbols referenced by asset and indicator nodes (they define the date axis)."""
+    symbols: dict[str, None] = {}
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if not node.is_list() or not node.children:
+            continue
+        head = node.children[0].get_symbol_name() if node.children[0].is_symbol() else None
+        is_reference = head == "asset" or head == "current-price" or head in _INDICATOR_SPECS
+        if is_reference and len(node.children) > 1 and node.children[1].is_atom():
+            value = node.children[1].get_atom_value()
+            if isinstance(value, str):
+                symbols[value] = None
+        stack.extend(node.children)
+    return list(symbols)
+
+
+def _rank_select(
+    scores: FloatArray,
+    scorable: BoolArray,
+    tiebreak: npt.NDArray[np.int64],
+    *,
+    take_top: bool,
+    limit: int | None,
+) -> tuple[FloatArray, FloatArray]:
+    """Rank candidates per date and mark the selected ones.
+
+    Args:
+        scores: Candidate scores (dates x candidates)
+        scorable: Candidates that can be ranked on each date
+        tiebreak: Secondary ascending sort key (alphabetical rank)
+        take_top: True sorts scores descending, False ascending
+        limit: Maximum number selected per date (None/negative: all)
+
+    Returns:
+        Tuple of (selected as 1.0/0.0 per cell, number selected per date)
+
+    """
+    primary = np.where(scorable, -scores if take_top else scores, np.inf)
+    order = np.lexsort((tiebreak, primary), axis=-1)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(scores.shape[1])[None, :], axis=1)
+    available = scorable.sum(axis=1)
+    chosen = available if limit is None or limit < 0 else np.minimum(available, limit)
+    selected = scorable & (ranks < chosen[:, None])
+    return selected.astype(np.float64), chosen.astype(np.float64)
+
+
+def _rolling_group_metric(returns: FloatArray, metric: str, window: int) -> FloatArray:
+    """Apply a group_scoring metric to the last `window` available returns of each date."""
+    size = len(returns)
+    result = np.full(size, np.nan)
+    available = np.flatnonzero(~np.isnan(returns))
+    if window < 1 or len(available) < window:
+        return result
+    compact = returns[available]
+    windows = np.lib.stride_tricks.sliding_window_view(compact, window)
+
+    if metric == "moving_average_return":
+        values = windows.mean(axis=1) * 100.0
+    elif metric == "cumulative_return":
+        values = (np.prod(1.0 + windows, axis=1) - 1.0) * 100.0
+    elif metric == "stdev_return":
+        values = (windows * 100.0).std(axis=1, ddof=0) * _ANNUALISATION_SQRT_252
+    elif metric == "max_drawdown":
+        equity = np.cumprod(1.0 + windows, axis=1)
+        peak = np.maximum(np.maximum.accumulate(equity, axis=1), 1.0)
+        values = np.max((peak - equity) / peak, axis=1) * 100.0
+    elif metric == "rsi":
+        prices = 100.0 * np.cumprod(1.0 + windows, axis=1)
+        deltas = np.diff(np.concatenate([np.full((len(windows), 1), 100.0), prices], axis=1))
+        gains = np.maximum(deltas, 0.0)
+        losses = np.maximum(-deltas, 0.0)
+        alpha = 1.0 / window
+        avg_gain = gains[:, 0]
+        avg_loss = losses[:, 0]
+        for i in range(1, window):
+            avg_gain = alpha * gains[:, i] + (1.0 - alpha) * avg_gain
+            avg_loss = alpha * losses[:, i] + (1.0 - alpha) * avg_loss
+        ratio = np.divide(avg_gain, avg_loss, out=np.zeros(len(windows)), where=avg_loss > 0)
+        values = np.where(avg_loss > 0, 100.0 - 100.0 / (1.0 + ratio), 100.0)
+    else:
+        return result
+
+    # Returns available through each date; the metric needs `window` of them
+    counts = np.searchsorted(available, np.arange(size), side="right")
+    ready = counts >= window
+    result[ready] = values[counts[ready] - window]
+    return result
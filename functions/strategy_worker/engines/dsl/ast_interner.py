@@ -0,0 +1,217 @@
+"""Business Unit: strategy | Status: current.
+
+Hash-consing for DSL ASTs.
+
+The large strategies are mostly copy-pasted subtrees: ftl_starburst.clj
+parses to ~34k nodes of which only ~2k are structurally distinct, and the
+same ``(group "X" ...)`` bodies and indicator conditions recur dozens of
+times. ``AstInterner`` builds each distinct subtree once and returns that
+shared node for every later occurrence, so parser and compiled-artifact
+output is a DAG rather than a tree.
+
+Nodes are identified by a stable structural digest (BLAKE2b-128 over the
+node kind and value for atoms, over the children's digests for lists).
+Digests depend only on structure, never on object identity or process, so
+the same subtree hashes identically in every parse and every worker.
+
+Sharing nodes is safe because ASTNode is frozen and operators never mutate
+a node's children in place. ``shared_subtrees`` selects the nodes worth
+memoizing during evaluation: those whose operator is pure and which occur
+more than once in the strategy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Collection
+from decimal import Decimal
+
+from the_alchemiser.shared.schemas.ast_node import ASTNode
+
+# Bytes of BLAKE2b output per structural digest
+STRUCTURAL_DIGEST_SIZE = 16
+
+# One-byte kind prefixes; list digests concatenate fixed-width child digests,
+# so every encoding is unambiguous
+_KIND_SYMBOL = b"S"
+_KIND_STRING = b"T"
+_KIND_DECIMAL = b"D"
+_KIND_LIST = b"L"
+_KIND_MAP = b"M"
+
+_MAP_METADATA = {"node_subtype": "map"}
+
+
+def _digest(data: bytes) -> bytes:
+    """Return the structural digest of an encoded node."""
+    return hashlib.blake2b(data, digest_size=STRUCTURAL_DIGEST_SIZE).digest()
+
+
+def _atom_key(node: ASTNode) -> bytes:
+    """Encode a symbol or atom node for hashing."""
+    value = node.value
+    if node.is_symbol():
+        return _KIND_SYMBOL + str(value).encode()
+    if isinstance(value, Decimal):
+        # str() keeps "1.0" and "1" distinct, as the parser does
+        return _KIND_DECIMAL + str(value).encode()
+    return _KIND_STRING + str(value).encode()
+
+
+def _is_map(node: ASTNode) -> bool:
+    """Check if a list node is a map literal."""
+    return node.metadata is not None and node.metadata.get("node_subtype") == "map"
+
+
+def structural_digest(node: ASTNode, memo: dict[int, bytes] | None = None) -> bytes:
+    """Return the structural digest of a subtree.
+
+    Args:
+        node: Subtree root
+        memo: Optional id(node) -> digest cache; shared subtrees of a DAG are
+            then hashed once
+
+    Returns:
+        STRUCTURAL_DIGEST_SIZE-byte digest, equal for structurally equal subtrees
+
+    """
+    memo = {} if memo is None else memo
+    # Iterative postorder: deep strategies would exhaust the recursion limit
+    stack: list[tuple[ASTNode, bool]] = [(node, False)]
+    while stack:
+        current, expanded = stack.pop()
+        key = id(current)
+        if key in memo:
+            continue
+        if not current.is_list():
+            memo[key] = _digest(_atom_key(current))
+        elif expanded:
+            kind = _KIND_MAP if _is_map(current) else _KIND_LIST
+            memo[key] = _digest(kind + b"".join(memo[id(child)] for child in current.children))
+        else:
+            stack.append((current, True))
+            stack.extend((child, False) for child in current.children)
+    return memo[id(node)]
+
+
+class AstInterner:
+    """Builds ASTNodes so that structurally equal subtrees are one object.
+
+    Nodes are built through ``ASTNode.trusted``; callers (the parser and the
+    compiled AST loader) must pass values exactly as validation would leave
+    them. An interner holds every node it returns, so use one per parse.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty interning table."""
+        self._atoms: dict[bytes, ASTNode] = {}
+        self._lists: dict[bytes, ASTNode] = {}
+        # id(node) -> structural digest, for every node this interner returned
+        self._digests: dict[int, bytes] = {}
+
+    def __len__(self) -> int:
+        """Return the number of distinct nodes built."""
+        return len(self._digests)
+
+    def symbol(self, name: str) -> ASTNode:
+        """Return the shared symbol node for name."""
+        return self._atom(_KIND_SYMBOL + name.encode(), "symbol", name)
+
+    def atom(self, value: str | Decimal) -> ASTNode:
+        """Return the shared atom node for a string or Decimal value."""
+        if isinstance(value, Decimal):
+            return self._atom(_KIND_DECIMAL + str(value).encode(), "atom", value)
+        return self._atom(_KIND_STRING + value.encode(), "atom", value)
+
+    def list_node(self, children: list[ASTNode], *, is_map: bool = False) -> ASTNode:
+        """Return the shared list (or map literal) node for children.
+
+        Args:
+            children: Child nodes, each previously returned by this interner
+            is_map: Whether the list is a ``{...}`` map literal
+
+        Returns:
+            Existing node with the same structure, or a new node owning children
+
+        """
+        digests = self._digests
+        kind = _KIND_MAP if is_map else _KIND_LIST
+        digest = _digest(kind + b"".join(digests[id(child)] for child in children))
+        node = self._lists.get(digest)
+        if node is None:
+            node = ASTNode.trusted(
+                "list", children=children, metadata=dict(_MAP_METADATA) if is_map else None
+            )
+            self._lists[digest] = node
+            digests[id(node)] = digest
+        return node
+
+    def digest(self, node: ASTNode) -> bytes:
+        """Return the structural digest of a node built by this interner."""
+        return self._digests[id(node)]
+
+    def _atom(self, key: bytes, node_type: str, value: str | Decimal) -> ASTNode:
+        """Return the shared leaf node for an encoded key."""
+        node = self._atoms.get(key)
+        if node is None:
+            node = ASTNode.trusted(node_type, value)
+            self._atoms[key] = node
+            self._digests[id(node)] = _digest(key)
+        return node
+
+
+def shared_subtrees(ast: ASTNode, operators: Collection[str]) -> dict[int, bytes]:
+    """Find repeated applications of the given operators.
+
+    Occurrences are counted structurally: two equal subtrees count twice
+    whether or not the AST was interned.
+
+    Args:
+        ast: Root of the strategy AST (tree or DAG)
+        operators: Operator symbols whose applications may be memoized
+
+    Returns:
+        id(node) -> structural digest for every application of one of
+        ``operators`` whose structure occurs more than once in the AST
+
+    """
+    digests: dict[int, bytes] = {}
+    structural_digest(ast, digests)
+
+    # Distinct nodes in reverse postorder: every parent precedes its children
+    order: list[ASTNode] = []
+    seen: set[int] = set()
+    stack: list[tuple[ASTNode, bool]] = [(ast, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        stack.append((node, True))
+        if node.is_list():
+            stack.extend((child, False) for child in node.children)
+    order.reverse()
+
+    # Propagate path counts from the root down the DAG
+    paths: dict[int, int] = {id(ast): 1}
+    occurrences: dict[bytes, int] = {}
+    for node in order:
+        count = paths[id(node)]
+        digest = digests[id(node)]
+        occurrences[digest] = occurrences.get(digest, 0) + count
+        if node.is_list():
+            for child in node.children:
+                paths[id(child)] = paths.get(id(child), 0) + count
+
+    shared: dict[int, bytes] = {}
+    for node in order:
+        if not node.is_list() or not node.children:
+            continue
+        head = node.children[0].get_symbol_name()
+        digest = digests[id(node)]
+        if head in operators and occurrences[digest] > 1:
+            shared[id(node)] = digest
+    return shared
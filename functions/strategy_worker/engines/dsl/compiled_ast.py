@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Business Unit: strategy | Status: current.
+
+Compiled AST artifacts for DSL strategy files.
+
+Parsing the large .clj strategies (ftl_starburst.clj is ~2.2 MB) is a
+significant share of strategy worker cold-start latency. This module
+serializes a parsed ASTNode tree into a compact binary artifact at
+build/deploy time so the DSL engine can load it instead of re-parsing.
+
+Artifact layout:
+    MAGIC (6 bytes) | FORMAT_VERSION (1 byte) | SHA-256 of .clj source (32 bytes)
+    | zlib-compressed marshal payload
+
+The payload mirrors the parser's hash-consed DAG: each distinct subtree is
+encoded once and repeats are written as marshal back-references, and the
+loader interns nodes again (engines.dsl.ast_interner), so a loaded AST
+shares subtrees exactly as a freshly parsed one does.
+
+Each artifact is keyed by the content hash of the .clj file it was compiled
+from. A hash mismatch (file edited after compilation), an unknown format
+version, or a corrupt payload makes the loader return None so callers fall
+back to the S-expression parser.
+
+Artifacts live in a ``compiled/`` directory inside the strategies directory,
+mirroring the relative path of each strategy file, e.g.
+``strategies/ftlt/holy_grail.clj`` -> ``strategies/compiled/ftlt/holy_grail.clj.astc``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import zlib
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from engines.dsl.ast_interner import AstInterner
+from engines.dsl.sexpr_parser import SexprParser, paused_gc
+
+from the_alchemiser.shared.logging import get_logger
+from the_alchemiser.shared.schemas.ast_node import ASTNode
+
+logger = get_logger(__name__)
+
+COMPILED_AST_MAGIC = b"ALCAST"
+# Bump whenever the payload encoding or the parser's output shape changes so
+# artifacts built by an older toolchain are rejected instead of misread.
+COMPILED_AST_FORMAT_VERSION = 1
+COMPILED_AST_DIRNAME = "compiled"
+COMPILED_AST_SUFFIX = ".astc"
+
+_DIGEST_SIZE = hashlib.sha256().digest_size
+_HEADER_SIZE = len(COMPILED_AST_MAGIC) + 1 + _DIGEST_SIZE
+
+# Payload node tags (kept as small ints so marshal output stays compact)
+_TAG_SYMBOL = 0
+_TAG_STRING = 1
+_TAG_DECIMAL = 2
+_TAG_LIST = 3
+_TAG_MAP = 4
+
+_MAP_METADATA = {"node_subtype": "map"}
+
+type _Payload = tuple[Any, ...]
+
+
+def source_digest(content: bytes) -> bytes:
+    """Return the SHA-256 digest used to key a compiled artifact.
+
+    Args:
+        content: Raw bytes of the .clj source file
+
+    Returns:
+        32-byte SHA-256 digest
+
+    """
+    return hashlib.sha256(content).digest()
+
+
+def compiled_artifact_relpath(strategy_file: str) -> str:
+    """Return the artifact path for a strategy file, relative to the strategies root.
+
+    Args:
+        strategy_file: Strategy path relative to the strategies root (e.g. "ftlt/holy_grail.clj")
+
+    Returns:
+        Relative artifact path (e.g. "compiled/ftlt/holy_grail.clj.astc")
+
+    """
+    return f"{COMPILED_AST_DIRNAME}/{strategy_file}{COMPILED_AST_SUFFIX}"
+
+
+def _encode_node(node: ASTNode, memo: dict[int, _Payload]) -> _Payload:
+    """Encode an ASTNode into the nested-tuple payload format.
+
+    Shared nodes map to one shared payload tuple (memo is keyed by id(node)),
+    which marshal writes once and back-references thereafter.
+    """
+    payload = memo.get(id(node))
+    if payload is not None:
+        return payload
+    if node.is_symbol():
+        payload = (_TAG_SYMBOL, node.value)
+    elif node.is_atom():
+        if isinstance(node.value, Decimal):
+            payload = (_TAG_DECIMAL, str(node.value))
+        elif isinstance(node.value, str):
+            payload = (_TAG_STRING, node.value)
+        else:
+            raise ValueError(f"Cannot compile atom value of type {type(node.value).__name__}")
+    elif node.is_list():
+        if node.metadata is None:
+            tag = _TAG_LIST
+        elif node.metadata == _MAP_METADATA:
+            tag = _TAG_MAP
+        else:
+            raise ValueError(f"Cannot compile list metadata: {node.metadata}")
+        payload = (tag, tuple(_encode_node(child, memo) for child in node.children))
+    else:
+        raise ValueError(f"Cannot compile node type: {node.node_type}")
+    memo[id(node)] = payload
+    return payload
+
+
+def _decode_node(payload: _Payload, interner: AstInterner, memo: dict[int, ASTNode]) -> ASTNode:
+    """Decode a payload node back into an ASTNode.
+
+    Payloads are only ever produced from parser output, so nodes are built
+    through the interner's trusted (validation-free) path, as in the parser.
+    Back-referenced payloads are decoded once (memo is keyed by id(payload)).
+    """
+    node = memo.get(id(payload))
+    if node is not None:
+        return node
+    tag = payload[0]
+    if tag == _TAG_SYMBOL:
+        node = interner.symbol(payload[1])
+    elif tag == _TAG_STRING:
+        node = interner.atom(payload[1])
+    elif tag == _TAG_DECIMAL:
+        node = interner.atom(Decimal(payload[1]))
+    elif tag in (_TAG_LIST, _TAG_MAP):
+        node = interner.list_node(
+            [_decode_node(child, interner, memo) for child in payload[1]],
+            is_map=tag == _TAG_MAP,
+        )
+    else:
+        raise ValueError(f"Unknown compiled AST tag: {tag}")
+    memo[id(payload)] = node
+    return node
+
+
+def serialize_ast(ast: ASTNode, content: bytes) -> bytes:
+    """Serialize a parsed AST into a compiled artifact keyed by its source content.
+
+    Args:
+        ast: Parsed AST produced by SexprParser
+        content: Raw bytes of the .clj source the AST was parsed from
+
+    Returns:
+        Artifact bytes (header + compressed payload)
+
+    Raises:
+        ValueError: If the AST contains nodes the parser never produces
+
+    """
+    header = COMPILED_AST_MAGIC + bytes([COMPILED_AST_FORMAT_VERSION]) + source_digest(content)
+    body = zlib.compress(marshal.dumps(_encode_node(ast, {})), level=9)
+    return header + body
+
+
+def deserialize_ast(data: bytes, content: bytes) -> ASTNode | None:
+    """Load a compiled artifact if it matches the given source content.
+
+    Args:
+        data: Artifact bytes produced by serialize_ast
+        content: Raw bytes of the current .clj source
+
+    Returns:
+        The AST, or None if the artifact is stale, from another format
+        version, or corrupt (callers should fall back to parsing)
+
+    """
+    if len(data) < _HEADER_SIZE or not data.startswith(COMPILED_AST_MAGIC):
+        logger.warning("compiled_ast_invalid_header")
+        return None
+
+    version = data[len(COMPILED_AST_MAGIC)]
+    if version != COMPILED_AST_FORMAT_VERSION:
+        logger.info(
+            "compiled_ast_version_mismatch",
+            artifact_version=version,
+            expected_version=COMPILED_AST_FORMAT_VERSION,
+        )
+        return None
+
+    if data[len(COMPILED_AST_MAGIC) + 1 : _HEADER_SIZE] != source_digest(content):
+        logger.info("compiled_ast_hash_mismatch")
+        return None
+
+    try:
+        # Artifacts are produced by our own build step and shipped in the
+        # read-only Lambda layer; they are never loaded from untrusted input.
+        payload = marshal.loads(zlib.decompress(data[_HEADER_SIZE:]))  # noqa: S302  # nosec B302
+        with paused_gc():
+            return _decode_node(payload, AstInterner(), {})
+    except (zlib.error, EOFError, ValueError, TypeError, IndexError, ArithmeticError) as e:
+        logger.warning(
+            "compiled_ast_load_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return None
+
+
+def compile_strategy_file(
+    strategy_file: Path, output_file: Path, parser: SexprParser | None = None
+) -> int:
+    """Parse a .clj file and write its compiled artifact.
+
+    Args:
+        strategy_file: Path to the .clj source
+        output_file: Destination artifact path (parent directories are created)
+        parser: Optional parser instance to reuse across files
+
+    Returns:
+        Size of the written artifact in bytes
+
+    Raises:
+        SexprParseError: If the strategy file cannot be parsed
+
+    """
+    content = strategy_file.read_bytes()
+    ast = (parser or SexprParser()).parse(content.decode("utf-8"))
+    artifact = serialize_ast(ast, content)
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_bytes(artifact)
+    return len(artifact)
+
+
+def compile_strategies_directory(strategies_dir: Path) -> dict[str, int]:
+    """Compile every .clj file under a strategies directory.
+
+    Artifacts are written to ``<strategies_dir>/compiled/`` mirroring each
+    file's relative path. Artifacts for deleted strategies are removed so the
+    compiled directory never ships stale entries.
+
+    Args:
+        strategies_dir: Root strategies directory (the_alchemiser/shared/strategies)
+
+    Returns:
+        Mapping of relative strategy path to artifact size in bytes
+
+    """
+    parser = SexprParser()
+    compiled_dir = strategies_dir / COMPILED_AST_DIRNAME
+    results: dict[str, int] = {}
+    expected: set[Path] = set()
+
+    for strategy_file in sorted(strategies_dir.rglob("*.clj")):
+        if compiled_dir in strategy_file.parents:
+            continue
+        relative = strategy_file.relative_to(strategies_dir).as_posix()
+        output_file = strategies_dir / compiled_artifact_relpath(relative)
+        results[relative] = compile_strategy_file(strategy_file, output_file, parser)
+        expected.add(output_file)
+
+    if compiled_dir.exists():
+        for stale in compiled_dir.rglob(f"*{COMPILED_AST_SUFFIX}"):
+            if stale not in expected:
+                stale.unlink()
+
+    logger.info(
+        "compiled_strategies",
+        strategies_dir=str(strategies_dir),
+        count=len(results),
+        total_bytes=sum(results.values()),
+    )
+    return results
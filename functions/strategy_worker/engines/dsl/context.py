@@ -24,6 +24,9 @@ from the_alchemiser.shared.types.market_data_port import MarketDataPort
 
 if TYPE_CHECKING:
     from engines.dsl.events import DslEventPublisher
+    from engines.dsl.operators.group_cache_lookup import GroupHistoryCache
+    from engines.dsl.operators.group_scheduler import GroupReturnStore
+    from engines.dsl.operators.return_matrix import ReturnMatrix
 
 logger = get_logger(__name__)
 
@@ -35,6 +38,7 @@ type ScoringPath = Literal[
     "per_symbol_direct",
     "cache_unavailable",
     "in_process_fallback",
+    "scheduled",
 ]
 
 
@@ -192,8 +196,8 @@ class DslContext:
         self.market_data_service = market_data_service
         # Decision path stored as list of dicts for serialization compatibility.
         # Note: This is initialized here but immediately replaced with evaluator's
-        # shared list (see dsl_evaluator.py line 289) to ensure all contexts
-        # accumulate decisions to the same list.
+        # shared list (see DslEvaluator._new_context) so decisions accumulate
+        # on the evaluator even if a context is rebuilt mid-evaluation.
         self.decision_path: list[dict[str, Any]] = []
         # Fragile decisions: comparisons where values are near the threshold.
         # Each entry is a dict with condition, margin, left/right values.
@@ -205,6 +209,12 @@ class DslContext:
         # Nesting depth counter: incremented each time we enter a portfolio
         # filter, so nested group-of-group scoring can be diagnosed.
         self.portfolio_filter_depth: int = 0
+        # Evaluation-scoped group history cache; None means query DynamoDB directly
+        self.group_history: GroupHistoryCache | None = None
+        # Evaluation-scoped date x symbol returns for group backfill scoring
+        self.return_matrix: ReturnMatrix | None = None
+        # Group return series precomputed bottom-up by the group scheduler
+        self.group_returns: GroupReturnStore | None = None
 
     def add_debug_trace(
         self,
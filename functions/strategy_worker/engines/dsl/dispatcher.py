@@ -13,6 +13,7 @@ from collections.abc import Callable
 
 import structlog
 from engines.dsl.context import DslContext
+from engines.dsl.profiler import DslProfiler
 from engines.dsl.types import DslEvaluationError, DSLValue
 
 from the_alchemiser.shared.schemas.ast_node import ASTNode
@@ -35,6 +36,8 @@ class DslDispatcher:
     def __init__(self) -> None:
         """Initialize empty dispatcher."""
         self.symbol_table: dict[str, Callable[[list[ASTNode], DslContext], DSLValue]] = {}
+        # Set by the evaluator for profiled evaluations only
+        self.profiler: DslProfiler | None = None
 
     def register(self, symbol: str, func: Callable[[list[ASTNode], DslContext], DSLValue]) -> None:
         """Register a function for a DSL symbol.
@@ -79,7 +82,15 @@ class DslDispatcher:
             correlation_id=context.correlation_id,
             arg_count=len(args),
         )
-        return self.symbol_table[symbol](args, context)
+        profiler = self.profiler
+        if profiler is None:
+            return self.symbol_table[symbol](args, context)
+
+        profiler.enter(symbol, args)
+        try:
+            return self.symbol_table[symbol](args, context)
+        finally:
+            profiler.exit()
 
     def is_registered(self, symbol: str) -> bool:
         """Check if a symbol is registered.
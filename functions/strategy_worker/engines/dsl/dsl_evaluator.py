@@ -11,18 +11,25 @@ from __future__ import annotations
 
 import decimal
 import uuid
-from datetime import UTC, datetime
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
 from typing import Any
 
+from engines.dsl.ast_interner import shared_subtrees
 from engines.dsl.context import DebugTrace, DslContext, FilterTrace
 from engines.dsl.dispatcher import DslDispatcher
 from engines.dsl.events import DslEventPublisher
 from engines.dsl.operators.comparison import register_comparison_operators
 from engines.dsl.operators.control_flow import register_control_flow_operators
-from engines.dsl.operators.group_scoring import clear_evaluation_caches
+from engines.dsl.operators.group_cache_lookup import GroupHistoryCache, is_cache_available
+from engines.dsl.operators.group_scheduler import GroupReturnStore, schedule_group_returns
+from engines.dsl.operators.group_scoring import clear_evaluation_caches, collect_scored_group_ids
 from engines.dsl.operators.indicators import register_indicator_operators
 from engines.dsl.operators.portfolio import register_portfolio_operators
+from engines.dsl.operators.return_matrix import ReturnMatrix, collect_asset_symbols
 from engines.dsl.operators.selection import register_selection_operators
+from engines.dsl.profiler import DslProfiler, ProfiledIndicatorService
 from engines.dsl.types import DslEvaluationError, DSLValue
 
 from the_alchemiser.shared.events.bus import EventBus
@@ -30,7 +37,7 @@ from the_alchemiser.shared.logging import get_logger
 from the_alchemiser.shared.schemas.ast_node import ASTNode
 from the_alchemiser.shared.schemas.indicator_request import PortfolioFragment
 from the_alchemiser.shared.schemas.strategy_allocation import StrategyAllocation
-from the_alchemiser.shared.schemas.trace import Trace
+from the_alchemiser.shared.schemas.trace import Trace, TraceBuilder
 from the_alchemiser.shared.types.indicator_port import IndicatorPort
 
 logger = get_logger(__name__)
@@ -41,6 +48,24 @@ __all__ = [
     "IndicatorPort",
 ]
 
+# Operators whose result depends only on their subtree and the indicator
+# service's as_of_date, so repeated applications can share one evaluation
+MEMOIZED_OPERATORS = frozenset({"group", ">", "<", ">=", "<=", "="})
+
+# Result types safe to hand out more than once (immutable)
+_MEMOIZABLE_RESULTS = (bool, int, float, str, decimal.Decimal, PortfolioFragment, type(None))
+
+
+@dataclass(frozen=True, slots=True)
+class _MemoEntry:
+    """Memoized result plus what its first evaluation appended to the shared lists."""
+
+    result: DSLValue
+    decision_path: list[dict[str, Any]]
+    debug_traces: list[DebugTrace]
+    filter_traces: list[FilterTrace]
+    fragile_decisions: list[dict[str, Any]]
+
 
 class DslEvaluator:
     """Evaluator for DSL strategy expressions.
@@ -55,6 +80,7 @@ class DslEvaluator:
         event_bus: EventBus | None = None,
         *,
         debug_mode: bool = False,
+        profile: bool = False,
     ) -> None:
         """Initialize DSL evaluator.
 
@@ -62,11 +88,13 @@ class DslEvaluator:
             indicator_service: Service for computing indicators (IndicatorPort)
             event_bus: Optional event bus for publishing events
             debug_mode: If True, enables detailed condition tracing for debugging
+            profile: If True, profiles each evaluation (see engines.dsl.profiler)
 
         """
         self.indicator_service = indicator_service
         self.event_bus = event_bus
         self.debug_mode = debug_mode
+        self.profile = profile
         self.event_publisher = DslEventPublisher(event_bus)
 
         # Initialize dispatcher and register all operators
@@ -81,6 +109,20 @@ class DslEvaluator:
         self.filter_traces: list[FilterTrace] = []
         # Shared fragile decisions: comparisons where values are near thresholds
         self.fragile_decisions: list[dict[str, Any]] = []
+        # Group history cache owned by the running evaluation (None outside evaluate)
+        self.group_history: GroupHistoryCache | None = None
+        # Held-symbol return matrix for group backfill (None outside evaluate)
+        self.return_matrix: ReturnMatrix | None = None
+        # Nested group return series computed bottom-up (None outside evaluate)
+        self.group_returns: GroupReturnStore | None = None
+        # Single operator context reused by every list node of an evaluation
+        self._context: DslContext | None = None
+        # Profile of the latest evaluation (profiling mode only)
+        self.profiler: DslProfiler | None = None
+        # Repeated pure subtrees of the running evaluation: id(node) -> structural digest
+        self._memo_nodes: dict[int, bytes] = {}
+        # (structural digest, as_of_date) -> memoized result (see _evaluate_memoized)
+        self._subtree_memo: dict[tuple[bytes, date | None], _MemoEntry] = {}
 
     def _register_all_operators(self) -> None:
         """Register all DSL operators with the dispatcher."""
@@ -115,6 +157,12 @@ class DslEvaluator:
                 started_at=datetime.now(UTC),
             )
 
+        # Buffer entries and freeze them into the returned Trace once
+        builder = TraceBuilder(trace)
+
+        self.profiler = DslProfiler() if self.profile else None
+        self._attach_profiler(self.profiler)
+
         try:
             # Clear decision path and debug traces for new evaluation
             self.decision_path = []
@@ -126,8 +174,36 @@ class DslEvaluator:
             # prevent stale memoization data leaking across invocations.
             clear_evaluation_caches()
 
+            # Repeated conditions and groups are evaluated once per as_of_date
+            self._memo_nodes = shared_subtrees(ast, MEMOIZED_OPERATORS)
+            self._subtree_memo = {}
+
+            # Load every group a filter can score in one parallel prefetch
+            with self._phase("prefetch_group_history"):
+                self.group_history = self._prefetch_group_history(ast)
+
+            # Returns of every symbol the strategy can hold, built on first use
+            market_data_service = getattr(self.indicator_service, "market_data_service", None)
+            self.return_matrix = (
+                ReturnMatrix(
+                    market_data_service,
+                    collect_asset_symbols(ast),
+                    tail_rows=getattr(self.indicator_service, "lookback_plan", None),
+                )
+                if market_data_service is not None
+                else None
+            )
+
+            # One context per evaluation, shared by every function application
+            self.group_returns = GroupReturnStore()
+            self._context = self._new_context(correlation_id, trace)
+
+            # Score nested groups bottom-up before the top-down walk needs them
+            with self._phase("schedule_group_returns"):
+                schedule_group_returns(ast, self._context)
+
             # Add trace entry for evaluation start
-            trace = trace.add_entry(
+            builder.add_entry(
                 step_id=str(uuid.uuid4()),
                 step_type="evaluation_start",
                 description="Starting DSL evaluation",
@@ -183,7 +259,7 @@ class DslEvaluator:
                 )
 
             # Add final trace entry
-            trace = trace.add_entry(
+            builder.add_entry(
                 step_id=str(uuid.uuid4()),
                 step_type="evaluation_complete",
                 description="DSL evaluation completed successfully",
@@ -199,11 +275,11 @@ class DslEvaluator:
                     correlation_id=correlation_id,
                 )
 
-            return allocation, trace
+            return allocation, builder.build()
 
         except Exception as e:
             # Add error trace entry
-            trace = trace.add_entry(
+            builder.add_entry(
                 step_id=str(uuid.uuid4()),
                 step_type="evaluation_error",
                 description=f"DSL evaluation failed: {e}",
@@ -211,6 +287,60 @@ class DslEvaluator:
             )
             raise DslEvaluationError(f"DSL evaluation failed: {e}") from e
 
+        finally:
+            # Persist backfilled returns buffered during this evaluation
+            if self.group_history is not None:
+                with self._phase("flush_group_history"):
+                    self.group_history.flush()
+                self.group_history = None
+            self.return_matrix = None
+            self.group_returns = None
+            self._context = None
+            if self._subtree_memo:
+                logger.debug(
+                    "subtree_memo_summary",
+                    shared_subtrees=len(self._memo_nodes),
+                    memoized_results=len(self._subtree_memo),
+                    correlation_id=correlation_id,
+                )
+            self._memo_nodes = {}
+            self._subtree_memo = {}
+            if self.profiler is not None:
+                self.profiler.finish()
+                self._attach_profiler(None)
+
+    def _attach_profiler(self, profiler: DslProfiler | None) -> None:
+        """Route dispatcher frames and indicator requests to a profiler (or stop)."""
+        self.dispatcher.profiler = profiler
+        if isinstance(self.indicator_service, ProfiledIndicatorService):
+            self.indicator_service.profiler = profiler
+
+    def _phase(self, name: str) -> AbstractContextManager[None]:
+        """Return a profiler frame for an evaluation phase, or a no-op."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name)
+
+    def _prefetch_group_history(self, ast: ASTNode) -> GroupHistoryCache | None:
+        """Create this evaluation's group history cache and prefetch its groups.
+
+        Args:
+            ast: AST about to be evaluated
+
+        Returns:
+            Prefetched cache, or None when the group history table is not configured
+
+        """
+        if not is_cache_available():
+            return None
+        cache = GroupHistoryCache()
+        group_ids = collect_scored_group_ids(ast)
+        if group_ids:
+            # Anchor at as_of_date so historical evaluations load their own window
+            end_date = getattr(self.indicator_service, "as_of_date", None)
+            cache.prefetch(group_ids, end_date=end_date)
+        return cache
+
     def _evaluate_atom_node(self, node: ASTNode) -> DSLValue:
         """Evaluate an atom node.
 
@@ -300,6 +430,48 @@ class DslEvaluator:
         # Dispatch to operator function (raises DslEvaluationError if unknown)
         return self.dispatcher.dispatch(func_name, args, context)
 
+    def _evaluate_memoized(self, node: ASTNode, digest: bytes, context: DslContext) -> DSLValue:
+        """Evaluate a repeated pure subtree at most once per as_of_date.
+
+        Operators also append to the shared decision path, debug/filter traces
+        and fragile decisions. What the first evaluation appended is stored
+        with its result and replayed on every hit, so traces read exactly as
+        if each occurrence had been evaluated. Errors and mutable results are
+        never memoized.
+
+        Args:
+            node: Function application listed in ``_memo_nodes``
+            digest: Structural digest of node
+            context: DSL evaluation context
+
+        Returns:
+            Result of the function application
+
+        """
+        key = (digest, getattr(self.indicator_service, "as_of_date", None))
+        entry = self._subtree_memo.get(key)
+        if entry is not None:
+            self.decision_path.extend(entry.decision_path)
+            self.debug_traces.extend(entry.debug_traces)
+            self.filter_traces.extend(entry.filter_traces)
+            self.fragile_decisions.extend(entry.fragile_decisions)
+            return entry.result
+
+        decision_mark = len(self.decision_path)
+        debug_mark = len(self.debug_traces)
+        filter_mark = len(self.filter_traces)
+        fragile_mark = len(self.fragile_decisions)
+        result = self._evaluate_function_application(node, context)
+        if isinstance(result, _MEMOIZABLE_RESULTS):
+            self._subtree_memo[key] = _MemoEntry(
+                result=result,
+                decision_path=self.decision_path[decision_mark:],
+                debug_traces=self.debug_traces[debug_mark:],
+                filter_traces=self.filter_traces[filter_mark:],
+                fragile_decisions=self.fragile_decisions[fragile_mark:],
+            )
+        return result
+
     def _evaluate_list_elements(
         self, node: ASTNode, correlation_id: str, trace: Trace
     ) -> list[DSLValue]:
@@ -335,10 +507,31 @@ class DslEvaluator:
         if node.metadata and node.metadata.get("node_subtype") == "map":
             return self._evaluate_map_literal(node, correlation_id, trace)
 
+        # Function application: (func arg1 arg2 ...)
+        first_child = node.children[0]
+        if first_child.is_symbol():
+            context = self._get_context(correlation_id, trace)
+            digest = self._memo_nodes.get(id(node))
+            if digest is not None:
+                return self._evaluate_memoized(node, digest, context)
+            return self._evaluate_function_application(node, context)
+        # Evaluate each element and return as list
+        return self._evaluate_list_elements(node, correlation_id, trace)
+
+    def _new_context(self, correlation_id: str, trace: Trace) -> DslContext:
+        """Create an operator context bound to this evaluator's shared state.
+
+        Args:
+            correlation_id: Correlation ID for tracking
+            trace: Trace for logging
+
+        Returns:
+            Context sharing decision path and debug traces with the evaluator
+
+        """
         # Resolve market_data_service from the concrete IndicatorService if available
         market_data_service = getattr(self.indicator_service, "market_data_service", None)
 
-        # Create context for function applications
         context = DslContext(
             indicator_service=self.indicator_service,
             event_publisher=self.event_publisher,
@@ -348,18 +541,47 @@ class DslEvaluator:
             debug_mode=self.debug_mode,
             market_data_service=market_data_service,
         )
-        # Share decision_path and debug_traces with context so all contexts accumulate to the same list
+        # Share decision_path and debug_traces so all operators accumulate to the same list
         context.decision_path = self.decision_path
         context.debug_traces = self.debug_traces
         context.filter_traces = self.filter_traces
         context.fragile_decisions = self.fragile_decisions
+        context.group_history = self.group_history
+        context.return_matrix = self.return_matrix
+        context.group_returns = self.group_returns
+        return context
 
-        # Function application: (func arg1 arg2 ...)
-        first_child = node.children[0]
-        if first_child.is_symbol():
-            return self._evaluate_function_application(node, context)
-        # Evaluate each element and return as list
-        return self._evaluate_list_elements(node, correlation_id, trace)
+    def _get_context(self, correlation_id: str, trace: Trace) -> DslContext:
+        """Return the evaluation's context, rebuilding it only when stale.
+
+        The context built by ``evaluate`` is reused for every list node. Direct
+        ``_evaluate_node`` callers with a different correlation ID or trace, or
+        whose shared lists were reset since, get a fresh context cached in its place.
+
+        Args:
+            correlation_id: Correlation ID for tracking
+            trace: Trace for logging
+
+        Returns:
+            Context to dispatch function applications with
+
+        """
+        context = self._context
+        if (
+            context is None
+            or context.correlation_id != correlation_id
+            or context.trace is not trace
+            or context.decision_path is not self.decision_path
+            or context.debug_traces is not self.debug_traces
+            or context.filter_traces is not self.filter_traces
+            or context.fragile_decisions is not self.fragile_decisions
+            or context.group_history is not self.group_history
+            or context.group_returns is not self.group_returns
+            or (self.return_matrix is not None and context.return_matrix is not self.return_matrix)
+        ):
+            context = self._new_context(correlation_id, trace)
+            self._context = context
+        return context
 
     def _evaluate_node(self, node: ASTNode, correlation_id: str, trace: Trace) -> DSLValue:
         """Evaluate a single AST node.
@@ -21,11 +21,24 @@ if sys.version_info >= (3, 14):
 else:
     from importlib.abc import Traversable
 
+from engines.dsl.compiled_ast import compiled_artifact_relpath, deserialize_ast, source_digest
 from engines.dsl.dsl_evaluator import DslEvaluator
+from engines.dsl.evaluation_cache import EvaluationCache, EvaluationCacheKey
+from engines.dsl.lookback_planner import (
+    LookbackPlan,
+    LookbackPlannedIndicatorService,
+    plan_lookback,
+)
+from engines.dsl.operators.group_cache_lookup import group_history_watermarks
+from engines.dsl.operators.group_scoring import collect_scored_group_ids
 from engines.dsl.sexpr_parser import SexprParseError, SexprParser
+from engines.dsl.symbol_collector import collect_strategy_symbols
 from errors import StrategyV2Error
 
 from the_alchemiser.shared.constants import DSL_ENGINE_MODULE
+from the_alchemiser.shared.data_v2.indicator_result_store import (
+    get_shared_indicator_result_store,
+)
 from the_alchemiser.shared.events.base import BaseEvent
 from the_alchemiser.shared.events.bus import EventBus
 from the_alchemiser.shared.events.dsl_events import (
@@ -57,6 +70,9 @@ class DslEngine(EventHandler):
         market_data_adapter: MarketDataPort | None = None,
         *,
         debug_mode: bool = False,
+        profile: bool = False,
+        evaluation_cache: EvaluationCache | None = None,
+        lookback_parity: bool = False,
     ) -> None:
         """Initialize DSL engine.
 
@@ -66,6 +82,14 @@ class DslEngine(EventHandler):
             indicator_service: Optional pre-configured indicator service (for testing)
             market_data_adapter: Optional injected market data adapter (from DI container)
             debug_mode: If True, enables detailed condition tracing for debugging
+            profile: If True, profiles evaluations and attaches the summary to the
+                trace metadata under "profile"
+            evaluation_cache: Optional cache replaying results of evaluations whose
+                inputs are unchanged (bypassed while profiling)
+            lookback_parity: If True, indicator results computed from tail-only
+                (lookback-planned) histories are checked against full history and
+                the outcome is attached to the trace metadata under
+                "lookback_parity" (applies to the default indicator service)
 
         """
         from indicators.indicator_service import IndicatorService
@@ -73,6 +97,8 @@ class DslEngine(EventHandler):
         self.logger = get_logger(__name__)
         self.event_bus = event_bus
         self.debug_mode = debug_mode
+        self.profile = profile
+        self.evaluation_cache = None if profile else evaluation_cache
         # Store as-is (can be str, Path, or Traversable for Lambda layer)
         self.strategy_config_path = (
             strategy_config_path if strategy_config_path is not None else Path()
@@ -81,6 +107,12 @@ class DslEngine(EventHandler):
         # Track processed events for idempotency
         self._processed_events: set[str] = set()
 
+        # Symbols already prefetched into the market data adapter's stores
+        self._warmed_symbols: set[str] = set()
+
+        # SHA-256 of the most recently parsed strategy source
+        self._source_digest: bytes | None = None
+
         # Initialize components
         self.parser = SexprParser()
 
@@ -96,10 +128,17 @@ class DslEngine(EventHandler):
 
                 # Default adapter for testing/standalone use
                 market_data_adapter = CachedMarketDataAdapter()
-            # IndicatorService computes indicators locally using pandas/numpy
-            self.indicator_service = IndicatorService(market_data_service=market_data_adapter)
+            # IndicatorService computes indicators locally using pandas/numpy,
+            # sharing live results with other workers when a store is configured
+            self.indicator_service = IndicatorService(
+                market_data_service=market_data_adapter,
+                result_store=get_shared_indicator_result_store(),
+                lookback_parity=lookback_parity,
+            )
 
-        self.evaluator = DslEvaluator(self.indicator_service, event_bus, debug_mode=self.debug_mode)
+        self.evaluator = DslEvaluator(
+            self.indicator_service, event_bus, debug_mode=self.debug_mode, profile=self.profile
+        )
 
         # Subscribe to events if event bus provided
         if self.event_bus:
@@ -201,6 +240,28 @@ class DslEngine(EventHandler):
             # Parse strategy file
             ast = self._parse_strategy_file(strategy_config_path)
 
+            # Replay the stored result when no input has changed since it was computed
+            cache_key = self._evaluation_cache_key(strategy_config_path, ast, as_of_date)
+            if cache_key is not None and self.evaluation_cache is not None:
+                cached = self.evaluation_cache.get(cache_key, correlation_id)
+                if cached is not None:
+                    self.logger.info(
+                        "DSL strategy evaluation served from cache",
+                        extra={
+                            "correlation_id": correlation_id,
+                            "strategy_config_path": strategy_config_path,
+                            "cache_key": cache_key.digest,
+                            "component": "dsl_engine",
+                        },
+                    )
+                    return cached
+
+            # Live evaluations read only the trailing rows each symbol needs
+            plan = self._plan_lookback(ast, as_of_date)
+
+            # Fetch the strategy's whole universe up front, concurrently
+            self._warm_market_data(ast, plan)
+
             # Evaluate AST
             allocation, trace = self.evaluator.evaluate(ast, correlation_id)
 
@@ -226,6 +287,42 @@ class DslEngine(EventHandler):
                     }
                 )
 
+            # Attach the tail-vs-full-history comparison when parity checks run
+            if getattr(self.indicator_service, "lookback_parity", False):
+                trace = trace.model_copy(
+                    update={
+                        "metadata": {
+                            **trace.metadata,
+                            "lookback_parity": {
+                                "checked": getattr(
+                                    self.indicator_service, "lookback_parity_checks", 0
+                                ),
+                                "mismatches": list(
+                                    getattr(self.indicator_service, "lookback_mismatches", [])
+                                ),
+                            },
+                        }
+                    }
+                )
+
+            # Attach the evaluation profile when profiling is enabled
+            if self.evaluator.profiler is not None:
+                trace = trace.model_copy(
+                    update={
+                        "metadata": {
+                            **trace.metadata,
+                            "profile": self.evaluator.profiler.summary(),
+                        }
+                    }
+                )
+
+            if cache_key is not None and self.evaluation_cache is not None:
+                # Backfill writes flushed by this evaluation move the group
+                # watermark, so store under the inputs a rerun will now see
+                stored_key = self._evaluation_cache_key(strategy_config_path, ast, as_of_date)
+                if stored_key is not None:
+                    self.evaluation_cache.put(stored_key, allocation, trace)
+
             self.logger.debug(
                 "DSL strategy evaluation completed successfully",
                 extra={
@@ -255,6 +352,102 @@ class DslEngine(EventHandler):
                 strategy_path=strategy_config_path,
             ) from e
 
+    def _evaluation_cache_key(
+        self, strategy_config_path: str, ast: ASTNode, as_of_date: date | None
+    ) -> EvaluationCacheKey | None:
+        """Collect every input an evaluation of the strategy depends on.
+
+        Symbol versions come from the market data store's per-invocation
+        manifest snapshot, so building a key reads no bars.
+
+        Args:
+            strategy_config_path: Strategy file path
+            ast: Parsed strategy AST
+            as_of_date: Historical cutoff, or None for live evaluation
+
+        Returns:
+            Cache key, or None when caching is off or an input cannot be
+            versioned (missing symbol data, group history unavailable)
+
+        """
+        if self.evaluation_cache is None or self._source_digest is None:
+            return None
+        market_data_service = getattr(self.indicator_service, "market_data_service", None)
+        store = getattr(market_data_service, "market_data_store", None)
+        if store is None:
+            return None
+
+        symbols: list[tuple[str, str, int, str]] = []
+        for symbol in sorted(collect_strategy_symbols(ast)):
+            metadata = store.get_cached_metadata(symbol)
+            if metadata is None:
+                return None
+            symbols.append(
+                (symbol, metadata.last_bar_date, metadata.row_count, metadata.updated_at)
+            )
+
+        groups = group_history_watermarks(collect_scored_group_ids(ast), end_date=as_of_date)
+        if groups is None:
+            return None
+
+        return EvaluationCacheKey(
+            strategy=strategy_config_path,
+            source_digest=self._source_digest.hex(),
+            evaluated_on=datetime.now(UTC).date().isoformat(),
+            as_of_date=as_of_date.isoformat() if as_of_date else None,
+            debug_mode=self.debug_mode,
+            symbols=tuple(symbols),
+            groups=tuple(sorted(groups.items())),
+        )
+
+    def _plan_lookback(self, ast: ASTNode, as_of_date: date | None) -> LookbackPlan | None:
+        """Plan tail-only history loads for a live evaluation.
+
+        Historical evaluations (backfills over many dates) keep full
+        history: their dates reach arbitrarily far back.
+
+        Args:
+            ast: Parsed strategy AST
+            as_of_date: Historical cutoff, or None for live evaluation
+
+        Returns:
+            Trailing rows per symbol, or None when full history is loaded
+
+        """
+        if not isinstance(self.indicator_service, LookbackPlannedIndicatorService):
+            return None
+        plan = plan_lookback(ast) if as_of_date is None else None
+        self.indicator_service.lookback_plan = plan
+        return plan
+
+    def _warm_market_data(self, ast: ASTNode, plan: LookbackPlan | None = None) -> None:
+        """Prefetch market data for every symbol the strategy references.
+
+        Without this, each symbol's parquet is read from S3 the first time an
+        indicator asks for it, serially, in the middle of the tree walk.
+        Symbols already warmed by this engine are skipped, so repeated
+        evaluations (e.g. backfill over many dates) prefetch only once.
+
+        Args:
+            ast: Parsed strategy AST
+            plan: Lookback plan; planned symbols are decoded tail-only
+
+        """
+        market_data_service = getattr(self.indicator_service, "market_data_service", None)
+        warm_cache = getattr(market_data_service, "warm_cache", None)
+        if warm_cache is None:
+            return
+
+        symbols = [s for s in collect_strategy_symbols(ast) if s not in self._warmed_symbols]
+        if not symbols:
+            return
+        if plan:
+            warm_cache(symbols, tail_rows=plan)
+        else:
+            warm_cache(symbols)
+        # Tails do not serve full-history requests; re-warm those symbols later
+        self._warmed_symbols.update(s for s in symbols if not plan or s not in plan)
+
     def _handle_evaluation_request(self, event: StrategyEvaluationRequested) -> None:
         """Handle strategy evaluation request event.
 
@@ -304,6 +497,7 @@ class DslEngine(EventHandler):
             DslEngineError: If parsing fails
 
         """
+        self._source_digest = None
         try:
             # Handle different path types: Traversable (Lambda layer), Path, or str
             if isinstance(self.strategy_config_path, Traversable):
@@ -321,9 +515,19 @@ class DslEngine(EventHandler):
                     extra={"component": "dsl_engine", "strategy_file": strategy_config_path},
                 )
 
-                # Read file content and parse directly
-                file_content = strategy_file.read_text(encoding="utf-8")
-                return self.parser.parse(file_content)
+                # Read file content; prefer the compiled AST shipped alongside it
+                file_content = strategy_file.read_bytes()
+                self._source_digest = source_digest(file_content)
+                compiled = self._load_compiled_ast(
+                    self.strategy_config_path.joinpath(
+                        compiled_artifact_relpath(strategy_config_path)
+                    ),
+                    file_content,
+                    strategy_config_path,
+                )
+                if compiled is not None:
+                    return compiled
+                return self.parser.parse(file_content.decode("utf-8"))
             # Local filesystem: use Path operations
             base_path = (
                 Path(self.strategy_config_path)
@@ -342,6 +546,20 @@ class DslEngine(EventHandler):
                     strategy_path=strategy_config_path,
                 )
 
+            file_content = full_path.read_bytes()
+            self._source_digest = source_digest(file_content)
+
+            # Compiled artifacts are only shipped for files under the strategies root
+            if full_path.is_relative_to(base_path):
+                relative_path = full_path.relative_to(base_path).as_posix()
+                compiled = self._load_compiled_ast(
+                    base_path / compiled_artifact_relpath(relative_path),
+                    file_content,
+                    strategy_config_path,
+                )
+                if compiled is not None:
+                    return compiled
+
             self.logger.debug(
                 "Parsing strategy file",
                 extra={"component": "dsl_engine", "strategy_file": str(full_path)},
@@ -362,6 +580,52 @@ class DslEngine(EventHandler):
                 strategy_path=strategy_config_path,
             ) from e
 
+    def _load_compiled_ast(
+        self, artifact: Traversable, content: bytes, strategy_config_path: str
+    ) -> ASTNode | None:
+        """Load the precompiled AST for a strategy file if it is present and current.
+
+        Args:
+            artifact: Location of the compiled artifact (may not exist)
+            content: Raw bytes of the .clj source, used to verify the artifact hash
+            strategy_config_path: Strategy path (for logging)
+
+        Returns:
+            Parsed AST from the artifact, or None to fall back to the parser
+
+        """
+        try:
+            if not artifact.is_file():
+                self.logger.debug(
+                    "No compiled AST artifact, parsing strategy file",
+                    extra={"component": "dsl_engine", "strategy_file": strategy_config_path},
+                )
+                return None
+            ast = deserialize_ast(artifact.read_bytes(), content)
+        except OSError as e:
+            self.logger.warning(
+                "Failed to read compiled AST artifact, parsing strategy file",
+                extra={
+                    "component": "dsl_engine",
+                    "strategy_file": strategy_config_path,
+                    "error_message": str(e),
+                },
+            )
+            return None
+
+        if ast is None:
+            self.logger.warning(
+                "Compiled AST artifact is stale, parsing strategy file",
+                extra={"component": "dsl_engine", "strategy_file": strategy_config_path},
+            )
+            return None
+
+        self.logger.debug(
+            "Loaded compiled AST artifact",
+            extra={"component": "dsl_engine", "strategy_file": strategy_config_path},
+        )
+        return ast
+
     def _resolve_strategy_path(self, config_path: str, strategy_id: str) -> str:
         """Resolve strategy configuration path.
 
@@ -0,0 +1,322 @@
+"""Business Unit: strategy | Status: current.
+
+Whole-strategy evaluation cache.
+
+Strategy worker retries and manual re-invocations evaluate the same .clj
+against exactly the same bars. An evaluation is a pure function of
+
+    - the strategy source (hashed, as for compiled AST artifacts),
+    - the evaluation date and ``as_of_date`` cutoff,
+    - each referenced symbol's data version (last bar date, row count and
+      write time from the market data manifest),
+    - the cached history of every group a filter can score,
+
+so its result can be keyed by exactly those inputs and replayed. Any
+upstream change (a data refresh, a backfilled group day, an edited
+strategy) produces a different key; stale entries are never served and
+simply expire.
+
+Entries hold the StrategyAllocation and the trace metadata (decision path,
+filter traces); the replayed Trace carries no per-step entries.
+
+Backends:
+    - S3EvaluationCacheBackend: production; one JSON object per entry.
+    - LocalDirEvaluationCacheBackend: local stand-in; one JSON file per entry.
+
+The cache is optional and strictly best-effort: backend failures are logged
+and treated as misses, never raised to the caller.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+from the_alchemiser.shared.logging import get_logger
+from the_alchemiser.shared.schemas.strategy_allocation import StrategyAllocation
+from the_alchemiser.shared.schemas.trace import Trace
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
+
+logger = get_logger(__name__)
+
+# Environment variables selecting the backend (bucket takes precedence)
+EVALUATION_CACHE_BUCKET_ENV = "EVALUATION_CACHE_BUCKET"
+EVALUATION_CACHE_DIR_ENV = "EVALUATION_CACHE_DIR"
+
+# Bump whenever evaluation semantics change so results computed by older
+# engine code are never replayed.
+EVALUATION_CACHE_VERSION = 1
+
+# S3 key prefix for cache entries
+EVALUATION_CACHE_PREFIX = "evaluations"
+
+# Trace metadata never replayed from the cache
+_UNCACHED_METADATA = frozenset({"profile", "evaluation_cache"})
+
+# S3 exception types for error handling
+S3Exception = (ClientError, BotoCoreError)
+
+type EntryPayload = dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class EvaluationCacheKey:
+    """Every input an evaluation result depends on.
+
+    Attributes:
+        strategy: Strategy file path, used to name entries
+        source_digest: SHA-256 of the strategy source (hex)
+        evaluated_on: UTC date of the evaluation (YYYY-MM-DD)
+        as_of_date: Historical cutoff (YYYY-MM-DD), or None for live
+        debug_mode: Whether filter traces were collected
+        symbols: (symbol, last bar date, row count, updated at), sorted
+        groups: (group_id, history watermark), sorted
+
+    """
+
+    strategy: str
+    source_digest: str
+    evaluated_on: str
+    as_of_date: str | None
+    debug_mode: bool
+    symbols: tuple[tuple[str, str, int, str], ...]
+    groups: tuple[tuple[str, str], ...]
+
+    @property
+    def digest(self) -> str:
+        """Stable hash of the full key."""
+        canonical = json.dumps(
+            [
+                EVALUATION_CACHE_VERSION,
+                self.strategy,
+                self.source_digest,
+                self.evaluated_on,
+                self.as_of_date,
+                self.debug_mode,
+                [list(entry) for entry in self.symbols],
+                [list(entry) for entry in self.groups],
+            ],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+    @property
+    def entry_name(self) -> str:
+        """Backend entry name: sanitized strategy path plus digest."""
+        strategy = re.sub(r"[^A-Za-z0-9._-]", "_", self.strategy)
+        return f"{strategy}/{self.digest}.json"
+
+
+class EvaluationCacheBackend(Protocol):
+    """Storage for serialized evaluation results."""
+
+    def get(self, name: str) -> EntryPayload | None:
+        """Return the entry stored under name, or None if there is none."""
+        ...
+
+    def put(self, name: str, payload: EntryPayload) -> None:
+        """Store one entry; writing the same name twice is harmless."""
+        ...
+
+
+class S3EvaluationCacheBackend:
+    """Evaluation results as JSON objects in S3.
+
+    Entries live under ``<prefix>/<strategy>/<digest>.json``; expiry is left
+    to a bucket lifecycle rule.
+    """
+
+    def __init__(self, bucket_name: str, *, prefix: str = EVALUATION_CACHE_PREFIX) -> None:
+        """Initialize backend.
+
+        Args:
+            bucket_name: S3 bucket name
+            prefix: Key prefix for cache entries
+
+        """
+        self._bucket_name = bucket_name
+        self._prefix = prefix
+        self._s3: S3Client = boto3.client("s3")
+
+    def get(self, name: str) -> EntryPayload | None:
+        """Fetch one object (missing object = miss)."""
+        try:
+            response = self._s3.get_object(Bucket=self._bucket_name, Key=f"{self._prefix}/{name}")
+        except self._s3.exceptions.NoSuchKey:
+            return None
+        payload: EntryPayload = json.loads(response["Body"].read())
+        return payload
+
+    def put(self, name: str, payload: EntryPayload) -> None:
+        """Write one object."""
+        self._s3.put_object(
+            Bucket=self._bucket_name,
+            Key=f"{self._prefix}/{name}",
+            Body=json.dumps(payload, separators=(",", ":")).encode(),
+            ContentType="application/json",
+        )
+
+
+class LocalDirEvaluationCacheBackend:
+    """Evaluation results as JSON files in a directory.
+
+    Intended for local runs and tests. Files are written to a temporary name
+    and renamed into place, so concurrent readers never see a partial entry.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize backend, creating the directory if needed.
+
+        Args:
+            directory: Directory holding entry files
+
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, name: str) -> EntryPayload | None:
+        """Read one entry file (missing file = miss)."""
+        path = self._directory / name
+        if not path.exists():
+            return None
+        payload: EntryPayload = json.loads(path.read_text())
+        return payload
+
+    def put(self, name: str, payload: EntryPayload) -> None:
+        """Write one entry file atomically."""
+        path = self._directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")))
+        tmp.replace(path)
+
+
+class EvaluationCache:
+    """Replays evaluation results stored under an EvaluationCacheKey."""
+
+    def __init__(self, backend: EvaluationCacheBackend) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: Storage backend
+
+        """
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: EvaluationCacheKey, correlation_id: str
+    ) -> tuple[StrategyAllocation, Trace] | None:
+        """Return the stored result for key, re-stamped for this request.
+
+        Args:
+            key: Evaluation inputs
+            correlation_id: Correlation ID of the current request
+
+        Returns:
+            (allocation, trace) as first computed, or None on a miss
+
+        """
+        try:
+            payload = self.backend.get(key.entry_name)
+            result = _decode(payload, key, correlation_id) if payload is not None else None
+        except (*S3Exception, OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                "Evaluation cache read failed; evaluating",
+                strategy=key.strategy,
+                error=str(e),
+            )
+            result = None
+
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, key: EvaluationCacheKey, allocation: StrategyAllocation, trace: Trace) -> None:
+        """Store an evaluation result (best effort).
+
+        Args:
+            key: Evaluation inputs
+            allocation: Allocation produced by the evaluation
+            trace: Trace produced by the evaluation
+
+        """
+        try:
+            self.backend.put(key.entry_name, _encode(key, allocation, trace))
+        except (*S3Exception, OSError, TypeError, ValueError) as e:
+            logger.warning(
+                "Evaluation cache write failed",
+                strategy=key.strategy,
+                error=str(e),
+            )
+
+    @classmethod
+    def from_environment(cls) -> EvaluationCache | None:
+        """Build a cache from EVALUATION_CACHE_BUCKET or EVALUATION_CACHE_DIR.
+
+        Returns:
+            Configured cache, or None when neither variable is set
+
+        """
+        bucket_name = os.environ.get(EVALUATION_CACHE_BUCKET_ENV, "")
+        if bucket_name:
+            return cls(S3EvaluationCacheBackend(bucket_name))
+        directory = os.environ.get(EVALUATION_CACHE_DIR_ENV, "")
+        if directory:
+            return cls(LocalDirEvaluationCacheBackend(directory))
+        return None
+
+
+def _encode(key: EvaluationCacheKey, allocation: StrategyAllocation, trace: Trace) -> EntryPayload:
+    """Serialize an evaluation result to a JSON-compatible entry."""
+    metadata = {k: v for k, v in trace.metadata.items() if k not in _UNCACHED_METADATA}
+    return {
+        "version": EVALUATION_CACHE_VERSION,
+        "digest": key.digest,
+        "cached_at": datetime.now(UTC).isoformat(),
+        "allocation": allocation.model_dump(mode="json"),
+        # Round-trip through JSON so Decimals and other values become plain types
+        "metadata": json.loads(json.dumps(metadata, default=str)),
+    }
+
+
+def _decode(
+    payload: EntryPayload, key: EvaluationCacheKey, correlation_id: str
+) -> tuple[StrategyAllocation, Trace] | None:
+    """Rebuild (allocation, trace) from an entry, or None if it does not match key."""
+    if payload.get("version") != EVALUATION_CACHE_VERSION or payload.get("digest") != key.digest:
+        return None
+
+    now = datetime.now(UTC)
+    allocation = StrategyAllocation.model_validate_json(
+        json.dumps(
+            {**payload["allocation"], "correlation_id": correlation_id, "as_of": now.isoformat()}
+        )
+    )
+    trace = Trace(
+        trace_id=str(uuid.uuid4()),
+        correlation_id=correlation_id,
+        strategy_id="dsl_strategy",
+        started_at=now,
+        final_allocation=dict(allocation.target_weights),
+        metadata={
+            **payload["metadata"],
+            "evaluation_cache": {"hit": True, "key": key.digest, "cached_at": payload["cached_at"]},
+        },
+    ).mark_completed()
+    return allocation, trace
@@ -0,0 +1,216 @@
+"""Business Unit: strategy | Status: current.
+
+Minimal-lookback planning for live strategy evaluation.
+
+A live evaluation reads each symbol's latest bars only: indicators need the
+rows given by ``indicators.lookback.exact_lookback_rows``, and a filter over
+groups re-evaluates the groups on the trading days of its backfill window
+(at most _MAX_BACKFILL_CALENDAR_DAYS calendar days per nesting level), each
+such day reaching that much further back. ``plan_lookback`` walks the AST,
+tracks that depth, and returns per symbol the number of trailing rows that
+covers every use the evaluator can make of it, so market data can be read
+tail-only.
+
+Depth is counted in calendar days and added to row counts directly; a
+calendar day holds at most one bar, so the plan errs on the long side.
+
+The plan is an optimization, not a correctness boundary: symbols the walk
+cannot bound (an unknown indicator, a non-literal parameter) are left out
+and load full history, and IndicatorService and ReturnMatrix reload full
+history whenever a tail turns out too short for a request.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Protocol, runtime_checkable
+
+from engines.dsl.operators.group_scoring import backfill_calendar_days
+from indicators.lookback import exact_lookback_rows
+
+from the_alchemiser.shared.logging import get_logger
+from the_alchemiser.shared.schemas.ast_node import ASTNode
+
+logger = get_logger(__name__)
+
+type LookbackPlan = Mapping[str, int]
+
+# DSL indicator operator -> IndicatorRequest indicator type
+DSL_INDICATOR_TYPES = {
+    "rsi": "rsi",
+    "current-price": "current_price",
+    "moving-average-price": "moving_average",
+    "moving-average-return": "moving_average_return",
+    "cumulative-return": "cumulative_return",
+    "exponential-moving-average-price": "exponential_moving_average_price",
+    "stdev-return": "stdev_return",
+    "stdev-price": "stdev_price",
+    "max-drawdown": "max_drawdown",
+    "percentage-price-oscillator": "percentage_price_oscillator",
+    "percentage-price-oscillator-signal": "percentage_price_oscillator_signal",
+}
+
+# Closes behind one held-position daily return
+_RETURN_ROWS = 2
+
+
+@runtime_checkable
+class LookbackPlannedIndicatorService(Protocol):
+    """Indicator service that can load only a planned tail of each history."""
+
+    lookback_plan: LookbackPlan | None
+
+
+def _literal_parameters(node: ASTNode | None) -> dict[str, int] | None:
+    """Read a ``{:key value ...}`` map of literal numbers as request parameters.
+
+    Keys use the IndicatorRequest spelling (``:short-window`` -> short_window).
+    Returns None when the node is not a map of literal numbers.
+    """
+    if node is None:
+        return {}
+    if not node.is_list() or not node.metadata or node.metadata.get("node_subtype") != "map":
+        return None
+    params: dict[str, int] = {}
+    it = iter(node.children)
+    for key_node, val_node in zip(it, it, strict=False):
+        key = key_node.get_symbol_name() or key_node.get_atom_value()
+        value = val_node.get_atom_value()
+        if not isinstance(key, str) or not isinstance(value, Decimal):
+            return None
+        params[key.lstrip(":").replace("-", "_")] = int(value)
+    return params
+
+
+def _indicator_rows(operator: str | None, params_node: ASTNode | None) -> int | None:
+    """Rows a DSL indicator call needs, or None if it cannot be bounded."""
+    indicator_type = DSL_INDICATOR_TYPES.get(operator or "")
+    if indicator_type is None:
+        return None
+    params = _literal_parameters(params_node)
+    if params is None:
+        return None
+    return exact_lookback_rows(indicator_type, params)
+
+
+def _asset_symbols(node: ASTNode) -> list[str]:
+    """Return the literal symbols of every ``(asset "SYM" ...)`` under node."""
+    symbols: list[str] = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if not current.is_list() or not current.children:
+            continue
+        children = current.children
+        if children[0].get_symbol_name() == "asset" and len(children) > 1:
+            value = children[1].get_atom_value()
+            if isinstance(value, str) and value:
+                symbols.append(value)
+            continue
+        stack.extend(children)
+    return symbols
+
+
+class _Planner:
+    """Accumulates per-symbol row requirements over one AST walk."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, int] = {}
+        # Symbols with a use the walk could not bound
+        self.unbounded: set[str] = set()
+        # (id(node), depth) pairs already walked; shared subtrees recur
+        self._seen: set[tuple[int, int]] = set()
+
+    def need(self, symbol: str, rows: int | None, depth: int) -> None:
+        """Record that symbol is read for rows bars, depth days before the anchor."""
+        if rows is None:
+            self.unbounded.add(symbol)
+            return
+        self.rows[symbol] = max(self.rows.get(symbol, 0), rows + depth)
+
+    def walk(self, ast: ASTNode) -> None:
+        """Visit every node with the calendar depth it can be evaluated at."""
+        stack: list[tuple[ASTNode, int]] = [(ast, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if not node.is_list() or not node.children:
+                continue
+            key = (id(node), depth)
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+
+            children = node.children
+            head = children[0].get_symbol_name()
+            if head in DSL_INDICATOR_TYPES and len(children) > 1:
+                symbol = children[1].get_atom_value()
+                if isinstance(symbol, str) and symbol:
+                    params_node = children[2] if len(children) > 2 else None
+                    self.need(symbol, _indicator_rows(head, params_node), depth)
+            elif head == "asset" and len(children) > 1:
+                symbol = children[1].get_atom_value()
+                if isinstance(symbol, str) and symbol:
+                    # Held by a group scored over the window around this depth
+                    self.need(symbol, _RETURN_ROWS, depth)
+            elif head == "filter" and len(children) >= 3:
+                self._plan_filter(children, depth, stack)
+                continue
+            elif head == "weight-inverse-volatility" and len(children) >= 3:
+                window = children[1].get_atom_value()
+                rows = (
+                    exact_lookback_rows("stdev_return", {"window": int(window)})
+                    if isinstance(window, Decimal)
+                    else None
+                )
+                for symbol in _asset_symbols(node):
+                    self.need(symbol, rows, depth)
+            stack.extend((child, depth) for child in children)
+
+    def _plan_filter(
+        self, children: list[ASTNode], depth: int, stack: list[tuple[ASTNode, int]]
+    ) -> None:
+        """Plan a filter: metric reads at this depth, groups re-evaluated deeper."""
+        condition, candidates = children[1], children[-1]
+        operator = condition.children[0].get_symbol_name() if condition.is_list() else None
+        params_node = (
+            condition.children[1] if condition.is_list() and len(condition.children) > 1 else None
+        )
+        metric_rows = _indicator_rows(operator, params_node) if operator else None
+
+        # Scored groups are evaluated on each day of the backfill window
+        window = (_literal_parameters(params_node) or {}).get("window")
+        inner = depth + backfill_calendar_days(window or None)
+        # Per-symbol scoring reads the metric of every asset a candidate holds
+        for symbol in _asset_symbols(candidates):
+            self.need(symbol, metric_rows, inner)
+
+        stack.extend((child, depth) for child in children[1:-1])
+        stack.append((candidates, inner))
+
+
+def plan_lookback(ast: ASTNode) -> dict[str, int]:
+    """Plan the trailing rows a live evaluation of ast reads per symbol.
+
+    Args:
+        ast: Root AST node of a strategy (tree or DAG)
+
+    Returns:
+        Symbol -> trailing row count; symbols missing from the mapping need
+        full history
+
+    """
+    planner = _Planner()
+    planner.walk(ast)
+    plan = {
+        symbol: rows for symbol, rows in planner.rows.items() if symbol not in planner.unbounded
+    }
+    logger.debug(
+        "Planned minimal lookback",
+        extra={
+            "planned_symbols": len(plan),
+            "full_history_symbols": sorted(planner.unbounded),
+            "max_rows": max(plan.values(), default=0),
+        },
+    )
+    return plan
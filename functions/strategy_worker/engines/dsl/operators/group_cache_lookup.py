@@ -12,6 +12,11 @@ lookback window. The Group Cache Lambda evaluates each group daily and stores
 both the selections and the portfolio daily return. This module queries
 that cache.
 
+``GroupHistoryCache`` is the per-evaluation read-through layer over the same
+table: it prefetches every scorable group with parallel paginated queries,
+answers lookups from memory, and buffers backfill writes into one batched
+flush at the end of the evaluation.
+
 Invariants:
     - DynamoDB items contain ``portfolio_daily_return`` (Decimal string) when
       available, alongside ``selections`` ({symbol: weight}).
@@ -22,9 +27,14 @@ Invariants:
 
 from __future__ import annotations
 
+import hashlib
 import os
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal, InvalidOperation
+from typing import Any
 
 import boto3
 from botocore.exceptions import ClientError
@@ -39,6 +49,24 @@ GROUP_HISTORY_TABLE = os.environ.get("GROUP_HISTORY_TABLE", "")
 # Lazy-loaded DynamoDB client
 _dynamodb_table = None
 
+# Calendar days prefetched per group. Covers the widest scoring lookback
+# (window * 2.5 + 10) anchored anywhere in the 45-day on-demand backfill span.
+PREFETCH_LOOKBACK_DAYS = 120
+
+# Concurrent group queries issued by GroupHistoryCache.prefetch
+PREFETCH_MAX_WORKERS = 8
+
+# DynamoDB BatchWriteItem request limit
+BATCH_WRITE_MAX_ITEMS = 25
+
+# Requests per flush batch, including resends of unprocessed items
+FLUSH_MAX_ATTEMPTS = 5
+
+# Backoff before the first resend of unprocessed items (doubles each attempt)
+FLUSH_RETRY_BASE_SECONDS = 0.05
+
+type GroupItem = dict[str, Any]
+
 
 def get_dynamodb_table() -> object | None:
     """Get the DynamoDB table resource (lazy-loaded singleton)."""
@@ -49,6 +77,136 @@ def get_dynamodb_table() -> object | None:
     return _dynamodb_table
 
 
+def _query_group_items(
+    table: object,
+    group_id: str,
+    start_date: date,
+    end_date: date,
+    projection: str | None = None,
+) -> list[GroupItem]:
+    """Query every item of a group in a date range, following pagination."""
+    query: dict[str, Any] = {
+        "KeyConditionExpression": "group_id = :gid AND record_date BETWEEN :start AND :end",
+        "ExpressionAttributeValues": {
+            ":gid": group_id,
+            ":start": start_date.isoformat(),
+            ":end": end_date.isoformat(),
+        },
+    }
+    if projection:
+        query["ProjectionExpression"] = projection
+
+    items: list[GroupItem] = []
+    while True:
+        # Note: table is typed as object but is a DynamoDB Table resource
+        response = table.query(**query)  # type: ignore[attr-defined]
+        items.extend(response.get("Items", []))
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return items
+        query["ExclusiveStartKey"] = last_key
+
+
+def _selections_from_items(items: Iterable[GroupItem]) -> dict[str, dict[str, Decimal]]:
+    """Map record_date -> {symbol: weight} for items carrying selections."""
+    selections: dict[str, dict[str, Decimal]] = {}
+    for item in items:
+        record_date = item.get("record_date", "")
+        raw_selections = item.get("selections", {})
+        # Convert string weights back to Decimal
+        selections[record_date] = {
+            symbol: Decimal(str(weight)) for symbol, weight in raw_selections.items()
+        }
+    return selections
+
+
+def _returns_from_items(group_id: str, items: Iterable[GroupItem]) -> list[Decimal]:
+    """Extract portfolio daily returns from items, sorted oldest-first."""
+    returns: list[Decimal] = []
+    for item in sorted(items, key=lambda x: x.get("record_date", "")):
+        raw_return = item.get("portfolio_daily_return")
+        if raw_return is not None:
+            try:
+                returns.append(Decimal(str(raw_return)))
+            except (InvalidOperation, ValueError):
+                logger.warning(
+                    "Invalid portfolio_daily_return value",
+                    extra={
+                        "group_id": group_id,
+                        "record_date": item.get("record_date"),
+                        "raw_value": str(raw_return),
+                    },
+                )
+    return returns
+
+
+def _log_selections_result(
+    group_id: str, lookback_days: int, selections: dict[str, dict[str, Decimal]]
+) -> None:
+    if len(selections) == 0:
+        logger.warning(
+            "Group history cache returned ZERO records -- cache may not "
+            "be populated for this group",
+            extra={
+                "group_id": group_id,
+                "lookback_days": lookback_days,
+                "dates_found": 0,
+            },
+        )
+    else:
+        logger.debug(
+            "Cache lookup successful",
+            extra={
+                "group_id": group_id,
+                "lookback_days": lookback_days,
+                "dates_found": len(selections),
+            },
+        )
+
+
+def _log_returns_result(group_id: str, lookback_days: int, returns: list[Decimal]) -> None:
+    if len(returns) == 0:
+        logger.warning(
+            "Historical returns lookup returned ZERO records -- group "
+            "cache is empty or unpopulated for the requested window",
+            extra={
+                "group_id": group_id,
+                "lookback_days": lookback_days,
+                "returns_found": 0,
+            },
+        )
+    else:
+        logger.debug(
+            "Historical returns lookup successful",
+            extra={
+                "group_id": group_id,
+                "lookback_days": lookback_days,
+                "returns_found": len(returns),
+            },
+        )
+
+
+def _build_return_item(
+    group_id: str,
+    record_date: str,
+    selections: dict[str, str],
+    portfolio_daily_return: Decimal,
+    ttl_days: int,
+) -> GroupItem:
+    """Build the DynamoDB item written by on-demand backfill."""
+    ttl_epoch = int((datetime.now(UTC) + timedelta(days=ttl_days)).timestamp())
+    return {
+        "group_id": group_id,
+        "record_date": record_date,
+        "selections": selections,
+        "selection_count": len(selections),
+        "portfolio_daily_return": str(portfolio_daily_return),
+        "evaluated_at": datetime.now(UTC).isoformat(),
+        "source": "on_demand_backfill",
+        "ttl": ttl_epoch,
+    }
+
+
 def lookup_historical_selections(
     group_id: str,
     lookback_days: int,
@@ -89,44 +247,9 @@ def lookup_historical_selections(
     selections: dict[str, dict[str, Decimal]] = {}
 
     try:
-        # Query using KeyConditionExpression
-        # Note: table is typed as object but is a DynamoDB Table resource
-        response = table.query(  # type: ignore[attr-defined]
-            KeyConditionExpression=("group_id = :gid AND record_date BETWEEN :start AND :end"),
-            ExpressionAttributeValues={
-                ":gid": group_id,
-                ":start": start_date.isoformat(),
-                ":end": end_date.isoformat(),
-            },
-        )
-
-        for item in response.get("Items", []):
-            record_date = item.get("record_date", "")
-            raw_selections = item.get("selections", {})
-            # Convert string weights back to Decimal
-            selections[record_date] = {
-                symbol: Decimal(weight) for symbol, weight in raw_selections.items()
-            }
-
-        if len(selections) == 0:
-            logger.warning(
-                "Group history cache returned ZERO records -- cache may not "
-                "be populated for this group",
-                extra={
-                    "group_id": group_id,
-                    "lookback_days": lookback_days,
-                    "dates_found": 0,
-                },
-            )
-        else:
-            logger.debug(
-                "Cache lookup successful",
-                extra={
-                    "group_id": group_id,
-                    "lookback_days": lookback_days,
-                    "dates_found": len(selections),
-                },
-            )
+        items = _query_group_items(table, group_id, start_date, end_date)
+        selections = _selections_from_items(items)
+        _log_selections_result(group_id, lookback_days, selections)
 
     except ClientError as e:
         logger.warning(
@@ -191,57 +314,16 @@ def lookup_historical_returns(
     start_date = end_date - timedelta(days=lookback_days)
 
     try:
-        response = table.query(  # type: ignore[attr-defined]
-            KeyConditionExpression=("group_id = :gid AND record_date BETWEEN :start AND :end"),
-            ExpressionAttributeValues={
-                ":gid": group_id,
-                ":start": start_date.isoformat(),
-                ":end": end_date.isoformat(),
-            },
-            # Only fetch what we need
-            ProjectionExpression="record_date, portfolio_daily_return",
+        # Only fetch what we need
+        items = _query_group_items(
+            table,
+            group_id,
+            start_date,
+            end_date,
+            projection="record_date, portfolio_daily_return",
         )
-
-        items = response.get("Items", [])
-
-        # Sort by date (oldest first) and extract returns
-        items.sort(key=lambda x: x.get("record_date", ""))
-
-        returns: list[Decimal] = []
-        for item in items:
-            raw_return = item.get("portfolio_daily_return")
-            if raw_return is not None:
-                try:
-                    returns.append(Decimal(str(raw_return)))
-                except (InvalidOperation, ValueError):
-                    logger.warning(
-                        "Invalid portfolio_daily_return value",
-                        extra={
-                            "group_id": group_id,
-                            "record_date": item.get("record_date"),
-                            "raw_value": str(raw_return),
-                        },
-                    )
-
-        if len(returns) == 0:
-            logger.warning(
-                "Historical returns lookup returned ZERO records -- group "
-                "cache is empty or unpopulated for the requested window",
-                extra={
-                    "group_id": group_id,
-                    "lookback_days": lookback_days,
-                    "returns_found": 0,
-                },
-            )
-        else:
-            logger.debug(
-                "Historical returns lookup successful",
-                extra={
-                    "group_id": group_id,
-                    "lookback_days": lookback_days,
-                    "returns_found": len(returns),
-                },
-            )
+        returns = _returns_from_items(group_id, items)
+        _log_returns_result(group_id, lookback_days, returns)
         return returns
 
     except ClientError as e:
@@ -263,6 +345,70 @@ def is_cache_available() -> bool:
     return bool(GROUP_HISTORY_TABLE and get_dynamodb_table() is not None)
 
 
+def group_history_watermarks(
+    group_ids: Iterable[str],
+    *,
+    end_date: date | None = None,
+    lookback_days: int = PREFETCH_LOOKBACK_DAYS,
+    max_workers: int = PREFETCH_MAX_WORKERS,
+) -> dict[str, str] | None:
+    """Fingerprint the cached history of many groups over the prefetch window.
+
+    Each fingerprint hashes the (record_date, portfolio_daily_return,
+    selections) of every item in the window, so any write that could change
+    a filter score -- a new day, a backfilled gap, a restated return --
+    changes it.
+
+    Args:
+        group_ids: Groups to fingerprint
+        end_date: End of the window (default: today UTC)
+        lookback_days: Calendar days before end_date, as loaded by prefetch
+        max_workers: Maximum concurrent queries
+
+    Returns:
+        group_id -> "<item count>:<digest>" (empty when the table is not
+        configured), or None if any query failed
+
+    """
+    group_ids = sorted(set(group_ids))
+    table = get_dynamodb_table()
+    if not group_ids or table is None:
+        return {}
+    if end_date is None:
+        end_date = datetime.now(UTC).date()
+    start_date = end_date - timedelta(days=lookback_days)
+
+    def fingerprint(group_id: str) -> str:
+        items = _query_group_items(
+            table,
+            group_id,
+            start_date,
+            end_date,
+            projection="record_date, portfolio_daily_return, selections",
+        )
+        canonical = sorted(
+            (
+                str(item.get("record_date", "")),
+                str(item.get("portfolio_daily_return", "")),
+                sorted((str(sym), str(w)) for sym, w in item.get("selections", {}).items()),
+            )
+            for item in items
+        )
+        digest = hashlib.sha256(repr(canonical).encode()).hexdigest()[:16]
+        return f"{len(items)}:{digest}"
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(group_ids))) as pool:
+            watermarks = list(pool.map(fingerprint, group_ids))
+    except Exception as e:
+        logger.warning(
+            "Failed to fingerprint group history",
+            extra={"groups": len(group_ids), "error": str(e)},
+        )
+        return None
+    return dict(zip(group_ids, watermarks, strict=True))
+
+
 def write_historical_return(
     group_id: str,
     record_date: str,
@@ -292,20 +438,11 @@ def write_historical_return(
         logger.warning("Cannot write to group cache: table not available")
         return False
 
-    ttl_epoch = int((datetime.now(UTC) + timedelta(days=ttl_days)).timestamp())
-
     try:
         table.put_item(  # type: ignore[attr-defined]
-            Item={
-                "group_id": group_id,
-                "record_date": record_date,
-                "selections": selections,
-                "selection_count": len(selections),
-                "portfolio_daily_return": str(portfolio_daily_return),
-                "evaluated_at": datetime.now(UTC).isoformat(),
-                "source": "on_demand_backfill",
-                "ttl": ttl_epoch,
-            },
+            Item=_build_return_item(
+                group_id, record_date, selections, portfolio_daily_return, ttl_days
+            ),
         )
         logger.debug(
             "Wrote historical return to cache",
@@ -337,3 +474,284 @@ def write_historical_return(
             },
         )
         return False
+
+
+class GroupHistoryCache:
+    """Read-through, write-behind view of the group history table for one evaluation.
+
+    ``prefetch`` loads every group an evaluation can score with parallel
+    paginated queries. Lookups are then answered from memory; a lookup whose
+    window falls outside a group's loaded range widens that range with one
+    more query. Backfill writes are visible to later lookups immediately and
+    are persisted together by ``flush``.
+
+    Not thread-safe; use one cache per evaluation.
+    """
+
+    def __init__(self, table: object | None = None) -> None:
+        """Initialize cache.
+
+        Args:
+            table: DynamoDB Table resource (default: GROUP_HISTORY_TABLE)
+
+        """
+        self._table = table if table is not None else get_dynamodb_table()
+        # group_id -> record_date -> item
+        self._items: dict[str, dict[str, GroupItem]] = {}
+        # group_id -> (start, end) date range held in memory
+        self._loaded: dict[str, tuple[date, date]] = {}
+        # (group_id, record_date) -> item awaiting flush
+        self._pending: dict[tuple[str, str], GroupItem] = {}
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of buffered writes not yet flushed."""
+        return len(self._pending)
+
+    def prefetch(
+        self,
+        group_ids: Iterable[str],
+        *,
+        end_date: date | None = None,
+        lookback_days: int = PREFETCH_LOOKBACK_DAYS,
+        max_workers: int = PREFETCH_MAX_WORKERS,
+    ) -> int:
+        """Load history for many groups with parallel paginated queries.
+
+        Groups whose query fails stay unloaded and are queried on first lookup.
+
+        Args:
+            group_ids: Groups to load
+            end_date: End of the loaded range (default: today UTC)
+            lookback_days: Calendar days to load before end_date
+            max_workers: Maximum concurrent queries
+
+        Returns:
+            Number of groups loaded
+
+        """
+        if self._table is None:
+            return 0
+        if end_date is None:
+            end_date = datetime.now(UTC).date()
+        start_date = end_date - timedelta(days=lookback_days)
+
+        missing = sorted(
+            gid for gid in set(group_ids) if not self._covers(gid, start_date, end_date)
+        )
+        if not missing:
+            return 0
+
+        def fetch(group_id: str) -> list[GroupItem] | None:
+            try:
+                return _query_group_items(self._table, group_id, start_date, end_date)
+            except Exception as e:
+                logger.warning(
+                    "Failed to prefetch group history",
+                    extra={"group_id": group_id, "error": str(e)},
+                )
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+            results = list(pool.map(fetch, missing))
+
+        loaded = 0
+        for group_id, items in zip(missing, results, strict=True):
+            if items is not None:
+                self._store(group_id, items, start_date, end_date)
+                loaded += 1
+
+        logger.info(
+            "Prefetched group history cache",
+            extra={
+                "groups_requested": len(missing),
+                "groups_loaded": loaded,
+                "lookback_days": lookback_days,
+                "end_date": end_date.isoformat(),
+            },
+        )
+        return loaded
+
+    def lookup_historical_selections(
+        self,
+        group_id: str,
+        lookback_days: int,
+        end_date: date | None = None,
+    ) -> dict[str, dict[str, Decimal]]:
+        """Look up historical selections, as ``lookup_historical_selections``."""
+        items = self._items_in_range(group_id, lookback_days, end_date)
+        if items is None:
+            return {}
+        selections = _selections_from_items(items)
+        _log_selections_result(group_id, lookback_days, selections)
+        return selections
+
+    def lookup_historical_returns(
+        self,
+        group_id: str,
+        lookback_days: int,
+        end_date: date | None = None,
+    ) -> list[Decimal]:
+        """Look up historical daily returns, as ``lookup_historical_returns``."""
+        items = self._items_in_range(group_id, lookback_days, end_date)
+        if items is None:
+            return []
+        returns = _returns_from_items(group_id, items)
+        _log_returns_result(group_id, lookback_days, returns)
+        return returns
+
+    def count_returns(
+        self,
+        group_id: str,
+        lookback_days: int,
+        end_date: date | None = None,
+    ) -> int:
+        """Count cached daily returns in a window without per-lookup logging."""
+        items = self._items_in_range(group_id, lookback_days, end_date)
+        if items is None:
+            return 0
+        return sum(1 for item in items if item.get("portfolio_daily_return") is not None)
+
+    def write_historical_return(
+        self,
+        group_id: str,
+        record_date: str,
+        selections: dict[str, str],
+        portfolio_daily_return: Decimal,
+        *,
+        ttl_days: int = 30,
+    ) -> bool:
+        """Buffer a historical return entry until ``flush``.
+
+        The entry is visible to lookups on this cache straight away.
+
+        Returns:
+            True if the entry was buffered, False if the table is unavailable.
+
+        """
+        if self._table is None:
+            logger.warning("Cannot write to group cache: table not available")
+            return False
+
+        item = _build_return_item(
+            group_id, record_date, selections, portfolio_daily_return, ttl_days
+        )
+        self._pending[(group_id, record_date)] = item
+        self._items.setdefault(group_id, {})[record_date] = item
+        return True
+
+    def flush(self) -> int:
+        """Persist buffered writes with batched requests.
+
+        Items DynamoDB leaves unprocessed are resent with backoff; items still
+        unwritten after FLUSH_MAX_ATTEMPTS, or in a batch whose request
+        failed, are dropped and logged at error level with their count.
+
+        Returns:
+            Number of items written (0 if nothing was pending)
+
+        """
+        if not self._pending or self._table is None:
+            return 0
+
+        items = list(self._pending.values())
+        self._pending.clear()
+        dropped = 0
+        for start in range(0, len(items), BATCH_WRITE_MAX_ITEMS):
+            dropped += self._write_batch(items[start : start + BATCH_WRITE_MAX_ITEMS])
+
+        written = len(items) - dropped
+        if dropped:
+            logger.error(
+                "Dropped buffered group history writes",
+                extra={"items": len(items), "written": written, "dropped": dropped},
+            )
+        logger.info(
+            "Flushed buffered group history writes",
+            extra={"items": written, "groups": len({item["group_id"] for item in items})},
+        )
+        return written
+
+    def _write_batch(self, items: list[GroupItem]) -> int:
+        """Write up to BATCH_WRITE_MAX_ITEMS items; return how many were dropped."""
+        client = self._table.meta.client  # type: ignore[attr-defined]
+        table_name: str = self._table.name  # type: ignore[attr-defined]
+        requests: list[dict[str, Any]] = [{"PutRequest": {"Item": item}} for item in items]
+        for attempt in range(FLUSH_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(FLUSH_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+            try:
+                response = client.batch_write_item(RequestItems={table_name: requests})
+            except ClientError as e:
+                logger.error(
+                    "Failed to flush buffered group history writes",
+                    extra={"items": len(requests), "error": str(e)},
+                )
+                return len(requests)
+            except Exception as e:
+                logger.error(
+                    "Unexpected error flushing buffered group history writes",
+                    extra={"items": len(requests), "error": str(e)},
+                )
+                return len(requests)
+            requests = response.get("UnprocessedItems", {}).get(table_name, [])
+            if not requests:
+                return 0
+        return len(requests)
+
+    def _covers(self, group_id: str, start_date: date, end_date: date) -> bool:
+        loaded = self._loaded.get(group_id)
+        return loaded is not None and loaded[0] <= start_date and end_date <= loaded[1]
+
+    def _store(
+        self, group_id: str, items: list[GroupItem], start_date: date, end_date: date
+    ) -> None:
+        by_date = self._items.setdefault(group_id, {})
+        for item in items:
+            record_date = item.get("record_date", "")
+            # Buffered writes are newer than anything read back from the table
+            if (group_id, record_date) not in self._pending:
+                by_date[record_date] = item
+        self._loaded[group_id] = (start_date, end_date)
+
+    def _items_in_range(
+        self, group_id: str, lookback_days: int, end_date: date | None
+    ) -> list[GroupItem] | None:
+        """Return a group's items in the lookback window, loading them on a miss."""
+        if self._table is None:
+            logger.debug("Group history cache not available (GROUP_HISTORY_TABLE not set)")
+            return None
+
+        if end_date is None:
+            end_date = datetime.now(UTC).date()
+        start_date = end_date - timedelta(days=lookback_days)
+
+        if not self._covers(group_id, start_date, end_date):
+            # Widen to the union with what is already loaded so the loaded
+            # range stays a single contiguous interval.
+            load_start, load_end = start_date, end_date
+            loaded = self._loaded.get(group_id)
+            if loaded is not None:
+                load_start, load_end = min(load_start, loaded[0]), max(load_end, loaded[1])
+            try:
+                items = _query_group_items(self._table, group_id, load_start, load_end)
+            except ClientError as e:
+                logger.warning(
+                    "Failed to query group history cache",
+                    extra={"group_id": group_id, "error": str(e)},
+                )
+                return None
+            except Exception as e:
+                logger.warning(
+                    "Unexpected error querying group history cache",
+                    extra={"group_id": group_id, "error": str(e)},
+                )
+                return None
+            self._store(group_id, items, load_start, load_end)
+
+        start_iso, end_iso = start_date.isoformat(), end_date.isoformat()
+        return [
+            item
+            for record_date, item in self._items.get(group_id, {}).items()
+            if start_iso <= record_date <= end_iso
+        ]
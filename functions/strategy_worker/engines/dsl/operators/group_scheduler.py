@@ -0,0 +1,494 @@
+"""Business Unit: strategy | Status: current.
+
+Bottom-up group dependency scheduler for nested filter scoring.
+
+A ``filter`` over named groups scores each group from its historical daily
+return series, and computing that series means re-evaluating the group's
+body for every day in the lookback window -- which in turn scores any
+groups filtered *inside* that body on each of those days.  Resolving this
+recursively from the top repeats inner work and relies on a recursion guard
+that silently degrades to today-only scoring.
+
+This module resolves the hierarchy ahead of the main evaluation instead:
+
+1. ``GroupDependencyGraph.from_ast`` extracts every filter-scored group, the
+   window it is scored with, and which groups its body scores in turn.
+   Groups are keyed by name *and* body structure: strategies reuse a name
+   for different bodies, and each body needs its own return series.
+2. Planning walks the graph top-down to find the trading days each group is
+   needed on.  A group whose cached returns already cover every anchor is
+   skipped, and the groups below it are not expanded on its behalf.
+3. Execution walks the graph bottom-up, one height level at a time.  Each
+   group is evaluated on each needed day exactly once.  Groups run serially
+   by default: evaluation moves the shared indicator service's as_of_date,
+   so threads cannot share a context.  With GROUP_SCHEDULER_PROCESSES=true
+   independent groups on the same level run in forked worker processes
+   instead.  That is opt-in because forking a process that holds boto3
+   clients, download threads and logging handlers can inherit a held lock,
+   and platforms without process pools (AWS Lambda) pay for the failed start;
+   availability is probed once per process.
+
+Results land in a ``GroupReturnStore`` attached to the DSL context, from
+which ``try_scheduled_scoring`` answers filter scoring, and are written back
+to the group history cache.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+from engines.dsl.ast_interner import structural_digest
+from engines.dsl.context import DslContext
+from engines.dsl.operators.group_scoring import (
+    cache_has_returns,
+    compute_group_return_series,
+    derive_group_id,
+    lookback_trading_days,
+    scorable_metric,
+)
+
+from the_alchemiser.shared.logging import get_logger
+from the_alchemiser.shared.schemas.ast_node import ASTNode
+
+logger = get_logger(__name__)
+
+# Opt in to evaluating each height level in forked worker processes
+GROUP_SCHEDULER_PROCESSES = os.environ.get("GROUP_SCHEDULER_PROCESSES", "false").lower() == "true"
+
+# Worker processes per height level with GROUP_SCHEDULER_PROCESSES (0 = one per CPU)
+GROUP_SCHEDULER_WORKERS = int(os.environ.get("GROUP_SCHEDULER_WORKERS", "0"))
+
+type ReturnSeries = list[tuple[date, Decimal, dict[str, Decimal]]]
+
+# (group name, structural digest of each body expression)
+type GroupKey = tuple[str, tuple[bytes, ...]]
+
+# Pseudo group key for filters outside any scored group (evaluated on the anchor only)
+_ROOT: GroupKey = ("", ())
+
+
+def group_key(group_name: str, body: list[ASTNode], digests: dict[int, bytes]) -> GroupKey:
+    """Identify a group by its name and the structure of its body.
+
+    Args:
+        group_name: Group name from the DSL
+        body: Raw AST body expressions of the group
+        digests: id(node) -> structural digest memo, reused across calls
+
+    Returns:
+        Key equal for every occurrence of the same group
+
+    """
+    return group_name, tuple(structural_digest(expr, digests) for expr in body)
+
+
+@dataclass(slots=True)
+class GroupNode:
+    """A filter-scored group in the dependency graph.
+
+    Attributes:
+        key: Name and body structure of the group (see ``group_key``)
+        group_id: Cache group_id (see ``derive_group_id``); shared by
+            groups with the same name but different bodies
+        group_name: Group name from the DSL
+        body: Raw AST body expressions of the group
+        scores: Groups scored by filters inside the body, mapped to the
+            largest window they are scored with
+        height: 0 for groups that score no other group, else one more than
+            the tallest group they score
+
+    """
+
+    key: GroupKey
+    group_id: str
+    group_name: str
+    body: list[ASTNode]
+    scores: dict[GroupKey, int] = field(default_factory=dict)
+    height: int = 0
+
+
+class GroupDependencyGraph:
+    """Filter-scored groups of a strategy and the groups each one scores."""
+
+    def __init__(self, nodes: dict[GroupKey, GroupNode], roots: dict[GroupKey, int]) -> None:
+        """Initialize graph.
+
+        Args:
+            nodes: Scored groups keyed by group key
+            roots: Groups scored outside any scored group, mapped to their window
+
+        """
+        self.nodes = nodes
+        self.roots = roots
+        # Cache group_ids naming more than one distinct body
+        bodies_per_id = Counter(node.group_id for node in nodes.values())
+        self.shared_group_ids = {group_id for group_id, n in bodies_per_id.items() if n > 1}
+        self._assign_heights()
+
+    def __len__(self) -> int:
+        """Return the number of scored groups."""
+        return len(self.nodes)
+
+    @classmethod
+    def from_ast(
+        cls, ast: ASTNode, digests: dict[int, bytes] | None = None
+    ) -> GroupDependencyGraph:
+        """Extract the graph from a strategy AST.
+
+        Only filters whose condition is a supported portfolio metric with a
+        literal ``:window`` contribute edges; any other filter cannot be
+        scored from a return series.
+
+        Args:
+            ast: Root AST node of a strategy
+            digests: Optional id(node) -> structural digest memo to fill
+
+        Returns:
+            Dependency graph (possibly empty)
+
+        """
+        digests = {} if digests is None else digests
+        nodes: dict[GroupKey, GroupNode] = {}
+        edges: dict[GroupKey, dict[GroupKey, int]] = defaultdict(dict)
+        # (node, key of the nearest enclosing scored group)
+        stack: list[tuple[ASTNode, GroupKey]] = [(ast, _ROOT)]
+        while stack:
+            node, owner = stack.pop()
+            if not node.is_list() or not node.children:
+                continue
+            children = node.children
+            if children[0].get_symbol_name() != "filter" or len(children) < 3:
+                stack.extend((child, owner) for child in children)
+                continue
+
+            stack.extend((child, owner) for child in children[:-1])
+            window = _static_window(children[1])
+            for group in _outermost_groups(children[-1]):
+                name = group.children[1].get_atom_value()
+                if not isinstance(name, str) or not name:
+                    continue
+                body = list(group.children[2:])
+                key = group_key(name, body, digests)
+                if window is not None:
+                    if key not in nodes:
+                        nodes[key] = GroupNode(key, derive_group_id(name), name, body)
+                    edges[owner][key] = max(window, edges[owner].get(key, 0))
+                stack.extend((expr, key if window is not None else owner) for expr in body)
+
+        for owner, scored in edges.items():
+            if owner != _ROOT:
+                nodes[owner].scores.update(scored)
+        return cls(nodes, dict(edges.get(_ROOT, {})))
+
+    def levels(self) -> list[list[GroupNode]]:
+        """Return groups grouped by height, lowest (innermost) first."""
+        by_height: dict[int, list[GroupNode]] = defaultdict(list)
+        for node in self.nodes.values():
+            by_height[node.height].append(node)
+        return [sorted(by_height[h], key=lambda n: n.key) for h in sorted(by_height)]
+
+    def _assign_heights(self) -> None:
+        """Compute node heights iteratively, dropping edges that close a cycle."""
+        state: dict[GroupKey, int] = {}  # 1 = on the DFS path, 2 = done
+        for start in self.nodes:
+            if start in state:
+                continue
+            path: list[tuple[GroupKey, list[GroupKey]]] = [(start, list(self.nodes[start].scores))]
+            state[start] = 1
+            while path:
+                key, pending = path[-1]
+                if pending:
+                    child = pending.pop()
+                    if state.get(child) == 1:
+                        # A group scoring itself (directly or not) has no bottom
+                        logger.warning(
+                            "Group scheduler: dropping cyclic scoring edge",
+                            extra={
+                                "group_id": self.nodes[key].group_id,
+                                "child_group_id": self.nodes[child].group_id,
+                            },
+                        )
+                        del self.nodes[key].scores[child]
+                    elif child not in state:
+                        state[child] = 1
+                        path.append((child, list(self.nodes[child].scores)))
+                    continue
+                node = self.nodes[key]
+                node.height = 1 + max((self.nodes[c].height for c in node.scores), default=-1)
+                state[key] = 2
+                path.pop()
+
+
+class GroupReturnStore:
+    """Daily return series computed by the scheduler, keyed by group key."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._days: dict[GroupKey, frozenset[date]] = {}
+        self._returns: dict[GroupKey, dict[date, Decimal]] = {}
+        # id(node) -> structural digest, shared by the graph and scoring lookups
+        self.digests: dict[int, bytes] = {}
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the group was computed."""
+        return key in self._days
+
+    def key_for(self, group_name: str, body: list[ASTNode]) -> GroupKey:
+        """Return the key of a group being scored (see ``group_key``)."""
+        return group_key(group_name, body, self.digests)
+
+    def add(self, key: GroupKey, trading_days: list[date], series: ReturnSeries) -> None:
+        """Record the series computed for a group over ``trading_days``."""
+        self._days[key] = frozenset(trading_days)
+        self._returns[key] = {day: ret for day, ret, _ in series}
+
+    def lookup(self, key: GroupKey, anchor_date: date, window: int) -> list[Decimal] | None:
+        """Return a group's returns for a scoring window, oldest-first.
+
+        Returns:
+            The returns, or None if the group was not evaluated on every
+            trading day of the window.
+
+        """
+        days = self._days.get(key)
+        if days is None:
+            return None
+        window_days = lookback_trading_days(anchor_date, window)
+        if not days.issuperset(window_days):
+            return None
+        returns = self._returns[key]
+        return [returns[day] for day in window_days if day in returns]
+
+
+def schedule_group_returns(ast: ASTNode, context: DslContext) -> GroupReturnStore | None:
+    """Precompute the return series of every filter-scored group bottom-up.
+
+    Fills ``context.group_returns`` (which must already be attached so that
+    inner filters evaluated during the run read the series of the levels
+    below them) and writes computed returns to ``context.group_history``.
+
+    Args:
+        ast: Root AST node of the strategy about to be evaluated
+        context: Evaluation context
+
+    Returns:
+        The filled store, or None if nothing could be scheduled
+
+    """
+    store = context.group_returns
+    indicator_svc = context.indicator_service
+    if store is None or not context.market_data_service or not hasattr(indicator_svc, "as_of_date"):
+        return None
+
+    graph = GroupDependencyGraph.from_ast(ast, store.digests)
+    if not graph.roots:
+        return None
+
+    started = time.perf_counter()
+    anchor_date = getattr(indicator_svc, "as_of_date", None) or datetime.now(UTC).date()
+    plan = _plan(graph, anchor_date, context)
+
+    levels = [[node for node in level if node.key in plan] for level in graph.levels()]
+    levels = [level for level in levels if level]
+    if levels and context.return_matrix is not None:
+        # Load closes once here rather than once per level (or forked worker)
+        context.return_matrix.build()
+
+    for level in levels:
+        for key, series in _run_level(level, plan, context).items():
+            store.add(key, plan[key], series)
+            group_id = graph.nodes[key].group_id
+            # The cache is keyed by name alone; leave ambiguous names to the cache path
+            if group_id not in graph.shared_group_ids:
+                _write_back(group_id, series, context)
+
+    logger.info(
+        "Group scheduler: computed nested group returns bottom-up",
+        extra={
+            "groups_scored": len(graph),
+            "shared_group_names": len(graph.shared_group_ids),
+            "groups_computed": len(plan),
+            "levels": len(levels),
+            "group_days_evaluated": sum(len(days) for days in plan.values()),
+            "anchor_date": anchor_date.isoformat(),
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+            "correlation_id": context.correlation_id,
+        },
+    )
+    return store
+
+
+def _plan(
+    graph: GroupDependencyGraph, anchor_date: date, context: DslContext
+) -> dict[GroupKey, list[date]]:
+    """Find the trading days each group must be evaluated on (top-down).
+
+    Returns:
+        group key -> oldest-first trading days, for groups not served by the cache
+
+    """
+    # group key -> {(anchor_date, window)} the group will be scored at
+    requests: dict[GroupKey, set[tuple[date, int]]] = defaultdict(set)
+    for key, window in graph.roots.items():
+        requests[key].add((anchor_date, window))
+
+    plan: dict[GroupKey, list[date]] = {}
+    # Parents are always taller than the groups they score
+    for level in reversed(graph.levels()):
+        for node in level:
+            wanted = requests.get(node.key)
+            if not wanted:
+                continue
+            if all(
+                cache_has_returns(context, node.group_id, anchor, window)
+                for anchor, window in wanted
+            ):
+                continue
+            days = sorted(
+                {day for anchor, window in wanted for day in lookback_trading_days(anchor, window)}
+            )
+            plan[node.key] = days
+            for child, window in node.scores.items():
+                requests[child].update((day, window) for day in days)
+    return plan
+
+
+def _run_level(
+    level: list[GroupNode], plan: dict[GroupKey, list[date]], context: DslContext
+) -> dict[GroupKey, ReturnSeries]:
+    """Compute every group of one height level, in worker processes if opted in."""
+    workers = min(GROUP_SCHEDULER_WORKERS or os.cpu_count() or 1, len(level))
+    if GROUP_SCHEDULER_PROCESSES and workers > 1 and _process_pool_available():
+        bodies = {node.key: node.body for node in level}
+        try:
+            # Fork start: initargs reach the workers by inheritance, unpickled
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp.get_context("fork"),
+                initializer=_worker_init,
+                initargs=(context, bodies, plan),
+            ) as pool:
+                return dict(pool.map(_compute_in_worker, list(bodies)))
+        except (OSError, NotImplementedError, BrokenProcessPool) as exc:
+            _mark_process_pool_unavailable(exc)
+
+    return {
+        node.key: compute_group_return_series(node.body, plan[node.key], context) for node in level
+    }
+
+
+# None until probed; a failed probe or pool start disables pools for the process
+_PROCESS_POOL_AVAILABLE: bool | None = None
+_PROCESS_POOL_LOCK = threading.Lock()
+
+
+def _process_pool_available() -> bool:
+    """Return whether forked process pools work here, probing once per process."""
+    global _PROCESS_POOL_AVAILABLE
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL_AVAILABLE is None:
+            if "fork" not in mp.get_all_start_methods():
+                _PROCESS_POOL_AVAILABLE = False
+            else:
+                try:
+                    # The pool's queues need POSIX semaphores (no /dev/shm on Lambda)
+                    mp.get_context("fork").Semaphore()
+                    _PROCESS_POOL_AVAILABLE = True
+                except (OSError, NotImplementedError) as exc:
+                    _PROCESS_POOL_AVAILABLE = False
+                    logger.info(
+                        "Group scheduler: process pool unavailable, evaluating serially",
+                        extra={"error": str(exc)},
+                    )
+        return _PROCESS_POOL_AVAILABLE
+
+
+def _mark_process_pool_unavailable(exc: BaseException) -> None:
+    """Stop using process pools for this process after a failed pool start."""
+    global _PROCESS_POOL_AVAILABLE
+    with _PROCESS_POOL_LOCK:
+        _PROCESS_POOL_AVAILABLE = False
+    logger.info(
+        "Group scheduler: process pool failed, evaluating serially",
+        extra={"error": str(exc)},
+    )
+
+
+# Worker process state set by _worker_init: (context, group bodies, plan)
+_WORKER_STATE: (
+    tuple[DslContext, dict[GroupKey, list[ASTNode]], dict[GroupKey, list[date]]] | None
+) = None
+
+
+def _worker_init(
+    context: DslContext,
+    bodies: dict[GroupKey, list[ASTNode]],
+    plan: dict[GroupKey, list[date]],
+) -> None:
+    """Process pool initializer: hold the level's state in the worker process."""
+    global _WORKER_STATE
+    _WORKER_STATE = (context, bodies, plan)
+
+
+def _compute_in_worker(key: GroupKey) -> tuple[GroupKey, ReturnSeries]:
+    """Process pool entry point: compute one group from the initializer's state."""
+    if _WORKER_STATE is None:
+        raise RuntimeError("Group scheduler worker started without scheduler state")
+    context, bodies, plan = _WORKER_STATE
+    return key, compute_group_return_series(bodies[key], plan[key], context)
+
+
+def _write_back(group_id: str, series: ReturnSeries, context: DslContext) -> None:
+    """Buffer computed returns into the group history cache, if attached."""
+    if context.group_history is None:
+        return
+    for day, daily_return, held in series:
+        context.group_history.write_historical_return(
+            group_id,
+            day.isoformat(),
+            {symbol: str(weight) for symbol, weight in held.items()},
+            daily_return,
+        )
+
+
+def _outermost_groups(node: ASTNode) -> list[ASTNode]:
+    """Return the ``(group "name" ...)`` nodes under ``node`` not nested in another group."""
+    groups: list[ASTNode] = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if not current.is_list() or not current.children:
+            continue
+        if current.children[0].get_symbol_name() == "group" and len(current.children) > 2:
+            groups.append(current)
+            continue
+        stack.extend(current.children)
+    return groups
+
+
+def _static_window(condition: ASTNode) -> int | None:
+    """Read the literal ``:window`` of a scorable filter condition, if any."""
+    if not condition.is_list() or len(condition.children) < 2:
+        return None
+    if scorable_metric(condition.children[0].get_symbol_name()) is None:
+        return None
+    params = condition.children[1]
+    if not params.metadata or params.metadata.get("node_subtype") != "map":
+        return None
+    it = iter(params.children)
+    for key_node, val_node in zip(it, it, strict=False):
+        key = key_node.get_symbol_name() or key_node.get_atom_value()
+        if isinstance(key, str) and key.lstrip(":") == "window":
+            value = val_node.get_atom_value()
+            if isinstance(value, Decimal) and value > 0:
+                return int(value)
+    return None
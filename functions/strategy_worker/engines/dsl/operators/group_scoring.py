@@ -15,15 +15,25 @@ a filter operator?"  It provides:
 - **Portfolio metric computation** -- pure functions that mirror
   ``TechnicalIndicators`` but operate on a pre-built return series
 
+When the evaluator has scheduled the strategy's groups bottom-up (see
+``group_scheduler``), ``try_scheduled_scoring`` answers from the precomputed
+return series in ``context.group_returns`` before any of the paths above.
+
+Cache reads and backfill writes go through the evaluation's
+``GroupHistoryCache`` (``context.group_history``) when one is attached, and
+straight to DynamoDB otherwise.  ``collect_scored_group_ids`` lists the groups
+an AST can score so the evaluator can prefetch them up front.
+
 Module-level mutable state
 --------------------------
-Four module-level stores provide cross-call memoization within a single
+Five module-level stores provide cross-call memoization within a single
 strategy evaluation run:
 
 - ``_BACKFILL_IN_PROGRESS`` -- recursion guard (set of group_ids)
 - ``_AST_BODY_STORE`` -- group AST bodies keyed by fragment_id (ephemeral)
 - ``_AST_BODY_BY_GROUP_ID`` -- group AST bodies keyed by stable group_id
-- ``_IN_PROCESS_RETURN_MEMO`` -- (group_id, date) -> daily return memoization
+- ``_IN_PROCESS_SIGNAL_MEMO`` -- (group_id, body digests, date) -> signal
+- ``_BODY_DIGESTS`` -- id(node) -> structural digest of group body nodes
 
 **Invariant:** These are cleared at the start of each ``evaluate()`` call via
 ``clear_evaluation_caches()``.  Any code path that bypasses ``evaluate()``
@@ -39,14 +49,15 @@ import math
 import re
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
-from typing import Any
 
+from engines.dsl.ast_interner import structural_digest
 from engines.dsl.context import DslContext
 from engines.dsl.operators.group_cache_lookup import (
     is_cache_available,
     lookup_historical_returns,
     write_historical_return,
 )
+from engines.dsl.operators.return_matrix import ReturnMatrix
 from engines.dsl.types import DslEvaluationError, DSLValue
 
 from the_alchemiser.shared.logging import get_logger
@@ -110,13 +121,17 @@ _AST_BODY_STORE: dict[str, list[ASTNode]] = {}
 _AST_BODY_BY_GROUP_ID: dict[str, list[ASTNode]] = {}
 
 # Memoization cache for in-process group signal evaluations.
-# Key: (group_id, date_iso_str) -> dict of weights (signal) or None.
+# Key: (group_id, body digests, date_iso_str) -> dict of weights (signal) or None.
 # Signal evaluation is deterministic (same group + same date = same
-# signal), so this is safe to cache across calls.  Prevents exponential
+# signal), so this is safe to cache across calls.  The body digests tell
+# apart groups that share a name but not a body.  Prevents exponential
 # recursion in deeply nested strategies where inner groups would otherwise
 # trigger their own full backfill loops for every outer evaluation date.
 # Cleared between strategy runs via ``clear_evaluation_caches()``.
-_IN_PROCESS_SIGNAL_MEMO: dict[tuple[str, str], dict[str, Decimal] | None] = {}
+_IN_PROCESS_SIGNAL_MEMO: dict[tuple[str, tuple[bytes, ...], str], dict[str, Decimal] | None] = {}
+
+# id(node) -> structural digest for the group bodies keyed into the memo above
+_BODY_DIGESTS: dict[int, bytes] = {}
 
 
 # ---------------------------------------------------------------------------
@@ -134,9 +149,53 @@ def clear_evaluation_caches() -> None:
     _AST_BODY_STORE.clear()
     _AST_BODY_BY_GROUP_ID.clear()
     _IN_PROCESS_SIGNAL_MEMO.clear()
+    _BODY_DIGESTS.clear()
     _BACKFILL_IN_PROGRESS.clear()
 
 
+def collect_scored_group_ids(ast: ASTNode) -> set[str]:
+    """Collect the group_ids of every group a ``filter`` in the AST can score.
+
+    A filter scores the groups that make up its portfolio argument.  Those are
+    found by descending through the argument until a ``(group "name" ...)``
+    node is reached; group bodies are not searched on behalf of the outer
+    filter, but any filter nested inside them contributes its own groups.
+
+    Args:
+        ast: Root AST node of a strategy.
+
+    Returns:
+        Set of cache group_ids (see ``derive_group_id``).
+
+    """
+    group_ids: set[str] = set()
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if not node.is_list() or not node.children:
+            continue
+        stack.extend(node.children)
+        if node.children[0].get_symbol_name() == "filter" and len(node.children) > 2:
+            _collect_group_ids(node.children[-1], group_ids)
+    return group_ids
+
+
+def _collect_group_ids(node: ASTNode, group_ids: set[str]) -> None:
+    """Add the ids of the outermost named groups under ``node``."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if not current.is_list() or not current.children:
+            continue
+        children = current.children
+        if children[0].get_symbol_name() == "group" and len(children) > 1:
+            name = children[1].get_atom_value()
+            if isinstance(name, str) and name:
+                group_ids.add(derive_group_id(name))
+            continue
+        stack.extend(children)
+
+
 def register_ast_body(fragment_id: str, group_name: str, body: list[ASTNode]) -> None:
     """Register a group's AST body for later backfill/in-process scoring.
 
@@ -212,11 +271,163 @@ def is_bare_asset_fragment(fragment: PortfolioFragment, group_name: object) -> b
     return bool(_TICKER_SYMBOL_RE.match(group_name))
 
 
+def scorable_metric(op_name: str | None) -> str | None:
+    """Return the canonical portfolio metric for a filter operator, if supported."""
+    return _METRIC_DISPATCH.get(op_name) if op_name else None
+
+
+def lookback_trading_days(anchor_date: date, window: int) -> list[date]:
+    """Return the trading days whose returns back a ``window``-day group score.
+
+    This is the range on-demand backfill and in-process scoring evaluate
+    for a group scored on ``anchor_date`` (oldest-first, anchor included).
+    """
+    return _get_trading_days(anchor_date, backfill_calendar_days(window))
+
+
+def cache_has_returns(
+    context: DslContext,
+    group_id: str,
+    anchor_date: date,
+    window: int,
+) -> bool:
+    """Return True if cached returns alone can score a group on ``anchor_date``.
+
+    Mirrors the first lookup of cache-based scoring without triggering
+    backfill or logging per-lookup warnings.
+    """
+    if context.group_history is None:
+        return False
+    found = context.group_history.count_returns(
+        group_id, _cache_lookback_calendar_days(window), anchor_date
+    )
+    return found >= window
+
+
+def compute_group_return_series(
+    ast_body: list[ASTNode],
+    trading_days: list[date],
+    context: DslContext,
+) -> list[tuple[date, Decimal, dict[str, Decimal]]]:
+    """Evaluate a group once per trading day and derive its daily returns.
+
+    The return for day D is the performance of the position held from the
+    signal of the previous evaluated day (the last non-empty one).  The
+    first day only establishes a position.  A day whose evaluation raises
+    books no return and keeps the previous position, as in-process scoring
+    does.  ``as_of_date`` on the indicator service is restored afterwards.
+
+    Args:
+        ast_body: Raw AST body expressions of the group.
+        trading_days: Days to evaluate, oldest-first, each at most once.
+        context: DSL context with market_data_service and an
+            indicator_service supporting ``as_of_date``.
+
+    Returns:
+        ``(date, daily_return, held_weights)`` for every day with a return.
+
+    """
+    indicator_svc = context.indicator_service
+    original_as_of_date = getattr(indicator_svc, "as_of_date", None)
+    series: list[tuple[date, Decimal, dict[str, Decimal]]] = []
+    prev_weights: dict[str, Decimal] | None = None
+    try:
+        for eval_date in trading_days:
+            try:
+                today_weights = _evaluate_group_signal_for_date(ast_body, eval_date, context)
+            except Exception as exc:
+                logger.warning(
+                    "Group scheduler: failed to evaluate signal for %s: %s",
+                    eval_date.isoformat(),
+                    exc,
+                    exc_info=True,
+                )
+                continue
+
+            if prev_weights is not None:
+                daily_ret = _compute_daily_return_for_portfolio(
+                    selections=prev_weights,
+                    record_date=eval_date,
+                    context=context,
+                )
+                if daily_ret is not None:
+                    series.append((eval_date, daily_ret, prev_weights))
+
+            if today_weights:
+                prev_weights = today_weights
+    finally:
+        indicator_svc.as_of_date = original_as_of_date
+    return series
+
+
 # ---------------------------------------------------------------------------
 # Scoring pipeline
 # ---------------------------------------------------------------------------
 
 
+def try_scheduled_scoring(
+    fragment: PortfolioFragment,
+    condition_expr: ASTNode,
+    context: DslContext,
+    *,
+    group_name: object,
+    op_name: str | None,
+    should_invert: bool,
+) -> float | None:
+    """Score a group from the return series the group scheduler precomputed.
+
+    The series is looked up by the group's name and the structure of the
+    body that produced ``fragment``, so groups sharing a name are told apart.
+
+    Returns ``None`` (fall through to the cache/in-process paths) when no
+    scheduler store is attached, the group was not scheduled, or the
+    scheduled series does not cover the window anchored at ``as_of_date``.
+    """
+    store = context.group_returns
+    if store is None or not isinstance(group_name, str) or not group_name:
+        return None
+    ast_body = _AST_BODY_STORE.get(fragment.fragment_id)
+    if not ast_body:
+        return None
+
+    window = _extract_window_from_condition(condition_expr, context)
+    canonical_metric = scorable_metric(op_name)
+    if not window or not canonical_metric:
+        return None
+
+    group_id = derive_group_id(group_name)
+    anchor_date = getattr(context.indicator_service, "as_of_date", None) or (
+        datetime.now(UTC).date()
+    )
+    returns = store.lookup(store.key_for(group_name, ast_body), anchor_date, window)
+    if returns is None or len(returns) < window:
+        return None
+
+    score = _compute_portfolio_metric(
+        returns=returns,
+        metric_name=canonical_metric,
+        window=window,
+    )
+    if score is None:
+        return None
+    if should_invert:
+        score = -score
+
+    logger.debug(
+        "DSL filter: scored group from scheduled return series",
+        extra={
+            "group_name": group_name,
+            "group_id": group_id,
+            "metric": canonical_metric,
+            "window": window,
+            "anchor_date": anchor_date.isoformat(),
+            "score": score,
+            "correlation_id": context.correlation_id,
+        },
+    )
+    return score
+
+
 def try_cache_scoring(
     fragment: PortfolioFragment,
     condition_expr: ASTNode,
@@ -412,8 +623,7 @@ def try_in_process_scoring(
     original_as_of_date = getattr(indicator_svc, "as_of_date", None)
     try:
         anchor_date = original_as_of_date or datetime.now(UTC).date()
-        calendar_days = min(int(window * 2.5) + 10, _MAX_BACKFILL_CALENDAR_DAYS)
-        trading_days = _get_trading_days(anchor_date, calendar_days)
+        trading_days = lookback_trading_days(anchor_date, window)
 
         returns = _collect_in_process_returns(ast_body, trading_days, group_name, context)
 
@@ -507,6 +717,21 @@ def _extract_window_from_condition(
 # ---------------------------------------------------------------------------
 
 
+def backfill_calendar_days(window: int | None) -> int:
+    """Calendar days re-evaluated for a window (bounded by the backfill cap).
+
+    An unknown window (None) is bounded by the cap itself.
+    """
+    if window is None:
+        return _MAX_BACKFILL_CALENDAR_DAYS
+    return min(int(window * 2.5) + 10, _MAX_BACKFILL_CALENDAR_DAYS)
+
+
+def _cache_lookback_calendar_days(window: int) -> int:
+    """Calendar days of cached returns read for a window."""
+    return int(window * 2.5) + 10
+
+
 def _get_trading_days(end_date: date, num_calendar_days: int) -> list[date]:
     """Generate a list of expected trading days (weekdays) in a date range.
 
@@ -544,9 +769,10 @@ def _compute_daily_return_for_portfolio(
 ) -> Decimal | None:
     """Compute weighted portfolio daily return for a single date.
 
-    For each symbol in the portfolio, fetches bars from the market data
-    service and computes close-to-close return.  The portfolio return is
-    the weight-normalised sum of individual returns.
+    Reads each held symbol's close-to-close return from the evaluation's
+    ``ReturnMatrix`` and returns the weight-normalised sum.  Contexts
+    created outside ``DslEvaluator.evaluate`` get a matrix of their own on
+    first use.
 
     Args:
         selections: Symbol-to-weight mapping (Decimal weights).
@@ -560,86 +786,9 @@ def _compute_daily_return_for_portfolio(
     if not context.market_data_service:
         return None
 
-    from the_alchemiser.shared.value_objects.symbol import Symbol
-
-    weighted_return = Decimal("0")
-    total_weight = Decimal("0")
-    record_date_str = record_date.isoformat()
-
-    for symbol_str, weight in selections.items():
-        if weight <= Decimal("0"):
-            continue
-        try:
-            # Derive a period that covers from today back through record_date
-            # plus a small buffer.  The fixed "30D" was insufficient for dates
-            # older than 30 calendar days, which the backfill window can reach.
-            today = datetime.now(UTC).date()
-            days_back = max((today - record_date).days + 5, 30)
-            period = f"{days_back}D"
-
-            bars = context.market_data_service.get_bars(
-                symbol=Symbol(symbol_str),
-                period=period,
-                timeframe="1Day",
-            )
-            if len(bars) < 2:
-                continue
-
-            # Find bar for record_date and its predecessor
-            daily_return = _extract_bar_return(bars, record_date_str)
-            if daily_return is not None:
-                weighted_return += weight * daily_return
-                total_weight += weight
-        except Exception as exc:
-            logger.warning(
-                "Backfill: failed to get bars for %s on %s: %s",
-                symbol_str,
-                record_date_str,
-                exc,
-            )
-
-    if total_weight <= Decimal("0"):
-        return None
-    return weighted_return / total_weight
-
-
-def _extract_bar_return(bars: list[Any], record_date_str: str) -> Decimal | None:
-    """Extract close-to-close daily return for a date from a bar series.
-
-    Extracts close-to-close daily return from bar objects that have
-    .timestamp and .close attributes.
-
-    Args:
-        bars: Chronologically ordered bars with .timestamp and .close.
-        record_date_str: ISO date string (YYYY-MM-DD).
-
-    Returns:
-        Daily return as Decimal, or None.
-
-    """
-    # Build date-indexed map
-    date_to_idx: dict[str, int] = {}
-    for i, bar in enumerate(bars):
-        bar_date = bar.timestamp.date().isoformat()
-        date_to_idx[bar_date] = i
-
-    target_idx = date_to_idx.get(record_date_str)
-    if target_idx is None:
-        # Fall back to most recent bar on or before the date
-        for i in range(len(bars) - 1, -1, -1):
-            if bars[i].timestamp.date().isoformat() <= record_date_str:
-                target_idx = i
-                break
-
-    if target_idx is None or target_idx < 1:
-        return None
-
-    current_close = bars[target_idx].close
-    prev_close = bars[target_idx - 1].close
-    if prev_close == Decimal("0"):
-        return None
-    result: Decimal = (current_close / prev_close) - Decimal("1")
-    return result
+    if context.return_matrix is None:
+        context.return_matrix = ReturnMatrix(context.market_data_service)
+    return context.return_matrix.portfolio_return(selections, record_date)
 
 
 # ---------------------------------------------------------------------------
@@ -660,7 +809,7 @@ def _backfill_group_cache(
     1. Determines which trading days need backfilling
     2. For each missing day, sets as_of_date on the indicator service,
        re-evaluates the group AST body, extracts the resulting weights,
-       fetches bars to compute the portfolio's daily return
+       reads the portfolio's daily return off the evaluation's return matrix
     3. Writes each result to DynamoDB
 
     The recursion guard ``_BACKFILL_IN_PROGRESS`` prevents infinite
@@ -711,10 +860,12 @@ def _backfill_group_cache(
     original_as_of_date = getattr(indicator_svc, "as_of_date", None)
     try:
         anchor_date = original_as_of_date or datetime.now(UTC).date()
-        calendar_days = min(int(window * 2.5) + 10, _MAX_BACKFILL_CALENDAR_DAYS)
+        calendar_days = backfill_calendar_days(window)
         trading_days = _get_trading_days(anchor_date, calendar_days)
 
-        existing_returns = _check_existing_cache(group_id, calendar_days, anchor_date, window)
+        existing_returns = _check_existing_cache(
+            group_id, calendar_days, anchor_date, window, context
+        )
         if existing_returns is not None:
             return existing_returns
 
@@ -736,7 +887,8 @@ def _backfill_group_cache(
             },
         )
 
-        refreshed = lookup_historical_returns(
+        refreshed = _lookup_returns(
+            context,
             group_id=group_id,
             lookback_days=calendar_days,
             end_date=anchor_date,
@@ -751,14 +903,52 @@ def _backfill_group_cache(
         _BACKFILL_IN_PROGRESS.discard(group_id)
 
 
+def _lookup_returns(
+    context: DslContext,
+    *,
+    group_id: str,
+    lookback_days: int,
+    end_date: date | None,
+) -> list[Decimal]:
+    """Look up cached returns via the evaluation's cache, else DynamoDB."""
+    if context.group_history is not None:
+        return context.group_history.lookup_historical_returns(group_id, lookback_days, end_date)
+    return lookup_historical_returns(
+        group_id=group_id, lookback_days=lookback_days, end_date=end_date
+    )
+
+
+def _write_return(
+    context: DslContext,
+    *,
+    group_id: str,
+    record_date: str,
+    selections: dict[str, str],
+    portfolio_daily_return: Decimal,
+) -> bool:
+    """Record a backfilled return, buffered when the evaluation has a cache."""
+    if context.group_history is not None:
+        return context.group_history.write_historical_return(
+            group_id, record_date, selections, portfolio_daily_return
+        )
+    return write_historical_return(
+        group_id=group_id,
+        record_date=record_date,
+        selections=selections,
+        portfolio_daily_return=portfolio_daily_return,
+    )
+
+
 def _check_existing_cache(
     group_id: str,
     calendar_days: int,
     anchor_date: date,
     window: int,
+    context: DslContext,
 ) -> list[Decimal] | None:
     """Check if the cache already has enough returns. Returns them or None."""
-    existing_returns = lookup_historical_returns(
+    existing_returns = _lookup_returns(
+        context,
         group_id=group_id,
         lookback_days=calendar_days,
         end_date=anchor_date,
@@ -846,7 +1036,8 @@ def _backfill_trading_days(
             if daily_ret is not None:
                 # Write the return of the held position
                 held_selections_str = {sym: str(w) for sym, w in prev_weights.items()}
-                write_ok = write_historical_return(
+                write_ok = _write_return(
+                    context,
                     group_id=group_id,
                     record_date=eval_date.isoformat(),
                     selections=held_selections_str,
@@ -854,8 +1045,7 @@ def _backfill_trading_days(
                 )
                 if not write_ok:
                     logger.warning(
-                        "Backfill: failed to persist cache entry to DynamoDB "
-                        "-- data computed but NOT saved",
+                        "Backfill: failed to record cache entry -- data computed but NOT saved",
                         extra={
                             "group_id": group_id,
                             "group_name": group_name,
@@ -975,19 +1165,20 @@ def _collect_in_process_returns(
 
     Tracks position state across days: the return for day D is the
     performance of the position determined by the signal at close of
-    day D-1.  Uses ``(group_id, date)`` memoization for signal evaluations
-    to ensure each group-date pair is evaluated at most once across the
-    entire strategy run.  This prevents exponential recursion in deeply
+    day D-1.  Uses ``(group_id, body, date)`` memoization for signal
+    evaluations to ensure each group-date pair is evaluated at most once
+    across the entire strategy run.  This prevents exponential recursion in deeply
     nested group hierarchies (e.g. FTL Starburst with 5+ nesting levels)
     where inner groups would otherwise trigger their own full backfill
     loops for every outer evaluation date.
     """
     group_id = derive_group_id(group_name)
+    body_key = tuple(structural_digest(expr, _BODY_DIGESTS) for expr in ast_body)
     returns: list[Decimal] = []
     prev_weights: dict[str, Decimal] | None = None
 
     for eval_date in trading_days:
-        memo_key = (group_id, eval_date.isoformat())
+        memo_key = (group_id, body_key, eval_date.isoformat())
         try:
             # Evaluate today's signal (memoized)
             if memo_key in _IN_PROCESS_SIGNAL_MEMO:
@@ -1038,14 +1229,15 @@ def _fetch_or_backfill_returns(
     context: DslContext,
 ) -> list[Decimal]:
     """Fetch historical returns from cache, triggering backfill on miss."""
-    lookback_calendar_days = int(window * 2.5) + 10
+    lookback_calendar_days = _cache_lookback_calendar_days(window)
 
     # When running inside a nested backfill, the indicator service has
     # as_of_date set to the outer evaluation date.  Bound the cache
     # lookup to that date to prevent look-ahead bias.
     anchor_date: date | None = getattr(context.indicator_service, "as_of_date", None)
 
-    historical_returns = lookup_historical_returns(
+    historical_returns = _lookup_returns(
+        context,
         group_id=group_id,
         lookback_days=lookback_calendar_days,
         end_date=anchor_date,
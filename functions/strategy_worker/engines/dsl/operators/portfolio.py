@@ -28,6 +28,7 @@ from engines.dsl.operators.group_scoring import (
     register_ast_body,
     try_cache_scoring,
     try_in_process_scoring,
+    try_scheduled_scoring,
 )
 from engines.dsl.operators.group_scoring import (
     unwrap_single_element_list as _unwrap_single_element_list,
@@ -1250,13 +1251,14 @@ def _score_portfolio(
     """Calculate a score for a portfolio fragment and report the scoring path.
 
     Tries scoring approaches in priority order:
-    1. DynamoDB cache-based historical scoring (Composer parity)
-    2. In-process historical re-evaluation (no DynamoDB, debug runs)
-    3. Per-symbol weighted-average of today's indicator values (fallback)
+    1. Return series precomputed bottom-up by the group scheduler
+    2. DynamoDB cache-based historical scoring (Composer parity)
+    3. In-process historical re-evaluation (no DynamoDB, debug runs)
+    4. Per-symbol weighted-average of today's indicator values (fallback)
 
     Returns:
         Tuple of (score, scoring_path) where scoring_path is one of:
-        ``"cache_hit"``, ``"cache_miss_backfill"``,
+        ``"scheduled"``, ``"cache_hit"``, ``"cache_miss_backfill"``,
         ``"in_process_fallback"``, ``"per_symbol_fallback"``,
         ``"cache_unavailable"``.
 
@@ -1354,6 +1356,18 @@ def _score_portfolio(
             fragment, condition_expr, context, should_invert=should_invert_for_portfolio
         ), "per_symbol_direct"
 
+    # ── Scheduled (bottom-up precomputed) scoring ──────────────────
+    scheduled_result = try_scheduled_scoring(
+        fragment,
+        condition_expr,
+        context,
+        group_name=group_name,
+        op_name=op_name,
+        should_invert=should_invert_for_portfolio,
+    )
+    if scheduled_result is not None:
+        return scheduled_result, "scheduled"
+
     # ── Cache-based scoring ────────────────────────────────────────
     cache_result = try_cache_scoring(
         fragment,
@@ -0,0 +1,270 @@
+"""Business Unit: strategy | Status: current.
+
+Date x symbol daily return matrix for group backfill and in-process scoring.
+
+Scoring a named group historically needs the return of the group's held
+position on each of up to ~45 trading days.  Fetching bars per held symbol
+per date re-reads the same history over and over; this module loads each
+symbol's closes once per evaluation and lays out, per trading date and
+symbol, the index of the symbol's latest bar on or before that date, so a
+portfolio's daily return needs no date search per symbol.
+
+Semantics match the former per-date bar lookup:
+    - The return for a record date is that of the symbol's latest bar on or
+      before the date (close / previous close - 1), computed in Decimal from
+      ``Decimal(str(close))`` as BarModel closes are.
+    - A symbol without such a bar, without a previous bar, or with a zero
+      previous close contributes nothing and its weight is dropped from the
+      normalisation.
+    - The portfolio return is the Decimal weight-normalised sum.
+
+A live evaluation's lookback plan may limit symbols to their latest closes.
+A lookup on a date before a truncated symbol's first answerable return
+reloads that symbol's full history, so truncation never changes a result.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import numpy.typing as npt
+
+from the_alchemiser.shared.logging import get_logger
+from the_alchemiser.shared.schemas.ast_node import ASTNode
+from the_alchemiser.shared.types.market_data_port import (
+    ColumnarMarketDataPort,
+    MarketDataPort,
+)
+from the_alchemiser.shared.value_objects.symbol import Symbol
+
+logger = get_logger(__name__)
+
+type FloatArray = npt.NDArray[np.float64]
+type DateArray = npt.NDArray[np.datetime64]
+type IndexArray = npt.NDArray[np.intp]
+
+
+def collect_asset_symbols(ast: ASTNode) -> list[str]:
+    """Return the symbols of every ``(asset "SYM" ...)`` node, in first-seen order.
+
+    Args:
+        ast: Root AST node of a strategy.
+
+    Returns:
+        Distinct asset symbols a group can hold.
+
+    """
+    symbols: dict[str, None] = {}
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if not node.is_list() or not node.children:
+            continue
+        children = node.children
+        if children[0].get_symbol_name() == "asset" and len(children) > 1:
+            value = children[1].get_atom_value()
+            if isinstance(value, str) and value:
+                symbols[value] = None
+        stack.extend(children)
+    return list(symbols)
+
+
+class ReturnMatrix:
+    """Latest-bar index per (trading date, symbol), built once per evaluation.
+
+    Rows are the union of all symbols' bar dates; each symbol's column holds
+    the index of its latest bar on or before the row's date (-1 for none),
+    so row ``searchsorted(dates, D) - 1`` answers "latest bar on or before
+    D" for every symbol at once.  Returns are computed in Decimal from the
+    two closes on first use and cached per bar.
+
+    Columns are added lazily: the first lookup loads the initial universe,
+    and a lookup that holds a symbol outside it loads just that symbol.  A
+    symbol that brings new dates widens the date axis by re-indexing the
+    existing columns; their closes are not reloaded.
+
+    Not thread-safe; use one matrix per evaluation.
+    """
+
+    def __init__(
+        self,
+        market_data_service: MarketDataPort,
+        symbols: Iterable[str] = (),
+        tail_rows: Mapping[str, int] | None = None,
+    ) -> None:
+        """Initialize matrix.
+
+        Args:
+            market_data_service: Source of daily closes.
+            symbols: Initial symbol universe (e.g. from ``collect_asset_symbols``).
+            tail_rows: Latest closes to load per symbol (a lookback plan);
+                unlisted symbols load full history.
+
+        """
+        self._market_data_service = market_data_service
+        self._universe: dict[str, None] = dict.fromkeys(symbols)
+        self._tail_rows: Mapping[str, int] = tail_rows or {}
+        self._closes: dict[str, tuple[DateArray, FloatArray]] = {}
+        # Truncated symbols -> first date whose return their loaded tail holds
+        self._first_return: dict[str, np.datetime64] = {}
+        # Symbols whose tail proved too short; always loaded in full
+        self._full_history: set[str] = set()
+        self._dates: DateArray = np.array([], dtype="datetime64[D]")
+        self._latest: dict[str, IndexArray] = {}
+        # Symbol -> bar index -> return of that bar (None if it has none)
+        self._bar_returns: dict[str, dict[int, Decimal | None]] = {}
+        self._built = False
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Return (dates, symbols) of the built matrix."""
+        return len(self._dates), len(self._latest)
+
+    def build(self) -> None:
+        """Load every universe symbol and build the matrix now, if not built yet."""
+        self._ensure(())
+
+    def portfolio_return(self, selections: dict[str, Decimal], record_date: date) -> Decimal | None:
+        """Compute the weight-normalised portfolio return on a date.
+
+        Args:
+            selections: Symbol-to-weight mapping; non-positive weights are ignored.
+            record_date: Date whose close-to-close return is wanted.
+
+        Returns:
+            Portfolio daily return, or None if no held symbol has a return.
+
+        """
+        held = {sym: weight for sym, weight in selections.items() if weight > Decimal("0")}
+        if not held:
+            return None
+        self._ensure(held)
+
+        record = np.datetime64(record_date, "D")
+        too_short = [
+            sym for sym in held if sym in self._first_return and record < self._first_return[sym]
+        ]
+        if too_short:
+            self._reload_full(too_short)
+
+        row_idx = int(np.searchsorted(self._dates, record, side="right"))
+        if row_idx == 0:
+            return None
+
+        weighted_return = Decimal("0")
+        total_weight = Decimal("0")
+        for sym, weight in held.items():
+            daily_return = self._bar_return(sym, int(self._latest[sym][row_idx - 1]))
+            if daily_return is not None:
+                weighted_return += weight * daily_return
+                total_weight += weight
+        if total_weight <= Decimal("0"):
+            return None
+        return weighted_return / total_weight
+
+    def _bar_return(self, symbol: str, bar: int) -> Decimal | None:
+        """Return a bar's close-to-close return (None without a usable previous close)."""
+        cache = self._bar_returns.setdefault(symbol, {})
+        if bar in cache:
+            return cache[bar]
+        result: Decimal | None = None
+        if bar >= 1:
+            _, closes = self._closes[symbol]
+            prev_close = Decimal(str(float(closes[bar - 1])))
+            if prev_close != Decimal("0"):
+                result = Decimal(str(float(closes[bar]))) / prev_close - Decimal("1")
+        cache[bar] = result
+        return result
+
+    def _ensure(self, symbols: Iterable[str]) -> None:
+        """Build the matrix, or add columns for symbols outside it."""
+        missing = [sym for sym in symbols if sym not in self._latest]
+        if self._built and not missing:
+            return
+        self._universe.update(dict.fromkeys(missing))
+        self._add_columns(missing if self._built else list(self._universe))
+        self._built = True
+
+    def _reload_full(self, symbols: list[str]) -> None:
+        """Replace truncated symbols' closes and columns with their full history."""
+        logger.debug(
+            "Return matrix lookback too short; loading full history",
+            extra={"symbols": symbols},
+        )
+        for sym in symbols:
+            self._closes.pop(sym, None)
+            self._first_return.pop(sym, None)
+            self._bar_returns.pop(sym, None)
+            self._full_history.add(sym)
+        self._add_columns(symbols)
+
+    def _add_columns(self, symbols: list[str]) -> None:
+        """Load symbols' closes and lay out (or replace) their columns."""
+        series = {sym: self._load_closes(sym) for sym in symbols}
+
+        new_dates = [dates for dates, _ in series.values() if len(dates)]
+        if new_dates:
+            dates = np.union1d(self._dates, np.concatenate(new_dates))
+            if len(dates) != len(self._dates):
+                self._widen(dates)
+
+        for sym, (sym_dates, _) in series.items():
+            self._latest[sym] = np.searchsorted(sym_dates, self._dates, side="right") - 1
+        logger.debug(
+            "Added group backfill return matrix columns",
+            extra={"added": len(symbols), "dates": len(self._dates), "symbols": len(self._latest)},
+        )
+
+    def _widen(self, dates: DateArray) -> None:
+        """Move existing columns onto a date axis that contains the current one."""
+        # A symbol's latest bar on a new date is its latest on the previous axis date
+        previous = np.searchsorted(self._dates, dates, side="right") - 1
+        has_row = previous >= 0
+        rows = previous[has_row]
+        for sym, column in self._latest.items():
+            widened = np.full(len(dates), -1, dtype=np.intp)
+            widened[has_row] = column[rows]
+            self._latest[sym] = widened
+        self._dates = dates
+
+    def _load_closes(self, symbol: str) -> tuple[DateArray, FloatArray]:
+        """Fetch a symbol's daily close history (or its planned tail) once per matrix."""
+        cached = self._closes.get(symbol)
+        if cached is not None:
+            return cached
+
+        dates: DateArray = np.array([], dtype="datetime64[D]")
+        closes: FloatArray = np.array([], dtype=np.float64)
+        tail_rows = None if symbol in self._full_history else self._tail_rows.get(symbol)
+        try:
+            if isinstance(self._market_data_service, ColumnarMarketDataPort):
+                close_array = self._market_data_service.get_close_array(
+                    Symbol(symbol), period="MAX", tail_rows=tail_rows
+                )
+                if close_array is not None:
+                    dates = close_array.timestamps.astype("datetime64[D]")
+                    closes = np.asarray(close_array.closes, dtype=np.float64)
+                    # A tail of exactly tail_rows closes may have cut older history;
+                    # its first close has no predecessor, so no return
+                    if tail_rows is not None and len(dates) >= tail_rows:
+                        self._first_return[symbol] = (
+                            dates[1] if len(dates) > 1 else np.datetime64("9999-12-31", "D")
+                        )
+            else:
+                bars = self._market_data_service.get_bars(
+                    symbol=Symbol(symbol), period="MAX", timeframe="1Day"
+                )
+                dates = np.array([bar.timestamp.date() for bar in bars], dtype="datetime64[D]")
+                closes = np.array([float(bar.close) for bar in bars], dtype=np.float64)
+        except Exception as exc:
+            logger.warning(
+                "Backfill: failed to get bars for %s: %s",
+                symbol,
+                exc,
+            )
+
+        self._closes[symbol] = (dates, closes)
+        return dates, closes
@@ -0,0 +1,247 @@
+"""Business Unit: strategy | Status: current.
+
+Opt-in profiler for DSL evaluation.
+
+When enabled, the dispatcher opens a frame around every operator call and
+the indicator service reports every ``get_indicator`` request, so one
+evaluation yields:
+
+    - per-operator call counts, inclusive and self wall time;
+    - per AST path (operator stack, with group names) self wall time,
+      exportable as collapsed stacks for flamegraph.pl / speedscope;
+    - per indicator key call counts, time and cache hit ratios (in-memory
+      cache, cross-worker result store, or computed).
+
+Disabled evaluations pay one ``is None`` check per dispatch. Work done in
+the group scheduler's worker processes is not visible here; it shows up as
+self time of the ``[schedule_group_returns]`` phase frame.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Literal, Protocol, runtime_checkable
+
+from the_alchemiser.shared.schemas.ast_node import ASTNode
+
+# Where an indicator value came from
+type IndicatorSource = Literal["memory", "shared", "computed"]
+
+# Entries kept per section of the JSON summary
+SUMMARY_TOP_N = 25
+
+# Operators whose first argument names the frame (e.g. group "Inner X")
+_NAMED_OPERATORS = frozenset({"group"})
+
+
+@runtime_checkable
+class ProfiledIndicatorService(Protocol):
+    """Indicator service that reports requests to an attached profiler."""
+
+    profiler: DslProfiler | None
+
+
+@dataclass(slots=True)
+class _OperatorStats:
+    """Aggregate timings for one operator."""
+
+    calls: int = 0
+    inclusive_s: float = 0.0
+    self_s: float = 0.0
+
+
+@dataclass(slots=True)
+class _IndicatorStats:
+    """Aggregate timings and cache outcomes for one indicator key."""
+
+    calls: int = 0
+    memory_hits: int = 0
+    shared_hits: int = 0
+    computed: int = 0
+    total_s: float = 0.0
+
+
+class DslProfiler:
+    """Wall-time and call-count profiler for one DSL evaluation.
+
+    Not thread-safe; frames are tracked on a single stack.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty profile."""
+        self._stack: list[list[Any]] = []  # [label, operator, start, child_s]
+        self._operators: dict[str, _OperatorStats] = {}
+        self._active: dict[str, int] = {}
+        self._paths: dict[tuple[str, ...], list[float]] = {}  # path -> [calls, self_s]
+        self._indicators: dict[str, _IndicatorStats] = {}
+        self._started = time.perf_counter()
+        self._elapsed_s: float | None = None
+
+    def enter(self, operator: str, args: list[ASTNode] | None = None) -> None:
+        """Open a frame for an operator call.
+
+        Args:
+            operator: Operator (DSL symbol) or phase name
+            args: Operator arguments, used to label named frames
+
+        """
+        label = operator
+        if operator in _NAMED_OPERATORS and args:
+            name = args[0].get_atom_value()
+            if isinstance(name, str):
+                label = f"{operator} {name}"
+        self._active[operator] = self._active.get(operator, 0) + 1
+        self._stack.append([label.replace(";", ","), operator, time.perf_counter(), 0.0])
+
+    def exit(self) -> None:
+        """Close the innermost frame and attribute its time."""
+        label, operator, start, child_s = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        self_s = max(elapsed - child_s, 0.0)
+        if self._stack:
+            self._stack[-1][3] += elapsed
+
+        stats = self._operators.get(operator)
+        if stats is None:
+            stats = self._operators[operator] = _OperatorStats()
+        stats.calls += 1
+        stats.self_s += self_s
+        # Count inclusive time only at the outermost frame of a recursive operator
+        self._active[operator] -= 1
+        if self._active[operator] == 0:
+            stats.inclusive_s += elapsed
+
+        path = (*(frame[0] for frame in self._stack), label)
+        totals = self._paths.get(path)
+        if totals is None:
+            self._paths[path] = [1, self_s]
+        else:
+            totals[0] += 1
+            totals[1] += self_s
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Profile a non-operator phase of the evaluation as its own frame.
+
+        Args:
+            name: Phase name; shown in brackets to set it apart from operators
+
+        """
+        self.enter(f"[{name}]")
+        try:
+            yield
+        finally:
+            self.exit()
+
+    def record_indicator(self, key: str, source: IndicatorSource, elapsed_s: float) -> None:
+        """Record one ``get_indicator`` request.
+
+        Args:
+            key: Indicator key, e.g. ``rsi(SPY, window=10)``
+            source: Whether the value came from memory, the shared store or was computed
+            elapsed_s: Wall time spent in ``get_indicator``
+
+        """
+        stats = self._indicators.get(key)
+        if stats is None:
+            stats = self._indicators[key] = _IndicatorStats()
+        stats.calls += 1
+        stats.total_s += elapsed_s
+        if source == "memory":
+            stats.memory_hits += 1
+        elif source == "shared":
+            stats.shared_hits += 1
+        else:
+            stats.computed += 1
+
+    def finish(self) -> None:
+        """Stop the wall clock; later summaries report the same total."""
+        if self._elapsed_s is None:
+            self._elapsed_s = time.perf_counter() - self._started
+
+    def collapsed_stacks(self, max_lines: int | None = None) -> str:
+        """Return self time per AST path in collapsed-stack format.
+
+        One ``frame;frame;frame <microseconds>`` line per path, heaviest
+        first, as consumed by flamegraph.pl and speedscope.
+
+        Args:
+            max_lines: Keep only the heaviest paths (None keeps all)
+
+        """
+        lines = [(";".join(path), round(s * 1_000_000)) for path, (_, s) in self._paths.items()]
+        lines.sort(key=lambda line: line[1], reverse=True)
+        kept = [f"{stack} {micros}" for stack, micros in lines if micros > 0]
+        return "\n".join(kept[:max_lines])
+
+    def summary(self, top_n: int = SUMMARY_TOP_N) -> dict[str, Any]:
+        """Return a JSON-serializable summary of the profile.
+
+        Args:
+            top_n: Entries kept in each ranked section
+
+        Returns:
+            Totals plus the top operators (by self time), AST paths (by self
+            time) and indicator keys (by time), with cache hit ratios.
+
+        """
+        self.finish()
+        elapsed_s = self._elapsed_s or 0.0
+
+        operators = sorted(self._operators.items(), key=lambda item: item[1].self_s, reverse=True)
+        paths = sorted(self._paths.items(), key=lambda item: item[1][1], reverse=True)
+        indicators = sorted(
+            self._indicators.items(), key=lambda item: item[1].total_s, reverse=True
+        )
+
+        indicator_calls = sum(stats.calls for stats in self._indicators.values())
+        memory_hits = sum(stats.memory_hits for stats in self._indicators.values())
+        shared_hits = sum(stats.shared_hits for stats in self._indicators.values())
+        computed = sum(stats.computed for stats in self._indicators.values())
+
+        return {
+            "wall_ms": _ms(elapsed_s),
+            "frames": sum(stats.calls for stats in self._operators.values()),
+            "unique_paths": len(self._paths),
+            "indicator_calls": indicator_calls,
+            "indicator_hit_ratio": _ratio(memory_hits + shared_hits, indicator_calls),
+            "indicator_memory_hits": memory_hits,
+            "indicator_shared_hits": shared_hits,
+            "indicators_computed": computed,
+            "operators": [
+                {
+                    "operator": name,
+                    "calls": stats.calls,
+                    "inclusive_ms": _ms(stats.inclusive_s),
+                    "self_ms": _ms(stats.self_s),
+                }
+                for name, stats in operators[:top_n]
+            ],
+            "paths": [
+                {"path": ";".join(path), "calls": int(calls), "self_ms": _ms(self_s)}
+                for path, (calls, self_s) in paths[:top_n]
+            ],
+            "indicators": [
+                {
+                    "key": key,
+                    "calls": stats.calls,
+                    "total_ms": _ms(stats.total_s),
+                    "hit_ratio": _ratio(stats.memory_hits + stats.shared_hits, stats.calls),
+                    "computed": stats.computed,
+                }
+                for key, stats in indicators[:top_n]
+            ],
+        }
+
+
+def _ms(seconds: float) -> float:
+    """Convert seconds to milliseconds rounded for reporting."""
+    return round(seconds * 1000, 3)
+
+
+def _ratio(hits: int, calls: int) -> float | None:
+    """Return hits / calls, or None when there were no calls."""
+    return round(hits / calls, 4) if calls else None
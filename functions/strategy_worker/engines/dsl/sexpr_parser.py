@@ -9,15 +9,48 @@ for evaluation by the DSL engine.
 
 from __future__ import annotations
 
+import gc
 import re
+from collections.abc import Iterator
+from contextlib import contextmanager
 from decimal import Decimal
 from pathlib import Path
+from typing import Literal
+
+from engines.dsl.ast_interner import AstInterner
 
 from the_alchemiser.shared.logging import get_logger
 from the_alchemiser.shared.schemas.ast_node import ASTNode
 
 logger = get_logger(__name__)
 
+# Tokens that separate expressions but are never emitted
+_SKIPPED_TOKEN_TYPES = frozenset({"WHITESPACE", "COMMENT", "COMMA"})
+
+# Opening token type -> the token type that closes it
+_OPENING_TOKENS = {"LPAREN": "RPAREN", "LBRACKET": "RBRACKET", "LBRACE": "RBRACE"}
+_CLOSING_TOKENS = frozenset(_OPENING_TOKENS.values())
+
+TokenizerMode = Literal["scanner", "sequential"]
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """Pause the cyclic garbage collector while building a large AST.
+
+    Building tens of thousands of nodes trips repeated full collections that
+    find nothing to free (the tree is acyclic and fully reachable), roughly
+    doubling parse time for the largest strategies. Collection is re-enabled
+    on exit only if it was enabled on entry.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
 
 class SexprParseError(Exception):
     """Error parsing S-expressions."""
@@ -38,14 +71,34 @@ class SexprParser:
     """Parser for Clojure-style S-expressions.
 
     Converts S-expression text into ASTNode tree structures for DSL evaluation.
+
+    Two tokenizer modes produce identical token streams:
+
+    - ``scanner`` (default): one master alternation regex swept across the
+      text with ``finditer``; each match's ``lastgroup`` names the token type.
+    - ``sequential``: tries every token pattern in turn at each position.
+      Kept for parity checks and benchmarking.
+
+    Parser-produced nodes are built through ``ASTNode.trusted`` because the
+    tokenizer already guarantees their shape; per-node pydantic validation
+    was the single largest cost of parsing the big strategies. Each parse
+    hash-conses its nodes (see engines.dsl.ast_interner), so structurally
+    identical subtrees are returned as one shared node.
     """
 
     # Resource limits to prevent DoS attacks
     MAX_NESTING_DEPTH = 300
     MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB
 
-    def __init__(self) -> None:
-        """Initialize parser."""
+    def __init__(self, tokenizer_mode: TokenizerMode = "scanner") -> None:
+        """Initialize parser.
+
+        Args:
+            tokenizer_mode: "scanner" (single-pass master regex) or
+                "sequential" (per-pattern matching at each position)
+
+        """
+        self.tokenizer_mode = tokenizer_mode
         # IMPORTANT: Pattern order matters!
         # - FLOAT must come before INTEGER (else "3.14" matches as "3")
         # - STRING pattern handles escaped quotes/backslashes
@@ -76,8 +129,24 @@ class SexprParser:
             (re.compile(pattern), token_type) for pattern, token_type in self.token_patterns
         ]
 
+        # Master pattern: the same alternatives in the same order (Python's
+        # alternation is first-match, so precedence is preserved), plus an
+        # unterminated-string and a catch-all alternative so every character
+        # of the input is covered by exactly one match. DOTALL lets an
+        # escaped newline inside a string match, as in _consume_string.
+        self.master_pattern = re.compile(
+            "|".join(
+                [f"(?P<{token_type}>{pattern})" for pattern, token_type in self.token_patterns]
+                + ['(?P<UNTERMINATED>")', "(?P<MISMATCH>.)"]
+            ),
+            re.DOTALL,
+        )
+
     def tokenize(self, text: str) -> list[tuple[str, str]]:
         """Tokenize S-expression text into (value, type) tuples."""
+        if self.tokenizer_mode == "scanner":
+            return self._scan(text)
+
         tokens: list[tuple[str, str]] = []
         position = 0
         length = len(text)
@@ -87,6 +156,35 @@ class SexprParser:
 
         return tokens
 
+    def _scan(self, text: str) -> list[tuple[str, str]]:
+        """Tokenize in a single sweep of the master pattern.
+
+        Args:
+            text: The text being tokenized
+
+        Returns:
+            List of (value, type) tuples, identical to sequential tokenization
+
+        Raises:
+            SexprParseError: On an unterminated string or unexpected character
+
+        """
+        tokens: list[tuple[str, str]] = []
+        append = tokens.append
+        skipped = _SKIPPED_TOKEN_TYPES
+
+        for match in self.master_pattern.finditer(text):
+            tok_type = match.lastgroup
+            if tok_type in skipped:
+                continue
+            if tok_type == "UNTERMINATED":
+                raise SexprParseError("Unterminated string literal", match.start())
+            if tok_type == "MISMATCH":
+                raise SexprParseError(f"Unexpected character: {match.group()}", match.start())
+            append((match.group(), tok_type))  # type: ignore[arg-type]
+
+        return tokens
+
     def _process_character_at_position(
         self, text: str, position: int, tokens: list[tuple[str, str]]
     ) -> int:
@@ -164,11 +262,12 @@ class SexprParser:
         )
 
         try:
-            tokens = self.tokenize(text)
-            if not tokens:
-                raise SexprParseError("Empty input")
+            with paused_gc():
+                tokens = self.tokenize(text)
+                if not tokens:
+                    raise SexprParseError("Empty input")
 
-            ast, remaining = self._parse_expression(tokens, 0)
+                ast, remaining = self._build_tree(tokens)
 
             if remaining < len(tokens):
                 remaining_tokens = tokens[remaining:]
@@ -190,129 +289,85 @@ class SexprParser:
             )
             raise
 
-    def _parse_expression(
-        self, tokens: list[tuple[str, str]], index: int, depth: int = 0
-    ) -> tuple[ASTNode, int]:
-        """Parse a single expression.
+    def _build_tree(self, tokens: list[tuple[str, str]]) -> tuple[ASTNode, int]:
+        """Build the AST for the first expression in a token stream.
 
-        Args:
-            tokens: List of tokens
-            index: Current token index
-            depth: Current nesting depth (for recursion limit)
-
-        Returns:
-            Tuple of (ASTNode, next_index)
-
-        Raises:
-            SexprParseError: If parsing fails or nesting depth exceeded
-
-        """
-        # Check nesting depth to prevent stack overflow
-        if depth > self.MAX_NESTING_DEPTH:
-            raise SexprParseError(
-                f"Maximum nesting depth {self.MAX_NESTING_DEPTH} exceeded at position {index}"
-            )
-
-        if index >= len(tokens):
-            raise SexprParseError("Unexpected end of input")
-
-        token_value, tok_type = tokens[index]
-
-        if tok_type == "LPAREN":
-            return self._parse_list(tokens, index + 1, "RPAREN", depth)
-        if tok_type == "LBRACKET":
-            return self._parse_list(tokens, index + 1, "RBRACKET", depth)
-        if tok_type == "LBRACE":
-            return self._parse_map(tokens, index + 1, depth)
-        return self._parse_atom(token_value, tok_type), index + 1
-
-    def _parse_list(
-        self, tokens: list[tuple[str, str]], index: int, end_token: str, depth: int = 0
-    ) -> tuple[ASTNode, int]:
-        """Parse a list expression.
-
-        Args:
-            tokens: List of tokens
-            index: Current token index
-            end_token: Expected end token type
-            depth: Current nesting depth
-
-        Returns:
-            Tuple of (ASTNode, next_index)
-
-        Raises:
-            SexprParseError: If parsing fails
-
-        """
-        children: list[ASTNode] = []
-        current_index = index
-
-        while current_index < len(tokens):
-            _token_value, tok_type = tokens[current_index]
-
-            if tok_type == end_token:
-                return ASTNode.list_node(children), current_index + 1
-
-            child, current_index = self._parse_expression(tokens, current_index, depth + 1)
-            children.append(child)
-
-        raise SexprParseError(f"Missing closing {end_token}")
-
-    def _parse_map(
-        self, tokens: list[tuple[str, str]], index: int, depth: int = 0
-    ) -> tuple[ASTNode, int]:
-        """Parse a map expression.
+        Iterative equivalent of recursive descent: each open list or map is a
+        frame on an explicit stack, so deep strategies cost no Python call
+        frames and each token is visited exactly once. Nodes are interned,
+        so the result is a DAG sharing every repeated subtree.
 
         Args:
-            tokens: List of tokens
-            index: Current token index
-            depth: Current nesting depth
+            tokens: Non-empty list of tokens
 
         Returns:
-            Tuple of (ASTNode, next_index)
+            Tuple of (ASTNode, index of the first token after the expression)
 
         Raises:
-            SexprParseError: If parsing fails
+            SexprParseError: If parsing fails or nesting depth exceeded
 
         """
-        children: list[ASTNode] = []
-        current_index = index
-
-        while current_index < len(tokens):
-            _token_value, tok_type = tokens[current_index]
-
-            if tok_type == "RBRACE":
-                # Convert map to list node with metadata indicating it's a map
-                return (
-                    ASTNode.list_node(children, metadata={"node_subtype": "map"}),
-                    current_index + 1,
+        # Frames are (children, closing token type); map frames close on RBRACE
+        stack: list[tuple[list[ASTNode], str]] = []
+        interner = AstInterner()
+        closers = _CLOSING_TOKENS
+        max_depth = self.MAX_NESTING_DEPTH
+
+        for index, (token_value, tok_type) in enumerate(tokens):
+            if tok_type in closers:
+                if stack:
+                    children, closer = stack[-1]
+                    if tok_type == closer:
+                        if closer != "RBRACE":
+                            node = interner.list_node(children)
+                        elif len(children) % 2 == 0:
+                            # Convert map to list node with metadata indicating it's a map
+                            node = interner.list_node(children, is_map=True)
+                        else:
+                            raise SexprParseError(f"Unknown token type: {tok_type}")
+                        stack.pop()
+                        if not stack:
+                            return node, index + 1
+                        stack[-1][0].append(node)
+                        continue
+                raise SexprParseError(f"Unknown token type: {tok_type}")
+
+            # Check nesting depth to prevent stack overflow in later tree walks
+            if len(stack) > max_depth:
+                raise SexprParseError(
+                    f"Maximum nesting depth {max_depth} exceeded at position {index}"
                 )
 
-            # Parse key-value pairs
-            key, current_index = self._parse_expression(tokens, current_index, depth + 1)
-            children.append(key)
-
-            if current_index >= len(tokens):
-                raise SexprParseError("Missing value in map")
+            if tok_type in _OPENING_TOKENS:
+                stack.append(([], _OPENING_TOKENS[tok_type]))
+                continue
 
-            value, current_index = self._parse_expression(tokens, current_index, depth + 1)
-            children.append(value)
+            node = self._parse_atom(token_value, tok_type, interner)
+            if not stack:
+                return node, index + 1
+            stack[-1][0].append(node)
 
-        raise SexprParseError("Missing closing }")
+        children, closer = stack[-1]
+        if closer == "RBRACE":
+            if len(children) % 2:
+                raise SexprParseError("Missing value in map")
+            raise SexprParseError("Missing closing }")
+        raise SexprParseError(f"Missing closing {closer}")
 
-    def _parse_atom(self, token_value: str, tok_type: str) -> ASTNode:
+    def _parse_atom(self, token_value: str, tok_type: str, interner: AstInterner) -> ASTNode:
         """Parse an atomic value.
 
         Args:
             token_value: Token value
             tok_type: Token type
+            interner: Interner of the current parse
 
         Returns:
             ASTNode representing the atom
 
         """
         if tok_type == "SYMBOL":
-            return ASTNode.symbol(token_value)
+            return interner.symbol(token_value)
         if tok_type == "STRING":
             # Remove quotes and unescape common sequences
             raw = token_value[1:-1]
@@ -324,12 +379,13 @@ class SexprParser:
                 .replace(r"\\r", "\r")
                 .replace(r"\\\\", "\\")
             )
-            return ASTNode.atom(string_value)
+            # Strip as ASTNode's str_strip_whitespace validation would
+            return interner.atom(string_value.strip())
         if tok_type == "FLOAT" or tok_type == "INTEGER":
-            return ASTNode.atom(Decimal(token_value))
+            return interner.atom(Decimal(token_value))
         if tok_type == "KEYWORD":
             # Keywords are symbols with : prefix
-            return ASTNode.symbol(token_value)
+            return interner.symbol(token_value)
         raise SexprParseError(f"Unknown token type: {tok_type}")
 
     def parse_file(self, file_path: str, correlation_id: str | None = None) -> ASTNode:
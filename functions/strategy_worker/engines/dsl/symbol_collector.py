@@ -0,0 +1,58 @@
+"""Business Unit: strategy | Status: current.
+
+Symbol extraction from parsed strategy ASTs.
+
+Mirrors the data function's .clj symbol extractor, but walks the parsed AST
+instead of regex-matching source text, so it sees exactly what the evaluator
+will request: every ``(asset "SYM" ...)`` and every indicator call whose
+first argument is a literal ticker.
+"""
+
+from __future__ import annotations
+
+from the_alchemiser.shared.schemas.ast_node import ASTNode
+
+# Indicator operators whose first argument is a ticker symbol
+SYMBOL_INDICATORS = frozenset(
+    {
+        "rsi",
+        "current-price",
+        "moving-average-price",
+        "moving-average-return",
+        "cumulative-return",
+        "exponential-moving-average-price",
+        "stdev-return",
+        "stdev-price",
+        "max-drawdown",
+        "percentage-price-oscillator",
+        "percentage-price-oscillator-signal",
+        "ma",
+        "volatility",
+    }
+)
+
+
+def collect_strategy_symbols(ast: ASTNode) -> list[str]:
+    """Return every ticker a strategy can read market data for, in first-seen order.
+
+    Args:
+        ast: Root AST node of a strategy.
+
+    Returns:
+        Distinct symbols referenced by asset declarations and indicator calls.
+
+    """
+    symbols: dict[str, None] = {}
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if not node.is_list() or not node.children:
+            continue
+        children = node.children
+        head = children[0].get_symbol_name()
+        if (head == "asset" or head in SYMBOL_INDICATORS) and len(children) > 1:
+            value = children[1].get_atom_value()
+            if isinstance(value, str) and value:
+                symbols[value] = None
+        stack.extend(reversed(children))
+    return list(symbols)
@@ -0,0 +1,68 @@
+"""Business Unit: strategy | Status: current.
+
+Deterministic synthetic daily bars for evaluator tests.
+
+SyntheticBarStore stands in for MarketDataStore behind a real
+CachedMarketDataAdapter: every symbol gets a geometric random walk seeded
+from its name, ending on the last weekday before today.
+"""
+
+from __future__ import annotations
+
+import zlib
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from the_alchemiser.shared.data_v2.cached_market_data_adapter import CachedMarketDataAdapter
+from the_alchemiser.shared.data_v2.columnar_bar_store import ColumnarBarStore
+from the_alchemiser.shared.data_v2.market_data_store import SymbolMetadata
+
+
+class SyntheticBarStore:
+    """MarketDataStore stand-in serving the same random walk for a symbol every time."""
+
+    def __init__(self, sessions: int = 300) -> None:
+        end = datetime.now(UTC).date() - timedelta(days=1)
+        self.dates = pd.bdate_range(end=end, periods=sessions, tz="UTC")
+        self._frames: dict[str, pd.DataFrame] = {}
+
+    def _frame(self, symbol: str) -> pd.DataFrame:
+        frame = self._frames.get(symbol)
+        if frame is None:
+            size = len(self.dates)
+            rng = np.random.default_rng(zlib.crc32(symbol.encode("utf-8")))
+            volatility = rng.uniform(0.005, 0.04)
+            close = rng.uniform(20.0, 300.0) * np.exp(
+                np.cumsum(rng.normal(0.0003, volatility, size=size))
+            )
+            frame = pd.DataFrame(
+                {
+                    "timestamp": self.dates,
+                    "open": close,
+                    "high": close,
+                    "low": close,
+                    "close": close,
+                    "volume": np.full(size, 1_000_000.0),
+                }
+            )
+            self._frames[symbol] = frame
+        return frame
+
+    def get_cached_metadata(self, symbol: str) -> SymbolMetadata:
+        return SymbolMetadata(symbol, str(self.dates[-1].date()), len(self.dates), "now")
+
+    def read_symbol_data(self, symbol: str) -> pd.DataFrame:
+        return self._frame(symbol)
+
+    def read_symbol_tail(self, symbol: str, rows: int) -> pd.DataFrame:
+        return self._frame(symbol).tail(rows)
+
+
+def synthetic_adapter(sessions: int = 300) -> CachedMarketDataAdapter:
+    """Return a CachedMarketDataAdapter over a fresh SyntheticBarStore."""
+    return CachedMarketDataAdapter(
+        SyntheticBarStore(sessions),  # type: ignore[arg-type]
+        bar_store=ColumnarBarStore(),
+    )
@@ -0,0 +1,155 @@
+"""Business Unit: strategy | Status: current.
+
+Unit tests for the group history cache.
+
+Tests:
+- flush resends items DynamoDB leaves unprocessed and reports the items it
+  drops instead of losing them silently
+- The strategy role grants every DynamoDB call the cache makes on the
+  group history table
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+import yaml
+from botocore.exceptions import ClientError
+from engines.dsl.operators import group_cache_lookup
+from engines.dsl.operators.group_cache_lookup import GroupHistoryCache
+
+TEMPLATE = Path(__file__).resolve().parents[5] / "template.yaml"
+END = date(2026, 3, 31)
+
+
+class FakeClient:
+    """Low-level client whose batch writes leave the first `unprocessed` items unwritten once."""
+
+    def __init__(self, table: FakeTable, *, unprocessed: int = 0, error: str = "") -> None:
+        self._table = table
+        self._unprocessed = unprocessed
+        self._error = error
+
+    def batch_write_item(self, RequestItems: dict[str, list[Any]]) -> dict[str, Any]:  # noqa: N803
+        self._table.calls.append("batch_write_item")
+        if self._error:
+            raise ClientError({"Error": {"Code": self._error, "Message": ""}}, "BatchWriteItem")
+        requests = RequestItems[self._table.name]
+        kept, self._unprocessed = requests[: self._unprocessed], 0
+        for request in requests[len(kept) :]:
+            item = request["PutRequest"]["Item"]
+            self._table.items[(item["group_id"], item["record_date"])] = item
+        return {"UnprocessedItems": {self._table.name: kept} if kept else {}}
+
+
+class FakeTable:
+    """Table resource recording the DynamoDB operations called on it."""
+
+    name = "group-history"
+
+    def __init__(self, **client_options: Any) -> None:  # noqa: ANN401
+        self.calls: list[str] = []
+        self.items: dict[tuple[str, str], dict[str, Any]] = {}
+        self.meta = SimpleNamespace(client=FakeClient(self, **client_options))
+
+    def query(self, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        self.calls.append("query")
+        return {"Items": []}
+
+    def put_item(self, Item: dict[str, Any]) -> None:  # noqa: N803
+        self.calls.append("put_item")
+        self.items[(Item["group_id"], Item["record_date"])] = Item
+
+
+def _buffer(cache: GroupHistoryCache, days: int) -> None:
+    for day in range(1, days + 1):
+        cache.write_historical_return(
+            "grp", date(2026, 1, day).isoformat(), {"SPY": "1"}, Decimal("0.01")
+        )
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(group_cache_lookup, "FLUSH_RETRY_BASE_SECONDS", 0.0)
+
+
+def test_flush_resends_unprocessed_items() -> None:
+    table = FakeTable(unprocessed=3)
+    cache = GroupHistoryCache(table)
+    _buffer(cache, 30)
+
+    written = cache.flush()
+
+    assert written == 30
+    assert len(table.items) == 30
+    # Two batches of 25 and 5, then one resend of the 3 unprocessed items
+    assert table.calls == ["batch_write_item"] * 3
+    assert cache.pending_writes == 0
+
+
+def test_flush_reports_dropped_items(monkeypatch: pytest.MonkeyPatch) -> None:
+    errors: list[tuple[str, dict[str, Any]]] = []
+    monkeypatch.setattr(
+        group_cache_lookup.logger, "error", lambda event, **kw: errors.append((event, kw))
+    )
+    cache = GroupHistoryCache(FakeTable(error="AccessDeniedException"))
+    _buffer(cache, 3)
+
+    written = cache.flush()
+
+    assert written == 0
+    assert errors[-1] == (
+        "Dropped buffered group history writes",
+        {"extra": {"items": 3, "written": 0, "dropped": 3}},
+    )
+
+
+def _cfn_loader() -> type[yaml.SafeLoader]:
+    """SafeLoader that reads CloudFormation tags (!Ref, !GetAtt, ...) as {tag: value}."""
+
+    class Loader(yaml.SafeLoader):
+        pass
+
+    def construct(loader: yaml.SafeLoader, suffix: str, node: yaml.Node) -> dict[str, Any]:
+        if isinstance(node, yaml.ScalarNode):
+            return {suffix: loader.construct_scalar(node)}
+        if isinstance(node, yaml.SequenceNode):
+            return {suffix: loader.construct_sequence(node, deep=True)}
+        return {suffix: loader.construct_mapping(node, deep=True)}  # type: ignore[arg-type]
+
+    Loader.add_multi_constructor("!", construct)
+    return Loader
+
+
+def _granted_actions(role: str, table_logical_id: str) -> set[str]:
+    template = yaml.load(TEMPLATE.read_text(encoding="utf-8"), Loader=_cfn_loader())  # noqa: S506
+    policies = template["Resources"][role]["Properties"]["Policies"]
+    actions: set[str] = set()
+    for policy in policies:
+        for statement in policy["PolicyDocument"]["Statement"]:
+            if {"GetAtt": f"{table_logical_id}.Arn"} in statement.get("Resource", []):
+                actions.update(statement["Action"])
+    return actions
+
+
+def test_strategy_role_grants_cache_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    table = FakeTable()
+    cache = GroupHistoryCache(table)
+    cache.prefetch(["grp"], end_date=END)
+    cache.lookup_historical_returns("grp", 200, end_date=END)
+    _buffer(cache, 2)
+    cache.flush()
+    monkeypatch.setattr(group_cache_lookup, "_dynamodb_table", table)
+    group_cache_lookup.write_historical_return("grp", "2026-03-31", {}, Decimal("0"))
+
+    used = {
+        "dynamodb:" + "".join(part.title() for part in call.split("_")) for call in table.calls
+    }
+
+    assert used == {"dynamodb:Query", "dynamodb:BatchWriteItem", "dynamodb:PutItem"}
+    assert used <= _granted_actions("StrategyExecutionRole", "GroupHistoricalSelectionsTable")
@@ -0,0 +1,149 @@
+"""Business Unit: strategy | Status: current.
+
+Tests for the bottom-up group scheduler.
+
+Tests:
+- Groups that share a name but not a body are scheduled separately
+- A strategy reusing group names allocates the same with and without the
+  scheduler
+- A day whose group evaluation raises books no return
+- Levels run serially unless process pools are opted in, and an unusable
+  pool is probed once per process, not once per level
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from engines.dsl import dsl_evaluator
+from engines.dsl.dsl_evaluator import DslEvaluator
+from engines.dsl.operators import group_scheduler, group_scoring
+from engines.dsl.operators.group_scheduler import GroupDependencyGraph
+from engines.dsl.sexpr_parser import SexprParser
+from engines.dsl.tests.synthetic_market_data import synthetic_adapter
+from indicators.indicator_service import IndicatorService
+
+# "Sector" is scored by two filters with different bodies
+STRATEGY = """
+(defsymphony
+ "shared group names"
+ {:asset-class "EQUITIES", :rebalance-frequency :daily}
+ (weight-equal
+  [(filter
+    (cumulative-return {:window 5})
+    (select-top 1)
+    [(group
+      "Sector"
+      [(weight-equal
+        [(filter (moving-average-return {:window 20}) (select-top 1)
+          [(asset "XLK") (asset "TECL")])])])
+     (group
+      "Other"
+      [(weight-equal
+        [(filter (moving-average-return {:window 20}) (select-top 1)
+          [(asset "XLF") (asset "FAS")])])])])
+   (filter
+    (cumulative-return {:window 5})
+    (select-top 1)
+    [(group
+      "Sector"
+      [(weight-equal
+        [(filter (moving-average-return {:window 3}) (select-bottom 1)
+          [(asset "XLE") (asset "ERX")])])])
+     (group
+      "Other"
+      [(weight-equal
+        [(filter (moving-average-return {:window 3}) (select-bottom 1)
+          [(asset "XLV") (asset "CURE")])])])])]))
+"""
+
+
+def _allocate(*, scheduled: bool, monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    with monkeypatch.context() as patch:
+        if not scheduled:
+            patch.setattr(dsl_evaluator, "schedule_group_returns", lambda ast, context: None)
+        evaluator = DslEvaluator(IndicatorService(synthetic_adapter()))
+        allocation, _ = evaluator.evaluate(SexprParser().parse(STRATEGY), "scheduler-test")
+    return dict(allocation.target_weights)
+
+
+def test_shared_names_are_separate_nodes() -> None:
+    graph = GroupDependencyGraph.from_ast(SexprParser().parse(STRATEGY))
+
+    names = sorted(node.group_name for node in graph.nodes.values())
+    assert names == ["Other", "Other", "Sector", "Sector"]
+    assert len(graph.roots) == 4
+    assert graph.shared_group_ids == {
+        group_scoring.derive_group_id("Sector"),
+        group_scoring.derive_group_id("Other"),
+    }
+
+
+def test_scheduled_allocation_matches_unscheduled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GROUP_HISTORY_TABLE", raising=False)
+
+    scheduled = _allocate(scheduled=True, monkeypatch=monkeypatch)
+    unscheduled = _allocate(scheduled=False, monkeypatch=monkeypatch)
+
+    assert scheduled == unscheduled
+    assert sum(scheduled.values()) == pytest.approx(Decimal(1))
+
+
+def test_failed_evaluation_books_no_return(monkeypatch: pytest.MonkeyPatch) -> None:
+    days = [date(2026, 3, 2), date(2026, 3, 3), date(2026, 3, 4)]
+
+    def evaluate(body: list[Any], eval_date: date, context: Any) -> dict[str, Decimal]:
+        if eval_date == days[1]:
+            raise ValueError("no data")
+        return {"SPY": Decimal(1)}
+
+    monkeypatch.setattr(group_scoring, "_evaluate_group_signal_for_date", evaluate)
+    monkeypatch.setattr(
+        group_scoring,
+        "_compute_daily_return_for_portfolio",
+        lambda selections, record_date, context: Decimal("0.01"),
+    )
+    context = SimpleNamespace(indicator_service=SimpleNamespace(as_of_date=None))
+
+    series = group_scoring.compute_group_return_series([], days, context)  # type: ignore[arg-type]
+
+    assert [day for day, _, _ in series] == [days[2]]
+    assert context.indicator_service.as_of_date is None
+
+
+def test_levels_fall_back_to_serial_after_one_probe(monkeypatch: pytest.MonkeyPatch) -> None:
+    probes: list[str] = []
+
+    class NoSemaphores:
+        def Semaphore(self) -> None:  # noqa: N802
+            probes.append("semaphore")
+            raise OSError("no /dev/shm")
+
+    def no_pool(*args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        raise AssertionError("process pool started after a failed probe")
+
+    monkeypatch.setattr(group_scheduler.mp, "get_context", lambda method: NoSemaphores())
+    monkeypatch.setattr(group_scheduler, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(group_scheduler, "_PROCESS_POOL_AVAILABLE", None)
+    monkeypatch.setattr(group_scheduler, "GROUP_SCHEDULER_WORKERS", 2)
+    monkeypatch.setattr(
+        group_scheduler,
+        "compute_group_return_series",
+        lambda body, days, context: [(days[0], Decimal("0.01"), {})],
+    )
+    level = [
+        group_scheduler.GroupNode((name, ()), name, name, []) for name in ("Low", "High")
+    ]
+    plan = {node.key: [date(2026, 3, 2)] for node in level}
+
+    serial = group_scheduler._run_level(level, plan, None)  # type: ignore[arg-type]
+    monkeypatch.setattr(group_scheduler, "GROUP_SCHEDULER_PROCESSES", True)
+    for _ in range(3):
+        pooled = group_scheduler._run_level(level, plan, None)  # type: ignore[arg-type]
+
+    assert pooled == serial
+    assert probes == ["semaphore"]
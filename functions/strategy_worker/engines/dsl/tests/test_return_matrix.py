@@ -0,0 +1,119 @@
+"""Business Unit: strategy | Status: current.
+
+Unit tests for the group backfill return matrix.
+
+Tests:
+- Portfolio returns equal the Decimal close-to-close arithmetic of the
+  former per-date bar lookup, including missing bars and zero closes
+- A symbol added after the build loads only that symbol, and a matrix
+  grown one column at a time answers like one built all at once
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import numpy as np
+from engines.dsl.operators.return_matrix import ReturnMatrix
+
+from the_alchemiser.shared.data_v2.columnar_bar_store import CloseArray
+from the_alchemiser.shared.types.market_data import BarModel
+from the_alchemiser.shared.value_objects.symbol import Symbol
+
+CLOSES = {
+    "AAA": {date(2026, 3, d): c for d, c in [(2, 100.1), (3, 100.3), (4, 99.7), (5, 101.9)]},
+    # Misses 3 March; zero close on 5 March
+    "BBB": {date(2026, 3, d): c for d, c in [(2, 33.33), (4, 0.0), (5, 12.07), (6, 12.11)]},
+    # Starts late, on a date no other symbol has
+    "CCC": {date(2026, 3, d): c for d, c in [(4, 7.77), (7, 7.91), (9, 8.03)]},
+}
+WEIGHTS = {"AAA": Decimal("0.5"), "BBB": Decimal("0.3"), "CCC": Decimal("0.2")}
+DATES = [date(2026, 3, d) for d in range(1, 11)]
+
+
+class FakeColumnarPort:
+    """Serves CLOSES as close arrays and counts loads."""
+
+    def __init__(self) -> None:
+        self.loads: list[str] = []
+
+    def get_close_array(
+        self,
+        symbol: Symbol,
+        as_of: date | None = None,
+        period: str = "MAX",
+        tail_rows: int | None = None,
+    ) -> CloseArray | None:
+        self.loads.append(str(symbol))
+        bars = CLOSES[str(symbol)]
+        return CloseArray(
+            str(symbol),
+            np.array(list(bars), dtype="datetime64[ns]"),
+            np.array(list(bars.values()), dtype=np.float64),
+        )
+
+    def get_bars(self, symbol: Symbol, period: str, timeframe: str) -> list[BarModel]:
+        raise AssertionError("closes are read as arrays")
+
+    def get_latest_quote(self, symbol: Symbol) -> None:
+        return None
+
+    def get_mid_price(self, symbol: Symbol) -> float | None:
+        return None
+
+
+def _bars(symbol: str) -> list[BarModel]:
+    """BarModels as CachedMarketDataAdapter builds them (Decimal(str(close)))."""
+    return [
+        BarModel(
+            symbol=symbol,
+            timestamp=datetime(d.year, d.month, d.day, tzinfo=UTC),
+            open=Decimal(str(close)),
+            high=Decimal(str(close)),
+            low=Decimal(str(close)),
+            close=Decimal(str(close)),
+            volume=0,
+        )
+        for d, close in CLOSES[symbol].items()
+    ]
+
+
+def _reference_return(selections: dict[str, Decimal], record_date: date) -> Decimal | None:
+    """The per-date bar lookup the matrix replaced."""
+    weighted_return = Decimal("0")
+    total_weight = Decimal("0")
+    for symbol, weight in selections.items():
+        earlier = [bar for bar in _bars(symbol) if bar.timestamp.date() <= record_date]
+        if len(earlier) < 2 or earlier[-2].close == Decimal("0"):
+            continue
+        weighted_return += weight * (earlier[-1].close / earlier[-2].close - Decimal("1"))
+        total_weight += weight
+    if total_weight <= Decimal("0"):
+        return None
+    return weighted_return / total_weight
+
+
+def test_returns_match_decimal_bar_lookup() -> None:
+    matrix = ReturnMatrix(FakeColumnarPort(), WEIGHTS)  # type: ignore[arg-type]
+
+    for record_date in DATES:
+        for selections in (WEIGHTS, {"AAA": Decimal("1")}, {"BBB": Decimal("1")}):
+            expected = _reference_return(selections, record_date)
+            assert matrix.portfolio_return(selections, record_date) == expected, record_date
+
+
+def test_columns_added_one_at_a_time() -> None:
+    port = FakeColumnarPort()
+    grown = ReturnMatrix(port, ["AAA"])  # type: ignore[arg-type]
+    grown.build()
+    for symbol in ("BBB", "CCC"):
+        grown.portfolio_return({symbol: Decimal("1")}, DATES[-1])
+    built = ReturnMatrix(FakeColumnarPort(), WEIGHTS)  # type: ignore[arg-type]
+
+    assert port.loads == ["AAA", "BBB", "CCC"]
+    assert grown.shape == (7, 3)
+    for record_date in DATES:
+        assert grown.portfolio_return(WEIGHTS, record_date) == built.portfolio_return(
+            WEIGHTS, record_date
+        )
@@ -0,0 +1,108 @@
+"""Business Unit: strategy | Status: current.
+
+Tests for DslEvaluator subtree memoization.
+
+A strategy that repeats a ``group`` and a comparator is evaluated with and
+without the (structural digest, as_of_date) memo:
+- The allocation is identical
+- Decision path, debug/filter traces and fragile decisions match entry for
+  entry, so memo hits replay what the first evaluation recorded
+- A new as_of_date is evaluated afresh instead of served from the memo
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from typing import Any
+
+import pytest
+from engines.dsl import dsl_evaluator
+from engines.dsl.dsl_evaluator import DslEvaluator
+from engines.dsl.sexpr_parser import SexprParser
+
+from the_alchemiser.shared.schemas.indicator_request import IndicatorRequest
+from the_alchemiser.shared.schemas.technical_indicator import TechnicalIndicator
+
+STRATEGY = """
+(defsymphony
+ "memo parity"
+ {:asset-class "EQUITIES", :rebalance-frequency :daily}
+ (weight-equal
+  [(group
+    "Risk"
+    [(if (> (rsi "SPY" {:window 10}) 50) [(asset "TQQQ")] [(asset "BIL")])])
+   (if
+    (> (rsi "SPY" {:window 10}) 50)
+    [(group
+      "Risk"
+      [(if (> (rsi "SPY" {:window 10}) 50) [(asset "TQQQ")] [(asset "BIL")])])]
+    [(asset "QQQ")])]))
+"""
+
+# as_of_date -> SPY RSI(10); near 50 so the comparison is also a fragile decision
+RSI_BY_DATE = {None: 50.2, date(2026, 3, 2): 49.5}
+
+
+class FakeIndicatorService:
+    """Serves SPY RSI(10) by as_of_date and counts requests."""
+
+    def __init__(self) -> None:
+        self.as_of_date: date | None = None
+        self.calls = 0
+
+    def get_indicator(self, request: IndicatorRequest) -> TechnicalIndicator:
+        self.calls += 1
+        return TechnicalIndicator(
+            symbol=request.symbol,
+            timestamp=datetime(2026, 3, 2, tzinfo=UTC),
+            rsi_10=RSI_BY_DATE[self.as_of_date],
+        )
+
+
+def _evaluate(as_of_dates: list[date | None]) -> tuple[list[Any], FakeIndicatorService]:
+    ast = SexprParser().parse(STRATEGY)
+    service = FakeIndicatorService()
+    evaluator = DslEvaluator(service, debug_mode=True)  # type: ignore[arg-type]
+    runs: list[Any] = []
+    for as_of_date in as_of_dates:
+        service.as_of_date = as_of_date
+        allocation, _ = evaluator.evaluate(ast, "memo-test")
+        runs.append(
+            (
+                dict(allocation.target_weights),
+                evaluator.decision_path,
+                # Debug traces carry the wall-clock time they were recorded at
+                [{k: v for k, v in t.items() if k != "timestamp"} for t in evaluator.debug_traces],
+                evaluator.filter_traces,
+                evaluator.fragile_decisions,
+            )
+        )
+    return runs, service
+
+
+def _without_memo(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dsl_evaluator, "MEMOIZED_OPERATORS", frozenset())
+
+
+@pytest.mark.parametrize("as_of_date", [None, date(2026, 3, 2)])
+def test_memoized_evaluation_matches_fresh(
+    monkeypatch: pytest.MonkeyPatch, as_of_date: date | None
+) -> None:
+    memoized, memo_service = _evaluate([as_of_date])
+    _without_memo(monkeypatch)
+    fresh, fresh_service = _evaluate([as_of_date])
+
+    assert memoized == fresh
+    assert memoized[0][1], "decision path should not be empty"
+    assert memoized[0][4], "comparison near its threshold should be fragile"
+    assert memo_service.calls < fresh_service.calls
+
+
+def test_memo_is_keyed_by_as_of_date(monkeypatch: pytest.MonkeyPatch) -> None:
+    dates: list[date | None] = [None, date(2026, 3, 2)]
+    memoized, _ = _evaluate(dates)
+    _without_memo(monkeypatch)
+    fresh, _ = _evaluate(dates)
+
+    assert memoized == fresh
+    assert memoized[0][0] != memoized[1][0]
@@ -8,6 +8,7 @@ target weights for the StrategyRebalancer to execute independently.
 
 from __future__ import annotations
 
+import os
 from datetime import UTC, datetime
 from decimal import Decimal
 from importlib import resources as importlib_resources
@@ -18,11 +19,18 @@ if TYPE_CHECKING:
     from the_alchemiser.shared.config.container import ApplicationContainer
 
 from engines.dsl.engine import DslEngine
+from engines.dsl.evaluation_cache import EvaluationCache
 
 from the_alchemiser.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Heaviest AST paths logged as collapsed stacks when profiling
+PROFILE_STACK_LINES = 500
+
+# "true" checks lookback-planned (tail-only) indicator results against full history
+LOOKBACK_PARITY_ENV = "LOOKBACK_PARITY_CHECK"
+
 
 class SingleFileSignalHandler:
     """Handler for generating signals from a single DSL strategy file.
@@ -37,6 +45,7 @@ class SingleFileSignalHandler:
         dsl_file: str,
         *,
         debug_mode: bool = False,
+        profile: bool = False,
     ) -> None:
         """Initialize the single-file signal handler.
 
@@ -44,11 +53,13 @@ class SingleFileSignalHandler:
             container: Application container for dependency injection.
             dsl_file: DSL strategy file name (e.g., '1-KMLM.clj').
             debug_mode: If True, enables detailed condition tracing for debugging.
+            profile: If True, profiles DSL evaluation and reports the summary.
 
         """
         self.container = container
         self.dsl_file = dsl_file
         self.debug_mode = debug_mode
+        self.profile = profile
         self.logger = logger
 
         # Resolve strategies directory using importlib.resources (Lambda layer)
@@ -80,6 +91,9 @@ class SingleFileSignalHandler:
             strategy_config_path=strategies_path,
             market_data_adapter=self.market_data_adapter,
             debug_mode=self.debug_mode,
+            profile=self.profile,
+            evaluation_cache=EvaluationCache.from_environment(),
+            lookback_parity=os.environ.get(LOOKBACK_PARITY_ENV, "false").lower() == "true",
         )
 
         self.logger.info(
@@ -87,6 +101,7 @@ class SingleFileSignalHandler:
             extra={
                 "dsl_file": dsl_file,
                 "debug_mode": debug_mode,
+                "profile": profile,
             },
         )
 
@@ -118,6 +133,9 @@ class SingleFileSignalHandler:
                 strategy_config_path=self.dsl_file,
                 correlation_id=correlation_id,
             )
+            profile = trace.metadata.get("profile") if trace.metadata else None
+            if profile is not None:
+                self._log_profile(profile, correlation_id)
 
             if not target_allocation or not target_allocation.target_weights:
                 self.logger.warning(
@@ -167,6 +185,7 @@ class SingleFileSignalHandler:
                     symbols=symbols,
                     correlation_id=correlation_id,
                 ),
+                "profile": profile,
             }
 
         except Exception as e:
@@ -181,6 +200,32 @@ class SingleFileSignalHandler:
             )
             raise
 
+    def _log_profile(self, profile: dict[str, Any], correlation_id: str) -> None:
+        """Log the evaluation profile summary and its collapsed stacks.
+
+        The stacks are in flamegraph.pl / speedscope input format, so a hot
+        run can be visualized straight from the log line.
+
+        Args:
+            profile: Profile summary attached to the trace metadata.
+            correlation_id: Workflow correlation ID for tracing.
+
+        """
+        profiler = self.dsl_engine.evaluator.profiler
+        self.logger.info(
+            f"DSL evaluation profile for {self.dsl_file}",
+            extra={
+                "correlation_id": correlation_id,
+                "dsl_file": self.dsl_file,
+                "profile": profile,
+                "collapsed_stacks": (
+                    profiler.collapsed_stacks(max_lines=PROFILE_STACK_LINES)
+                    if profiler is not None
+                    else None
+                ),
+            },
+        )
+
     def _capture_data_freshness(
         self,
         symbols: list[str],
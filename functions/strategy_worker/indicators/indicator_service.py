@@ -5,26 +5,64 @@ Indicator service for computing technical indicators using real market data.
 
 Integrates with the existing market data infrastructure to provide
 real-time technical indicator calculations for DSL strategy evaluation.
+
+Historical (as_of_date) evaluation runs incrementally by default: each
+symbol's price history is loaded once, each (symbol, indicator, params)
+series is computed once over that full history, and any as_of_date is
+answered by binary-searching the history's date index. Every indicator is
+causal (its value on a date depends only on prices up to that date), so
+this matches recomputing on the truncated history while turning backfills
+over many dates from O(dates x history) into O(history).
+
+Live (no as_of_date) results can additionally be shared across strategy
+workers through an IndicatorResultStore: before computing, the service looks
+up the content-addressed key (symbol, indicator, params, last bar, data
+version) and, on a miss, publishes what it computed for the next worker.
+
+A live evaluation may set ``lookback_plan`` (see engines.dsl.lookback_planner)
+so each planned symbol's history is loaded tail-only. A request whose tail
+turns out shorter than its exact lookback (indicators.lookback) reloads the
+full history, so a plan can cost speed but never accuracy. With
+``lookback_parity`` every tail-derived result is recomputed on full history;
+differences are logged, collected in ``lookback_mismatches`` and resolved in
+favour of the full-history value.
 """
 
 from __future__ import annotations
 
 import math
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from engines.dsl.types import DslEvaluationError
 from errors import MarketDataError
 from indicators.indicators import TechnicalIndicators
+from indicators.lookback import exact_lookback_rows
 
+from the_alchemiser.shared.data_v2.indicator_result_store import (
+    IndicatorResultKey,
+    IndicatorResultStore,
+)
 from the_alchemiser.shared.logging import get_logger
 from the_alchemiser.shared.schemas.indicator_request import IndicatorRequest
 from the_alchemiser.shared.schemas.technical_indicator import TechnicalIndicator
 from the_alchemiser.shared.types.market_data import BarModel
-from the_alchemiser.shared.types.market_data_port import MarketDataPort
+from the_alchemiser.shared.types.market_data_port import (
+    ColumnarMarketDataPort,
+    MarketDataPort,
+)
 from the_alchemiser.shared.value_objects.symbol import Symbol
 
+if TYPE_CHECKING:
+    from engines.dsl.profiler import DslProfiler, IndicatorSource
+
 logger = get_logger(__name__)
 
 # Module constant for logging context
@@ -35,6 +73,34 @@ MODULE_NAME = "strategy_v2.indicators"
 # so we request all bars from S3 to maximise parity.
 _ALL_AVAILABLE_BARS = 999_999
 
+# Agreement required between tail-only and full-history results in parity mode
+LOOKBACK_PARITY_TOLERANCE = 1e-9
+
+# TechnicalIndicators method name -> indicator type, where they differ
+_SERIES_INDICATOR_TYPES = {"exponential_moving_average": "exponential_moving_average_price"}
+
+type _IndicatorCompute = Callable[
+    [str, pd.Series, dict[str, int | float | str]], TechnicalIndicator
+]
+
+
+@dataclass(frozen=True, slots=True)
+class _PriceHistory:
+    """Close history for one (symbol, period) with its date index.
+
+    ``truncated`` marks a tail-only load that may miss older bars.
+    """
+
+    prices: pd.Series
+    dates: npt.NDArray[np.datetime64]
+    truncated: bool = False
+
+    def end_for(self, as_of_date: date | None) -> int:
+        """Return how many bars fall on or before as_of_date (O(log n))."""
+        if as_of_date is None:
+            return len(self.prices)
+        return int(np.searchsorted(self.dates, np.datetime64(as_of_date, "D"), side="right"))
+
 
 class IndicatorService:
     """Service for computing technical indicators using real market data.
@@ -48,12 +114,28 @@ class IndicatorService:
 
     """
 
-    def __init__(self, market_data_service: MarketDataPort | None) -> None:
+    def __init__(
+        self,
+        market_data_service: MarketDataPort | None,
+        *,
+        incremental: bool = True,
+        result_store: IndicatorResultStore | None = None,
+        lookback_parity: bool = False,
+    ) -> None:
         """Initialize indicator service with market data provider.
 
         Args:
             market_data_service: MarketDataService instance for real market data.
                 None is allowed only for testing; production code must provide a service.
+            incremental: Compute each indicator series once over the full history
+                and answer as_of_date lookups by date index (see module docstring).
+                When False, every as_of_date recomputes on truncated history.
+            result_store: Optional cross-worker store of live indicator results,
+                consulted before computing and published to after (incremental
+                mode only).
+            lookback_parity: Recompute every result derived from a tail-only
+                history on the full history and report differences (see
+                module docstring).
 
         Raises:
             None. Validation occurs at usage time via get_indicator method.
@@ -67,6 +149,19 @@ class IndicatorService:
         # loading the same history during backfill loops.
         self._bars_cache: dict[tuple[str, str, str], list[BarModel]] = {}
 
+        self.incremental = incremental
+
+        # Incremental mode: full close history per (symbol, period), and full
+        # indicator series per (symbol, period, indicator, params). Both are
+        # independent of as_of_date and survive date changes.
+        self._history_cache: dict[tuple[str, str], _PriceHistory] = {}
+        self._series_cache: dict[
+            tuple[str, str, str, tuple[tuple[str, str], ...]],
+            pd.Series,
+        ] = {}
+        # (symbol, period) of the request being computed, for _indicator_series
+        self._series_scope: tuple[str, str] | None = None
+
         # Cache computed indicators for the current as_of_date only.
         # Cleared whenever as_of_date changes to preserve historical correctness.
         self._indicator_cache: dict[
@@ -74,6 +169,17 @@ class IndicatorService:
             TechnicalIndicator,
         ] = {}
 
+        self.result_store = result_store
+
+        # Receives per-request timings while a profiled evaluation runs
+        self.profiler: DslProfiler | None = None
+
+        # Trailing rows to load per symbol (incremental mode); see lookback_plan
+        self._lookback_plan: Mapping[str, int] | None = None
+        self.lookback_parity = lookback_parity
+        self.lookback_parity_checks = 0
+        self.lookback_mismatches: list[dict[str, object]] = []
+
         # Optional date cutoff for historical evaluation (backfilling).
         # When set, bars are truncated to only include data on or before
         # this date, ensuring indicators reflect the historical state.
@@ -89,7 +195,8 @@ class IndicatorService:
         """Optional cutoff date for historical evaluation.
 
         Changing this value clears the computed-indicator cache so cached
-        results do not leak across dates during backfills.
+        results do not leak across dates during backfills. In incremental
+        mode the underlying history and indicator series are kept.
         """
         return self._as_of_date
 
@@ -99,6 +206,22 @@ class IndicatorService:
             self._as_of_date = value
             self._indicator_cache.clear()
 
+    @property
+    def lookback_plan(self) -> Mapping[str, int] | None:
+        """Trailing rows to load per symbol, or None to load full history.
+
+        Set by the engine before each evaluation (None for historical ones);
+        setting it also resets the parity statistics. Only incremental mode
+        uses the plan.
+        """
+        return self._lookback_plan
+
+    @lookback_plan.setter
+    def lookback_plan(self, value: Mapping[str, int] | None) -> None:
+        self._lookback_plan = value
+        self.lookback_parity_checks = 0
+        self.lookback_mismatches = []
+
     def _parameters_cache_key(
         self, parameters: dict[str, int | float | str]
     ) -> tuple[tuple[str, str], ...]:
@@ -133,6 +256,245 @@ class IndicatorService:
         self._bars_cache[cache_key] = bars
         return bars
 
+    def _get_price_history(self, *, symbol: str, period: str) -> _PriceHistory:
+        """Fetch the (untruncated by as_of_date) close history once per (symbol, period).
+
+        Symbols in ``lookback_plan`` load only their planned trailing rows.
+
+        Args:
+            symbol: Trading symbol
+            period: Lookback period (e.g., "1Y", "MAX")
+
+        Returns:
+            Close prices oldest first with their bar dates
+
+        """
+        cache_key = (symbol, period)
+        cached = self._history_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        tail_rows = self.lookback_plan.get(symbol) if self.lookback_plan else None
+        history = self._load_price_history(symbol=symbol, period=period, tail_rows=tail_rows)
+        self._history_cache[cache_key] = history
+        return history
+
+    def _load_price_history(
+        self, *, symbol: str, period: str, tail_rows: int | None
+    ) -> _PriceHistory:
+        """Load a close history, tail-only when tail_rows is set and supported."""
+        if isinstance(self.market_data_service, ColumnarMarketDataPort):
+            close_array = self.market_data_service.get_close_array(
+                Symbol(symbol), period=period, tail_rows=tail_rows
+            )
+            if close_array is None:
+                return _PriceHistory(
+                    pd.Series([], dtype=float), np.array([], dtype="datetime64[D]")
+                )
+            return _PriceHistory(
+                pd.Series(close_array.closes),
+                close_array.timestamps.astype("datetime64[D]"),
+                # A tail of exactly tail_rows bars may have cut older history
+                truncated=tail_rows is not None and len(close_array) >= tail_rows,
+            )
+
+        # Same date semantics as the truncation in _get_prices
+        bars = self._get_bars_cached(symbol=symbol, period=period, timeframe="1Day")
+        return _PriceHistory(
+            pd.Series([float(bar.close) for bar in bars], dtype=float),
+            np.array([bar.timestamp.date() for bar in bars], dtype="datetime64[D]"),
+        )
+
+    def _reload_full_history(self, *, symbol: str, period: str) -> _PriceHistory:
+        """Replace a tail-only history that is too short with the full history."""
+        logger.info(
+            "Lookback plan too short for request; loading full history",
+            module=MODULE_NAME,
+            symbol=symbol,
+            period=period,
+            as_of_date=self.as_of_date.isoformat() if self.as_of_date else None,
+        )
+        history = self._load_price_history(symbol=symbol, period=period, tail_rows=None)
+        self._history_cache[(symbol, period)] = history
+        # Series over the tail are not prefixes of series over the full history
+        stale = [key for key in self._series_cache if key[:2] == (symbol, period)]
+        for key in stale:
+            del self._series_cache[key]
+        return history
+
+    def _indicator_series(
+        self,
+        symbol: str,
+        name: str,
+        prices: pd.Series,
+        **params: int,
+    ) -> pd.Series:
+        """Compute a TechnicalIndicators series, reusing the full-history series.
+
+        In incremental mode ``prices`` is a prefix of the (symbol, period)
+        history, so the series over it is the matching prefix of the series
+        over the full history. Prefixes no longer than the indicator's exact
+        lookback (indicators.lookback) are computed directly: the indicators
+        special-case histories shorter than a window, and before its warm-up
+        a recursive indicator's prefix slice only approximates recomputation.
+
+        Args:
+            symbol: Trading symbol
+            name: TechnicalIndicators method name (e.g., "rsi")
+            prices: Close prices up to as_of_date
+            **params: Keyword arguments for the indicator method
+
+        Returns:
+            Indicator series aligned with prices
+
+        """
+        compute: Callable[..., pd.Series] = getattr(self.technical_indicators, name)
+        scope = self._series_scope
+        warmup = exact_lookback_rows(_SERIES_INDICATOR_TYPES.get(name, name), params)
+        if scope is None or warmup is None or len(prices) <= warmup:
+            return compute(prices, **params)
+
+        cache_key = (*scope, name, self._parameters_cache_key(dict(params)))
+        full_series = self._series_cache.get(cache_key)
+        if full_series is None:
+            history = self._get_price_history(symbol=scope[0], period=scope[1])
+            full_series = compute(history.prices, **params)
+            self._series_cache[cache_key] = full_series
+        return full_series.iloc[: len(prices)]
+
+    def _get_prices(
+        self,
+        *,
+        symbol: str,
+        period: str,
+        correlation_id: str | None,
+        required_rows: int | None = None,
+    ) -> pd.Series:
+        """Fetch close prices up to as_of_date as a float Series.
+
+        In incremental mode this slices the cached history at the as_of_date
+        position. Otherwise it uses the columnar close-array path when the
+        market data port supports it (no BarModel materialization), falling
+        back to fetching bars and converting closes to floats.
+
+        Args:
+            symbol: Trading symbol
+            period: Lookback period (e.g., "1Y", "MAX")
+            correlation_id: Correlation ID for logging
+            required_rows: Exact lookback of the requested indicator; a
+                tail-only history with fewer rows up to as_of_date is
+                replaced by the full history (None = always full)
+
+        Returns:
+            Close prices oldest first, truncated to as_of_date when set
+
+        """
+        if self.incremental:
+            history = self._get_price_history(symbol=symbol, period=period)
+            end = history.end_for(self.as_of_date)
+            if history.truncated and (required_rows is None or end < required_rows):
+                history = self._reload_full_history(symbol=symbol, period=period)
+                end = history.end_for(self.as_of_date)
+            return history.prices.iloc[:end]
+
+        if isinstance(self.market_data_service, ColumnarMarketDataPort):
+            close_array = self.market_data_service.get_close_array(
+                Symbol(symbol), as_of=self.as_of_date, period=period
+            )
+            if close_array is None:
+                return pd.Series([], dtype=float)
+            return pd.Series(close_array.closes)
+
+        # Fetch bars with computed lookback using standard MarketDataPort interface
+        bars = self._get_bars_cached(symbol=symbol, period=period, timeframe="1Day")
+
+        # Truncate bars to as_of_date when doing historical evaluation.
+        # Without this, backfilled dates would all use current market data
+        # and produce identical selections regardless of the target date.
+        if self.as_of_date is not None and bars:
+            bars = [b for b in bars if b.timestamp.date() <= self.as_of_date]
+            logger.debug(
+                "Truncated bars to as_of_date",
+                module=MODULE_NAME,
+                symbol=symbol,
+                as_of_date=self.as_of_date.isoformat(),
+                bars_after_truncation=len(bars),
+                correlation_id=correlation_id,
+            )
+
+        return pd.Series([float(bar.close) for bar in bars], dtype=float)
+
+    def _shared_result_key(
+        self,
+        symbol: str,
+        indicator_type: str,
+        parameters: dict[str, int | float | str],
+        period: str,
+        prices: pd.Series,
+    ) -> IndicatorResultKey | None:
+        """Build the cross-worker result key, or None when sharing does not apply.
+
+        Only live incremental evaluation is shared: historical as_of_date
+        lookups are already O(1) per date, and current_price is cheaper to
+        read than to fetch. Symbols without a data version (no market data
+        store, or no metadata) are not shared, since the last bar alone does
+        not identify restated earlier bars.
+        """
+        if (
+            self.result_store is None
+            or not self.incremental
+            or self.as_of_date is not None
+            or indicator_type == "current_price"
+            or prices.empty
+        ):
+            return None
+        data_version = self._data_version(symbol)
+        if data_version is None:
+            return None
+        history = self._get_price_history(symbol=symbol, period=period)
+        last_bar_date = history.dates[len(prices) - 1].astype(date)
+        return IndicatorResultKey(
+            symbol=symbol,
+            indicator_type=indicator_type,
+            parameters=self._parameters_cache_key(parameters),
+            last_bar_date=last_bar_date.isoformat(),
+            last_close=float(prices.iloc[-1]),
+            data_version=data_version,
+        )
+
+    def _data_version(self, symbol: str) -> str | None:
+        """Return the symbol's data version from the market data store snapshot.
+
+        Like the evaluation cache key, this reads SymbolMetadata (row count
+        and updated_at), which every write of the symbol's data file changes.
+        """
+        store = getattr(self.market_data_service, "market_data_store", None)
+        if store is None:
+            return None
+        metadata = store.get_cached_metadata(symbol)
+        if metadata is None:
+            return None
+        return f"{metadata.row_count}:{metadata.updated_at}"
+
+    def _load_shared_result(self, key: IndicatorResultKey) -> TechnicalIndicator | None:
+        """Return a result another worker published for key, if any."""
+        if self.result_store is None:
+            return None
+        payload = self.result_store.get(key)
+        if payload is None:
+            return None
+        try:
+            return TechnicalIndicator.from_dict(dict(payload))
+        except (ValueError, TypeError) as e:
+            logger.warning(
+                "Discarding unreadable shared indicator result",
+                module=MODULE_NAME,
+                symbol=key.symbol,
+                indicator_type=key.indicator_type,
+                error=str(e),
+            )
+            return None
+
     def _latest_value(
         self, series: pd.Series, fallback: float | None = None
     ) -> tuple[float | None, bool]:
@@ -178,7 +540,7 @@ class IndicatorService:
 
         """
         window = int(parameters.get("window", 14))
-        rsi_series = self.technical_indicators.rsi(prices, window=window)
+        rsi_series = self._indicator_series(symbol, "rsi", prices, window=window)
         rsi_value, fallback_used = self._latest_value(
             rsi_series, None
         )  # REM-005: None instead of 50.0
@@ -292,7 +654,7 @@ class IndicatorService:
                 f"Insufficient data for {symbol}: need {window} bars, have {len(prices)} bars"
             )
 
-        ma_series = self.technical_indicators.moving_average(prices, window=window)
+        ma_series = self._indicator_series(symbol, "moving_average", prices, window=window)
 
         latest_ma = float(ma_series.iloc[-1]) if len(ma_series) > 0 else None
         if latest_ma is None or pd.isna(latest_ma):
@@ -341,7 +703,7 @@ class IndicatorService:
 
         """
         window = int(parameters.get("window", 21))
-        mar_series = self.technical_indicators.moving_average_return(prices, window=window)
+        mar_series = self._indicator_series(symbol, "moving_average_return", prices, window=window)
 
         latest = float(mar_series.iloc[-1]) if len(mar_series) > 0 else None
         if latest is None or pd.isna(latest):
@@ -388,7 +750,7 @@ class IndicatorService:
 
         """
         window = int(parameters.get("window", 60))
-        cum_series = self.technical_indicators.cumulative_return(prices, window=window)
+        cum_series = self._indicator_series(symbol, "cumulative_return", prices, window=window)
 
         latest = float(cum_series.iloc[-1]) if len(cum_series) > 0 else None
         if latest is None or pd.isna(latest):
@@ -442,7 +804,9 @@ class IndicatorService:
 
         """
         window = int(parameters.get("window", 12))
-        ema_series = self.technical_indicators.exponential_moving_average(prices, window=window)
+        ema_series = self._indicator_series(
+            symbol, "exponential_moving_average", prices, window=window
+        )
 
         latest = float(ema_series.iloc[-1]) if len(ema_series) > 0 else None
         if latest is None or pd.isna(latest):
@@ -490,7 +854,7 @@ class IndicatorService:
 
         """
         window = int(parameters.get("window", 6))
-        std_series = self.technical_indicators.stdev_return(prices, window=window)
+        std_series = self._indicator_series(symbol, "stdev_return", prices, window=window)
 
         latest = float(std_series.iloc[-1]) if len(std_series) > 0 else None
         if latest is None or pd.isna(latest):
@@ -537,7 +901,7 @@ class IndicatorService:
 
         """
         window = int(parameters.get("window", 6))
-        std_series = self.technical_indicators.stdev_price(prices, window=window)
+        std_series = self._indicator_series(symbol, "stdev_price", prices, window=window)
 
         latest = float(std_series.iloc[-1]) if len(std_series) > 0 else None
         if latest is None or pd.isna(latest):
@@ -664,7 +1028,7 @@ class IndicatorService:
 
         """
         window = int(parameters.get("window", 60))
-        mdd_series = self.technical_indicators.max_drawdown(prices, window=window)
+        mdd_series = self._indicator_series(symbol, "max_drawdown", prices, window=window)
 
         latest = float(mdd_series.iloc[-1]) if len(mdd_series) > 0 else None
         if latest is None or pd.isna(latest):
@@ -712,8 +1076,12 @@ class IndicatorService:
         """
         short_window = int(parameters.get("short_window", 12))
         long_window = int(parameters.get("long_window", 26))
-        ppo_series = self.technical_indicators.percentage_price_oscillator(
-            prices, short_window=short_window, long_window=long_window
+        ppo_series = self._indicator_series(
+            symbol,
+            "percentage_price_oscillator",
+            prices,
+            short_window=short_window,
+            long_window=long_window,
         )
 
         latest = float(ppo_series.iloc[-1]) if len(ppo_series) > 0 else None
@@ -769,7 +1137,9 @@ class IndicatorService:
         short_window = int(parameters.get("short_window", 12))
         long_window = int(parameters.get("long_window", 26))
         smooth_window = int(parameters.get("smooth_window", 9))
-        ppo_signal_series = self.technical_indicators.percentage_price_oscillator_signal(
+        ppo_signal_series = self._indicator_series(
+            symbol,
+            "percentage_price_oscillator_signal",
             prices,
             short_window=short_window,
             long_window=long_window,
@@ -814,6 +1184,79 @@ class IndicatorService:
             },
         )
 
+    def _check_lookback_parity(
+        self,
+        request: IndicatorRequest,
+        period: str,
+        result: TechnicalIndicator,
+        compute: _IndicatorCompute,
+    ) -> TechnicalIndicator:
+        """Recompute a result on full history when it came from a tail-only history.
+
+        Args:
+            request: Indicator request that produced result
+            period: Lookback period the history was loaded for
+            result: Result computed from the cached history
+            compute: Indicator computation used for result
+
+        Returns:
+            result if it matches the full-history value within
+            LOOKBACK_PARITY_TOLERANCE, otherwise the full-history result
+
+        """
+        history = self._history_cache.get((request.symbol, period))
+        if history is None or not history.truncated:
+            return result
+
+        full = self._load_price_history(symbol=request.symbol, period=period, tail_rows=None)
+        expected = compute(
+            request.symbol,
+            full.prices.iloc[: full.end_for(self.as_of_date)],
+            request.parameters,
+        )
+        self.lookback_parity_checks += 1
+
+        actual_value = (result.metadata or {}).get("value")
+        expected_value = (expected.metadata or {}).get("value")
+        if actual_value == expected_value or (
+            isinstance(actual_value, int | float)
+            and isinstance(expected_value, int | float)
+            and math.isclose(
+                actual_value,
+                expected_value,
+                rel_tol=LOOKBACK_PARITY_TOLERANCE,
+                abs_tol=LOOKBACK_PARITY_TOLERANCE,
+            )
+        ):
+            return result
+
+        mismatch: dict[str, object] = {
+            "symbol": request.symbol,
+            "indicator_type": request.indicator_type,
+            "parameters": dict(self._parameters_cache_key(request.parameters)),
+            "as_of_date": self.as_of_date.isoformat() if self.as_of_date else None,
+            "tail_rows": len(history.prices),
+            "tail_value": actual_value,
+            "full_history_value": expected_value,
+        }
+        self.lookback_mismatches.append(mismatch)
+        logger.warning(
+            "Tail-only indicator result differs from full history",
+            module=MODULE_NAME,
+            **mismatch,
+        )
+        return expected
+
+    def _record_profile(
+        self, request: IndicatorRequest, source: IndicatorSource, started: float
+    ) -> None:
+        """Report a served request to the active profiler, if any."""
+        if self.profiler is None:
+            return
+        params = [f"{k}={v}" for k, v in self._parameters_cache_key(request.parameters)]
+        key = f"{request.indicator_type}({', '.join([request.symbol, *params])})"
+        self.profiler.record_indicator(key, source, time.perf_counter() - started)
+
     def get_indicator(self, request: IndicatorRequest) -> TechnicalIndicator:
         """Get technical indicator for symbol using real market data.
 
@@ -843,8 +1286,10 @@ class IndicatorService:
             self._parameters_cache_key(parameters),
             self.as_of_date,
         )
+        started = time.perf_counter()
         cached = self._indicator_cache.get(indicator_cache_key)
         if cached is not None:
+            self._record_profile(request, "memory", started)
             return cached
 
         logger.info(
@@ -883,24 +1328,14 @@ class IndicatorService:
                 correlation_id=correlation_id,
             )
 
-            # Fetch bars with computed lookback using standard MarketDataPort interface
-            bars = self._get_bars_cached(symbol=symbol, period=period, timeframe="1Day")
-
-            # Truncate bars to as_of_date when doing historical evaluation.
-            # Without this, backfilled dates would all use current market data
-            # and produce identical selections regardless of the target date.
-            if self.as_of_date is not None and bars:
-                bars = [b for b in bars if b.timestamp.date() <= self.as_of_date]
-                logger.debug(
-                    "Truncated bars to as_of_date",
-                    module=MODULE_NAME,
-                    symbol=symbol,
-                    as_of_date=self.as_of_date.isoformat(),
-                    bars_after_truncation=len(bars),
-                    correlation_id=correlation_id,
-                )
+            prices = self._get_prices(
+                symbol=symbol,
+                period=period,
+                correlation_id=correlation_id,
+                required_rows=exact_lookback_rows(indicator_type, parameters),
+            )
 
-            if not bars:
+            if prices.empty:
                 logger.error(
                     "No market data available",
                     module=MODULE_NAME,
@@ -917,13 +1352,10 @@ class IndicatorService:
                 "Market data fetched",
                 module=MODULE_NAME,
                 symbol=symbol,
-                bars_count=len(bars),
+                bars_count=len(prices),
                 correlation_id=correlation_id,
             )
 
-            # Convert bars to pandas Series for technical indicators
-            prices = pd.Series([float(bar.close) for bar in bars])
-
             # Dispatch to appropriate indicator computation method
             indicator_dispatch = {
                 "rsi": self._compute_rsi,
@@ -940,7 +1372,32 @@ class IndicatorService:
             }
 
             if indicator_type in indicator_dispatch:
-                result = indicator_dispatch[indicator_type](symbol, prices, parameters)
+                shared_key = self._shared_result_key(
+                    symbol, indicator_type, parameters, period, prices
+                )
+                shared = self._load_shared_result(shared_key) if shared_key else None
+                if shared is not None:
+                    logger.debug(
+                        "Indicator served from shared result store",
+                        module=MODULE_NAME,
+                        symbol=symbol,
+                        indicator_type=indicator_type,
+                        correlation_id=correlation_id,
+                    )
+                    self._indicator_cache[indicator_cache_key] = shared
+                    self._record_profile(request, "shared", started)
+                    return shared
+
+                if self.incremental:
+                    self._series_scope = (symbol, period)
+                try:
+                    result = indicator_dispatch[indicator_type](symbol, prices, parameters)
+                finally:
+                    self._series_scope = None
+                if self.lookback_parity:
+                    result = self._check_lookback_parity(
+                        request, period, result, indicator_dispatch[indicator_type]
+                    )
                 logger.info(
                     "Indicator computed successfully",
                     module=MODULE_NAME,
@@ -949,6 +1406,9 @@ class IndicatorService:
                     correlation_id=correlation_id,
                 )
                 self._indicator_cache[indicator_cache_key] = result
+                if shared_key is not None and self.result_store is not None:
+                    self.result_store.put(shared_key, result.to_dict())
+                self._record_profile(request, "computed", started)
                 return result
 
             # Unsupported indicator types
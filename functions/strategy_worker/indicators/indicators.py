@@ -3,9 +3,11 @@
 Technical indicators for trading strategies.
 
 This module provides technical analysis indicators used by trading strategies
-in The Alchemiser quantitative trading system. All indicators are implemented using pandas
-for efficient computation and follow industry-standard calculation methods
-to ensure compatibility with external trading platforms.
+in The Alchemiser quantitative trading system. All indicators follow
+industry-standard calculation methods to ensure compatibility with external
+trading platforms. The hot indicators (RSI, EMA, PPO, stdev and max drawdown)
+delegate to the NumPy kernels in indicators.kernels; the pandas formulations
+remain as the fallback for series with missing values.
 
 The module focuses on indicators actually used by the trading strategies:
 - RSI (Relative Strength Index) using Wilder's smoothing method
@@ -24,7 +26,9 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pandas as pd
+from indicators import kernels
 
 from the_alchemiser.shared.errors.exceptions import MarketDataError
 from the_alchemiser.shared.logging import get_logger
@@ -39,6 +43,16 @@ TRADING_DAYS_PER_YEAR = 252  # Standard annualization factor
 logger = get_logger(__name__)
 
 
+def _finite_values(data: pd.Series) -> kernels.FloatArray | None:
+    """Return the series as float64 if every value is finite, else None.
+
+    The smoothing kernels require gap-free input; series with NaN/inf keep
+    the pandas path so their missing-value semantics are unchanged.
+    """
+    values = data.to_numpy(dtype=np.float64)
+    return values if np.isfinite(values).all() else None
+
+
 class TechnicalIndicators:
     """Technical analysis indicators for trading strategies.
 
@@ -113,6 +127,14 @@ class TechnicalIndicators:
             return pd.Series([NEUTRAL_RSI_VALUE] * len(data), index=data.index)
 
         try:
+            values = _finite_values(data)
+            if values is not None:
+                return pd.Series(
+                    kernels.wilder_rsi(values, window, NEUTRAL_RSI_VALUE),
+                    index=data.index,
+                    name=data.name,
+                )
+
             delta = data.diff()
             gain = delta.where(delta > 0, 0)
             loss = -delta.where(delta < 0, 0)
@@ -225,6 +247,12 @@ class TechnicalIndicators:
             return pd.Series(dtype=float)
 
         try:
+            values = _finite_values(data)
+            if values is not None:
+                smoothed = kernels.ema_span(values, window)
+                smoothed[: window - 1] = np.nan
+                return pd.Series(smoothed, index=data.index, name=data.name)
+
             # align behavior with SMA min_periods by masking early values
             ema = data.ewm(span=window, adjust=False).mean()
             ema.iloc[: window - 1] = pd.NA
@@ -395,6 +423,13 @@ class TechnicalIndicators:
             return pd.Series([0] * len(data), index=data.index)
 
         try:
+            values = _finite_values(data)
+            if values is not None:
+                daily = kernels.rolling_std(kernels.pct_change(values) * 100, window, ddof=0)
+                return pd.Series(
+                    daily * math.sqrt(TRADING_DAYS_PER_YEAR), index=data.index, name=data.name
+                )
+
             # Composer method: daily returns as percentages
             returns = data.pct_change() * 100
             # Population standard deviation (ddof=0) per Composer specification.
@@ -516,27 +551,14 @@ class TechnicalIndicators:
             return pd.Series([0] * len(data), index=data.index)
 
         try:
-            # Rolling window apply using Composer's peak-to-trough methodology
-            def mdd_window(x: pd.Series) -> float:
-                """Compute max drawdown using peak-to-trough (Composer methodology).
-
-                Tracks the running maximum (peak) within the window and finds
-                the largest percentage decline from any peak to any subsequent
-                trough.
-
-                Args:
-                    x: Price series within the rolling window.
-
-                Returns:
-                    Maximum drawdown as a positive percentage value.
-
-                """
-                # Composer method: track running peak and measure decline from it
-                cummax = x.cummax()  # Running maximum (peak tracking)
-                drawdowns = (x / cummax) - 1.0  # Decline from peak at each point
-                return float(-drawdowns.min() * 100.0)  # Largest decline as positive %
-
-            return data.rolling(window=window, min_periods=window).apply(mdd_window, raw=False)
+            # Composer's peak-to-trough methodology per window: track the running
+            # peak and take the largest decline from it, evaluated on strided
+            # views rather than one Series per window.
+            return pd.Series(
+                kernels.rolling_max_drawdown(data.to_numpy(dtype=np.float64), window),
+                index=data.index,
+                name=data.name,
+            )
         except (ValueError, TypeError, KeyError) as e:
             logger.error(f"Error calculating maximum drawdown: {e}", exc_info=True)
             raise MarketDataError(f"Failed to calculate maximum drawdown: {e}") from e
@@ -603,6 +625,15 @@ class TechnicalIndicators:
             return pd.Series([0] * len(data), index=data.index)
 
         try:
+            values = _finite_values(data)
+            if values is not None:
+                short = kernels.ema_span(values, short_window)
+                long = kernels.ema_span(values, long_window)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    oscillator = ((short - long) / long) * 100
+                oscillator[: long_window - 1] = np.nan
+                return pd.Series(oscillator, index=data.index, name=data.name)
+
             # Calculate EMAs
             ema_short = data.ewm(span=short_window, adjust=False).mean()
             ema_long = data.ewm(span=long_window, adjust=False).mean()
@@ -678,6 +709,14 @@ class TechnicalIndicators:
             # Calculate PPO first
             ppo = TechnicalIndicators.percentage_price_oscillator(data, short_window, long_window)
 
+            # The PPO is NaN only on its masked warm-up prefix; smooth the rest
+            tail = _finite_values(ppo.iloc[long_window - 1 :])
+            if tail is not None:
+                smoothed = np.full(len(ppo), np.nan)
+                smoothed[long_window - 1 :] = kernels.ema_span(tail, smooth_window)
+                smoothed[: long_window + smooth_window - 2] = np.nan
+                return pd.Series(smoothed, index=data.index, name=ppo.name)
+
             # Signal line is EMA of PPO
             signal = ppo.ewm(span=smooth_window, adjust=False).mean()
 
@@ -0,0 +1,265 @@
+"""Business Unit: strategy | Status: current.
+
+Vectorized indicator kernels on raw float64 arrays.
+
+Filter-heavy strategies evaluate max-drawdown, stdev and RSI over long
+histories for many symbols. The pandas formulations pay a Python call per
+window (rolling().apply for max drawdown) or allocate several intermediate
+Series per call (pct_change, diff/where for RSI). These kernels compute the
+same quantities directly on NumPy arrays:
+
+- Rolling max drawdown is evaluated over strided views (sliding_window_view)
+  in bounded-size chunks, so memory stays O(chunk) regardless of history
+  length.
+- Rolling standard deviation runs pandas' compiled online aggregation on the
+  raw array, after returns are computed in NumPy.
+- Exponential smoothing (EMA with adjust=False, Wilder RSI) is evaluated in
+  fixed-size blocks: each block is one small matrix product against a
+  precomputed decay matrix, and only the carry between blocks is sequential.
+
+Semantics mirror the pandas implementations in TechnicalIndicators:
+non-finite values make every window that contains them NaN (pandas treats
+inf as missing and uses min_periods=window), and the first output index of
+each rolling kernel is window-1. Max drawdown and standard deviation are
+bit-identical to the pandas versions; the blocked smoothing kernels agree to
+floating-point rounding (see tests/test_kernels.py for the parity suite).
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+type FloatArray = npt.NDArray[np.float64]
+
+# Upper bound on the number of float64 elements materialized per chunk of
+# strided windows (8 MiB); keeps temporaries small for long histories.
+_CHUNK_ELEMENTS = 1 << 20
+
+# Block length for the blocked exponential-smoothing recursion.
+_EMA_BLOCK = 64
+
+
+def _window_chunks(values: FloatArray, window: int) -> list[tuple[int, FloatArray]]:
+    """Split the strided windows of values into memory-bounded chunks.
+
+    Args:
+        values: Input array (length >= window)
+        window: Window length
+
+    Returns:
+        List of (first window index, windows view) pairs
+
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    rows = max(1, _CHUNK_ELEMENTS // window)
+    return [(start, windows[start : start + rows]) for start in range(0, len(windows), rows)]
+
+
+def _incomplete_windows(values: FloatArray, window: int) -> npt.NDArray[np.bool_]:
+    """Flag windows containing at least one non-finite value.
+
+    Args:
+        values: Input array (length >= window)
+        window: Window length
+
+    Returns:
+        Boolean array with one entry per full window
+
+    """
+    missing = np.concatenate(([0], np.cumsum(~np.isfinite(values))))
+    incomplete: npt.NDArray[np.bool_] = (missing[window:] - missing[:-window]) > 0
+    return incomplete
+
+
+def rolling_max_drawdown(values: FloatArray, window: int) -> FloatArray:
+    """Return the rolling peak-to-trough drawdown as a positive percentage.
+
+    Equivalent to applying ``-(x / x.cummax() - 1).min() * 100`` to every
+    full window, evaluated on strided views instead of per-window Series.
+
+    Args:
+        values: Price array, oldest first
+        window: Window length (positive)
+
+    Returns:
+        Array aligned with values; the first window-1 entries and any window
+        containing a non-finite price are NaN
+
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) < window:
+        return out
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for start, chunk in _window_chunks(values, window):
+            peaks = np.maximum.accumulate(chunk, axis=1)
+            drawdowns = chunk / peaks - 1.0
+            # fmin skips NaN (0/0) the way Series.min() does
+            offset = window - 1 + start
+            out[offset : offset + len(chunk)] = -np.fmin.reduce(drawdowns, axis=1) * 100.0
+    out[window - 1 :][_incomplete_windows(values, window)] = np.nan
+    return out
+
+
+def rolling_std(values: FloatArray, window: int, ddof: int = 1) -> FloatArray:
+    """Return the rolling standard deviation with pandas min_periods=window semantics.
+
+    pandas' rolling variance is already a compiled O(n) online (Welford)
+    update, and NumPy reformulations are slower and only rounding-equal, so
+    this runs that aggregation directly on the raw array (no index alignment
+    or intermediate Series from the caller).
+
+    Args:
+        values: Input array, oldest first
+        window: Window length (positive)
+        ddof: Delta degrees of freedom (1 = sample, 0 = population)
+
+    Returns:
+        Array aligned with values; the first window-1 entries and windows
+        containing a non-finite value are NaN
+
+    """
+    series = pd.Series(np.asarray(values, dtype=np.float64), copy=False)
+    std: FloatArray = (
+        series.rolling(window=window, min_periods=window).std(ddof=ddof).to_numpy(np.float64)
+    )
+    return std
+
+
+def pct_change(values: FloatArray) -> FloatArray:
+    """Return one-period fractional changes, NaN at index 0.
+
+    Args:
+        values: Input array, oldest first
+
+    Returns:
+        Array aligned with values computing values[i] / values[i-1] - 1
+
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.empty(len(values))
+    if len(values) == 0:
+        return out
+    out[0] = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.subtract(values[1:] / values[:-1], 1.0, out=out[1:])
+    return out
+
+
+@lru_cache(maxsize=64)
+def _decay_matrix(alpha: float) -> FloatArray:
+    """Build the block transfer matrix for y[t] = (1-alpha) * y[t-1] + alpha * x[t].
+
+    Row j holds the weights of block inputs 0..j on block output j; the last
+    column of the returned array holds (1-alpha)**(j+1), the weight of the
+    carry entering the block.
+
+    Args:
+        alpha: Smoothing factor in (0, 1]
+
+    Returns:
+        Array of shape (_EMA_BLOCK, _EMA_BLOCK + 1), read-only
+
+    """
+    decay = 1.0 - alpha
+    lags = np.arange(_EMA_BLOCK)[:, None] - np.arange(_EMA_BLOCK)[None, :]
+    weights = np.where(lags >= 0, alpha * decay ** np.maximum(lags, 0), 0.0)
+    carry = decay ** np.arange(1, _EMA_BLOCK + 1, dtype=np.float64)
+    matrix = np.hstack([weights, carry[:, None]])
+    matrix.flags.writeable = False
+    return matrix
+
+
+def ema(values: FloatArray, alpha: float) -> FloatArray:
+    """Return the exponentially weighted mean with pandas adjust=False semantics.
+
+    y[0] = x[0] and y[t] = (1-alpha) * y[t-1] + alpha * x[t]. All values must
+    be finite; callers with gaps should use the pandas implementation.
+
+    Args:
+        values: Finite input array, oldest first
+        alpha: Smoothing factor in (0, 1]
+
+    Returns:
+        Smoothed array aligned with values
+
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    out = np.empty(n)
+    if n == 0:
+        return out
+    out[0] = values[0]
+    rest = n - 1
+    if rest == 0:
+        return out
+
+    matrix = _decay_matrix(alpha)
+    blocks = -(-rest // _EMA_BLOCK)
+    padded = np.zeros(blocks * _EMA_BLOCK)
+    padded[:rest] = values[1:]
+    local = padded.reshape(blocks, _EMA_BLOCK) @ matrix[:, :-1].T
+
+    # Sequential carry across blocks: one scalar update per block.
+    block_decay = float(matrix[-1, -1])
+    block_ends = local[:, -1].tolist()
+    carries = np.empty(blocks)
+    carry = float(values[0])
+    for index, block_end in enumerate(block_ends):
+        carries[index] = carry
+        carry = block_decay * carry + block_end
+
+    smoothed = local + carries[:, None] * matrix[:, -1][None, :]
+    out[1:] = smoothed.ravel()[:rest]
+    return out
+
+
+def ema_span(values: FloatArray, span: int) -> FloatArray:
+    """Return the adjust=False EMA for a pandas-style span (alpha = 2 / (span + 1)).
+
+    Args:
+        values: Finite input array, oldest first
+        span: EMA span (positive)
+
+    Returns:
+        Smoothed array aligned with values
+
+    """
+    return ema(values, 2.0 / (span + 1.0))
+
+
+def wilder_rsi(values: FloatArray, window: int, neutral: float = 50.0) -> FloatArray:
+    """Return Wilder RSI (smoothing alpha = 1/window) on a finite price array.
+
+    Mirrors the pandas formulation: gains/losses from first differences (the
+    first difference counts as zero), Wilder-smoothed averages, and
+    100 - 100 / (1 + avg_gain / avg_loss). Undefined values (0/0) are replaced
+    with the neutral value.
+
+    Args:
+        values: Finite price array, oldest first
+        window: RSI period (positive)
+        neutral: Value used where the RSI is undefined
+
+    Returns:
+        RSI values aligned with values
+
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return np.empty(0)
+    delta = np.empty(len(values))
+    delta[0] = 0.0
+    np.subtract(values[1:], values[:-1], out=delta[1:])
+    gains = np.where(delta > 0, delta, 0.0)
+    losses = np.where(delta < 0, -delta, 0.0)
+    alpha = 1.0 / window
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative_strength = ema(gains, alpha) / ema(losses, alpha)
+        rsi = 100 - (100 / (1 + relative_strength))
+    rsi[np.isnan(rsi)] = neutral
+    return rsi
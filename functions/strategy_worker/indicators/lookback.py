@@ -0,0 +1,95 @@
+"""Business Unit: strategy | Status: current.
+
+Exact lookback requirements of the technical indicators.
+
+A live indicator value depends only on the most recent closes. Windowed
+indicators read the last ``window`` closes, or ``window + 1`` when they work
+on returns, so truncating history further back changes nothing. The
+recursive indicators (Wilder RSI, EMA, PPO) weight the bar ``n`` rows back by
+``(1 - alpha) ** n``; once the warm-up below is loaded, the seed of the
+recursion carries less than RECURSIVE_TOLERANCE of the weight and the
+truncated value agrees with the full-history value to that tolerance.
+
+``exact_lookback_rows`` is the per-request row count; the DSL lookback
+planner takes its maximum over a strategy, and IndicatorService uses it to
+detect tail-only histories that are too short for a request.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+
+# Weight the seed of a recursive indicator may keep after its warm-up
+RECURSIVE_TOLERANCE = 1e-12
+
+
+def _warmup_rows(alpha: float) -> int:
+    """Rows after which an alpha-smoothing's seed weighs < RECURSIVE_TOLERANCE."""
+    if alpha >= 1.0:
+        return 1
+    return math.ceil(math.log(RECURSIVE_TOLERANCE) / math.log1p(-alpha))
+
+
+def _span_warmup_rows(span: int) -> int:
+    """Warm-up rows of a pandas-style span EMA (alpha = 2 / (span + 1))."""
+    return _warmup_rows(2.0 / (span + 1.0))
+
+
+def exact_lookback_rows(
+    indicator_type: str, parameters: Mapping[str, int | float | str]
+) -> int | None:
+    """Return how many trailing closes an indicator's latest value depends on.
+
+    Defaults match the IndicatorService computations.
+
+    Args:
+        indicator_type: IndicatorRequest indicator type (e.g. "rsi")
+        parameters: IndicatorRequest parameters
+
+    Returns:
+        Row count ending at the evaluated bar, or None for an unknown
+        indicator or unusable parameters (callers then need full history)
+
+    """
+    try:
+        if indicator_type == "current_price":
+            return 1
+        if indicator_type in {"percentage_price_oscillator", "percentage_price_oscillator_signal"}:
+            long_window = int(parameters.get("long_window", 26))
+            if long_window <= 0:
+                return None
+            rows = max(long_window, _span_warmup_rows(long_window))
+            if indicator_type == "percentage_price_oscillator_signal":
+                smooth_window = int(parameters.get("smooth_window", 9))
+                if smooth_window <= 0:
+                    return None
+                rows += max(smooth_window, _span_warmup_rows(smooth_window))
+            return rows
+
+        defaults = {
+            "rsi": 14,
+            "moving_average": 200,
+            "moving_average_return": 21,
+            "cumulative_return": 60,
+            "exponential_moving_average_price": 12,
+            "stdev_return": 6,
+            "stdev_price": 6,
+            "max_drawdown": 60,
+        }
+        if indicator_type not in defaults:
+            return None
+        window = int(parameters.get("window", defaults[indicator_type]))
+    except (TypeError, ValueError):
+        return None
+    if window <= 0:
+        return None
+
+    if indicator_type == "rsi":
+        # First differences need one extra close
+        return 1 + max(window, _warmup_rows(1.0 / window))
+    if indicator_type == "exponential_moving_average_price":
+        return max(window, _span_warmup_rows(window))
+    if indicator_type in {"moving_average_return", "cumulative_return", "stdev_return"}:
+        return window + 1
+    return window
@@ -0,0 +1,4 @@
+"""Business Unit: strategy | Status: current.
+
+Test suite for technical indicator kernels.
+"""
@@ -0,0 +1,127 @@
+"""Business Unit: strategy | Status: current.
+
+Parity tests for incremental indicator series at the warm-up boundary.
+
+Incremental mode slices series computed once over the full history; prefixes
+no longer than an indicator's exact lookback are computed directly instead.
+
+Tests:
+- Histories one bar below, at, and one bar above each indicator's exact
+  lookback give the same result (or the same refusal) as recomputing on
+  truncated history
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import pytest
+
+from engines.dsl.types import DslEvaluationError
+from indicators.indicator_service import IndicatorService
+from indicators.lookback import exact_lookback_rows
+from the_alchemiser.shared.schemas.indicator_request import IndicatorRequest
+from the_alchemiser.shared.types.market_data import BarModel
+from the_alchemiser.shared.value_objects.symbol import Symbol
+
+START = datetime(2023, 1, 2, tzinfo=UTC)
+
+CASES: list[tuple[str, dict[str, int | float | str]]] = [
+    ("rsi", {"window": 10}),
+    ("exponential_moving_average_price", {"window": 12}),
+    ("moving_average_return", {"window": 20}),
+    ("cumulative_return", {"window": 60}),
+    ("stdev_return", {"window": 6}),
+    ("max_drawdown", {"window": 60}),
+    ("percentage_price_oscillator", {"short_window": 12, "long_window": 26}),
+    (
+        "percentage_price_oscillator_signal",
+        {"short_window": 12, "long_window": 26, "smooth_window": 9},
+    ),
+]
+
+
+class FakePort:
+    """Bar-only market data port over a fixed close series."""
+
+    def __init__(self, closes: list[float]) -> None:
+        self.closes = closes
+
+    def get_bars(self, symbol: Symbol, period: str, timeframe: str) -> list[BarModel]:
+        return [
+            BarModel(
+                symbol=str(symbol),
+                timestamp=START + timedelta(days=i),
+                open=Decimal(str(close)),
+                high=Decimal(str(close)),
+                low=Decimal(str(close)),
+                close=Decimal(str(close)),
+                volume=0,
+            )
+            for i, close in enumerate(self.closes)
+        ]
+
+
+@pytest.fixture(scope="module")
+def port() -> FakePort:
+    rng = np.random.default_rng(11)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 900)))
+    return FakePort([round(float(c), 2) for c in closes])
+
+
+def _values(
+    service: IndicatorService,
+    indicator_type: str,
+    parameters: dict[str, int | float | str],
+    rows: int,
+) -> dict[str, Any]:
+    service.as_of_date = (START + timedelta(days=rows - 1)).date()
+    request = IndicatorRequest(
+        request_id="r",
+        correlation_id="c",
+        symbol="SPY",
+        indicator_type=indicator_type,
+        parameters=parameters,
+    )
+    try:
+        return service.get_indicator(request).model_dump(exclude={"timestamp"})
+    except DslEvaluationError:
+        # Too short for this indicator: both modes must refuse alike
+        return {"error": DslEvaluationError.__name__}
+
+
+def _assert_close(actual: Any, expected: Any) -> None:
+    if isinstance(expected, dict):
+        assert actual.keys() == expected.keys()
+        for key in expected:
+            _assert_close(actual[key], expected[key])
+    elif isinstance(expected, float) and isinstance(actual, float):
+        assert math.isclose(actual, expected, rel_tol=1e-9, abs_tol=1e-9)
+    else:
+        assert actual == expected
+
+
+@pytest.mark.parametrize(("indicator_type", "parameters"), CASES)
+def test_matches_truncated_recompute_around_warmup(
+    port: FakePort, indicator_type: str, parameters: dict[str, int | float | str]
+) -> None:
+    warmup = exact_lookback_rows(indicator_type, parameters)
+    assert warmup is not None
+    assert warmup + 1 < len(port.closes)
+    incremental = IndicatorService(port)  # type: ignore[arg-type]
+    reference = IndicatorService(port, incremental=False)  # type: ignore[arg-type]
+
+    for rows in (warmup - 1, warmup):
+        # Computed directly on the prefix: identical to the reference
+        assert _values(incremental, indicator_type, parameters, rows) == _values(
+            reference, indicator_type, parameters, rows
+        )
+    rows = warmup + 1
+    _assert_close(
+        _values(incremental, indicator_type, parameters, rows),
+        _values(reference, indicator_type, parameters, rows),
+    )
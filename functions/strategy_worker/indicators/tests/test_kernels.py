@@ -0,0 +1,240 @@
+"""Business Unit: strategy | Status: current.
+
+Parity tests for the NumPy indicator kernels.
+
+Each kernel is checked against the pandas formulation it replaced, both
+directly and through the TechnicalIndicators entry points:
+- Random-walk price series across several seeds and window sizes
+- Edge cases: window of 1, window equal to the series length, constant and
+  monotonic series, and series containing NaN/inf gaps
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import kernels
+from indicators.indicators import TechnicalIndicators
+
+RTOL = 1e-10
+ATOL = 1e-9
+
+
+def _prices(seed: int, length: int = 600) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0004, 0.02, size=length)
+    index = pd.date_range("2015-01-02", periods=length, freq="B")
+    return pd.Series(100.0 * np.exp(np.cumsum(returns)), index=index)
+
+
+def _gapped(seed: int) -> pd.Series:
+    prices = _prices(seed, 300)
+    prices.iloc[[40, 41, 150]] = np.nan
+    prices.iloc[220] = np.inf
+    return prices
+
+
+# Reference pandas implementations (the formulations the kernels replaced).
+
+
+def _reference_max_drawdown(data: pd.Series, window: int) -> pd.Series:
+    def mdd_window(x: pd.Series) -> float:
+        cummax = x.cummax()
+        drawdowns = (x / cummax) - 1.0
+        return float(-drawdowns.min() * 100.0)
+
+    return data.rolling(window=window, min_periods=window).apply(mdd_window, raw=False)
+
+
+def _reference_stdev_return(data: pd.Series, window: int) -> pd.Series:
+    returns = data.pct_change() * 100
+    daily_std = returns.rolling(window=window, min_periods=window).std(ddof=0)
+    return daily_std * math.sqrt(252)
+
+
+def _reference_stdev_price(data: pd.Series, window: int) -> pd.Series:
+    return data.rolling(window=window, min_periods=window).std()
+
+
+def _reference_rsi(data: pd.Series, window: int) -> pd.Series:
+    delta = data.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    alpha = 1.0 / window
+    avg_gain = gain.ewm(alpha=alpha, adjust=False).mean()
+    avg_loss = loss.ewm(alpha=alpha, adjust=False).mean()
+    rs = avg_gain.divide(avg_loss, fill_value=0.0)
+    return (100 - (100 / (1 + rs))).fillna(50.0)
+
+
+def _reference_ema(data: pd.Series, window: int) -> pd.Series:
+    ema = data.ewm(span=window, adjust=False).mean()
+    ema.iloc[: window - 1] = np.nan
+    return ema
+
+
+def _reference_ppo(data: pd.Series, short_window: int, long_window: int) -> pd.Series:
+    ema_short = data.ewm(span=short_window, adjust=False).mean()
+    ema_long = data.ewm(span=long_window, adjust=False).mean()
+    ppo = ((ema_short - ema_long) / ema_long) * 100
+    ppo.iloc[: long_window - 1] = np.nan
+    return ppo
+
+
+def _reference_ppo_signal(
+    data: pd.Series, short_window: int, long_window: int, smooth_window: int
+) -> pd.Series:
+    signal = _reference_ppo(data, short_window, long_window).ewm(
+        span=smooth_window, adjust=False
+    ).mean()
+    signal.iloc[: long_window + smooth_window - 2] = np.nan
+    return signal
+
+
+def _assert_close(actual: pd.Series, expected: pd.Series) -> None:
+    assert actual.index.equals(expected.index)
+    np.testing.assert_allclose(
+        actual.to_numpy(dtype=float),
+        expected.to_numpy(dtype=float),
+        rtol=RTOL,
+        atol=ATOL,
+        equal_nan=True,
+    )
+
+
+class TestRollingMaxDrawdown:
+    """Max drawdown kernel is bit-identical to the rolling-apply formulation."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    @pytest.mark.parametrize("window", [1, 2, 5, 20, 60, 252])
+    def test_matches_pandas_exactly(self, seed: int, window: int) -> None:
+        prices = _prices(seed)
+        expected = _reference_max_drawdown(prices, window).to_numpy()
+        actual = kernels.rolling_max_drawdown(prices.to_numpy(), window)
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_window_equal_to_length(self) -> None:
+        prices = _prices(4, 30)
+        actual = kernels.rolling_max_drawdown(prices.to_numpy(), 30)
+        assert np.isnan(actual[:-1]).all()
+        assert actual[-1] == _reference_max_drawdown(prices, 30).iloc[-1]
+
+    def test_gaps_match_pandas(self) -> None:
+        prices = _gapped(5)
+        expected = _reference_max_drawdown(prices, 10).to_numpy()
+        actual = kernels.rolling_max_drawdown(prices.to_numpy(), 10)
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_chunking_is_transparent(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        prices = _prices(6).to_numpy()
+        whole = kernels.rolling_max_drawdown(prices, 50)
+        monkeypatch.setattr(kernels, "_CHUNK_ELEMENTS", 120)
+        np.testing.assert_array_equal(kernels.rolling_max_drawdown(prices, 50), whole)
+
+    def test_technical_indicators_delegates(self) -> None:
+        prices = _prices(7)
+        result = TechnicalIndicators.max_drawdown(prices, 20)
+        pd.testing.assert_series_equal(result, _reference_max_drawdown(prices, 20))
+
+
+class TestRollingStd:
+    """Rolling standard deviation kernels are bit-identical to pandas."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    @pytest.mark.parametrize("window", [2, 5, 20, 63])
+    def test_stdev_price(self, seed: int, window: int) -> None:
+        prices = _prices(seed)
+        pd.testing.assert_series_equal(
+            TechnicalIndicators.stdev_price(prices, window), _reference_stdev_price(prices, window)
+        )
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    @pytest.mark.parametrize("window", [1, 2, 5, 20, 63])
+    def test_stdev_return(self, seed: int, window: int) -> None:
+        prices = _prices(seed)
+        pd.testing.assert_series_equal(
+            TechnicalIndicators.stdev_return(prices, window),
+            _reference_stdev_return(prices, window),
+        )
+
+    def test_window_of_one_sample_std_is_nan(self) -> None:
+        prices = _prices(8, 20)
+        result = TechnicalIndicators.stdev_price(prices, 1)
+        _assert_close(result, _reference_stdev_price(prices, 1))
+        assert result.isna().all()
+
+    def test_constant_windows_are_exactly_zero(self) -> None:
+        prices = pd.Series([0.1] * 10 + [0.3] * 10, dtype=float)
+        result = kernels.rolling_std(prices.to_numpy(), 5, ddof=1)
+        assert (result[4:8] == 0.0).all()
+        assert (result[15:] == 0.0).all()
+
+    def test_gaps_match_pandas(self) -> None:
+        prices = _gapped(9)
+        _assert_close(
+            TechnicalIndicators.stdev_price(prices, 10), _reference_stdev_price(prices, 10)
+        )
+        _assert_close(
+            TechnicalIndicators.stdev_return(prices, 10), _reference_stdev_return(prices, 10)
+        )
+
+
+class TestSmoothing:
+    """EMA, RSI and PPO kernels agree with pandas ewm(adjust=False)."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    @pytest.mark.parametrize("window", [1, 2, 10, 14, 63, 200])
+    def test_rsi(self, seed: int, window: int) -> None:
+        prices = _prices(seed, 1500)
+        _assert_close(TechnicalIndicators.rsi(prices, window), _reference_rsi(prices, window))
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    @pytest.mark.parametrize("window", [1, 3, 12, 26, 200])
+    def test_ema(self, seed: int, window: int) -> None:
+        prices = _prices(seed, 1500)
+        _assert_close(
+            TechnicalIndicators.exponential_moving_average(prices, window),
+            _reference_ema(prices, window),
+        )
+
+    @pytest.mark.parametrize("length", [2, 63, 64, 65, 129])
+    def test_ema_block_boundaries(self, length: int) -> None:
+        values = _prices(10, length).to_numpy()
+        expected = pd.Series(values).ewm(alpha=0.3, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(kernels.ema(values, 0.3), expected, rtol=RTOL)
+
+    def test_ppo_and_signal(self) -> None:
+        prices = _prices(11, 800)
+        _assert_close(
+            TechnicalIndicators.percentage_price_oscillator(prices, 12, 26),
+            _reference_ppo(prices, 12, 26),
+        )
+        _assert_close(
+            TechnicalIndicators.percentage_price_oscillator_signal(prices, 12, 26, 9),
+            _reference_ppo_signal(prices, 12, 26, 9),
+        )
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [100.0] * 30,
+            list(np.linspace(100.0, 130.0, 30)),
+            list(np.linspace(130.0, 100.0, 30)),
+        ],
+        ids=["constant", "rising", "falling"],
+    )
+    def test_rsi_degenerate_series(self, values: list[float]) -> None:
+        prices = pd.Series(values)
+        _assert_close(TechnicalIndicators.rsi(prices, 14), _reference_rsi(prices, 14))
+
+    def test_gapped_series_keep_pandas_semantics(self) -> None:
+        prices = _gapped(12)
+        _assert_close(TechnicalIndicators.rsi(prices, 14), _reference_rsi(prices, 14))
+        _assert_close(
+            TechnicalIndicators.exponential_moving_average(prices, 12),
+            _reference_ema(prices, 12),
+        )
@@ -0,0 +1,107 @@
+"""Business Unit: strategy | Status: current.
+
+Tests for indicator results shared across workers.
+
+Tests:
+- A worker reuses a result another worker published for the same data
+- After a rewrite of earlier bars (split/dividend adjustment, backfill) that
+  keeps the last bar's date and close, the old result is not served
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from indicators.indicator_service import IndicatorService
+from the_alchemiser.shared.data_v2.indicator_result_store import (
+    IndicatorResultStore,
+    LocalFileIndicatorResultBackend,
+)
+from the_alchemiser.shared.data_v2.market_data_store import SymbolMetadata
+from the_alchemiser.shared.schemas.indicator_request import IndicatorRequest
+from the_alchemiser.shared.types.market_data import BarModel
+from the_alchemiser.shared.value_objects.symbol import Symbol
+
+START = datetime(2025, 1, 2, tzinfo=UTC)
+
+
+class FakeStore:
+    """Market data store exposing one symbol's metadata."""
+
+    def __init__(self, metadata: SymbolMetadata) -> None:
+        self.metadata = metadata
+
+    def get_cached_metadata(self, symbol: str) -> SymbolMetadata | None:
+        return self.metadata
+
+
+class FakePort:
+    """Bar-only market data port over a fixed close series."""
+
+    def __init__(self, closes: list[float], updated_at: str) -> None:
+        self.closes = closes
+        last_bar = (START + timedelta(days=len(closes) - 1)).date().isoformat()
+        self.market_data_store = FakeStore(SymbolMetadata("SPY", last_bar, len(closes), updated_at))
+
+    def get_bars(self, symbol: Symbol, period: str, timeframe: str) -> list[BarModel]:
+        return [
+            BarModel(
+                symbol=str(symbol),
+                timestamp=START + timedelta(days=i),
+                open=Decimal(str(close)),
+                high=Decimal(str(close)),
+                low=Decimal(str(close)),
+                close=Decimal(str(close)),
+                volume=0,
+            )
+            for i, close in enumerate(self.closes)
+        ]
+
+
+def _rsi(port: FakePort, store: IndicatorResultStore) -> float | None:
+    service = IndicatorService(port, result_store=store)  # type: ignore[arg-type]
+    request = IndicatorRequest(
+        request_id="r",
+        correlation_id="c",
+        symbol="SPY",
+        indicator_type="rsi",
+        parameters={"window": 10},
+    )
+    return service.get_indicator(request).rsi_10
+
+
+@pytest.fixture
+def closes() -> list[float]:
+    rng = np.random.default_rng(7)
+    return [round(float(c), 2) for c in 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 120)))]
+
+
+def test_same_data_is_served_from_the_store(closes: list[float], tmp_path: Path) -> None:
+    backend = LocalFileIndicatorResultBackend(tmp_path)
+    first = _rsi(FakePort(closes, "2026-03-10T21:00:00+00:00"), IndicatorResultStore(backend))
+    second_store = IndicatorResultStore(backend)
+
+    second = _rsi(FakePort(closes, "2026-03-10T21:00:00+00:00"), second_store)
+
+    assert second == first
+    assert second_store.hits == 1
+
+
+def test_restated_history_is_recomputed(closes: list[float], tmp_path: Path) -> None:
+    backend = LocalFileIndicatorResultBackend(tmp_path)
+    original = _rsi(FakePort(closes, "2026-03-10T21:00:00+00:00"), IndicatorResultStore(backend))
+    # Back-adjust every bar but the last; last bar date and close are unchanged
+    adjusted = [round(c * 0.5, 2) for c in closes[:-1]] + closes[-1:]
+    adjusted_port = FakePort(adjusted, "2026-03-11T06:00:00+00:00")
+    store = IndicatorResultStore(backend)
+
+    shared = _rsi(adjusted_port, store)
+
+    assert store.hits == 0
+    assert shared is not None
+    assert shared != original
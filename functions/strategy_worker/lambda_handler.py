@@ -62,6 +62,9 @@ def lambda_handler(event: dict[str, Any], context: object) -> dict[str, Any]:
     dsl_file = event.get("dsl_file", "")
     allocation = Decimal(str(event.get("allocation", "0")))
     debug_mode = event.get("debug_mode", False)
+    profile = bool(
+        event.get("profile", False) or os.environ.get("DSL_PROFILE", "false").lower() == "true"
+    )
 
     # Derive strategy_id from dsl_file (e.g., '1-KMLM.clj' -> '1-KMLM')
     strategy_id = Path(dsl_file).stem if dsl_file else ""
@@ -106,6 +109,7 @@ def lambda_handler(event: dict[str, Any], context: object) -> dict[str, Any]:
             "dsl_file": dsl_file,
             "allocation": str(allocation),
             "debug_mode": debug_mode,
+            "profile": profile,
         },
     )
 
@@ -119,6 +123,7 @@ def lambda_handler(event: dict[str, Any], context: object) -> dict[str, Any]:
             container=container,
             dsl_file=dsl_file,
             debug_mode=debug_mode,
+            profile=profile,
         )
 
         result = handler.generate_signals(correlation_id)
@@ -128,6 +133,7 @@ def lambda_handler(event: dict[str, Any], context: object) -> dict[str, Any]:
 
         target_weights = result["target_weights"]
         data_freshness = result.get("data_freshness")
+        evaluation_profile = result.get("profile")
 
         logger.info(
             "DSL evaluation complete, starting rebalance",
@@ -160,6 +166,9 @@ def lambda_handler(event: dict[str, Any], context: object) -> dict[str, Any]:
                 "trade_count": rebalance_result.trade_count,
                 "plan_id": rebalance_result.plan_id,
                 "strategy_capital": str(rebalance_result.strategy_capital),
+                "evaluation_wall_ms": (
+                    evaluation_profile["wall_ms"] if evaluation_profile else None
+                ),
             },
         )
 
@@ -184,6 +193,7 @@ def lambda_handler(event: dict[str, Any], context: object) -> dict[str, Any]:
                 "trade_count": rebalance_result.trade_count,
                 "plan_id": rebalance_result.plan_id,
                 "strategy_capital": str(rebalance_result.strategy_capital),
+                "profile": evaluation_profile,
             },
         }
 
@@ -77,6 +77,10 @@ from the_alchemiser.shared.schemas.operations import OrderCancellationResult
 from the_alchemiser.shared.services.alpaca_account_service import AlpacaAccountService
 from the_alchemiser.shared.services.alpaca_trading_service import AlpacaTradingService
 from the_alchemiser.shared.services.asset_metadata_service import AssetMetadataService
+from the_alchemiser.shared.services.order_update_dispatcher import (
+    OrderUpdate,
+    OrderUpdateDispatcher,
+)
 from the_alchemiser.shared.types.market_data import QuoteModel
 from the_alchemiser.shared.utils.alpaca_error_handler import AlpacaErrorHandler
 
@@ -711,17 +715,21 @@ class AlpacaManager(TradingRepository, MarketDataRepository, AccountRepository):
             return price
         return Decimal(str(price))  # Convert via string to avoid float precision issues
 
-    def get_current_prices(self, symbols: list[str]) -> dict[str, float]:
+    def get_current_prices(
+        self, symbols: list[str], *, run_id: str | None = None
+    ) -> dict[str, float]:
         """Get current prices for multiple symbols.
 
         Args:
             symbols: List of stock symbols
+            run_id: Run correlation ID, so concurrent workers share one snapshot
 
         Returns:
-            Dictionary mapping symbols to their current prices
+            Dictionary mapping symbols to their current prices (unpriceable
+            symbols are omitted)
 
         """
-        return self._market_data_service.get_current_prices(symbols)
+        return self._market_data_service.get_current_prices(symbols, run_id=run_id)
 
     def get_latest_quote(self, symbol: str) -> QuoteModel | None:
         """Get latest bid/ask quote for a symbol (delegates to MarketDataService).
@@ -1034,6 +1042,27 @@ class AlpacaManager(TradingRepository, MarketDataRepository, AccountRepository):
         """
         return self._get_trading_service().wait_for_order_completion(order_ids, max_wait_seconds)
 
+    def get_order_update_dispatcher(self) -> OrderUpdateDispatcher:
+        """Get the shared order-update dispatcher (starts the TradingStream if needed).
+
+        Returns:
+            OrderUpdateDispatcher fed by this account's TradingStream
+
+        """
+        return self._get_trading_service().order_updates
+
+    def get_order_update(self, order_id: str) -> OrderUpdate | None:
+        """Fetch an order's current state over REST (dispatcher polling fallback).
+
+        Args:
+            order_id: Order ID to look up
+
+        Returns:
+            OrderUpdate snapshot, or None on error
+
+        """
+        return self._get_trading_service().get_order_update(order_id)
+
     def _check_order_completion_status(self, order_id: str) -> str | None:
         """Check if a single order has reached a final state (delegates to TradingService).
 
@@ -16,6 +16,7 @@ from dependency_injector import containers, providers
 if TYPE_CHECKING:
     from the_alchemiser.shared.brokers import AlpacaManager
     from the_alchemiser.shared.options.adapters import AlpacaOptionsAdapter
+    from the_alchemiser.shared.options.chain_snapshot import OptionChainSnapshots
     from the_alchemiser.shared.services.market_data_service import MarketDataService
     from the_alchemiser.shared.types.market_data_port import MarketDataPort
 
@@ -60,6 +61,21 @@ def _create_alpaca_options_adapter(
     return AlpacaOptionsAdapter(api_key=api_key, secret_key=secret_key, paper=paper)
 
 
+def _create_option_chain_snapshots(options_adapter: AlpacaOptionsAdapter) -> OptionChainSnapshots:
+    """Create OptionChainSnapshots with lazy import.
+
+    Args:
+        options_adapter: Alpaca options adapter the snapshots fetch through
+
+    Returns:
+        OptionChainSnapshots instance
+
+    """
+    from the_alchemiser.shared.options.chain_snapshot import OptionChainSnapshots
+
+    return OptionChainSnapshots(options_adapter)
+
+
 def _create_market_data_service(market_data_repo: object) -> MarketDataService:
     """Create MarketDataService with lazy import.
 
@@ -204,3 +220,11 @@ class InfrastructureProviders(containers.DeclarativeContainer):
         secret_key=config.alpaca_secret_key,
         paper=config.paper_trading,
     )
+
+    # Option chain snapshots (Singleton pattern)
+    # Paginated, quoted chains cached per underlying and expiry window, so
+    # every chain consumer in a run shares one fetch
+    option_chain_snapshots = providers.Singleton(
+        _create_option_chain_snapshots,
+        options_adapter=alpaca_options_adapter,
+    )
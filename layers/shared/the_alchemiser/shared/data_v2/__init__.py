@@ -5,6 +5,8 @@ Shared data utilities for market data storage and retrieval.
 This module provides utilities for reading/writing market data to S3:
 - CachedMarketDataAdapter: Adapter for reading market data from S3 Parquet files
 - MarketDataStore: Low-level S3 Parquet read/write operations
+- ColumnarBarStore: Process-wide float64 column store for indicator inputs
+- IndicatorResultStore: Content-addressed indicator results shared across workers
 
 These utilities are used by:
 - DataFunction: Writes market data to S3
@@ -23,7 +23,8 @@ from __future__ import annotations
 import json
 import os
 import time
-from datetime import UTC, datetime, timedelta
+from collections.abc import Mapping
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
@@ -31,10 +32,16 @@ import boto3
 import pandas as pd
 from botocore.config import Config
 
+from the_alchemiser.shared.data_v2.columnar_bar_store import (
+    CloseArray,
+    ColumnarBars,
+    ColumnarBarStore,
+    get_process_bar_store,
+)
 from the_alchemiser.shared.data_v2.market_data_store import MarketDataStore
 from the_alchemiser.shared.logging import get_logger
 from the_alchemiser.shared.types.market_data import BarModel, QuoteModel
-from the_alchemiser.shared.types.market_data_port import MarketDataPort
+from the_alchemiser.shared.types.market_data_port import ColumnarMarketDataPort, MarketDataPort
 from the_alchemiser.shared.value_objects.symbol import Symbol
 
 if TYPE_CHECKING:
@@ -100,7 +107,7 @@ def _parse_period_to_days(period: str) -> int:
     )
 
 
-class CachedMarketDataAdapter(MarketDataPort):
+class CachedMarketDataAdapter(ColumnarMarketDataPort):
     """Market data adapter that uses S3 cache with optional fallback.
 
     This adapter reads daily bars from S3 Parquet files populated by the
@@ -114,10 +121,18 @@ class CachedMarketDataAdapter(MarketDataPort):
 
     In production, data should always be pre-populated by the scheduled refresh.
 
+    get_close_array serves float64 closes from a process-wide ColumnarBarStore,
+    so indicator computation never materializes BarModel objects. Stored bars
+    are reused across warm invocations once checked against S3 metadata.
+    Callers that need only the latest bars pass ``tail_rows``; those symbols
+    are read tail-only (MarketDataStore.read_symbol_tail) and stored as
+    truncated bars that full-history requests never see.
+
     Attributes:
         market_data_store: S3-backed Parquet storage for historical data
         fallback_adapter: Optional MarketDataPort for cache miss handling
         _alpaca_manager: Lazy-loaded Alpaca client for direct API fallback
+        _bar_store: Columnar bar store (process-wide unless injected)
 
     """
 
@@ -128,6 +143,7 @@ class CachedMarketDataAdapter(MarketDataPort):
         fallback_adapter: MarketDataPort | None = None,
         enable_live_fallback: bool = False,
         enable_sync_refresh: bool = False,
+        bar_store: ColumnarBarStore | None = None,
     ) -> None:
         """Initialize cached market data adapter.
 
@@ -140,9 +156,12 @@ class CachedMarketDataAdapter(MarketDataPort):
             enable_sync_refresh: Whether to synchronously invoke the Data Lambda to
                                 refresh stale/missing data. Only for live trading runs.
                                 Defaults to False to avoid blocking in backtests.
+            bar_store: Columnar bar store for get_close_array. If None, uses the
+                      process-wide store so warm invocations reuse decoded bars.
 
         """
         self.market_data_store = market_data_store or MarketDataStore()
+        self._bar_store = bar_store if bar_store is not None else get_process_bar_store()
         self._fallback_adapter = fallback_adapter
         self._alpaca_manager: AlpacaManager | None = None
         self._enable_live_fallback = enable_live_fallback
@@ -604,6 +623,90 @@ class CachedMarketDataAdapter(MarketDataPort):
 
         return bars
 
+    def _get_columnar_bars(
+        self, symbol_str: str, tail_rows: int | None = None
+    ) -> ColumnarBars | None:
+        """Return a symbol's columnar bars, reading parquet only when needed.
+
+        Bars already in the process-wide store are reused when they were
+        built from the metadata version in this invocation's snapshot (see
+        MarketDataStore.get_cached_metadata), so freshness costs no extra
+        S3 round-trip.
+
+        Args:
+            symbol_str: Ticker symbol
+            tail_rows: Latest bars needed; when set, the bars may be a
+                truncated tail holding at least this many rows. None
+                requires full history.
+
+        Returns:
+            ColumnarBars, or None if the symbol has no usable cached data
+
+        """
+        version = self.market_data_store.get_cached_metadata(symbol_str)
+        if version is None:
+            return None
+        stored = self._bar_store.get(symbol_str, version, min_rows=tail_rows)
+        if stored is not None:
+            return stored
+
+        if tail_rows is None:
+            df = self.market_data_store.read_symbol_data(symbol_str)
+        else:
+            df = self.market_data_store.read_symbol_tail(symbol_str, tail_rows)
+        if df is None:
+            return None
+        columns = ColumnarBars.from_dataframe(symbol_str, df, truncated=len(df) < version.row_count)
+        if columns is None:
+            return None
+
+        self._bar_store.put(columns, version)
+        return columns
+
+    def get_close_array(
+        self,
+        symbol: Symbol,
+        as_of: date | None = None,
+        period: str = "MAX",
+        tail_rows: int | None = None,
+    ) -> CloseArray | None:
+        """Get daily closes as float64 arrays without building BarModel objects.
+
+        Applies the same lookback cutoff as get_bars. On a cache miss (or an
+        empty lookback window) delegates to get_bars so the sync-refresh and
+        live fallbacks behave identically, converting the result once.
+
+        Args:
+            symbol: Trading symbol
+            as_of: Optional inclusive cutoff on the bar's UTC date
+            period: Lookback period (e.g., "1Y", "90D", "MAX")
+            tail_rows: Return only the last ``tail_rows`` bars on or before
+                as_of within the lookback window. Without as_of this allows a
+                tail-only read; with as_of the full history is read so the
+                tail ends at the cutoff
+
+        Returns:
+            CloseArray oldest first, or None if no data is available
+
+        Raises:
+            ValueError: If period format is invalid
+
+        """
+        symbol_str = str(symbol)
+        lookback_days = _parse_period_to_days(period)
+
+        # The latest rows only cover a window ending today, not one ending at as_of
+        columns = self._get_columnar_bars(symbol_str, tail_rows if as_of is None else None)
+        if columns is not None:
+            since = datetime.now(UTC) - timedelta(days=lookback_days) if lookback_days > 0 else None
+            if len(columns.close_array(since=since)) > 0:
+                return columns.close_array(as_of=as_of, since=since, tail=tail_rows)
+
+        bars = self.get_bars(symbol, period, "1Day")
+        if not bars:
+            return None
+        return CloseArray.from_bars(symbol_str, bars).as_of(as_of).tail(tail_rows)
+
     def get_latest_quote(self, symbol: Symbol) -> QuoteModel | None:
         """Get latest quote from cached data.
 
@@ -675,28 +778,38 @@ class CachedMarketDataAdapter(MarketDataPort):
 
         return float(df.iloc[-1]["close"])
 
-    def warm_cache(self, symbols: list[str]) -> None:
-        """Pre-load symbol data into local Lambda /tmp cache.
+    def warm_cache(self, symbols: list[str], tail_rows: Mapping[str, int] | None = None) -> None:
+        """Pre-load symbol data into the in-process stores.
 
         Call during cold start to minimize S3 calls during indicator computation.
+        Parquet objects are fetched concurrently by the market data store, then
+        decoded into the columnar bar store that get_close_array reads, so
+        evaluation does not wait on S3 for any symbol in the list.
 
         Args:
             symbols: List of symbol strings to pre-cache
+            tail_rows: Latest bars needed per symbol (a lookback plan);
+                listed symbols are decoded tail-only
 
         """
+        tail_rows = tail_rows or {}
         logger.info(
             "Warming cache",
             symbol_count=len(symbols),
         )
 
         try:
-            results = self.market_data_store.download_to_cache(symbols)
+            results = self.market_data_store.download_to_cache(symbols, tail_rows=tail_rows)
             failed = [s for s, ok in results.items() if not ok]
             if failed:
                 logger.warning(
                     "Some symbols failed to cache",
                     failed_symbols=failed,
                 )
+            # Served from the frame cache just populated; no further S3 reads
+            for symbol, ok in results.items():
+                if ok:
+                    self._get_columnar_bars(symbol, tail_rows.get(symbol))
         except Exception as e:
             logger.warning(
                 "Failed to warm cache",
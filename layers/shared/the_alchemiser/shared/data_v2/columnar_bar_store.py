@@ -0,0 +1,313 @@
+"""Business Unit: data | Status: current.
+
+Columnar in-memory bar store for the strategy hot path.
+
+Indicator computation only needs float closes and a date index, but the
+BarModel path materializes one frozen dataclass (five Decimal conversions)
+per row for decades of history, only for IndicatorService to turn them
+straight back into floats. This module keeps each symbol's bars as parallel
+float64 NumPy arrays plus a sorted timestamp/date index, built once per
+parquet read and shared by every consumer in the process.
+
+Slicing to a lookback cutoff or an as-of date is a binary search over the
+sorted index and returns read-only views; no per-row objects are created.
+
+Entries may hold only a symbol's latest rows (a tail-only parquet read for
+a live evaluation with a lookback plan). Such entries are marked truncated
+and are served only to callers that ask for at most that many rows, so a
+full-history request never sees a tail.
+
+BarModel remains the interface for callers that need Decimal precision
+(order sizing, reporting); this store is for float-only analytics.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from the_alchemiser.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    from the_alchemiser.shared.data_v2.market_data_store import SymbolMetadata
+    from the_alchemiser.shared.types.market_data import BarModel
+
+logger = get_logger(__name__)
+
+
+def _readonly[T: np.generic](array: npt.NDArray[T]) -> npt.NDArray[T]:
+    """Mark an array read-only so shared views cannot be mutated by consumers."""
+    array.flags.writeable = False
+    return array
+
+
+@dataclass(frozen=True, slots=True)
+class CloseArray:
+    """Daily closes for one symbol as float64, oldest first.
+
+    Attributes:
+        symbol: Ticker symbol
+        timestamps: Bar timestamps as naive UTC datetime64[ns]
+        closes: Close prices as float64, aligned with timestamps
+
+    """
+
+    symbol: str
+    timestamps: npt.NDArray[np.datetime64]
+    closes: npt.NDArray[np.float64]
+
+    def __len__(self) -> int:
+        """Return the number of bars."""
+        return len(self.closes)
+
+    @classmethod
+    def from_bars(cls, symbol: str, bars: list[BarModel]) -> CloseArray:
+        """Build from BarModel objects (used for fallback data not in the store).
+
+        Args:
+            symbol: Ticker symbol
+            bars: Chronologically ordered bars with timezone-aware timestamps
+
+        Returns:
+            CloseArray with the bars' closes converted to float64
+
+        """
+        timestamps = np.array(
+            [bar.timestamp.astimezone(UTC).replace(tzinfo=None) for bar in bars],
+            dtype="datetime64[ns]",
+        )
+        closes = np.array([float(bar.close) for bar in bars], dtype=np.float64)
+        return cls(symbol=symbol, timestamps=_readonly(timestamps), closes=_readonly(closes))
+
+    def as_of(self, as_of_date: date | None) -> CloseArray:
+        """Return the bars whose UTC date is on or before as_of_date.
+
+        Args:
+            as_of_date: Inclusive cutoff date, or None for all bars
+
+        Returns:
+            View of this array truncated to the cutoff
+
+        """
+        if as_of_date is None:
+            return self
+        end = int(
+            np.searchsorted(
+                self.timestamps.astype("datetime64[D]"),
+                np.datetime64(as_of_date, "D"),
+                side="right",
+            )
+        )
+        return CloseArray(self.symbol, self.timestamps[:end], self.closes[:end])
+
+    def tail(self, rows: int | None) -> CloseArray:
+        """Return the last ``rows`` bars.
+
+        Args:
+            rows: Bars to keep, or None for all bars
+
+        Returns:
+            View of this array's latest bars
+
+        """
+        if rows is None or rows >= len(self):
+            return self
+        start = len(self) - rows
+        return CloseArray(self.symbol, self.timestamps[start:], self.closes[start:])
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnarBars:
+    """All daily bars for one symbol stored column-wise.
+
+    Attributes:
+        symbol: Ticker symbol
+        timestamps: Sorted bar timestamps as naive UTC datetime64[ns]
+        dates: UTC calendar date of each bar (datetime64[D]), for as-of lookups
+        open: Open prices (float64)
+        high: High prices (float64)
+        low: Low prices (float64)
+        close: Close prices (float64)
+        volume: Volumes (float64)
+        truncated: True if older bars of the symbol were not loaded
+
+    """
+
+    symbol: str
+    timestamps: npt.NDArray[np.datetime64]
+    dates: npt.NDArray[np.datetime64]
+    open: npt.NDArray[np.float64]
+    high: npt.NDArray[np.float64]
+    low: npt.NDArray[np.float64]
+    close: npt.NDArray[np.float64]
+    volume: npt.NDArray[np.float64]
+    truncated: bool = False
+
+    @property
+    def row_count(self) -> int:
+        """Number of bars stored."""
+        return len(self.timestamps)
+
+    @classmethod
+    def from_dataframe(
+        cls, symbol: str, df: pd.DataFrame, *, truncated: bool = False
+    ) -> ColumnarBars | None:
+        """Build columns from a MarketDataStore DataFrame.
+
+        Args:
+            symbol: Ticker symbol
+            df: DataFrame with timestamp/open/high/low/close/volume columns
+            truncated: Whether df holds only the symbol's latest bars
+
+        Returns:
+            ColumnarBars sorted by timestamp, or None if df is empty or has
+            no timestamp column
+
+        """
+        if df.empty or "timestamp" not in df.columns:
+            return None
+
+        timestamps = (
+            pd.to_datetime(df["timestamp"], utc=True)
+            .dt.tz_localize(None)
+            .to_numpy(dtype="datetime64[ns]")
+        )
+        order = np.argsort(timestamps, kind="stable")
+        timestamps = timestamps[order]
+
+        def column(name: str) -> npt.NDArray[np.float64]:
+            return _readonly(df[name].to_numpy(dtype=np.float64)[order])
+
+        return cls(
+            symbol=symbol,
+            timestamps=_readonly(timestamps),
+            dates=_readonly(timestamps.astype("datetime64[D]")),
+            open=column("open"),
+            high=column("high"),
+            low=column("low"),
+            close=column("close"),
+            volume=column("volume"),
+            truncated=truncated,
+        )
+
+    def close_array(
+        self,
+        *,
+        as_of: date | None = None,
+        since: datetime | None = None,
+        tail: int | None = None,
+    ) -> CloseArray:
+        """Slice closes to [since, as_of] without copying.
+
+        Args:
+            as_of: Inclusive cutoff on the bar's UTC date (None = no cutoff)
+            since: Inclusive lower bound on the bar timestamp (None = all history)
+            tail: Keep only the last ``tail`` bars of the [since, as_of] range
+
+        Returns:
+            CloseArray view over the selected bars
+
+        """
+        start = 0
+        if since is not None:
+            since_utc = since.astimezone(UTC).replace(tzinfo=None)
+            start = int(
+                np.searchsorted(self.timestamps, np.datetime64(since_utc, "ns"), side="left")
+            )
+        end = self.row_count
+        if as_of is not None:
+            end = int(np.searchsorted(self.dates, np.datetime64(as_of, "D"), side="right"))
+        end = max(start, end)
+        if tail is not None:
+            start = max(start, end - tail)
+        return CloseArray(self.symbol, self.timestamps[start:end], self.close[start:end])
+
+
+class ColumnarBarStore:
+    """Thread-safe, process-wide store of ColumnarBars keyed by symbol.
+
+    Entries survive across warm Lambda invocations. Each entry records the
+    SymbolMetadata version it was built from, and get() only returns bars
+    built from the version the caller currently sees, so a data refresh
+    naturally replaces stale entries. Truncated entries are returned only
+    to callers that bound the rows they need (see get()).
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._entries: dict[str, tuple[SymbolMetadata, ColumnarBars]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, symbol: str, version: SymbolMetadata, *, min_rows: int | None = None
+    ) -> ColumnarBars | None:
+        """Return a symbol's bars if they were built from this version, else None.
+
+        Args:
+            symbol: Ticker symbol
+            version: Metadata version the caller currently sees
+            min_rows: Latest rows the caller needs; None requires full history.
+                Truncated entries are returned only if they hold this many rows.
+
+        Returns:
+            Stored bars, or None if absent, stale, or too short
+
+        """
+        entry = self._entries.get(symbol)
+        if entry is None or entry[0] != version:
+            return None
+        bars = entry[1]
+        if bars.truncated and (min_rows is None or bars.row_count < min_rows):
+            return None
+        return bars
+
+    def put(self, bars: ColumnarBars, version: SymbolMetadata) -> None:
+        """Store (or replace) a symbol's bars built from the given version.
+
+        A truncated entry never replaces full or longer bars of the same version.
+        """
+        with self._lock:
+            current = self._entries.get(bars.symbol)
+            if (
+                bars.truncated
+                and current is not None
+                and current[0] == version
+                and (not current[1].truncated or current[1].row_count >= bars.row_count)
+            ):
+                return
+            self._entries[bars.symbol] = (version, bars)
+        logger.debug(
+            "Stored columnar bars",
+            symbol=bars.symbol,
+            rows=bars.row_count,
+            truncated=bars.truncated,
+            last_bar_date=version.last_bar_date,
+        )
+
+    def invalidate(self, symbol: str) -> None:
+        """Drop a symbol's bars (e.g. after a data refresh)."""
+        with self._lock:
+            self._entries.pop(symbol, None)
+
+    def clear(self) -> None:
+        """Drop all stored bars."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of symbols stored."""
+        return len(self._entries)
+
+
+_PROCESS_BAR_STORE = ColumnarBarStore()
+
+
+def get_process_bar_store() -> ColumnarBarStore:
+    """Return the process-wide columnar bar store."""
+    return _PROCESS_BAR_STORE
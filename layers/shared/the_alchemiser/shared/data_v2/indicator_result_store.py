@@ -0,0 +1,345 @@
+"""Business Unit: data | Status: current.
+
+Shared store for computed indicator results.
+
+Every strategy worker builds its own IndicatorService, so when 15+ strategies
+run on the same day each one recomputes ``rsi SPY 10`` or
+``cumulative-return TQQQ 60`` from scratch. This store lets the first process
+that computes a result publish it, and every later process read it instead
+of redoing the math.
+
+Results are content-addressed: the key is (symbol, indicator type,
+parameters, last bar date, last close, data version). The data version is
+the symbol's (row count, updated_at) from SymbolMetadata, so an entry can
+only be served for exactly the price history it was computed from and the
+store never needs invalidating: a refresh that appends a bar, restates the
+latest one, or rewrites earlier bars (split/dividend adjustment, backfill)
+produces a different key, and old entries simply expire.
+
+Entries are grouped into one partition per (symbol, last bar date). A reader
+loads a symbol's whole partition with a single request the first time it
+needs any indicator for that symbol, then answers the rest from memory.
+
+Backends:
+    - DynamoDBIndicatorResultBackend: production; PK = partition,
+      SK = digest, with a TTL attribute.
+    - LocalFileIndicatorResultBackend: local stand-in; one append-only JSONL
+      file per partition in a directory.
+
+The store is optional and strictly best-effort: backend failures are logged
+and treated as misses, never raised to the caller.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+from the_alchemiser.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import Table
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "DynamoDBIndicatorResultBackend",
+    "IndicatorResultBackend",
+    "IndicatorResultKey",
+    "IndicatorResultStore",
+    "LocalFileIndicatorResultBackend",
+    "get_shared_indicator_result_store",
+]
+
+# Environment variables selecting the backend (table takes precedence)
+INDICATOR_RESULTS_TABLE_ENV = "INDICATOR_RESULTS_TABLE"
+INDICATOR_RESULTS_DIR_ENV = "INDICATOR_RESULTS_DIR"
+
+# Entries are only useful for the trading day they were computed on
+DEFAULT_RESULT_TTL_DAYS = 7
+
+# Max partitions (symbol, last bar date) held in memory per process
+DEFAULT_PARTITION_CACHE_SIZE = 1024
+
+# DynamoDB exception types for error handling
+DynamoDBException = (ClientError, BotoCoreError)
+
+type ResultPayload = dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class IndicatorResultKey:
+    """Content address of one computed indicator.
+
+    Attributes:
+        symbol: Ticker symbol
+        indicator_type: Indicator name as used by IndicatorService
+        parameters: Normalized (name, value) pairs, sorted by name
+        last_bar_date: Date of the last bar the value was computed from (YYYY-MM-DD)
+        last_close: Close of that bar
+        data_version: "<row_count>:<updated_at>" of the symbol's data file,
+            changed by every rewrite including restated earlier bars
+
+    """
+
+    symbol: str
+    indicator_type: str
+    parameters: tuple[tuple[str, str], ...]
+    last_bar_date: str
+    last_close: float
+    data_version: str
+
+    @property
+    def partition(self) -> str:
+        """Partition holding every indicator for this symbol and bar date."""
+        return f"{self.symbol}#{self.last_bar_date}"
+
+    @property
+    def digest(self) -> str:
+        """Stable hash of the full key, unique within the partition."""
+        canonical = json.dumps(
+            [
+                self.symbol,
+                self.indicator_type,
+                [list(pair) for pair in self.parameters],
+                self.last_bar_date,
+                repr(self.last_close),
+                self.data_version,
+            ],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+class IndicatorResultBackend(Protocol):
+    """Storage for partitions of serialized indicator results."""
+
+    def load_partition(self, partition: str) -> dict[str, ResultPayload]:
+        """Return every entry of a partition keyed by digest (empty if none)."""
+        ...
+
+    def put(self, partition: str, digest: str, payload: ResultPayload) -> None:
+        """Store one entry; writing the same digest twice is harmless."""
+        ...
+
+
+class DynamoDBIndicatorResultBackend:
+    """Indicator results in DynamoDB.
+
+    Table structure:
+    - PK (partition key): "<SYMBOL>#<YYYY-MM-DD>"
+    - SK (sort key): key digest
+    - payload: JSON-encoded result
+    - ttl: epoch seconds after which DynamoDB may delete the item
+    """
+
+    def __init__(self, table_name: str, *, ttl_days: int = DEFAULT_RESULT_TTL_DAYS) -> None:
+        """Initialize backend.
+
+        Args:
+            table_name: DynamoDB table name
+            ttl_days: Days before stored items expire
+
+        """
+        self._table: Table = boto3.resource("dynamodb").Table(table_name)
+        self._ttl_seconds = ttl_days * 86_400
+
+    def load_partition(self, partition: str) -> dict[str, ResultPayload]:
+        """Query all items of a partition, following pagination."""
+        entries: dict[str, ResultPayload] = {}
+        query: dict[str, Any] = {
+            "KeyConditionExpression": "PK = :pk",
+            "ExpressionAttributeValues": {":pk": partition},
+        }
+        while True:
+            response = self._table.query(**query)
+            for item in response.get("Items", []):
+                entries[str(item["SK"])] = json.loads(str(item["payload"]))
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return entries
+            query["ExclusiveStartKey"] = last_key
+
+    def put(self, partition: str, digest: str, payload: ResultPayload) -> None:
+        """Write one item with a TTL."""
+        self._table.put_item(
+            Item={
+                "PK": partition,
+                "SK": digest,
+                "payload": json.dumps(payload, separators=(",", ":")),
+                "ttl": int(time.time()) + self._ttl_seconds,
+            }
+        )
+
+
+class LocalFileIndicatorResultBackend:
+    """Indicator results as append-only JSONL files, one per partition.
+
+    Intended for local runs and tests. Each put appends one line in a single
+    write, so concurrent writers on one machine do not corrupt each other's
+    entries; a later line for the same digest wins.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize backend, creating the directory if needed.
+
+        Args:
+            directory: Directory holding partition files
+
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, partition: str) -> Path:
+        return self._directory / f"{re.sub(r'[^A-Za-z0-9._-]', '_', partition)}.jsonl"
+
+    def load_partition(self, partition: str) -> dict[str, ResultPayload]:
+        """Read a partition file (missing file = empty partition)."""
+        path = self._path(partition)
+        if not path.exists():
+            return {}
+        entries: dict[str, ResultPayload] = {}
+        for line in path.read_text().splitlines():
+            if line:
+                record = json.loads(line)
+                entries[record["digest"]] = record["payload"]
+        return entries
+
+    def put(self, partition: str, digest: str, payload: ResultPayload) -> None:
+        """Append one entry to the partition file."""
+        line = json.dumps({"digest": digest, "payload": payload}, separators=(",", ":"))
+        with self._path(partition).open("a") as handle:
+            handle.write(line + "\n")
+
+
+class IndicatorResultStore:
+    """Read-through view over an IndicatorResultBackend.
+
+    Partitions are loaded lazily, once per process, and kept in a bounded
+    LRU so warm invocations reuse them. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        backend: IndicatorResultBackend,
+        *,
+        max_partitions: int = DEFAULT_PARTITION_CACHE_SIZE,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            backend: Storage backend
+            max_partitions: Partitions kept in memory before evicting the
+                least recently used
+
+        """
+        self.backend = backend
+        self.max_partitions = max_partitions
+        self._partitions: OrderedDict[str, dict[str, ResultPayload]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _partition(self, partition: str) -> dict[str, ResultPayload]:
+        with self._lock:
+            entries = self._partitions.get(partition)
+            if entries is not None:
+                self._partitions.move_to_end(partition)
+                return entries
+        try:
+            loaded = self.backend.load_partition(partition)
+        except (*DynamoDBException, OSError, ValueError, KeyError) as e:
+            logger.warning(
+                "Indicator result partition load failed; treating as empty",
+                partition=partition,
+                error=str(e),
+            )
+            loaded = {}
+        with self._lock:
+            entries = self._partitions.setdefault(partition, loaded)
+            while len(self._partitions) > self.max_partitions:
+                self._partitions.popitem(last=False)
+        return entries
+
+    def get(self, key: IndicatorResultKey) -> ResultPayload | None:
+        """Return the stored payload for key, or None on a miss.
+
+        Args:
+            key: Content address of the indicator
+
+        Returns:
+            Payload previously published for exactly this key, or None
+
+        """
+        payload = self._partition(key.partition).get(key.digest)
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return payload
+
+    def put(self, key: IndicatorResultKey, payload: ResultPayload) -> None:
+        """Publish a computed payload (best effort).
+
+        Args:
+            key: Content address of the indicator
+            payload: JSON-serializable result
+
+        """
+        entries = self._partition(key.partition)
+        with self._lock:
+            if key.digest in entries:
+                return
+            entries[key.digest] = payload
+        try:
+            self.backend.put(key.partition, key.digest, payload)
+        except (*DynamoDBException, OSError, TypeError, ValueError) as e:
+            logger.warning(
+                "Indicator result publish failed",
+                partition=key.partition,
+                indicator_type=key.indicator_type,
+                error=str(e),
+            )
+
+    @classmethod
+    def from_environment(cls) -> IndicatorResultStore | None:
+        """Build a store from INDICATOR_RESULTS_TABLE or INDICATOR_RESULTS_DIR.
+
+        Returns:
+            Configured store, or None when neither variable is set
+
+        """
+        table_name = os.environ.get(INDICATOR_RESULTS_TABLE_ENV, "")
+        if table_name:
+            return cls(DynamoDBIndicatorResultBackend(table_name))
+        directory = os.environ.get(INDICATOR_RESULTS_DIR_ENV, "")
+        if directory:
+            return cls(LocalFileIndicatorResultBackend(directory))
+        return None
+
+
+_SHARED_STORE: IndicatorResultStore | None = None
+_SHARED_STORE_RESOLVED = False
+_SHARED_STORE_LOCK = threading.Lock()
+
+
+def get_shared_indicator_result_store() -> IndicatorResultStore | None:
+    """Return the process-wide store configured from the environment (or None)."""
+    global _SHARED_STORE, _SHARED_STORE_RESOLVED
+    with _SHARED_STORE_LOCK:
+        if not _SHARED_STORE_RESOLVED:
+            _SHARED_STORE = IndicatorResultStore.from_environment()
+            _SHARED_STORE_RESOLVED = True
+        return _SHARED_STORE
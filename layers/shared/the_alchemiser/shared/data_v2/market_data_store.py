@@ -5,22 +5,48 @@ Market data store for S3 Parquet files.
 Handles reading, writing, and incremental updates of historical market data
 stored as Parquet files in S3. Each symbol has its own Parquet file containing
 all available daily bars.
+
+Read path caching:
+    - A consolidated manifest object (``metadata_manifest.json``) holds every
+      symbol's SymbolMetadata. Readers fetch it once per store instance (one
+      S3 GET plus one paginated LIST per invocation) instead of one metadata
+      GET per read. The manifest is only a hint: an entry older than the
+      symbol's metadata file (a manifest write that was lost) is ignored, and
+      such symbols and symbols missing from the manifest fall back to their
+      per-symbol metadata file.
+    - Decoded DataFrames are kept in a process-wide LRU keyed by symbol and
+      metadata version, so warm invocations re-read nothing for symbols whose
+      version is unchanged.
+    - Writers update the manifest with conditional (ETag) writes; bulk
+      refreshes batch their updates into one write via batched_manifest_updates().
+    - Parquet files are written in row groups of PARQUET_ROW_GROUP_ROWS bars,
+      so read_symbol_tail can decode only the trailing row groups of the
+      /tmp copy when a caller needs just the latest bars.
 """
 
 from __future__ import annotations
 
 import json
 import os
+import random
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from itertools import pairwise
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import boto3
 import pandas as pd
 import pyarrow.parquet as pq
+from botocore.exceptions import ClientError
 
 from the_alchemiser.shared.logging import get_logger
 
@@ -32,6 +58,27 @@ logger = get_logger(__name__)
 # Module constant for cache directory
 CACHE_DIR = Path(tempfile.gettempdir()) / "alchemiser_market_data"
 
+# Consolidated metadata manifest (bucket root, so list_symbols never sees it)
+MANIFEST_KEY = "metadata_manifest.json"
+MANIFEST_FORMAT_VERSION = 1
+MANIFEST_MAX_RETRIES = 5
+# S3 error codes returned when a conditional manifest write loses a race
+_MANIFEST_CONFLICT_CODES = frozenset({"PreconditionFailed", "ConditionalRequestConflict"})
+# Per-symbol metadata file name (see _symbol_metadata_key)
+METADATA_FILE_NAME = "metadata.json"
+# Allowed lag between a manifest entry's updated_at and its metadata file's
+# LastModified (updated_at is stamped just before the file is written)
+MANIFEST_ENTRY_TOLERANCE = timedelta(seconds=60)
+
+# Max decoded DataFrames kept in the process-wide frame cache
+DEFAULT_FRAME_CACHE_SIZE = 128
+
+# Concurrent S3 reads in download_to_cache (boto3's default connection pool is 10)
+DEFAULT_DOWNLOAD_WORKERS = 10
+
+# Bars per parquet row group (about one trading year); the unit of tail reads
+PARQUET_ROW_GROUP_ROWS = 252
+
 
 @dataclass(frozen=True)
 class AdjustmentInfo:
@@ -90,6 +137,119 @@ class SymbolMetadata:
         )
 
 
+class FrameCache:
+    """Thread-safe LRU of decoded DataFrames keyed by (bucket, symbol).
+
+    Each entry remembers the SymbolMetadata it was loaded under; a lookup
+    with any other version is a miss, so an updated symbol is re-read while
+    unchanged symbols are served from memory across warm invocations.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_FRAME_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of DataFrames kept before evicting the
+                least recently used
+
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], tuple[SymbolMetadata, pd.DataFrame]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str], version: SymbolMetadata) -> pd.DataFrame | None:
+        """Return the cached DataFrame if it was loaded under this version."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: tuple[str, str], version: SymbolMetadata, frame: pd.DataFrame) -> None:
+        """Cache a DataFrame under a version, evicting the LRU entry if full."""
+        with self._lock:
+            self._entries[key] = (version, frame)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def evict(self, key: tuple[str, str]) -> None:
+        """Drop an entry."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached DataFrames."""
+        return len(self._entries)
+
+
+def _frame_cache_size() -> int:
+    """Get frame cache size from MARKET_DATA_FRAME_CACHE_SIZE env var."""
+    try:
+        return int(os.environ.get("MARKET_DATA_FRAME_CACHE_SIZE", DEFAULT_FRAME_CACHE_SIZE))
+    except (ValueError, TypeError):
+        return DEFAULT_FRAME_CACHE_SIZE
+
+
+_PROCESS_FRAME_CACHE = FrameCache(_frame_cache_size())
+
+
+def _tail_row_groups(metadata: pq.FileMetaData, rows: int) -> list[int] | None:
+    """Return the trailing row groups that hold a file's latest ``rows`` bars.
+
+    Row groups are pruned on their timestamp column statistics, which must
+    show the groups in ascending, non-overlapping timestamp order.
+
+    Args:
+        metadata: Parquet file metadata
+        rows: Latest bars needed
+
+    Returns:
+        Row group indices in file order, or None when the statistics cannot
+        prove the file is sorted (the whole file must then be read)
+
+    """
+    if "timestamp" not in metadata.schema.names:
+        return None
+    column = metadata.schema.names.index("timestamp")
+    bounds = []
+    for index in range(metadata.num_row_groups):
+        statistics = metadata.row_group(index).column(column).statistics
+        if statistics is None or not statistics.has_min_max:
+            return None
+        bounds.append((statistics.min, statistics.max))
+    try:
+        if any(later[0] < earlier[1] for earlier, later in pairwise(bounds)):
+            return None
+    except TypeError:
+        return None
+
+    selected: list[int] = []
+    covered = 0
+    for index in reversed(range(metadata.num_row_groups)):
+        selected.append(index)
+        covered += metadata.row_group(index).num_rows
+        if covered >= rows:
+            break
+    return selected[::-1]
+
+
+def _download_workers() -> int:
+    """Get download concurrency from MARKET_DATA_DOWNLOAD_WORKERS env var."""
+    try:
+        return max(1, int(os.environ.get("MARKET_DATA_DOWNLOAD_WORKERS", DEFAULT_DOWNLOAD_WORKERS)))
+    except (ValueError, TypeError):
+        return DEFAULT_DOWNLOAD_WORKERS
+
+
 class MarketDataStore:
     """S3-backed store for historical market data in Parquet format.
 
@@ -107,6 +267,7 @@ class MarketDataStore:
         bucket_name: str | None = None,
         region: str = "us-east-1",
         s3_client: S3Client | None = None,
+        frame_cache: FrameCache | None = None,
     ) -> None:
         """Initialize market data store.
 
@@ -114,6 +275,7 @@ class MarketDataStore:
             bucket_name: S3 bucket name. If None, reads from MARKET_DATA_BUCKET env var.
             region: AWS region for S3 operations
             s3_client: Optional S3 client for dependency injection (testing)
+            frame_cache: DataFrame cache. If None, uses the process-wide cache.
 
         Raises:
             ValueError: If bucket_name is not provided and env var is not set
@@ -128,6 +290,17 @@ class MarketDataStore:
         self.bucket_name: str = resolved_bucket
         self.region = region
         self._s3_client = s3_client
+        self._frame_cache = frame_cache if frame_cache is not None else _PROCESS_FRAME_CACHE
+
+        # Metadata snapshot for this store instance (one per invocation):
+        # the manifest, loaded on first use, plus per-symbol fallbacks.
+        self._manifest: dict[str, SymbolMetadata] | None = None
+        self._manifest_loaded = False
+        self._metadata_snapshot: dict[str, SymbolMetadata | None] = {}
+        self._snapshot_lock = threading.Lock()
+
+        # Pending manifest entries while inside batched_manifest_updates()
+        self._manifest_batch: dict[str, SymbolMetadata] | None = None
 
         # Ensure cache directory exists
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -168,14 +341,16 @@ class MarketDataStore:
     def _symbol_metadata_key(self, symbol: str) -> str:
         """Get S3 key for symbol's metadata file."""
         sanitized = self._sanitize_symbol_for_path(symbol)
-        return f"{sanitized}/metadata.json"
+        return f"{sanitized}/{METADATA_FILE_NAME}"
 
     def _local_cache_path(self, symbol: str) -> Path:
         """Get local cache path for symbol's data."""
         sanitized = self._sanitize_symbol_for_path(symbol)
         return CACHE_DIR / f"{sanitized}_daily.parquet"
 
-    def _is_cache_valid(self, symbol: str, cache_path: Path) -> bool:
+    def _is_cache_valid(
+        self, symbol: str, cache_path: Path, s3_metadata: SymbolMetadata | None
+    ) -> bool:
         """Check if local cache is valid against S3 metadata.
 
         Validates cache by comparing row count in cached file against
@@ -185,6 +360,7 @@ class MarketDataStore:
         Args:
             symbol: Ticker symbol
             cache_path: Path to local cached parquet file
+            s3_metadata: Current metadata for the symbol (see get_cached_metadata)
 
         Returns:
             True if cache is valid and can be used, False if stale
@@ -193,17 +369,15 @@ class MarketDataStore:
         if not cache_path.exists():
             return False
 
-        try:
-            # Get S3 metadata for comparison
-            s3_metadata = self.get_metadata(symbol)
-            if s3_metadata is None:
-                # No metadata in S3, cache is potentially stale
-                logger.warning(
-                    "No S3 metadata found, invalidating cache",
-                    symbol=symbol,
-                )
-                return False
+        if s3_metadata is None:
+            # No metadata in S3, cache is potentially stale
+            logger.warning(
+                "No S3 metadata found, invalidating cache",
+                symbol=symbol,
+            )
+            return False
 
+        try:
             # Read cached file row count (metadata only, not full file)
             cached_metadata = pq.read_metadata(cache_path)
             cached_row_count = cached_metadata.num_rows
@@ -250,7 +424,7 @@ class MarketDataStore:
                 Key=self._symbol_metadata_key(symbol),
             )
             data = json.loads(response["Body"].read().decode("utf-8"))
-            return SymbolMetadata.from_dict(data)
+            metadata = SymbolMetadata.from_dict(data)
         except self.s3_client.exceptions.NoSuchKey:
             return None
         except Exception as e:
@@ -261,16 +435,227 @@ class MarketDataStore:
             )
             return None
 
-    def _update_metadata(self, symbol: str, df: pd.DataFrame) -> None:
-        """Update metadata file for symbol after data update.
+        # Inside a batch, republish metadata we read so a full refresh leaves
+        # the manifest complete even for symbols that needed no update.
+        if self._manifest_batch is not None:
+            self._manifest_batch.setdefault(symbol, metadata)
+        return metadata
+
+    def _load_manifest(self) -> dict[str, SymbolMetadata] | None:
+        """Fetch the consolidated manifest, keeping only entries that are current.
+
+        An entry is current when its updated_at is not older than the
+        LastModified of the symbol's metadata file, so a refresh whose
+        manifest write was lost never hides the metadata it wrote.
+
+        Returns:
+            Symbol -> current manifest entry, or None if the manifest or the
+            metadata listing is unavailable
+
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=MANIFEST_KEY)
+            data = json.loads(response["Body"].read().decode("utf-8"))
+            manifest = {
+                symbol: SymbolMetadata.from_dict(entry)
+                for symbol, entry in data.get("symbols", {}).items()
+            }
+            written = self._metadata_modified_times()
+        except self.s3_client.exceptions.NoSuchKey:
+            logger.info("No metadata manifest found, using per-symbol metadata")
+            return None
+        except Exception as e:
+            logger.warning(
+                "Failed to load metadata manifest, using per-symbol metadata",
+                error=str(e),
+            )
+            return None
+
+        current: dict[str, SymbolMetadata] = {}
+        for symbol, entry in manifest.items():
+            modified = written.get(self._sanitize_symbol_for_path(symbol))
+            if modified is None:
+                continue
+            try:
+                updated_at = datetime.fromisoformat(entry.updated_at)
+            except ValueError:
+                continue
+            if updated_at.tzinfo is None:
+                updated_at = updated_at.replace(tzinfo=UTC)
+            if updated_at + MANIFEST_ENTRY_TOLERANCE >= modified:
+                current[symbol] = entry
+
+        if len(current) < len(manifest):
+            logger.info(
+                "Ignoring outdated metadata manifest entries",
+                outdated=len(manifest) - len(current),
+                symbols=len(manifest),
+            )
+        logger.debug("Loaded metadata manifest", symbols=len(current))
+        return current
+
+    def _metadata_modified_times(self) -> dict[str, datetime]:
+        """LastModified of every per-symbol metadata file, keyed by sanitized symbol."""
+        modified: dict[str, datetime] = {}
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name):
+            for obj in page.get("Contents", []):
+                prefix, _, name = obj["Key"].rpartition("/")
+                if name == METADATA_FILE_NAME and prefix:
+                    modified[prefix] = obj["LastModified"]
+        return modified
+
+    def get_cached_metadata(self, symbol: str) -> SymbolMetadata | None:
+        """Get a symbol's metadata from this store's per-invocation snapshot.
+
+        The first call loads the consolidated manifest; symbols it does not
+        cover, or covers with an entry older than their metadata file, are
+        fetched individually once and remembered. Use this for cache
+        validation on the read path; writers deciding what to fetch and
+        freshness checks should use get_metadata for the authoritative
+        per-symbol value.
+
+        Args:
+            symbol: Ticker symbol
+
+        Returns:
+            SymbolMetadata if the symbol has data, None otherwise
+
+        """
+        with self._snapshot_lock:
+            if symbol in self._metadata_snapshot:
+                return self._metadata_snapshot[symbol]
+            if not self._manifest_loaded:
+                self._manifest = self._load_manifest()
+                self._manifest_loaded = True
+            if self._manifest is not None and symbol in self._manifest:
+                metadata: SymbolMetadata | None = self._manifest[symbol]
+                self._metadata_snapshot[symbol] = metadata
+                return metadata
+
+        metadata = self.get_metadata(symbol)
+        with self._snapshot_lock:
+            self._metadata_snapshot[symbol] = metadata
+        return metadata
+
+    def invalidate_metadata(self, symbol: str) -> None:
+        """Forget a symbol's snapshot metadata so the next lookup refetches it.
+
+        Args:
+            symbol: Ticker symbol whose data was changed outside this store
+
+        """
+        with self._snapshot_lock:
+            self._metadata_snapshot.pop(symbol, None)
+            if self._manifest is not None:
+                self._manifest.pop(symbol, None)
+
+    def _fetch_manifest_for_update(self) -> tuple[dict[str, Any], str | None]:
+        """Fetch raw manifest entries and ETag for a conditional update."""
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=MANIFEST_KEY)
+        except self.s3_client.exceptions.NoSuchKey:
+            return {}, None
+        data = json.loads(response["Body"].read().decode("utf-8"))
+        return dict(data.get("symbols", {})), response["ETag"]
+
+    def update_manifest(self, entries: list[SymbolMetadata]) -> bool:
+        """Merge metadata entries into the consolidated manifest.
+
+        Uses optimistic concurrency: the manifest is written with If-Match on
+        the ETag it was read at (If-None-Match when creating it) and the merge
+        is retried if another writer got there first.
+
+        Args:
+            entries: Metadata to publish (replaces existing entries per symbol)
+
+        Returns:
+            True if the manifest was written, False otherwise
+
+        """
+        if not entries:
+            return True
+
+        for attempt in range(MANIFEST_MAX_RETRIES):
+            try:
+                symbols, etag = self._fetch_manifest_for_update()
+                symbols.update({entry.symbol: entry.to_dict() for entry in entries})
+                body = json.dumps(
+                    {
+                        "format_version": MANIFEST_FORMAT_VERSION,
+                        "updated_at": datetime.now(UTC).isoformat(),
+                        "symbols": symbols,
+                    }
+                ).encode("utf-8")
+
+                if etag is None:
+                    self.s3_client.put_object(
+                        Bucket=self.bucket_name,
+                        Key=MANIFEST_KEY,
+                        Body=body,
+                        ContentType="application/json",
+                        IfNoneMatch="*",
+                    )
+                else:
+                    self.s3_client.put_object(
+                        Bucket=self.bucket_name,
+                        Key=MANIFEST_KEY,
+                        Body=body,
+                        ContentType="application/json",
+                        IfMatch=etag,
+                    )
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in _MANIFEST_CONFLICT_CODES:
+                    logger.debug("Manifest write conflict, retrying", attempt=attempt + 1)
+                    time.sleep(random.uniform(0.05, 0.2) * (attempt + 1))  # noqa: S311  # nosec B311
+                    continue
+                logger.warning("Failed to update metadata manifest", error=str(e))
+                return False
+            except Exception as e:
+                logger.warning("Failed to update metadata manifest", error=str(e))
+                return False
+
+            logger.debug("Updated metadata manifest", entries=len(entries))
+            return True
+
+        logger.error(
+            "Gave up updating metadata manifest after conflicts",
+            entries=len(entries),
+            attempts=MANIFEST_MAX_RETRIES,
+        )
+        return False
+
+    @contextmanager
+    def batched_manifest_updates(self) -> Iterator[None]:
+        """Collect manifest updates and publish them in one write on exit.
+
+        Wrap bulk refreshes in this so N symbol writes cost one manifest
+        write instead of N. Nested use joins the outer batch.
+        """
+        if self._manifest_batch is not None:
+            yield
+            return
+
+        self._manifest_batch = {}
+        try:
+            yield
+        finally:
+            pending, self._manifest_batch = self._manifest_batch, None
+            self.update_manifest(list(pending.values()))
+
+    def _update_metadata(self, symbol: str, df: pd.DataFrame) -> SymbolMetadata | None:
+        """Update metadata file (and manifest entry) for symbol after data update.
 
         Args:
             symbol: Ticker symbol
             df: DataFrame with the symbol's data
 
+        Returns:
+            The written metadata, or None if df is empty
+
         """
         if df.empty:
-            return
+            return None
 
         # Get the last bar date from the DataFrame (normalize to UTC for consistency)
         if "timestamp" in df.columns:
@@ -293,28 +678,55 @@ class MarketDataStore:
             ContentType="application/json",
         )
 
+        if self._manifest_batch is not None:
+            self._manifest_batch[symbol] = metadata
+        else:
+            self.update_manifest([metadata])
+
         logger.debug(
             "Updated metadata",
             symbol=symbol,
             last_bar_date=metadata.last_bar_date,
             row_count=metadata.row_count,
         )
+        return metadata
 
     def read_symbol_data(self, symbol: str, *, use_cache: bool = True) -> pd.DataFrame | None:
         """Read historical data for a symbol.
 
+        Lookup order with use_cache: process-wide frame cache (same metadata
+        version), then the /tmp parquet cache, then S3. Returned DataFrames
+        are shallow copies, so callers may assign columns freely.
+
         Args:
             symbol: Ticker symbol
-            use_cache: If True, use local cache when available (validates against S3 metadata)
+            use_cache: If True, use in-memory and local caches when valid
+                (validated against the per-invocation metadata snapshot)
 
         Returns:
             DataFrame with OHLCV data, or None if not found
 
         """
+        frame_key = (self.bucket_name, symbol)
+        version: SymbolMetadata | None = None
+        if use_cache:
+            # Resolve the version before reading data so a frame is never
+            # cached under a version newer than its contents.
+            version = self.get_cached_metadata(symbol)
+        else:
+            # Caller expects S3 to have moved on; re-resolve on the next read
+            self.invalidate_metadata(symbol)
+
+        if use_cache and version is not None:
+            cached = self._frame_cache.get(frame_key, version)
+            if cached is not None:
+                logger.debug("Read from frame cache", symbol=symbol, rows=len(cached))
+                return cached.copy(deep=False)
+
         cache_path = self._local_cache_path(symbol)
 
         # Check local cache first (with validation against S3 metadata)
-        if use_cache and self._is_cache_valid(symbol, cache_path):
+        if use_cache and self._is_cache_valid(symbol, cache_path, version):
             try:
                 df = pd.read_parquet(cache_path, engine="pyarrow")
                 logger.debug(
@@ -322,7 +734,9 @@ class MarketDataStore:
                     symbol=symbol,
                     rows=len(df),
                 )
-                return df
+                if version is not None:
+                    self._frame_cache.put(frame_key, version, df)
+                return df.copy(deep=False)
             except Exception as e:
                 logger.warning(
                     "Cache read failed, fetching from S3",
@@ -347,14 +761,22 @@ class MarketDataStore:
 
             # Update local cache
             if use_cache:
-                df.to_parquet(cache_path, index=False, engine="pyarrow")
+                df.to_parquet(
+                    cache_path,
+                    index=False,
+                    engine="pyarrow",
+                    row_group_size=PARQUET_ROW_GROUP_ROWS,
+                )
+
+            if version is not None:
+                self._frame_cache.put(frame_key, version, df)
 
             logger.info(
                 "Read from S3",
                 symbol=symbol,
                 rows=len(df),
             )
-            return df
+            return df.copy(deep=False)
 
         except self.s3_client.exceptions.NoSuchKey:
             logger.debug("No data found for symbol", symbol=symbol)
@@ -367,6 +789,104 @@ class MarketDataStore:
             )
             return None
 
+    def fetch_to_local_cache(self, symbol: str) -> bool:
+        """Ensure the /tmp parquet copy of a symbol is current, without decoding it.
+
+        A copy validated against the metadata snapshot is kept; otherwise
+        the S3 object is written to the cache as-is.
+
+        Args:
+            symbol: Ticker symbol
+
+        Returns:
+            True if a current local copy exists, False if the symbol has no
+            data or the download failed
+
+        """
+        cache_path = self._local_cache_path(symbol)
+        if self._is_cache_valid(symbol, cache_path, self.get_cached_metadata(symbol)):
+            return True
+
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=self._symbol_data_key(symbol),
+            )
+            # Written under a temporary name so concurrent readers never see
+            # a partial file
+            with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix=".parquet", delete=False) as tmp:
+                tmp.write(response["Body"].read())
+            Path(tmp.name).replace(cache_path)
+        except self.s3_client.exceptions.NoSuchKey:
+            logger.debug("No data found for symbol", symbol=symbol)
+            return False
+        except Exception as e:
+            logger.error(
+                "Failed to fetch symbol data",
+                symbol=symbol,
+                error=str(e),
+            )
+            return False
+
+        logger.debug("Fetched symbol data to local cache", symbol=symbol)
+        return True
+
+    def read_symbol_tail(self, symbol: str, rows: int) -> pd.DataFrame | None:
+        """Read a symbol's latest bars, decoding as little of the file as possible.
+
+        A full frame already in the frame cache is returned as-is. Otherwise
+        only the trailing row groups of the local parquet copy are decoded
+        (see _tail_row_groups); files whose row groups cannot be pruned are
+        decoded in full.
+
+        Args:
+            symbol: Ticker symbol
+            rows: Latest bars needed
+
+        Returns:
+            DataFrame holding at least the latest ``rows`` bars (or every bar
+            when the symbol has fewer), or None if not found
+
+        """
+        version = self.get_cached_metadata(symbol)
+        if version is not None:
+            cached = self._frame_cache.get((self.bucket_name, symbol), version)
+            if cached is not None:
+                return cached.copy(deep=False)
+
+        if not self.fetch_to_local_cache(symbol):
+            return None
+
+        cache_path = self._local_cache_path(symbol)
+        try:
+            parquet_file = pq.ParquetFile(cache_path)
+            row_groups = _tail_row_groups(parquet_file.metadata, rows)
+            table = (
+                parquet_file.read()
+                if row_groups is None
+                else parquet_file.read_row_groups(row_groups)
+            )
+            df = table.to_pandas()
+        except Exception as e:
+            logger.warning(
+                "Tail read failed, reading full history",
+                symbol=symbol,
+                error=str(e),
+            )
+            return self.read_symbol_data(symbol)
+
+        logger.debug(
+            "Read symbol tail from local cache",
+            symbol=symbol,
+            rows=len(df),
+            requested_rows=rows,
+            row_groups_read=(
+                parquet_file.metadata.num_row_groups if row_groups is None else len(row_groups)
+            ),
+            row_groups_total=parquet_file.metadata.num_row_groups,
+        )
+        return df
+
     def write_symbol_data(self, symbol: str, df: pd.DataFrame) -> bool:
         """Write historical data for a symbol.
 
@@ -385,7 +905,13 @@ class MarketDataStore:
         try:
             # Write to temp file first
             with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-                df.to_parquet(tmp.name, index=False, compression="snappy", engine="pyarrow")
+                df.to_parquet(
+                    tmp.name,
+                    index=False,
+                    compression="snappy",
+                    engine="pyarrow",
+                    row_group_size=PARQUET_ROW_GROUP_ROWS,
+                )
                 tmp_path = Path(tmp.name)
 
             # Upload to S3
@@ -400,11 +926,19 @@ class MarketDataStore:
             tmp_path.unlink()  # Clean up temp file
 
             # Update metadata
-            self._update_metadata(symbol, df)
+            metadata = self._update_metadata(symbol, df)
 
             # Update local cache
             cache_path = self._local_cache_path(symbol)
-            df.to_parquet(cache_path, index=False, engine="pyarrow")
+            df.to_parquet(
+                cache_path, index=False, engine="pyarrow", row_group_size=PARQUET_ROW_GROUP_ROWS
+            )
+
+            # Later reads through this store see the new version immediately
+            if metadata is not None:
+                with self._snapshot_lock:
+                    self._metadata_snapshot[symbol] = metadata
+                self._frame_cache.put((self.bucket_name, symbol), metadata, df.copy(deep=False))
 
             logger.info(
                 "Wrote symbol data to S3",
@@ -545,27 +1079,63 @@ class MarketDataStore:
         success = self.write_symbol_data(symbol, combined_df)
         return success, adjustment_info
 
-    def download_to_cache(self, symbols: list[str]) -> dict[str, bool]:
-        """Download multiple symbols to local cache.
+    def download_to_cache(
+        self,
+        symbols: list[str],
+        *,
+        max_workers: int | None = None,
+        tail_rows: Mapping[str, int] | None = None,
+    ) -> dict[str, bool]:
+        """Download multiple symbols to local cache concurrently.
+
+        Each symbol is read through the normal cached read path, so valid
+        local/frame cache entries are reused and everything fetched from S3
+        lands in both the /tmp parquet cache and the process-wide frame
+        cache. S3 GETs run on a bounded thread pool (boto3 clients are
+        thread-safe), so warming N symbols costs roughly N / max_workers
+        round-trips instead of N.
+
+        Symbols listed in ``tail_rows`` are only fetched to the /tmp cache,
+        not decoded: their readers use read_symbol_tail.
 
         Args:
             symbols: List of ticker symbols to download
+            max_workers: Concurrent reads. If None, reads
+                MARKET_DATA_DOWNLOAD_WORKERS (default 10).
+            tail_rows: Symbols whose readers need only their latest bars
 
         Returns:
             Dict mapping symbol to success status
 
         """
-        results: dict[str, bool] = {}
+        unique = list(dict.fromkeys(symbols))
+        if not unique:
+            return {}
+
+        workers = min(max_workers or _download_workers(), len(unique))
+        # Create the lazy client (and load the manifest) before fanning out
+        _ = self.s3_client
+        self.get_cached_metadata(unique[0])
+
+        tail_symbols = tail_rows or {}
+
+        def _download(symbol: str) -> bool:
+            if symbol in tail_symbols:
+                return self.fetch_to_local_cache(symbol)
+            return self.read_symbol_data(symbol) is not None
 
-        for symbol in symbols:
-            df = self.read_symbol_data(symbol, use_cache=False)
-            results[symbol] = df is not None
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="md-download") as pool:
+            results = dict(zip(unique, pool.map(_download, unique), strict=True))
 
+        succeeded = sum(results.values())
         logger.info(
             "Downloaded symbols to cache",
-            total=len(symbols),
-            success=sum(results.values()),
-            failed=len(symbols) - sum(results.values()),
+            total=len(unique),
+            success=succeeded,
+            failed=len(unique) - succeeded,
+            workers=workers,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
         )
 
         return results
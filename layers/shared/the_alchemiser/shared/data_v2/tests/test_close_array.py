@@ -0,0 +1,79 @@
+"""Business Unit: shared | Status: current.
+
+Unit tests for CachedMarketDataAdapter.get_close_array.
+
+Tests:
+- A tail with a historical as_of ends at the cutoff, not at the latest bar
+- A tail without as_of still allows a tail-only read
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from the_alchemiser.shared.data_v2.cached_market_data_adapter import CachedMarketDataAdapter
+from the_alchemiser.shared.data_v2.columnar_bar_store import ColumnarBarStore
+from the_alchemiser.shared.data_v2.market_data_store import SymbolMetadata
+from the_alchemiser.shared.value_objects.symbol import Symbol
+
+DAYS = 300
+
+
+class FakeStore:
+    """MarketDataStore stand-in serving one symbol's daily bars."""
+
+    def __init__(self) -> None:
+        end = datetime.now(UTC).replace(hour=20, minute=0, second=0, microsecond=0)
+        timestamps = pd.date_range(end=end, periods=DAYS, freq="D")
+        closes = np.arange(1.0, DAYS + 1.0)
+        self.df = pd.DataFrame(
+            {
+                "timestamp": timestamps,
+                "open": closes,
+                "high": closes,
+                "low": closes,
+                "close": closes,
+                "volume": np.full(DAYS, 1000.0),
+            }
+        )
+        self.tail_reads: list[int] = []
+
+    def get_cached_metadata(self, symbol: str) -> SymbolMetadata:
+        return SymbolMetadata(symbol, str(self.df["timestamp"].iloc[-1].date()), DAYS, "now")
+
+    def read_symbol_data(self, symbol: str) -> pd.DataFrame:
+        return self.df
+
+    def read_symbol_tail(self, symbol: str, rows: int) -> pd.DataFrame:
+        self.tail_reads.append(rows)
+        return self.df.tail(rows)
+
+
+def _adapter(store: FakeStore) -> CachedMarketDataAdapter:
+    return CachedMarketDataAdapter(store, bar_store=ColumnarBarStore())  # type: ignore[arg-type]
+
+
+def test_tail_ends_at_historical_as_of() -> None:
+    store = FakeStore()
+    as_of = date.today() - timedelta(days=100)
+
+    closes = _adapter(store).get_close_array(Symbol("SPY"), as_of=as_of, tail_rows=20)
+
+    assert closes is not None
+    assert len(closes) == 20
+    assert closes.timestamps[-1].astype("datetime64[D]") == np.datetime64(as_of, "D")
+    assert closes.closes[-1] == DAYS - 100
+    assert store.tail_reads == []
+
+
+def test_tail_without_as_of_reads_tail_only() -> None:
+    store = FakeStore()
+
+    closes = _adapter(store).get_close_array(Symbol("SPY"), tail_rows=20)
+
+    assert closes is not None
+    assert list(closes.closes) == [float(v) for v in range(DAYS - 19, DAYS + 1)]
+    assert store.tail_reads == [20]
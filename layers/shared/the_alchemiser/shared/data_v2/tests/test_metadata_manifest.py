@@ -0,0 +1,104 @@
+"""Business Unit: data | Status: current.
+
+Unit tests for the consolidated metadata manifest.
+
+Tests:
+- A manifest entry older than the symbol's metadata file (a refresh whose
+  manifest write was lost) is ignored in favour of the per-symbol file
+- Current entries are served from the manifest without a per-symbol GET
+- Without a manifest every symbol is read from its metadata file
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from the_alchemiser.shared.data_v2 import market_data_store
+from the_alchemiser.shared.data_v2.market_data_store import (
+    MANIFEST_KEY,
+    FrameCache,
+    MarketDataStore,
+    SymbolMetadata,
+)
+
+REFRESHED = datetime(2026, 3, 10, 21, 0, tzinfo=UTC)
+
+
+class NoSuchKeyError(Exception):
+    pass
+
+
+class FakeS3:
+    """S3 client over an in-memory bucket of JSON objects with LastModified times."""
+
+    class exceptions:  # noqa: N801
+        NoSuchKey = NoSuchKeyError
+
+    def __init__(self) -> None:
+        self.objects: dict[str, tuple[dict[str, Any], datetime]] = {}
+        self.gets: list[str] = []
+
+    def put(self, key: str, body: dict[str, Any], modified: datetime) -> None:
+        self.objects[key] = (body, modified)
+
+    def get_object(self, Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        self.gets.append(Key)
+        if Key not in self.objects:
+            raise NoSuchKeyError(Key)
+        body = json.dumps(self.objects[Key][0]).encode("utf-8")
+        return {"Body": io.BytesIO(body), "ETag": '"etag"'}
+
+    def get_paginator(self, operation: str) -> FakeS3:
+        assert operation == "list_objects_v2"
+        return self
+
+    def paginate(self, Bucket: str) -> list[dict[str, Any]]:  # noqa: N803
+        contents = [{"Key": k, "LastModified": m} for k, (_, m) in sorted(self.objects.items())]
+        return [{"Contents": contents[:1]}, {"Contents": contents[1:]}]
+
+
+def _metadata(symbol: str, rows: int, updated_at: datetime) -> SymbolMetadata:
+    return SymbolMetadata(symbol, "2026-03-10", rows, updated_at.isoformat())
+
+
+def _write(s3: FakeS3, metadata: SymbolMetadata, *, manifest: bool) -> None:
+    """Write a symbol's metadata file as a refresh does, optionally publishing it."""
+    written_at = datetime.fromisoformat(metadata.updated_at) + timedelta(milliseconds=200)
+    s3.put(f"{metadata.symbol}/metadata.json", metadata.to_dict(), written_at)
+    if manifest:
+        entries = s3.objects.get(MANIFEST_KEY, ({"symbols": {}}, written_at))[0]["symbols"]
+        entries[metadata.symbol] = metadata.to_dict()
+        s3.put(MANIFEST_KEY, {"format_version": 1, "symbols": entries}, written_at)
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> MarketDataStore:
+    monkeypatch.setattr(market_data_store, "CACHE_DIR", tmp_path)
+    return MarketDataStore("bucket", s3_client=FakeS3(), frame_cache=FrameCache())  # type: ignore[arg-type]
+
+
+def test_outdated_manifest_entry_falls_back_to_metadata_file(store: MarketDataStore) -> None:
+    s3: FakeS3 = store.s3_client  # type: ignore[assignment]
+    _write(s3, _metadata("SPY", 100, REFRESHED - timedelta(days=1)), manifest=True)
+    _write(s3, _metadata("QQQ", 100, REFRESHED), manifest=True)
+    # Next refresh rewrites SPY but loses its manifest write
+    refreshed = _metadata("SPY", 101, REFRESHED)
+    _write(s3, refreshed, manifest=False)
+
+    assert store.get_cached_metadata("SPY") == refreshed
+    assert store.get_cached_metadata("QQQ") == _metadata("QQQ", 100, REFRESHED)
+    assert s3.gets == [MANIFEST_KEY, "SPY/metadata.json"]
+
+
+def test_missing_manifest_uses_metadata_files(store: MarketDataStore) -> None:
+    s3: FakeS3 = store.s3_client  # type: ignore[assignment]
+    _write(s3, _metadata("SPY", 100, REFRESHED), manifest=False)
+
+    assert store.get_cached_metadata("SPY") == _metadata("SPY", 100, REFRESHED)
+    assert store.get_cached_metadata("DIA") is None
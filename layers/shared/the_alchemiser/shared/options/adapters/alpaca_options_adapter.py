@@ -37,6 +37,9 @@ class AlpacaOptionsAdapter:
     - Option position management
     """
 
+    # Safety cap on option chain pagination (requests per get_option_chain call)
+    _MAX_CHAIN_PAGES = 50
+
     def __init__(
         self,
         api_key: str,
@@ -91,6 +94,9 @@ class AlpacaOptionsAdapter:
     ) -> list[OptionContract]:
         """Get option chain for an underlying symbol.
 
+        Follows ``next_page_token`` until every matching contract has been
+        fetched (capped at ``_MAX_CHAIN_PAGES`` requests).
+
         Args:
             underlying_symbol: The underlying equity symbol (e.g., "SPY", "QQQ")
             expiration_date_gte: Minimum expiration date (inclusive)
@@ -98,7 +104,7 @@ class AlpacaOptionsAdapter:
             strike_price_gte: Minimum strike price
             strike_price_lte: Maximum strike price
             option_type: Filter by PUT or CALL
-            limit: Maximum number of contracts to return
+            limit: Contracts per page (API maximum is 10000)
 
         Returns:
             List of OptionContract objects matching the criteria
@@ -124,24 +130,41 @@ class AlpacaOptionsAdapter:
             params["type"] = option_type.value
 
         try:
-            response = self._session.get(
-                f"{self._base_url}/v2/options/contracts",
-                params=params,
-                timeout=30,
-            )
-            response.raise_for_status()
-            data = response.json()
-
             contracts = []
-            for contract_data in data.get("option_contracts", []):
-                contract = self._parse_option_contract(contract_data)
-                if contract:
-                    contracts.append(contract)
+            pages = 0
+            while True:
+                response = self._session.get(
+                    f"{self._base_url}/v2/options/contracts",
+                    params=params,
+                    timeout=30,
+                )
+                response.raise_for_status()
+                data = response.json()
+                pages += 1
+
+                for contract_data in data.get("option_contracts") or []:
+                    contract = self._parse_option_contract(contract_data)
+                    if contract:
+                        contracts.append(contract)
+
+                next_page_token = data.get("next_page_token")
+                if not next_page_token:
+                    break
+                if pages >= self._MAX_CHAIN_PAGES:
+                    logger.warning(
+                        "Option chain truncated at page cap",
+                        underlying=underlying_symbol,
+                        pages=pages,
+                        contracts_found=len(contracts),
+                    )
+                    break
+                params["page_token"] = next_page_token
 
             logger.info(
                 "Fetched option chain",
                 underlying=underlying_symbol,
                 contracts_found=len(contracts),
+                pages=pages,
             )
             return contracts
 
@@ -0,0 +1,361 @@
+"""Business Unit: shared | Status: current.
+
+Session-scoped option chain snapshots.
+
+OptionChainSnapshots fetches every page of an option chain once, attaches
+the latest quotes, and answers later requests whose expiry window and
+strike range fall inside an already fetched snapshot from memory. One
+instance lives for a Lambda run (the container singleton, or the hedge
+executor handler), so the IV signal, single-leg and spread selection on
+the same underlying share one chain fetch instead of repeating it.
+
+ChainColumns holds the fields contract selection filters and scores on as
+parallel float columns, built once per chain, so selection walks plain
+floats instead of pydantic properties and Decimal arithmetic per contract.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from ..logging import get_logger
+from .schemas.option_contract import OptionContract, OptionType
+
+if TYPE_CHECKING:
+    from .adapters.alpaca_options_adapter import AlpacaOptionsAdapter
+
+logger = get_logger(__name__)
+
+# Quotes go stale; a snapshot older than this is refetched
+DEFAULT_SNAPSHOT_TTL_SECONDS = 300.0
+
+# Contracts per option chain page request
+DEFAULT_CHAIN_PAGE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class ChainRequest:
+    """Expiry window and strike range of an option chain query.
+
+    None bounds are unbounded.
+    """
+
+    underlying_symbol: str
+    option_type: OptionType | None
+    expiration_date_gte: date | None
+    expiration_date_lte: date | None
+    strike_price_gte: Decimal | None = None
+    strike_price_lte: Decimal | None = None
+
+    def covers(self, other: ChainRequest) -> bool:
+        """Check whether every contract matching ``other`` also matches this request."""
+        return (
+            self.underlying_symbol == other.underlying_symbol
+            and self.option_type == other.option_type
+            and _covers_lower(self.expiration_date_gte, other.expiration_date_gte)
+            and _covers_upper(self.expiration_date_lte, other.expiration_date_lte)
+            and _covers_lower(self.strike_price_gte, other.strike_price_gte)
+            and _covers_upper(self.strike_price_lte, other.strike_price_lte)
+        )
+
+    def matches(self, contract: OptionContract) -> bool:
+        """Check whether a contract falls inside this request's bounds."""
+        expiry = contract.expiration_date
+        strike = contract.strike_price
+        return (
+            (self.expiration_date_gte is None or expiry >= self.expiration_date_gte)
+            and (self.expiration_date_lte is None or expiry <= self.expiration_date_lte)
+            and (self.strike_price_gte is None or strike >= self.strike_price_gte)
+            and (self.strike_price_lte is None or strike <= self.strike_price_lte)
+        )
+
+
+def _covers_lower[T: (date, Decimal)](outer: T | None, inner: T | None) -> bool:
+    return outer is None or (inner is not None and outer <= inner)
+
+
+def _covers_upper[T: (date, Decimal)](outer: T | None, inner: T | None) -> bool:
+    return outer is None or (inner is not None and outer >= inner)
+
+
+@dataclass(frozen=True)
+class OptionChainSnapshot:
+    """Contracts fetched for one chain request.
+
+    Attributes:
+        request: Bounds the contracts were fetched with
+        contracts: Every contract the API returned for the request
+        quoted: Whether latest bid/ask quotes were attached
+        fetched_at: time.monotonic() of the fetch
+
+    """
+
+    request: ChainRequest
+    contracts: tuple[OptionContract, ...]
+    quoted: bool
+    fetched_at: float
+
+    def select(self, request: ChainRequest) -> list[OptionContract]:
+        """Return the contracts matching a request this snapshot covers."""
+        if request == self.request:
+            return list(self.contracts)
+        return [contract for contract in self.contracts if request.matches(contract)]
+
+
+class OptionChainSnapshots:
+    """Per-run cache of paginated, quoted option chains.
+
+    Requests are served from the freshest snapshot that covers them;
+    otherwise the full chain for the request is fetched (all pages) and,
+    if asked for, quoted in rate-limited batches.
+    """
+
+    def __init__(
+        self,
+        options_adapter: AlpacaOptionsAdapter,
+        *,
+        ttl_seconds: float = DEFAULT_SNAPSHOT_TTL_SECONDS,
+        page_size: int = DEFAULT_CHAIN_PAGE_SIZE,
+    ) -> None:
+        """Initialize the snapshot cache.
+
+        Args:
+            options_adapter: Alpaca options API adapter
+            ttl_seconds: Age after which a snapshot is refetched
+            page_size: Contracts per option chain page request
+
+        """
+        self._adapter = options_adapter
+        self._ttl_seconds = ttl_seconds
+        self._page_size = page_size
+        self._snapshots: dict[str, list[OptionChainSnapshot]] = {}
+
+    def get_chain(
+        self,
+        underlying_symbol: str,
+        *,
+        expiration_date_gte: date | None = None,
+        expiration_date_lte: date | None = None,
+        strike_price_gte: Decimal | None = None,
+        strike_price_lte: Decimal | None = None,
+        option_type: OptionType | None = None,
+        with_quotes: bool = True,
+    ) -> list[OptionContract]:
+        """Get the option chain for a request, fetching it only on a cache miss.
+
+        Args:
+            underlying_symbol: The underlying equity symbol (e.g., "SPY", "QQQ")
+            expiration_date_gte: Minimum expiration date (inclusive)
+            expiration_date_lte: Maximum expiration date (inclusive)
+            strike_price_gte: Minimum strike price
+            strike_price_lte: Maximum strike price
+            option_type: Filter by PUT or CALL
+            with_quotes: Attach latest bid/ask quotes (contracts without a
+                quote are returned unchanged)
+
+        Returns:
+            Contracts matching the request
+
+        Raises:
+            TradingClientError: If the option chain request fails
+
+        """
+        request = ChainRequest(
+            underlying_symbol=underlying_symbol.upper(),
+            option_type=option_type,
+            expiration_date_gte=expiration_date_gte,
+            expiration_date_lte=expiration_date_lte,
+            strike_price_gte=strike_price_gte,
+            strike_price_lte=strike_price_lte,
+        )
+
+        snapshot = self._find_snapshot(request, with_quotes=with_quotes)
+        if snapshot is not None:
+            contracts = snapshot.select(request)
+            if with_quotes and not snapshot.quoted:
+                contracts = self._attach_quotes(contracts)
+                self._store(request, contracts, quoted=True)
+            logger.debug(
+                "Option chain served from snapshot",
+                underlying=request.underlying_symbol,
+                contracts=len(contracts),
+            )
+            return contracts
+
+        contracts = self._adapter.get_option_chain(
+            underlying_symbol=request.underlying_symbol,
+            expiration_date_gte=expiration_date_gte,
+            expiration_date_lte=expiration_date_lte,
+            strike_price_gte=strike_price_gte,
+            strike_price_lte=strike_price_lte,
+            option_type=option_type,
+            limit=self._page_size,
+        )
+        if with_quotes:
+            contracts = self._attach_quotes(contracts)
+        self._store(request, contracts, quoted=with_quotes)
+        return contracts
+
+    def invalidate(self, underlying_symbol: str | None = None) -> None:
+        """Drop cached snapshots for one underlying, or all of them."""
+        if underlying_symbol is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(underlying_symbol.upper(), None)
+
+    def _find_snapshot(
+        self, request: ChainRequest, *, with_quotes: bool
+    ) -> OptionChainSnapshot | None:
+        """Return the freshest snapshot covering a request, preferring quoted ones."""
+        now = time.monotonic()
+        snapshots = self._snapshots.get(request.underlying_symbol, [])
+        fresh = [s for s in snapshots if now - s.fetched_at <= self._ttl_seconds]
+        if len(fresh) != len(snapshots):
+            self._snapshots[request.underlying_symbol] = fresh
+
+        covering = [s for s in fresh if s.request.covers(request)]
+        if with_quotes:
+            quoted = [s for s in covering if s.quoted]
+            covering = quoted or covering
+        return max(covering, key=lambda s: s.fetched_at, default=None)
+
+    def _store(
+        self, request: ChainRequest, contracts: list[OptionContract], *, quoted: bool
+    ) -> None:
+        """Cache contracts fetched for a request."""
+        self._snapshots.setdefault(request.underlying_symbol, []).append(
+            OptionChainSnapshot(
+                request=request,
+                contracts=tuple(contracts),
+                quoted=quoted,
+                fetched_at=time.monotonic(),
+            )
+        )
+
+    def _attach_quotes(self, contracts: list[OptionContract]) -> list[OptionContract]:
+        """Attach latest bid/ask quotes (the contracts endpoint returns none)."""
+        if not contracts:
+            return contracts
+
+        quotes = self._adapter.get_option_quotes_batch([c.symbol for c in contracts])
+        enriched = [
+            contract.model_copy(
+                update={"bid_price": quote.get("bid_price"), "ask_price": quote.get("ask_price")}
+            )
+            if (quote := quotes.get(contract.symbol))
+            else contract
+            for contract in contracts
+        ]
+
+        logger.info(
+            "Enriched contracts with quotes",
+            underlying=contracts[0].underlying_symbol,
+            total_contracts=len(contracts),
+            contracts_with_quotes=len(quotes),
+        )
+        return enriched
+
+
+@dataclass(frozen=True)
+class ChainColumns:
+    """Selection fields of a chain as parallel columns.
+
+    Row ``i`` of every column describes ``contracts[i]``. Missing values
+    are NaN, so comparisons against them are False. Quote-derived columns
+    are computed in Decimal and converted once, so threshold comparisons
+    on whole-cent spreads agree with the Decimal values.
+
+    Attributes:
+        contracts: The contracts, in column order
+        abs_delta: |delta|
+        expiry_ordinal: Expiration date as date.toordinal()
+        dte: Calendar days to expiry
+        bid: Bid price
+        ask: Ask price
+        mid: (bid + ask) / 2
+        spread: ask - bid
+        spread_pct: (ask - bid) / mid, NaN unless mid > 0
+        open_interest: Open interest
+        volume: Daily volume
+
+    """
+
+    contracts: tuple[OptionContract, ...]
+    abs_delta: tuple[float, ...]
+    expiry_ordinal: tuple[int, ...]
+    dte: tuple[int, ...]
+    bid: tuple[float, ...]
+    ask: tuple[float, ...]
+    mid: tuple[float, ...]
+    spread: tuple[float, ...]
+    spread_pct: tuple[float, ...]
+    open_interest: tuple[int, ...]
+    volume: tuple[int, ...]
+
+    def __len__(self) -> int:
+        """Return the number of contracts."""
+        return len(self.contracts)
+
+    @classmethod
+    def from_contracts(
+        cls, contracts: list[OptionContract], *, today: date | None = None
+    ) -> ChainColumns:
+        """Build columns from contracts.
+
+        Args:
+            contracts: Option contracts
+            today: Date days-to-expiry is measured from (default: today, UTC)
+
+        Returns:
+            ChainColumns over the contracts
+
+        """
+        today_ordinal = (today or datetime.now(UTC).date()).toordinal()
+        nan = math.nan
+        two = Decimal(2)
+
+        abs_delta: list[float] = []
+        expiry: list[int] = []
+        bid: list[float] = []
+        ask: list[float] = []
+        mid: list[float] = []
+        spread: list[float] = []
+        spread_pct: list[float] = []
+        # One pass; quote math mirrors OptionContract.mid_price/spread/spread_pct
+        for contract in contracts:
+            delta = contract.delta
+            abs_delta.append(abs(float(delta)) if delta is not None else nan)
+            expiry.append(contract.expiration_date.toordinal())
+            bid_price = contract.bid_price
+            ask_price = contract.ask_price
+            bid.append(float(bid_price) if bid_price is not None else nan)
+            ask.append(float(ask_price) if ask_price is not None else nan)
+            if bid_price is None or ask_price is None:
+                mid.append(nan)
+                spread.append(nan)
+                spread_pct.append(nan)
+                continue
+            mid_price = (bid_price + ask_price) / two
+            width = ask_price - bid_price
+            mid.append(float(mid_price))
+            spread.append(float(width))
+            spread_pct.append(float(width / mid_price) if mid_price > 0 else nan)
+
+        return cls(
+            contracts=tuple(contracts),
+            abs_delta=tuple(abs_delta),
+            expiry_ordinal=tuple(expiry),
+            dte=tuple(e - today_ordinal for e in expiry),
+            bid=tuple(bid),
+            ask=tuple(ask),
+            mid=tuple(mid),
+            spread=tuple(spread),
+            spread_pct=tuple(spread_pct),
+            open_interest=tuple(c.open_interest for c in contracts),
+            volume=tuple(c.volume for c in contracts),
+        )
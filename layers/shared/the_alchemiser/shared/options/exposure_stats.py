@@ -0,0 +1,142 @@
+"""Business Unit: shared | Status: current.
+
+Vectorized rolling beta / correlation engine for hedge exposure.
+
+Works on a date-aligned matrix of closing prices (benchmarks first, then
+held symbols). The portfolio return series is one matrix-vector product of
+the symbol returns and the exposure weights, and beta and correlation
+against every benchmark come from one set of column moments. Cost is
+therefore O(days x symbols) NumPy work with no per-element Python, and
+values become Decimal only at the output boundary.
+
+Kept apart from ``options.utils`` (pure-Decimal reference versions of the
+same statistics) because NumPy is not available on every Lambda layer that
+imports ``options.utils``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+import numpy as np
+import numpy.typing as npt
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+# Fallbacks matching options.utils for degenerate (zero-variance) windows
+DEFAULT_BETA = Decimal("1.0")
+DEFAULT_CORRELATION = Decimal("0.0")
+
+
+@dataclass(frozen=True)
+class BenchmarkStats:
+    """Rolling statistics of the portfolio against one benchmark.
+
+    Attributes:
+        benchmark: Benchmark symbol
+        beta: Population beta over the beta window
+        correlation: Pearson correlation over the correlation window
+
+    """
+
+    benchmark: str
+    beta: Decimal
+    correlation: Decimal
+
+
+def _to_decimal(value: float) -> Decimal:
+    """Convert a float statistic to Decimal at the output boundary."""
+    return Decimal(str(round(value, 12)))
+
+
+def close_to_returns(closes: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Compute simple daily returns of each column of a close-price matrix.
+
+    Args:
+        closes: (days, columns) closing prices, oldest first
+
+    Returns:
+        (days - 1, columns) returns; NaN where the previous close is not positive
+
+    """
+    previous = closes[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = closes[1:] / previous - 1.0
+    returns[~(previous > 0)] = np.nan
+    return returns
+
+
+def _window_moments(
+    portfolio: npt.NDArray[np.float64],
+    benchmarks: npt.NDArray[np.float64],
+    window: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], float]:
+    """Return population covariances with, and variances of, each benchmark column."""
+    p = portfolio[-window:]
+    b = benchmarks[-window:]
+    p_dev = p - p.mean()
+    b_dev = b - b.mean(axis=0)
+    covariance = p_dev @ b_dev / window
+    benchmark_variance = np.einsum("ij,ij->j", b_dev, b_dev) / window
+    portfolio_variance = float(p_dev @ p_dev) / window
+    return covariance, benchmark_variance, portfolio_variance
+
+
+def rolling_benchmark_stats(
+    closes: npt.NDArray[np.float64],
+    benchmarks: list[str],
+    weights: npt.NDArray[np.float64],
+    *,
+    beta_window: int = 60,
+    correlation_window: int = 90,
+) -> list[BenchmarkStats] | None:
+    """Compute portfolio beta and correlation to every benchmark in one pass.
+
+    Args:
+        closes: (days, len(benchmarks) + len(weights)) date-aligned closes,
+            oldest first; benchmark columns first, then held symbols
+        benchmarks: Benchmark symbols, in column order
+        weights: Exposure weight of each held-symbol column (value / total)
+        beta_window: Trailing returns used for beta
+        correlation_window: Trailing returns used for correlation
+
+    Returns:
+        One BenchmarkStats per benchmark, or None when there are fewer than
+        max(beta_window, correlation_window) complete return rows
+
+    """
+    k = len(benchmarks)
+    if closes.ndim != 2 or closes.shape[1] != k + len(weights):
+        raise ValueError(f"closes must have {k + len(weights)} columns, got shape {closes.shape}")
+
+    returns = close_to_returns(closes)
+    returns = returns[~np.isnan(returns).any(axis=1)]
+    required = max(beta_window, correlation_window)
+    if len(returns) < required:
+        logger.warning(
+            "Insufficient aligned returns for rolling stats",
+            return_count=len(returns),
+            required=required,
+        )
+        return None
+
+    benchmark_returns = returns[:, :k]
+    portfolio_returns = returns[:, k:] @ weights
+
+    beta_cov, beta_var, _ = _window_moments(portfolio_returns, benchmark_returns, beta_window)
+    corr_cov, corr_var, portfolio_var = _window_moments(
+        portfolio_returns, benchmark_returns, correlation_window
+    )
+
+    stats: list[BenchmarkStats] = []
+    for i, symbol in enumerate(benchmarks):
+        beta = _to_decimal(beta_cov[i] / beta_var[i]) if beta_var[i] > 0 else DEFAULT_BETA
+        denominator = np.sqrt(portfolio_var * corr_var[i])
+        correlation = (
+            _to_decimal(corr_cov[i] / denominator) if denominator > 0 else DEFAULT_CORRELATION
+        )
+        stats.append(BenchmarkStats(benchmark=symbol, beta=beta, correlation=correlation))
+    return stats
@@ -194,8 +194,8 @@ class IVSignalCalculator:
         )
 
         try:
-            # Get options adapter
-            alpaca_options = self._container.infrastructure.alpaca_options_adapter()
+            # Get option chain snapshots (shared with other chain consumers this run)
+            option_chains = self._container.infrastructure.option_chain_snapshots()
 
             # Calculate target expiration date range (60-90 DTE from today)
             today = datetime.now(UTC).date()
@@ -204,12 +204,12 @@ class IVSignalCalculator:
 
             # Fetch option chain for puts in target DTE range
             # We need both ATM and OTM puts for skew calculation
-            option_chain = alpaca_options.get_option_chain(
-                underlying_symbol=underlying_symbol,
+            option_chain = option_chains.get_chain(
+                underlying_symbol,
                 expiration_date_gte=min_expiry,
                 expiration_date_lte=max_expiry,
                 option_type=OptionType.PUT,
-                limit=100,
+                with_quotes=False,
             )
 
             if not option_chain:
@@ -0,0 +1,149 @@
+"""Business Unit: shared | Status: current.
+
+Unit tests for option chain snapshots.
+
+Tests:
+- The adapter follows next_page_token across every chain page
+- Requests inside a cached snapshot are served without refetching
+- Wider or stale requests refetch; quotes are attached once
+- ChainColumns carries NaN for missing quotes and greeks
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from the_alchemiser.shared.options.adapters import AlpacaOptionsAdapter
+from the_alchemiser.shared.options.chain_snapshot import ChainColumns, OptionChainSnapshots
+from the_alchemiser.shared.options.schemas import OptionContract, OptionType
+
+TODAY = date(2026, 3, 2)
+EXPIRY = TODAY + timedelta(days=60)
+
+
+def _contract(strike: int, **fields: Any) -> OptionContract:
+    return OptionContract(
+        symbol=f"SPY{EXPIRY:%y%m%d}P{strike * 1000:08d}",
+        underlying_symbol="SPY",
+        option_type=OptionType.PUT,
+        strike_price=Decimal(strike),
+        expiration_date=EXPIRY,
+        **fields,
+    )
+
+
+class FakeAdapter:
+    """Records chain and quote requests."""
+
+    def __init__(self, contracts: list[OptionContract]) -> None:
+        self.contracts = contracts
+        self.chain_calls: list[dict[str, Any]] = []
+        self.quote_calls: list[list[str]] = []
+
+    def get_option_chain(self, **kwargs: Any) -> list[OptionContract]:
+        self.chain_calls.append(kwargs)
+        low = kwargs["strike_price_gte"] or Decimal(0)
+        return [c for c in self.contracts if c.strike_price >= low]
+
+    def get_option_quotes_batch(self, symbols: list[str]) -> dict[str, dict[str, Decimal | None]]:
+        self.quote_calls.append(symbols)
+        return {
+            symbol: {"bid_price": Decimal("1.00"), "ask_price": Decimal("1.10")}
+            for symbol in symbols
+        }
+
+
+class FakeResponse:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict[str, Any]:
+        return self._payload
+
+
+def test_adapter_follows_page_tokens() -> None:
+    adapter = AlpacaOptionsAdapter("key", "secret")
+    pages = {
+        None: {
+            "option_contracts": [
+                {"symbol": "SPY260501P00400000", "underlying_symbol": "SPY", "strike_price": "400"}
+            ],
+            "next_page_token": "p2",
+        },
+        "p2": {
+            "option_contracts": [
+                {"symbol": "SPY260501P00390000", "underlying_symbol": "SPY", "strike_price": "390"}
+            ],
+            "next_page_token": None,
+        },
+    }
+    tokens: list[str | None] = []
+
+    def get(url: str, *, params: dict[str, Any], timeout: int) -> FakeResponse:
+        tokens.append(params.get("page_token"))
+        return FakeResponse(pages[params.get("page_token")])
+
+    adapter._session.get = get  # type: ignore[method-assign]
+
+    contracts = adapter.get_option_chain("spy", limit=1)
+
+    assert tokens == [None, "p2"]
+    assert [c.strike_price for c in contracts] == [Decimal("400"), Decimal("390")]
+
+
+def test_covered_request_served_from_snapshot() -> None:
+    fake = FakeAdapter([_contract(380), _contract(400), _contract(420)])
+    chains = OptionChainSnapshots(fake)  # type: ignore[arg-type]
+    window = {"expiration_date_gte": TODAY, "expiration_date_lte": EXPIRY + timedelta(days=30)}
+
+    wide = chains.get_chain("SPY", option_type=OptionType.PUT, **window)
+    narrow = chains.get_chain(
+        "spy", option_type=OptionType.PUT, strike_price_gte=Decimal(390), **window
+    )
+
+    assert len(fake.chain_calls) == 1
+    assert len(fake.quote_calls) == 1
+    assert [c.strike_price for c in narrow] == [Decimal(400), Decimal(420)]
+    assert all(c.bid_price == Decimal("1.00") for c in wide)
+
+
+def test_uncovered_or_stale_request_refetches() -> None:
+    fake = FakeAdapter([_contract(400)])
+    chains = OptionChainSnapshots(fake)  # type: ignore[arg-type]
+    chains.get_chain("SPY", expiration_date_gte=TODAY, with_quotes=False)
+    chains.get_chain("SPY", expiration_date_gte=TODAY - timedelta(days=1), with_quotes=False)
+
+    stale_fake = FakeAdapter([_contract(400)])
+    stale = OptionChainSnapshots(stale_fake, ttl_seconds=-1)  # type: ignore[arg-type]
+    stale.get_chain("SPY", expiration_date_gte=TODAY, with_quotes=False)
+    stale.get_chain("SPY", expiration_date_gte=TODAY, with_quotes=False)
+
+    assert len(fake.chain_calls) == 2
+    assert len(stale_fake.chain_calls) == 2
+    assert fake.quote_calls == []
+
+
+def test_chain_columns() -> None:
+    quoted = _contract(
+        400, bid_price=Decimal("2.00"), ask_price=Decimal("2.20"), delta=Decimal("-0.15")
+    )
+    bare = _contract(380, open_interest=7)
+
+    columns = ChainColumns.from_contracts([quoted, bare], today=TODAY)
+
+    assert len(columns) == 2
+    assert columns.dte == (60, 60)
+    assert columns.abs_delta[0] == pytest.approx(0.15)
+    assert columns.mid[0] == pytest.approx(2.10)
+    assert columns.spread_pct[0] == pytest.approx(0.2 / 2.1)
+    assert math.isnan(columns.mid[1])
+    assert math.isnan(columns.abs_delta[1])
+    assert columns.open_interest == (0, 7)
@@ -0,0 +1,69 @@
+"""Business Unit: shared | Status: current.
+
+Unit tests for the vectorized hedge exposure statistics.
+
+Tests:
+- Beta and correlation match the Decimal reference implementations
+- Too few aligned returns yields None
+- Zero-variance benchmarks fall back to the default beta and correlation
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from the_alchemiser.shared.options.exposure_stats import (
+    DEFAULT_BETA,
+    DEFAULT_CORRELATION,
+    close_to_returns,
+    rolling_benchmark_stats,
+)
+from the_alchemiser.shared.options.utils import (
+    calculate_rolling_beta,
+    calculate_rolling_correlation,
+)
+
+
+def _closes(days: int, columns: int, seed: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0005, 0.01, size=(days, columns))
+    return 100.0 * np.cumprod(1.0 + returns, axis=0)
+
+
+def test_matches_decimal_reference() -> None:
+    closes = _closes(91, 5)
+    weights = np.array([0.5, 0.3, 0.2])
+
+    stats = rolling_benchmark_stats(closes, ["SPY", "QQQ"], weights)
+
+    returns = close_to_returns(closes)
+    portfolio = [Decimal(str(r)) for r in returns[:, 2:] @ weights]
+    assert stats is not None
+    for i, stat in enumerate(stats):
+        benchmark = [Decimal(str(r)) for r in returns[:, i]]
+        beta = calculate_rolling_beta(portfolio, benchmark, 60)
+        correlation = calculate_rolling_correlation(portfolio, benchmark, 90)
+        assert float(stat.beta) == pytest.approx(float(beta), abs=1e-9)
+        assert float(stat.correlation) == pytest.approx(float(correlation), abs=1e-9)
+
+
+def test_insufficient_returns() -> None:
+    closes = _closes(60, 3)
+    closes[10, 2] = np.nan
+
+    assert rolling_benchmark_stats(closes, ["SPY"], np.array([0.6, 0.4])) is None
+    with pytest.raises(ValueError, match="columns"):
+        rolling_benchmark_stats(closes, ["SPY"], np.array([1.0]))
+
+
+def test_flat_benchmark_uses_defaults() -> None:
+    closes = _closes(91, 2)
+    closes[:, 0] = 400.0
+
+    stats = rolling_benchmark_stats(closes, ["SPY"], np.array([1.0]))
+
+    assert stats is not None
+    assert (stats[0].beta, stats[0].correlation) == (DEFAULT_BETA, DEFAULT_CORRELATION)
@@ -77,7 +77,7 @@ from .strategy_signal import StrategySignal
 from .technical_indicator import (
     TechnicalIndicator,
 )
-from .trace import Trace, TraceEntry
+from .trace import Trace, TraceBuilder, TraceEntry
 from .trade_ledger import TradeLedger, TradeLedgerEntry
 from .trade_message import TradeMessage
 from .trade_result_factory import create_failure_result, create_success_result
@@ -142,6 +142,7 @@ __all__ = [
     "StrategySignal",
     "TechnicalIndicator",
     "Trace",
+    "TraceBuilder",
     "TraceEntry",
     "TradeEligibilityResult",
     "TradeLedger",
@@ -16,6 +16,8 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from ..constants import CONTRACT_VERSION
 
+_TRUSTED_FIELDS_SET = frozenset({"node_type", "value", "children", "metadata"})
+
 
 class ASTNode(BaseModel):
     """DTO for Abstract Syntax Tree nodes from S-expression parsing.
@@ -87,6 +89,40 @@ class ASTNode(BaseModel):
         """
         return cls(node_type="list", children=children, metadata=metadata)
 
+    @classmethod
+    def trusted(
+        cls,
+        node_type: str,
+        value: str | Decimal | None = None,
+        children: list[ASTNode] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> ASTNode:
+        """Create a node without running pydantic validation.
+
+        Only for producers that already guarantee well-formed nodes (the DSL
+        parser and compiled AST loader), where per-node validation dominates
+        the cost of building large strategy trees. Callers must pass values
+        exactly as validation would leave them (e.g. string values already
+        whitespace-stripped).
+
+        Args:
+            node_type: Node type (symbol, list, atom)
+            value: Node value for symbols and atoms
+            children: Child nodes for lists
+            metadata: Optional metadata
+
+        Returns:
+            ASTNode equal to the validated equivalent
+
+        """
+        return cls.model_construct(
+            _fields_set=set(_TRUSTED_FIELDS_SET),
+            node_type=node_type,
+            value=value,
+            children=[] if children is None else children,
+            metadata=metadata,
+        )
+
     def is_symbol(self) -> bool:
         """Check if node is a symbol."""
         return self.node_type == "symbol"
@@ -4,7 +4,9 @@
 Trace data transfer objects for DSL engine execution tracking.
 
 Provides typed DTOs for tracking strategy evaluation traces with structured
-logging and observability support.
+logging and observability support, plus a mutable TraceBuilder for hot paths
+that record many entries: entries are appended to a buffer in O(1) and frozen
+into an immutable Trace once, instead of copying the entry list per entry.
 """
 
 from __future__ import annotations
@@ -46,6 +48,26 @@ class TraceEntry(BaseModel):
         return ensure_timezone_aware(v)
 
 
+def _new_entry(
+    step_id: str,
+    step_type: str,
+    description: str,
+    inputs: dict[str, Any] | None,
+    outputs: dict[str, Any] | None,
+    metadata: dict[str, Any] | None,
+) -> TraceEntry:
+    """Build a timestamped trace entry."""
+    return TraceEntry(
+        step_id=step_id,
+        step_type=step_type,
+        timestamp=datetime.now(UTC),
+        description=description,
+        inputs=inputs or {},
+        outputs=outputs or {},
+        metadata=metadata or {},
+    )
+
+
 class Trace(BaseModel):
     """DTO for complete strategy evaluation trace.
 
@@ -120,16 +142,7 @@ class Trace(BaseModel):
             New Trace with added entry
 
         """
-        entry = TraceEntry(
-            step_id=step_id,
-            step_type=step_type,
-            timestamp=datetime.now(UTC),
-            description=description,
-            inputs=inputs or {},
-            outputs=outputs or {},
-            metadata=metadata or {},
-        )
-
+        entry = _new_entry(step_id, step_type, description, inputs, outputs, metadata)
         new_entries = [*self.entries, entry]
         return self.model_copy(update={"entries": new_entries})
 
@@ -157,3 +170,82 @@ class Trace(BaseModel):
         if self.completed_at is None:
             return None
         return (self.completed_at - self.started_at).total_seconds()
+
+
+class TraceBuilder:
+    """Append-only trace buffer that is frozen into an immutable Trace.
+
+    ``Trace.add_entry`` copies the full entry list on every call, so adding
+    one entry per evaluated node is quadratic in strategy size. The builder
+    keeps the base trace untouched, appends new entries to a list in O(1),
+    and materializes a single Trace (base entries followed by the buffered
+    entries, in insertion order) when ``build`` is called.
+
+    Not thread-safe; use one builder per evaluation.
+    """
+
+    __slots__ = ("_base", "_entries")
+
+    def __init__(self, base: Trace) -> None:
+        """Initialize builder.
+
+        Args:
+            base: Trace whose identity, timing, and existing entries are kept
+
+        """
+        self._base = base
+        self._entries: list[TraceEntry] = []
+
+    @property
+    def trace_id(self) -> str:
+        """Trace identifier of the trace being built."""
+        return self._base.trace_id
+
+    @property
+    def correlation_id(self) -> str:
+        """Correlation ID of the trace being built."""
+        return self._base.correlation_id
+
+    @property
+    def strategy_id(self) -> str:
+        """Strategy the trace being built belongs to."""
+        return self._base.strategy_id
+
+    def __len__(self) -> int:
+        """Return the total number of entries (base plus buffered)."""
+        return len(self._base.entries) + len(self._entries)
+
+    def add_entry(
+        self,
+        step_id: str,
+        step_type: str,
+        description: str,
+        inputs: dict[str, Any] | None = None,
+        outputs: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Append a trace entry to the buffer.
+
+        Args:
+            step_id: Unique step identifier
+            step_type: Type of evaluation step
+            description: Human-readable description
+            inputs: Step inputs
+            outputs: Step outputs
+            metadata: Additional metadata
+
+        """
+        self._entries.append(_new_entry(step_id, step_type, description, inputs, outputs, metadata))
+
+    def build(self) -> Trace:
+        """Freeze the buffered entries into an immutable Trace.
+
+        The builder stays usable; later entries appear in later builds.
+
+        Returns:
+            Base trace with all buffered entries appended in order
+
+        """
+        if not self._entries:
+            return self._base
+        return self._base.model_copy(update={"entries": [*self._base.entries, *self._entries]})
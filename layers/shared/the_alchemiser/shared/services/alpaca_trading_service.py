@@ -40,6 +40,10 @@ from the_alchemiser.shared.services.circuit_breaker import (
     CircuitBreakerError,
     get_circuit_breaker,
 )
+from the_alchemiser.shared.services.order_update_dispatcher import (
+    OrderUpdate,
+    OrderUpdateDispatcher,
+)
 from the_alchemiser.shared.utils.alpaca_error_handler import AlpacaErrorHandler
 from the_alchemiser.shared.utils.order_tracker import OrderTracker
 
@@ -1010,6 +1014,36 @@ class AlpacaTradingService:
                 metadata={"error": str(e), "correlation_id": correlation_id},
             )
 
+    @property
+    def order_updates(self) -> OrderUpdateDispatcher:
+        """Order-update dispatcher fed by the shared TradingStream (started on first use)."""
+        self._ensure_trading_stream()
+        return self._websocket_manager.order_updates
+
+    def get_order_update(self, order_id: str) -> OrderUpdate | None:
+        """Fetch an order's current state over REST.
+
+        Used by OrderUpdateDispatcher waiters as the stale-stream fallback.
+
+        Args:
+            order_id: Order ID to look up
+
+        Returns:
+            OrderUpdate snapshot, or None on error
+
+        """
+        try:
+            order = self._trading_client.get_order_by_id(order_id)
+        except Exception as e:
+            logger.error(
+                "Failed to poll order state",
+                order_id=order_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return None
+        return OrderUpdate.from_order(order, "poll")
+
     # --- DTO Creation Methods ---
 
     def _create_success_order_result(
@@ -1338,6 +1372,11 @@ class AlpacaTradingService:
 
             if self._order_tracker.is_terminal_status(status):
                 self._order_tracker.signal_completion(order_id)
+
+            # Seed the dispatcher: a market order may be terminal on submission
+            submitted = OrderUpdate.from_order(order, "submit")
+            if submitted is not None:
+                self._websocket_manager.order_updates.publish(submitted)
         except (AttributeError, TypeError, ValueError) as exc:
             logger.debug(
                 "Skipping order tracking for submitted order",
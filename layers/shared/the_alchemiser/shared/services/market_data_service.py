@@ -17,7 +17,11 @@ from secrets import randbelow
 from typing import TYPE_CHECKING, Any, NoReturn
 
 from alpaca.data.enums import Adjustment
-from alpaca.data.requests import StockBarsRequest, StockLatestQuoteRequest
+from alpaca.data.requests import (
+    StockBarsRequest,
+    StockLatestQuoteRequest,
+    StockLatestTradeRequest,
+)
 from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
 
 from the_alchemiser.shared.brokers.alpaca_utils import normalize_symbol_for_alpaca
@@ -29,6 +33,10 @@ from the_alchemiser.shared.errors import (
     ValidationError,
 )
 from the_alchemiser.shared.logging import get_logger
+from the_alchemiser.shared.services.price_snapshot_cache import (
+    PriceSnapshotCache,
+    get_shared_price_snapshot_cache,
+)
 from the_alchemiser.shared.types.market_data import BarModel, QuoteModel
 from the_alchemiser.shared.types.market_data_port import MarketDataPort
 from the_alchemiser.shared.utils.alpaca_error_handler import (
@@ -53,6 +61,8 @@ MIN_DAYS_FOR_DATA_CHECK = 5
 DEFAULT_PERIOD_DAYS = 365
 API_TIMEOUT_SECONDS = 30  # 30 seconds timeout for external API calls
 FLOAT_COMPARISON_TOLERANCE = 1e-9
+# Symbols per multi-symbol latest quote/trade request
+PRICE_SNAPSHOT_CHUNK_SIZE = 100
 
 # Timeframe mapping - single source of truth
 TIMEFRAME_MAP = {
@@ -77,14 +87,22 @@ class MarketDataService(MarketDataPort):
 
     """
 
-    def __init__(self, market_data_repo: AlpacaManager) -> None:
+    def __init__(
+        self,
+        market_data_repo: AlpacaManager,
+        price_cache: PriceSnapshotCache | None = None,
+    ) -> None:
         """Initialize with market data repository.
 
         Args:
             market_data_repo: The underlying market data repository (AlpacaManager)
+            price_cache: Cache for price snapshots (defaults to the process-wide one)
 
         """
         self._repo = market_data_repo
+        self._price_cache = (
+            price_cache if price_cache is not None else get_shared_price_snapshot_cache()
+        )
         self.logger = get_logger(__name__)
         # Use deterministic RNG in test environment
         self._use_deterministic_jitter = os.getenv("ALCHEMISER_TEST_MODE", "").lower() in (
@@ -507,46 +525,189 @@ class MarketDataService(MarketDataPort):
         # No error encountered but no price available (e.g., missing quote data)
         return None
 
-    def get_current_prices(self, symbols: list[str]) -> dict[str, float]:
+    def get_current_prices(
+        self, symbols: list[str], *, run_id: str | None = None
+    ) -> dict[str, float]:
         """Get current prices for multiple symbols.
 
+        Prices come from one batched snapshot (see get_price_snapshot). A
+        symbol that cannot be priced, including one whose request failed
+        after retries, is omitted and logged; the others are still returned.
+
         Args:
             symbols: List of stock symbols
+            run_id: Run correlation ID shared by concurrent workers, so they
+                reuse one snapshot (see PriceSnapshotCache)
 
         Returns:
             Dictionary mapping symbols to their current prices
 
-        Raises:
-            RuntimeError: If batch price fetch fails
+        """
+        prices = self.get_price_snapshot(symbols, run_id=run_id)
+
+        # Log missing symbols once instead of per-symbol
+        missing_symbols = [symbol for symbol in symbols if symbol not in prices]
+        if missing_symbols:
+            self.logger.warning(
+                "Could not get prices for some symbols",
+                missing_count=len(missing_symbols),
+                missing_symbols=missing_symbols,
+            )
+        return prices
+
+    def get_price_snapshot(
+        self, symbols: list[str], *, run_id: str | None = None
+    ) -> dict[str, float]:
+        """Get current prices for many symbols with multi-symbol requests.
+
+        Symbols are priced in chunks of PRICE_SNAPSHOT_CHUNK_SIZE: first the
+        bid/ask midpoint of the latest quote (with the same one-sided fallback
+        as get_latest_quote), then the latest trade price for symbols without
+        a usable quote. A chunk that still fails after retries degrades to
+        no price for its symbols instead of failing the snapshot. Results go
+        through the shared PriceSnapshotCache, so callers within its TTL (in
+        this process, or workers of the same run) reuse one snapshot.
+
+        Args:
+            symbols: Stock symbols
+            run_id: Run correlation ID keying the cross-worker snapshot
+
+        Returns:
+            Dictionary mapping symbols to their current prices; symbols with
+            neither a usable quote nor a trade, or whose requests failed,
+            are omitted
 
         """
-        try:
-            prices = {}
-            missing_symbols = []
+        if not symbols:
+            return {}
+        return self._price_cache.get_prices(symbols, self._fetch_price_snapshot, run_id=run_id)
 
-            for symbol in symbols:
-                price = self.get_current_price(symbol)
-                if price is not None:
-                    prices[symbol] = price
-                else:
-                    missing_symbols.append(symbol)
+    def _fetch_price_snapshot(self, symbols: list[str]) -> dict[str, float | None]:
+        """Fetch current prices for symbols, quote midpoints first, then trades.
 
-            # Log missing symbols once instead of per-symbol
-            if missing_symbols:
-                self.logger.warning(
-                    "Could not get prices for some symbols",
-                    missing_count=len(missing_symbols),
-                    missing_symbols=missing_symbols,
-                )
+        Returns:
+            Symbol -> price, or None when the provider had neither a usable
+            quote nor a trade; symbols whose requests failed are omitted
 
-            return prices
-        except Exception as e:
-            self.logger.error(
-                "Failed to get current prices",
-                symbol_count=len(symbols),
-                error=str(e),
+        """
+        from the_alchemiser.shared.utils.price_discovery_utils import calculate_midpoint_price
+
+        start_time = time.perf_counter()
+        api_symbols = {normalize_symbol_for_alpaca(symbol): symbol for symbol in symbols}
+        prices: dict[str, float] = {}
+
+        quotes, failed = self._fetch_latest_multi(list(api_symbols), "quote")
+        for api_symbol, quote in quotes.items():
+            symbol = api_symbols.get(api_symbol)
+            quote_model = self._build_quote_model(quote, api_symbol) if symbol else None
+            if symbol is None or quote_model is None:
+                continue
+            price = calculate_midpoint_price(
+                float(quote_model.bid_price), float(quote_model.ask_price)
             )
-            raise
+            if price is not None:
+                prices[symbol] = price
+
+        unpriced = [api for api, symbol in api_symbols.items() if symbol not in prices]
+        if unpriced:
+            trades, failed_trades = self._fetch_latest_multi(unpriced, "trade")
+            failed |= failed_trades
+            for api_symbol, trade in trades.items():
+                trade_price = float(getattr(trade, "price", 0) or 0)
+                symbol = api_symbols.get(api_symbol)
+                if symbol is not None and trade_price > 0:
+                    prices[symbol] = trade_price
+
+        self.logger.debug(
+            "Fetched price snapshot",
+            symbol_count=len(symbols),
+            priced_count=len(prices),
+            trade_fallback_count=len(unpriced),
+            failed_count=len(failed),
+            duration_ms=round((time.perf_counter() - start_time) * 1000, 2),
+        )
+        # Unpriced symbols whose requests failed are omitted, not reported as unavailable
+        return {
+            symbol: prices.get(symbol)
+            for api_symbol, symbol in api_symbols.items()
+            if symbol in prices or api_symbol not in failed
+        }
+
+    def _fetch_latest_multi(
+        self, api_symbols: list[str], kind: str
+    ) -> tuple[dict[str, Any], set[str]]:
+        """Fetch latest quotes or trades for symbols in chunks, with retry logic.
+
+        A chunk that fails permanently or exhausts its retries is logged and
+        skipped, so one bad chunk does not cost the other chunks' prices.
+
+        Args:
+            api_symbols: Alpaca-normalized symbols
+            kind: "quote" or "trade"
+
+        Returns:
+            Dict mapping api symbols to raw Alpaca quote/trade objects, and
+            the api symbols of the chunks that failed
+
+        """
+        client = self._repo.get_data_client()
+        results: dict[str, Any] = {}
+        failed: set[str] = set()
+        for offset in range(0, len(api_symbols), PRICE_SNAPSHOT_CHUNK_SIZE):
+            chunk = api_symbols[offset : offset + PRICE_SNAPSHOT_CHUNK_SIZE]
+            label = f"{len(chunk)} symbols ({chunk[0]}..{chunk[-1]})"
+            for attempt in range(1, MAX_RETRIES + 1):
+                try:
+                    if kind == "quote":
+                        response = client.get_stock_latest_quote(
+                            StockLatestQuoteRequest(symbol_or_symbols=chunk)
+                        )
+                    else:
+                        response = client.get_stock_latest_trade(
+                            StockLatestTradeRequest(symbol_or_symbols=chunk)
+                        )
+                    results.update(response)
+                    break
+                except (RetryException, HTTPError, RequestException, Exception) as e:
+                    if not self._should_retry_snapshot_fetch(e, attempt, label, kind):
+                        failed.update(chunk)
+                        break
+                    self._sleep_with_backoff(attempt, label)
+        return results, failed
+
+    def _should_retry_snapshot_fetch(
+        self, error: Exception, attempt: int, label: str, kind: str
+    ) -> bool:
+        """Determine if a snapshot chunk should be retried (rate limits included).
+
+        Args:
+            error: The exception that occurred
+            attempt: Current attempt number
+            label: Chunk description for logging
+            kind: "quote" or "trade"
+
+        Returns:
+            True if should retry; False (after logging) if the error is
+            permanent or retries are exhausted
+
+        """
+        transient, _reason = AlpacaErrorHandler.is_transient_error(error)
+        is_rate_limit = "429" in str(error) or "rate limit" in str(error).lower()
+        if (transient or is_rate_limit) and attempt < MAX_RETRIES:
+            return True
+
+        summary = AlpacaErrorHandler.sanitize_error_message(error)
+        self.logger.error(
+            "Price snapshot fetch failed; symbols in this chunk stay unpriced",
+            symbols=label,
+            kind=kind,
+            error_summary=summary,
+            is_transient=transient,
+            is_rate_limit=is_rate_limit,
+            attempt=attempt,
+            max_retries=MAX_RETRIES,
+        )
+        return False
 
     def get_quote(self, symbol: str) -> dict[str, Any] | None:
         """Get quote information for a symbol.
@@ -727,6 +888,75 @@ class MarketDataService(MarketDataPort):
         # Convert bars to dictionaries and return
         return self._convert_bars_to_dicts_core(bars_obj, symbol)
 
+    def get_historical_bars_multi(
+        self, symbols: list[str], start_date: str, end_date: str, timeframe: str = "1Day"
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get historical bars for several symbols in one request, with retry logic.
+
+        Issues a single multi-symbol StockBarsRequest (the SDK follows
+        pagination). Unlike get_historical_bars, a symbol with no bars in the
+        response is not treated as a transient error: it maps to an empty
+        list so the caller can decide whether to retry it individually.
+
+        Args:
+            symbols: Stock symbols sharing the same date range
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            timeframe: Timeframe (1Min, 5Min, 15Min, 1Hour, 1Day)
+
+        Returns:
+            Dict mapping each requested symbol to its bar dictionaries
+
+        Raises:
+            MarketDataServiceError: If the request fails after retries
+
+        """
+        if not symbols:
+            return {}
+        label = f"{len(symbols)} symbols ({symbols[0]}..{symbols[-1]})"
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                return self._fetch_multi_bars_with_request(symbols, start_date, end_date, timeframe)
+            except (RetryException, HTTPError, RequestException, Exception) as e:
+                if not self._should_retry_bars_fetch(e, attempt, label):
+                    raise
+
+                self._sleep_with_backoff(attempt, label)
+
+        # Defensive fallback for static analysis (should not be reached)
+        return {}
+
+    def _fetch_multi_bars_with_request(
+        self, symbols: list[str], start_date: str, end_date: str, timeframe: str
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch bars for several symbols in a single request attempt.
+
+        Args:
+            symbols: Stock symbols
+            start_date: Start date string
+            end_date: End date string
+            timeframe: Timeframe string
+
+        Returns:
+            Dict mapping each requested symbol to its bar dictionaries
+
+        """
+        api_symbols = {normalize_symbol_for_alpaca(symbol): symbol for symbol in symbols}
+        request = StockBarsRequest(
+            symbol_or_symbols=list(api_symbols),
+            timeframe=self._resolve_timeframe_core(timeframe),
+            start=datetime.fromisoformat(start_date),
+            end=datetime.fromisoformat(end_date),
+            adjustment=Adjustment.ALL,
+        )
+        response = self._repo.get_data_client().get_stock_bars(request)
+
+        result: dict[str, list[dict[str, Any]]] = {}
+        for api_symbol, symbol in api_symbols.items():
+            bars_obj = self._extract_bars_from_response_core(response, api_symbol)
+            result[symbol] = self._convert_bars_to_dicts_core(bars_obj, symbol) if bars_obj else []
+        return result
+
     def _should_retry_bars_fetch(self, error: Exception, attempt: int, symbol: str) -> bool:
         """Determine if bars fetch should be retried.
 
@@ -0,0 +1,289 @@
+"""Business Unit: shared | Status: current.
+
+Order-update multiplexer for the shared TradingStream.
+
+One TradingStream per credential set (see WebSocketConnectionManager)
+delivers every order's trade updates. ``OrderUpdateDispatcher`` keeps the
+latest update per order and routes terminal updates to per-order asyncio
+futures, so any number of coroutines can await fills concurrently and each
+wakes up at push latency.
+
+REST polling is a fallback only: while a waiter is pending and the stream is
+stale (not connected, per the ``is_connected`` hook), the waiter polls its
+order every ``poll_interval_seconds``, plus once more after the stream
+reconnects to catch updates pushed while it was down. Staleness follows the
+connection, not event recency: a live order can go minutes without an
+update, and a connected stream would still push it. A healthy stream
+therefore costs no polling at all.
+
+The stream callback runs on the TradingStream thread's own event loop, so
+futures are always resolved through their loop's ``call_soon_threadsafe``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from the_alchemiser.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Lower-case Alpaca order statuses after which an order never changes again
+TERMINAL_ORDER_STATUSES = frozenset({"filled", "canceled", "cancelled", "rejected", "expired"})
+TERMINAL_ORDER_EVENTS = frozenset({"fill", "canceled", "rejected", "expired"})
+
+# Seconds between REST polls while the stream is not connected
+DEFAULT_FALLBACK_POLL_SECONDS = 1.0
+
+# Orders whose latest update is remembered (oldest evicted first)
+MAX_TRACKED_ORDERS = 10_000
+
+type OrderStatusPoller = Callable[[str], OrderUpdate | None]
+
+
+def _decimal(value: object) -> Decimal | None:
+    """Convert an SDK numeric field to Decimal (None when absent or invalid)."""
+    if value is None or value == "":
+        return None
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _field(obj: object, name: str) -> Any:  # noqa: ANN401
+    """Read a field from an SDK model or a dict payload."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _status_text(value: object) -> str | None:
+    """Normalize an SDK enum or string status to lower case."""
+    if value is None:
+        return None
+    text = str(getattr(value, "value", value)).lower()
+    # str() of a plain Enum member is "OrderStatus.FILLED"
+    return text.rsplit(".", 1)[-1] or None
+
+
+@dataclass(frozen=True, slots=True)
+class OrderUpdate:
+    """Point-in-time state of one order.
+
+    Attributes:
+        order_id: Alpaca order ID
+        event: Stream event ("new", "partial_fill", "fill", ...) or "poll"/"submit"
+        status: Lower-case order status, if known
+        filled_qty: Cumulative filled quantity
+        filled_avg_price: Average fill price, if any fill
+        received_at: Monotonic time the update was observed
+
+    """
+
+    order_id: str
+    event: str
+    status: str | None
+    filled_qty: Decimal
+    filled_avg_price: Decimal | None
+    received_at: float
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the order can no longer change."""
+        return self.event in TERMINAL_ORDER_EVENTS or self.status in TERMINAL_ORDER_STATUSES
+
+    @classmethod
+    def from_order(cls, order: object, event: str) -> OrderUpdate | None:
+        """Build an update from an Alpaca Order (SDK model or dict).
+
+        Args:
+            order: Order object or dict
+            event: Event label to record
+
+        Returns:
+            OrderUpdate, or None when the order has no ID
+
+        """
+        order_id = str(_field(order, "id") or "")
+        if not order_id:
+            return None
+        return cls(
+            order_id=order_id,
+            event=event,
+            status=_status_text(_field(order, "status")),
+            filled_qty=_decimal(_field(order, "filled_qty")) or Decimal("0"),
+            filled_avg_price=_decimal(_field(order, "filled_avg_price")),
+            received_at=time.monotonic(),
+        )
+
+    @classmethod
+    def from_stream(cls, data: object) -> OrderUpdate | None:
+        """Build an update from a TradingStream trade update (SDK model or dict)."""
+        order = _field(data, "order")
+        if order is None:
+            return None
+        event = _status_text(_field(data, "event")) or ""
+        return cls.from_order(order, event)
+
+
+class OrderUpdateDispatcher:
+    """Routes trade updates to per-order waiters, polling only when the stream is stale.
+
+    Thread Safety:
+        ``dispatch`` and ``publish`` may be called from any thread;
+        ``wait_for_terminal`` must be awaited on an asyncio event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        is_connected: Callable[[], bool] | None = None,
+        poll_interval_seconds: float = DEFAULT_FALLBACK_POLL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            is_connected: Reports whether the trade-update stream is connected
+                (None = no stream, always poll)
+            poll_interval_seconds: Seconds between REST polls while stale
+            clock: Monotonic time source
+
+        """
+        self._is_connected = is_connected
+        self.poll_interval_seconds = poll_interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latest: OrderedDict[str, OrderUpdate] = OrderedDict()
+        self._waiters: dict[str, list[asyncio.Future[OrderUpdate]]] = {}
+        self.stream_events = 0
+        self.polls = 0
+
+    def dispatch(self, data: object) -> None:
+        """Handle one raw TradingStream trade update."""
+        try:
+            update = OrderUpdate.from_stream(data)
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.error(
+                "Unreadable trade update",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return
+        with self._lock:
+            self.stream_events += 1
+        if update is not None:
+            self.publish(update)
+
+    def publish(self, update: OrderUpdate) -> None:
+        """Record an order's state and wake its waiters if it is terminal.
+
+        A non-terminal update never replaces a terminal one, so late or
+        out-of-order deliveries (and stale REST snapshots) are harmless.
+        """
+        with self._lock:
+            prior = self._latest.get(update.order_id)
+            if prior is not None and prior.is_terminal and not update.is_terminal:
+                return
+            self._latest[update.order_id] = update
+            self._latest.move_to_end(update.order_id)
+            while len(self._latest) > MAX_TRACKED_ORDERS:
+                self._latest.popitem(last=False)
+            waiters = self._waiters.pop(update.order_id, []) if update.is_terminal else []
+
+        for future in waiters:
+            future.get_loop().call_soon_threadsafe(_resolve, future, update)
+
+    def latest(self, order_id: str) -> OrderUpdate | None:
+        """Return the most recent known state of an order."""
+        with self._lock:
+            return self._latest.get(order_id)
+
+    def is_stale(self) -> bool:
+        """Whether waiters should fall back to REST polling (stream not connected)."""
+        return self._is_connected is None or not self._is_connected()
+
+    async def wait_for_terminal(
+        self,
+        order_id: str,
+        timeout: float,
+        *,
+        poll: OrderStatusPoller | None = None,
+        poll_interval_seconds: float | None = None,
+    ) -> OrderUpdate | None:
+        """Wait until an order reaches a terminal state.
+
+        Args:
+            order_id: Order to wait for
+            timeout: Maximum seconds to wait
+            poll: Blocking REST lookup used while the stream is stale, and
+                once after it reconnects (run in a worker thread)
+            poll_interval_seconds: Per-call override of the dispatcher's poll
+                interval
+
+        Returns:
+            The terminal update, or on timeout the latest known update
+            (None if nothing is known about the order)
+
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[OrderUpdate] = loop.create_future()
+        with self._lock:
+            known = self._latest.get(order_id)
+            if known is not None and known.is_terminal:
+                return known
+            self._waiters.setdefault(order_id, []).append(future)
+
+        deadline = self._clock() + timeout
+        # Wake up periodically to check whether the stream went stale
+        interval = poll_interval_seconds or self.poll_interval_seconds
+        was_stale = False
+        try:
+            while (remaining := deadline - self._clock()) > 0:
+                done, _ = await asyncio.wait({future}, timeout=min(remaining, interval))
+                if done:
+                    return future.result()
+                stale = self.is_stale()
+                # One more poll after a reconnect covers updates pushed while down
+                catch_up, was_stale = was_stale and not stale, stale
+                if poll is None or not (stale or catch_up):
+                    continue
+                self.polls += 1
+                try:
+                    polled = await asyncio.to_thread(poll, order_id)
+                except Exception as e:
+                    logger.warning(
+                        "Order status poll failed",
+                        order_id=order_id,
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+                    continue
+                if polled is not None:
+                    self.publish(polled)
+                    if polled.is_terminal:
+                        return self.latest(order_id) or polled
+        finally:
+            with self._lock:
+                pending = self._waiters.get(order_id)
+                if pending is not None and future in pending:
+                    pending.remove(future)
+                    if not pending:
+                        del self._waiters[order_id]
+            if not future.done():
+                future.cancel()
+        return self.latest(order_id)
+
+
+def _resolve(future: asyncio.Future[OrderUpdate], update: OrderUpdate) -> None:
+    """Complete a waiter's future unless it was already settled or cancelled."""
+    if not future.done():
+        future.set_result(update)
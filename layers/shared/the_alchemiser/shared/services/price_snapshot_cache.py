@@ -0,0 +1,349 @@
+"""Business Unit: shared | Status: current.
+
+Short-lived shared cache of current-price snapshots.
+
+Every strategy worker prices its target symbols right before rebalancing,
+and the workers of one run ask for largely the same symbols within
+seconds of each other. ``PriceSnapshotCache`` keeps each fetched price
+(and each symbol the provider had no price for) for a few seconds so that
+those callers reuse one snapshot instead of re-querying the provider.
+
+Two layers:
+    - In process: concurrent callers, and warm invocations of the same
+      container, read a thread-safe in-memory map. Fetches are
+      single-flight per (run_id, symbol): a caller that misses a symbol
+      another caller is already fetching waits for that fetch and reads its
+      result, while fetches of unrelated symbols proceed concurrently.
+    - Across workers: strategy workers run in separate Lambda containers,
+      so with PRICE_SNAPSHOT_TABLE set, fetched prices are also published
+      to DynamoDB under the run's correlation ID and read back by the other
+      workers of that run before they query the provider. Freshness is
+      checked against the stored fetch time; the table TTL only removes
+      old items.
+
+Symbols whose fetch failed are never cached, so a transient error is
+retried by the next caller. The shared layer is best-effort: backend
+failures are logged and treated as misses, never raised to the caller.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Protocol
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+from ..logging import get_logger
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import Table
+
+logger = get_logger(__name__)
+
+# Seconds a fetched price may be served from the cache
+DEFAULT_PRICE_SNAPSHOT_TTL_SECONDS = 5.0
+
+# Environment variable naming the cross-worker snapshot table
+PRICE_SNAPSHOT_TABLE_ENV = "PRICE_SNAPSHOT_TABLE"
+
+# Seconds before DynamoDB may delete a stored snapshot (reads check freshness)
+SHARED_SNAPSHOT_EXPIRY_SECONDS = 3_600
+
+# DynamoDB exception types for error handling
+DynamoDBException = (ClientError, BotoCoreError)
+
+# Prices found by a fetch; None = the provider had no price, absent = fetch failed
+type PriceFetcher = Callable[[list[str]], Mapping[str, float | None]]
+
+# (fetch time as epoch seconds, price or None when the provider had none)
+type SharedEntry = tuple[float, float | None]
+
+
+class PriceSnapshotBackend(Protocol):
+    """Cross-process storage of price snapshots, partitioned by run."""
+
+    def load(self, run_id: str) -> dict[str, SharedEntry]:
+        """Return every stored entry of a run keyed by symbol (empty if none)."""
+        ...
+
+    def put(self, run_id: str, entries: Mapping[str, SharedEntry]) -> None:
+        """Store entries for a run; a later write for a symbol replaces it."""
+        ...
+
+
+class DynamoDBPriceSnapshotBackend:
+    """Price snapshots in DynamoDB.
+
+    Table structure:
+    - PK (partition key): run correlation ID
+    - SK (sort key): symbol
+    - fetched_at: epoch seconds of the provider request
+    - price: price as a number (absent when the provider had none)
+    - ttl: epoch seconds after which DynamoDB may delete the item
+    """
+
+    def __init__(
+        self, table_name: str, *, expiry_seconds: int = SHARED_SNAPSHOT_EXPIRY_SECONDS
+    ) -> None:
+        """Initialize backend.
+
+        Args:
+            table_name: DynamoDB table name
+            expiry_seconds: Seconds before stored items expire
+
+        """
+        self._table: Table = boto3.resource("dynamodb").Table(table_name)
+        self._expiry_seconds = expiry_seconds
+
+    def load(self, run_id: str) -> dict[str, SharedEntry]:
+        """Query all items of a run, following pagination."""
+        entries: dict[str, SharedEntry] = {}
+        query: dict[str, Any] = {
+            "KeyConditionExpression": "PK = :pk",
+            "ExpressionAttributeValues": {":pk": run_id},
+        }
+        while True:
+            response = self._table.query(**query)
+            for item in response.get("Items", []):
+                price = item.get("price")
+                entries[str(item["SK"])] = (
+                    float(str(item["fetched_at"])),
+                    float(str(price)) if price is not None else None,
+                )
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return entries
+            query["ExclusiveStartKey"] = last_key
+
+    def put(self, run_id: str, entries: Mapping[str, SharedEntry]) -> None:
+        """Write one item per symbol with a TTL."""
+        with self._table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+            for symbol, (fetched_at, price) in entries.items():
+                item: dict[str, Any] = {
+                    "PK": run_id,
+                    "SK": symbol,
+                    "fetched_at": Decimal(repr(fetched_at)),
+                    "ttl": int(fetched_at) + self._expiry_seconds,
+                }
+                if price is not None:
+                    item["price"] = Decimal(repr(price))
+                batch.put_item(Item=item)
+
+
+class PriceSnapshotCache:
+    """Thread-safe TTL cache of symbol -> current price (None = unavailable)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_PRICE_SNAPSHOT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        *,
+        shared: PriceSnapshotBackend | None = None,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: Seconds an entry stays fresh (0 disables caching)
+            clock: Monotonic time source, injectable for tests
+            shared: Cross-worker backend consulted for calls with a run_id
+            wall_clock: Epoch time source for shared entries, injectable for tests
+
+        Raises:
+            ValueError: If ttl_seconds is negative
+
+        """
+        if ttl_seconds < 0:
+            raise ValueError(f"ttl_seconds must be non-negative, got {ttl_seconds}")
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._shared = shared
+        self._wall_clock = wall_clock
+        # symbol -> (fetched_at, price or None when the provider had none)
+        self._entries: dict[str, tuple[float, float | None]] = {}
+        # (run_id, symbol) -> set once the fetch in progress for it finishes
+        self._in_flight: dict[tuple[str | None, str], threading.Event] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_environment(cls) -> PriceSnapshotCache:
+        """Build a cache, shared across workers when PRICE_SNAPSHOT_TABLE is set."""
+        table_name = os.environ.get(PRICE_SNAPSHOT_TABLE_ENV, "")
+        return cls(shared=DynamoDBPriceSnapshotBackend(table_name) if table_name else None)
+
+    def get_prices(
+        self, symbols: Iterable[str], fetch: PriceFetcher, *, run_id: str | None = None
+    ) -> dict[str, float]:
+        """Return current prices, fetching only symbols without a fresh entry.
+
+        Args:
+            symbols: Symbols to price
+            fetch: Called with the symbols missing from the cache; returns the
+                prices it found, None for symbols the provider had no price
+                for, and omits symbols it failed to fetch
+            run_id: Run correlation ID; when set, the shared backend (if any)
+                is read before fetching and written after
+
+        Returns:
+            Symbol -> price for every requested symbol with a price; each
+            price was fetched at most ttl_seconds ago
+
+        """
+        requested = list(dict.fromkeys(symbols))
+        prices, missing = self._lookup(requested)
+        if not missing:
+            return prices
+
+        owned, waiting = self._claim(run_id, missing)
+        try:
+            if owned:
+                prices.update(self._fetch(owned, fetch, run_id))
+        finally:
+            self._release(run_id, owned)
+
+        if waiting:
+            for event in waiting.values():
+                event.wait()
+            fetched, failed = self._lookup(list(waiting))
+            prices.update(fetched)
+            if failed:
+                # The other caller's fetch failed for these; retry them here
+                prices.update(self._fetch(failed, fetch, run_id))
+        return prices
+
+    def _claim(
+        self, run_id: str | None, symbols: list[str]
+    ) -> tuple[list[str], dict[str, threading.Event]]:
+        """Split symbols into ones this caller fetches and ones already in flight."""
+        owned: list[str] = []
+        waiting: dict[str, threading.Event] = {}
+        with self._lock:
+            for symbol in symbols:
+                event = self._in_flight.get((run_id, symbol))
+                if event is None:
+                    self._in_flight[(run_id, symbol)] = threading.Event()
+                    owned.append(symbol)
+                else:
+                    waiting[symbol] = event
+        return owned, waiting
+
+    def _release(self, run_id: str | None, symbols: list[str]) -> None:
+        """End this caller's fetches and wake the callers waiting on them."""
+        with self._lock:
+            events = [self._in_flight.pop((run_id, symbol)) for symbol in symbols]
+        for event in events:
+            event.set()
+
+    def _fetch(
+        self, symbols: list[str], fetch: PriceFetcher, run_id: str | None
+    ) -> dict[str, float]:
+        """Price symbols from the shared backend, then the provider, caching the results."""
+        # Another caller may have fetched these since our lookup
+        prices, missing = self._lookup(symbols)
+        if missing and run_id and self._shared is not None:
+            fetched, missing = self._lookup_shared(run_id, missing)
+            prices.update(fetched)
+        if not missing:
+            return prices
+
+        # Age entries from the request, not the response
+        fetched_at = self._clock()
+        fetched_at_epoch = self._wall_clock()
+        fresh = fetch(missing)
+        answered = {symbol: fresh[symbol] for symbol in missing if symbol in fresh}
+        with self._lock:
+            self.misses += len(missing)
+            for symbol, price in answered.items():
+                self._entries[symbol] = (fetched_at, price)
+        prices.update({s: p for s, p in answered.items() if p is not None})
+        if run_id and answered:
+            self._publish(run_id, {s: (fetched_at_epoch, p) for s, p in answered.items()})
+        return prices
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, symbols: list[str]) -> tuple[dict[str, float], list[str]]:
+        """Split symbols into fresh cached prices and symbols to fetch."""
+        now = self._clock()
+        prices: dict[str, float] = {}
+        missing: list[str] = []
+        with self._lock:
+            for symbol in symbols:
+                entry = self._entries.get(symbol)
+                if entry is None or now - entry[0] >= self._ttl_seconds:
+                    missing.append(symbol)
+                    continue
+                self.hits += 1
+                if entry[1] is not None:
+                    prices[symbol] = entry[1]
+        return prices, missing
+
+    def _lookup_shared(self, run_id: str, symbols: list[str]) -> tuple[dict[str, float], list[str]]:
+        """Adopt fresh entries other workers of the run published; return the rest."""
+        if self._shared is None:
+            return {}, symbols
+        try:
+            stored = self._shared.load(run_id)
+        except (*DynamoDBException, OSError, ValueError, KeyError) as e:
+            logger.warning(
+                "Shared price snapshot load failed; fetching from provider",
+                run_id=run_id,
+                error=str(e),
+            )
+            return {}, symbols
+
+        now = self._clock()
+        now_epoch = self._wall_clock()
+        prices: dict[str, float] = {}
+        missing: list[str] = []
+        with self._lock:
+            for symbol in symbols:
+                entry = stored.get(symbol)
+                if entry is None or not 0 <= now_epoch - entry[0] < self._ttl_seconds:
+                    missing.append(symbol)
+                    continue
+                age = now_epoch - entry[0]
+                self.shared_hits += 1
+                # Keep the entry's age when moving it onto the monotonic clock
+                self._entries[symbol] = (now - age, entry[1])
+                if entry[1] is not None:
+                    prices[symbol] = entry[1]
+        return prices, missing
+
+    def _publish(self, run_id: str, entries: Mapping[str, SharedEntry]) -> None:
+        """Write fetched entries to the shared backend (best effort)."""
+        if self._shared is None:
+            return
+        try:
+            self._shared.put(run_id, entries)
+        except (*DynamoDBException, OSError, TypeError, ValueError) as e:
+            logger.warning(
+                "Shared price snapshot publish failed",
+                run_id=run_id,
+                symbols=len(entries),
+                error=str(e),
+            )
+
+
+_SHARED_CACHE: PriceSnapshotCache | None = None
+_SHARED_CACHE_LOCK = threading.Lock()
+
+
+def get_shared_price_snapshot_cache() -> PriceSnapshotCache:
+    """Return the process-wide cache shared by every MarketDataService instance."""
+    global _SHARED_CACHE
+    with _SHARED_CACHE_LOCK:
+        if _SHARED_CACHE is None:
+            _SHARED_CACHE = PriceSnapshotCache.from_environment()
+        return _SHARED_CACHE
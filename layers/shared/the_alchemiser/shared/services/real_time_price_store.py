@@ -4,6 +4,16 @@ Price storage and retrieval for real-time market data.
 
 This module handles thread-safe storage, retrieval, and cleanup
 of real-time price and quote data.
+
+Each symbol has one slotted record that quote and trade ticks overwrite in
+place; ticks only store references to the values they carry, so ingesting a
+tick builds no model objects. Symbols are spread over lock stripes, so the
+WebSocket thread never waits on one global lock, and readers take no lock
+at all on the common path: every record carries a sequence counter that
+writers make odd while a write is in progress (seqlock), and readers retry
+a snapshot that raced with a write. ``QuoteModel``, ``PriceDataModel`` and
+legacy ``RealTimeQuote`` views are built only when asked for, and the
+structured views are cached until the next tick changes them.
 """
 
 from __future__ import annotations
@@ -11,7 +21,7 @@ from __future__ import annotations
 import threading
 import time
 from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
+from datetime import datetime
 from decimal import Decimal
 
 from the_alchemiser.shared.logging import get_logger
@@ -21,41 +31,121 @@ from the_alchemiser.shared.types.market_data import (
     RealTimeQuote,
 )
 
+# Lock stripes symbols are hashed onto (power of two)
+DEFAULT_LOCK_STRIPES = 16
+
+# Lock-free snapshot attempts before a reader falls back to the stripe lock
+_OPTIMISTIC_READ_ATTEMPTS = 4
+
+_ZERO = Decimal("0")
+_TWO = Decimal("2")
+
+
+def _as_decimal(value: Decimal | float) -> Decimal:
+    """Return value as a Decimal (ticks normally already carry Decimals)."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+class _SymbolSlot:
+    """Latest quote and trade state of one symbol, updated in place.
+
+    ``seq`` is odd while a writer is mid-update. ``quote_version`` and
+    ``trade_version`` count the ticks of each kind and key the cached views.
+    """
+
+    __slots__ = (
+        "ask",
+        "ask_size",
+        "bid",
+        "bid_size",
+        "last_price",
+        "legacy_timestamp",
+        "price_view",
+        "quote_timestamp",
+        "quote_version",
+        "quote_view",
+        "seq",
+        "trade_ask",
+        "trade_bid",
+        "trade_timestamp",
+        "trade_version",
+        "updated_at",
+        "volume",
+    )
+
+    def __init__(self) -> None:
+        self.seq = 0
+        self.quote_version = 0
+        self.trade_version = 0
+        self.bid: Decimal | None = None
+        self.ask: Decimal | None = None
+        self.bid_size: Decimal | None = None
+        self.ask_size: Decimal | None = None
+        self.quote_timestamp: datetime | None = None
+        self.last_price: Decimal | None = None
+        self.volume: Decimal | None = None
+        self.trade_timestamp: datetime | None = None
+        # Quote bid/ask as of the latest trade (PriceDataModel.bid/ask)
+        self.trade_bid: Decimal | None = None
+        self.trade_ask: Decimal | None = None
+        # Timestamp of the latest tick of either kind (RealTimeQuote.timestamp)
+        self.legacy_timestamp: datetime | None = None
+        # Monotonic time of the latest tick
+        self.updated_at = 0.0
+        # (version, model) caches of the structured views
+        self.quote_view: tuple[int, QuoteModel] | None = None
+        self.price_view: tuple[int, PriceDataModel] | None = None
+
+
+class _Stripe:
+    """A lock and the symbols hashed onto it."""
+
+    __slots__ = ("lock", "slots")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.slots: dict[str, _SymbolSlot] = {}
+
 
 class RealTimePriceStore:
-    """Thread-safe storage for real-time price and quote data."""
+    """Thread-safe storage for real-time price and quote data.
+
+    Thread Safety:
+        Writers serialize per lock stripe; readers use seqlock snapshots and
+        never block writers.
+    """
 
     def __init__(
         self,
         cleanup_interval: int = 60,
         max_quote_age: int = 300,
+        lock_stripes: int = DEFAULT_LOCK_STRIPES,
     ) -> None:
         """Initialize the price store.
 
         Args:
             cleanup_interval: Seconds between cleanup cycles (must be > 0)
             max_quote_age: Maximum age of quotes in seconds before cleanup (must be > 0)
+            lock_stripes: Number of writer lock stripes (power of two)
 
         Raises:
-            ValueError: If cleanup_interval or max_quote_age are not positive
+            ValueError: If cleanup_interval or max_quote_age are not positive,
+                or lock_stripes is not a power of two
 
         """
         if cleanup_interval <= 0:
             raise ValueError(f"cleanup_interval must be positive, got {cleanup_interval}")
         if max_quote_age <= 0:
             raise ValueError(f"max_quote_age must be positive, got {max_quote_age}")
+        if lock_stripes <= 0 or lock_stripes & (lock_stripes - 1):
+            raise ValueError(f"lock_stripes must be a power of two, got {lock_stripes}")
 
         self._cleanup_interval = cleanup_interval
         self._max_quote_age = max_quote_age
 
-        # Data storage
-        self._quotes: dict[str, RealTimeQuote] = {}
-        self._price_data: dict[str, PriceDataModel] = {}
-        self._quote_data: dict[str, QuoteModel] = {}
-        self._last_update: dict[str, datetime] = {}
-
-        # Thread safety
-        self._quotes_lock = threading.Lock()
+        # Data storage, striped by symbol hash
+        self._stripes = tuple(_Stripe() for _ in range(lock_stripes))
+        self._stripe_mask = lock_stripes - 1
 
         # Cleanup control
         self._should_cleanup = False
@@ -98,7 +188,7 @@ class RealTimePriceStore:
         ask_size: Decimal | None,
         timestamp: datetime,
     ) -> None:
-        """Update quote data with locking.
+        """Update quote data under the symbol's stripe lock.
 
         Args:
             symbol: Stock symbol (non-empty)
@@ -126,35 +216,26 @@ class RealTimePriceStore:
         if timestamp.tzinfo is None:
             raise ValueError("Timestamp must be timezone-aware")
 
-        with self._quotes_lock:
-            current_quote = self._quotes.get(symbol)
-            last_price = current_quote.last_price if current_quote else 0.0
-
-            # Update legacy RealTimeQuote
-            self._quotes[symbol] = RealTimeQuote(
-                bid=float(bid_price),
-                ask=float(ask_price),
-                last_price=last_price,
-                timestamp=timestamp,
-            )
-
-            # Create new structured QuoteModel
-            self._quote_data[symbol] = QuoteModel(
-                symbol=symbol,
-                bid_price=Decimal(str(bid_price)),
-                ask_price=Decimal(str(ask_price)),
-                bid_size=(Decimal(str(bid_size)) if bid_size is not None else Decimal("0.0")),
-                ask_size=(Decimal(str(ask_size)) if ask_size is not None else Decimal("0.0")),
-                timestamp=timestamp,
-            )
-
-            # Update last update timestamp inside lock
-            self._last_update[symbol] = datetime.now(UTC)
+        stripe = self._stripe(symbol)
+        with stripe.lock:
+            slot = stripe.slots.get(symbol)
+            if slot is None:
+                slot = stripe.slots[symbol] = _SymbolSlot()
+            slot.seq += 1
+            slot.bid = bid_price
+            slot.ask = ask_price
+            slot.bid_size = bid_size
+            slot.ask_size = ask_size
+            slot.quote_timestamp = timestamp
+            slot.legacy_timestamp = timestamp
+            slot.quote_version += 1
+            slot.updated_at = time.monotonic()
+            slot.seq += 1
 
     def update_trade_data(
         self, symbol: str, price: Decimal, timestamp: datetime, volume: Decimal | None
     ) -> None:
-        """Update trade data with locking.
+        """Update trade data under the symbol's stripe lock.
 
         Args:
             symbol: Stock symbol (non-empty)
@@ -176,46 +257,21 @@ class RealTimePriceStore:
         if volume is not None and volume < 0:
             raise ValueError(f"Volume cannot be negative: {volume}")
 
-        # Convert price to Decimal early for consistency
-        price_decimal = Decimal(str(price))
-
-        with self._quotes_lock:
-            current_quote = self._quotes.get(symbol)
-            current_quote_data = self._quote_data.get(symbol)
-
-            # Legacy RealTimeQuote storage (for backward compatibility)
-            if current_quote:
-                # Update existing quote with new trade price
-                self._quotes[symbol] = RealTimeQuote(
-                    bid=current_quote.bid,
-                    ask=current_quote.ask,
-                    last_price=float(price_decimal),
-                    timestamp=timestamp,
-                )
-            else:
-                # Create new quote with trade price only
-                self._quotes[symbol] = RealTimeQuote(
-                    bid=0.0,
-                    ask=0.0,
-                    last_price=float(price_decimal),
-                    timestamp=timestamp,
-                )
-
-            # New structured PriceDataModel storage
-            bid_price = current_quote_data.bid_price if current_quote_data else None
-            ask_price = current_quote_data.ask_price if current_quote_data else None
-
-            self._price_data[symbol] = PriceDataModel(
-                symbol=symbol,
-                price=price_decimal,
-                timestamp=timestamp,
-                bid=bid_price,
-                ask=ask_price,
-                volume=int(volume) if volume else None,
-            )
-
-            # CRITICAL FIX: Update timestamp inside lock to prevent race condition
-            self._last_update[symbol] = datetime.now(UTC)
+        stripe = self._stripe(symbol)
+        with stripe.lock:
+            slot = stripe.slots.get(symbol)
+            if slot is None:
+                slot = stripe.slots[symbol] = _SymbolSlot()
+            slot.seq += 1
+            slot.last_price = price
+            slot.volume = volume
+            slot.trade_timestamp = timestamp
+            slot.trade_bid = slot.bid
+            slot.trade_ask = slot.ask
+            slot.legacy_timestamp = timestamp
+            slot.trade_version += 1
+            slot.updated_at = time.monotonic()
+            slot.seq += 1
 
     def get_real_time_quote(self, symbol: str) -> RealTimeQuote | None:
         """Get real-time quote for a symbol (legacy).
@@ -237,8 +293,18 @@ class RealTimePriceStore:
             DeprecationWarning,
             stacklevel=2,
         )
-        with self._quotes_lock:
-            return self._quotes.get(symbol)
+        snapshot = self._read(symbol, _legacy_fields)
+        if snapshot is None:
+            return None
+        bid, ask, last_price, timestamp = snapshot
+        if timestamp is None:
+            return None
+        return RealTimeQuote(
+            bid=float(bid) if bid is not None else 0.0,
+            ask=float(ask) if ask is not None else 0.0,
+            last_price=float(last_price) if last_price is not None else 0.0,
+            timestamp=timestamp,
+        )
 
     def get_quote_data(self, symbol: str) -> QuoteModel | None:
         """Get structured quote data for a symbol.
@@ -250,8 +316,27 @@ class RealTimePriceStore:
             QuoteModel object with bid/ask prices and sizes, or None if not available
 
         """
-        with self._quotes_lock:
-            return self._quote_data.get(symbol)
+        slot = self._slot(symbol)
+        if slot is None:
+            return None
+        cached = slot.quote_view
+        snapshot = self._read_slot(slot, symbol, _quote_fields)
+        version, bid, ask, bid_size, ask_size, timestamp = snapshot
+        # A quote tick sets bid, ask and timestamp together
+        if not version or bid is None or ask is None or timestamp is None:
+            return None
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        model = QuoteModel(
+            symbol=symbol,
+            bid_price=_as_decimal(bid),
+            ask_price=_as_decimal(ask),
+            bid_size=_as_decimal(bid_size) if bid_size is not None else _ZERO,
+            ask_size=_as_decimal(ask_size) if ask_size is not None else _ZERO,
+            timestamp=timestamp,
+        )
+        slot.quote_view = (version, model)
+        return model
 
     def get_price_data(self, symbol: str) -> PriceDataModel | None:
         """Get structured price data for a symbol.
@@ -263,10 +348,29 @@ class RealTimePriceStore:
             PriceDataModel object with price, bid/ask, and volume, or None if not available
 
         """
-        with self._quotes_lock:
-            return self._price_data.get(symbol)
+        slot = self._slot(symbol)
+        if slot is None:
+            return None
+        cached = slot.price_view
+        snapshot = self._read_slot(slot, symbol, _trade_fields)
+        version, price, timestamp, bid, ask, volume = snapshot
+        # A trade tick sets price and timestamp together
+        if not version or price is None or timestamp is None:
+            return None
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        model = PriceDataModel(
+            symbol=symbol,
+            price=_as_decimal(price),
+            timestamp=timestamp,
+            bid=_as_decimal(bid) if bid is not None else None,
+            ask=_as_decimal(ask) if ask is not None else None,
+            volume=int(volume) if volume else None,
+        )
+        slot.price_view = (version, model)
+        return model
 
-    def get_real_time_price(self, symbol: str) -> Decimal | float | None:
+    def get_real_time_price(self, symbol: str) -> Decimal | None:
         """Get the best available real-time price for a symbol.
 
         Priority: mid-price > last trade > bid > ask
@@ -275,86 +379,53 @@ class RealTimePriceStore:
             symbol: Stock symbol
 
         Returns:
-            Current price (Decimal from structured data or float from legacy) or None if not available
+            Current price or None if not available
 
         """
-        # Try structured data first (preferred)
-        price_data = self.get_price_data(symbol)
-        quote_data = self.get_quote_data(symbol)
-
-        if quote_data and quote_data.bid_price > 0 and quote_data.ask_price > 0:
-            return quote_data.mid_price
-
-        if price_data and price_data.price > 0:
-            return price_data.price
-
-        if quote_data and quote_data.bid_price > 0:
-            return quote_data.bid_price
-
-        if quote_data and quote_data.ask_price > 0:
-            return quote_data.ask_price
-
-        # Fallback to legacy quote (for backward compatibility)
-        quote = self.get_real_time_quote(symbol)
-        if not quote:
+        snapshot = self._read(symbol, _price_fields)
+        if snapshot is None:
             return None
-
-        # Return mid-price if both bid/ask available
-        if quote.bid > 0 and quote.ask > 0:
-            return quote.mid_price
-        # Fallback to last trade price
-        if quote.last_price > 0:
-            return quote.last_price
-        # Final fallback to bid or ask
-        if quote.bid > 0:
-            return quote.bid
-        if quote.ask > 0:
-            return quote.ask
-
+        bid, ask, last_price = snapshot
+
+        if bid is not None and ask is not None and bid > 0 and ask > 0:
+            return (_as_decimal(bid) + _as_decimal(ask)) / _TWO
+        if last_price is not None and last_price > 0:
+            return _as_decimal(last_price)
+        if bid is not None and bid > 0:
+            return _as_decimal(bid)
+        if ask is not None and ask > 0:
+            return _as_decimal(ask)
         return None
 
-    def get_bid_ask_spread(self, symbol: str) -> tuple[Decimal | float, Decimal | float] | None:
+    def get_bid_ask_spread(self, symbol: str) -> tuple[Decimal, Decimal] | None:
         """Get current bid/ask spread for a symbol.
 
         Args:
             symbol: Stock symbol
 
         Returns:
-            Tuple of (bid, ask) - Decimal from structured data or float from legacy, or None if not available
+            Tuple of (bid, ask), or None if not available
 
         """
-        # Try structured data first (preferred)
-        quote_data = self.get_quote_data(symbol)
-        if quote_data and quote_data.bid_price > 0 and quote_data.ask_price > 0:
-            # Additional validation: ensure ask > bid for a reasonable spread
-            if quote_data.ask_price <= quote_data.bid_price:
-                self.logger.warning(
-                    f"Invalid spread for {symbol}: bid={quote_data.bid_price}, "
-                    f"ask={quote_data.ask_price} (ask <= bid)"
-                )
-                return None
-            return quote_data.bid_price, quote_data.ask_price
-
-        # Fallback to legacy quote
-        quote = self.get_real_time_quote(symbol)
-        if not quote or quote.bid <= 0 or quote.ask <= 0:
+        snapshot = self._read(symbol, _price_fields)
+        if snapshot is None:
+            return None
+        bid, ask, _ = snapshot
+        if bid is None or ask is None or bid <= 0 or ask <= 0:
             return None
 
         # Additional validation: ensure ask > bid for a reasonable spread
-        if quote.ask <= quote.bid:
-            self.logger.warning(
-                f"Invalid spread for {symbol}: bid={quote.bid}, ask={quote.ask} (ask <= bid)"
-            )
+        if ask <= bid:
+            self.logger.warning(f"Invalid spread for {symbol}: bid={bid}, ask={ask} (ask <= bid)")
             return None
-
-        return quote.bid, quote.ask
+        return _as_decimal(bid), _as_decimal(ask)
 
     def get_optimized_price_for_order(
         self,
         symbol: str,
         subscribe_callback: Callable[[str], None],
         max_wait: float = 0.5,
-    ) -> Decimal | float | None:
+    ) -> Decimal | None:
         """Get the most accurate price for order placement.
 
         This method blocks the calling thread while waiting for fresh data.
@@ -366,7 +437,7 @@ class RealTimePriceStore:
             max_wait: Maximum wait time for fresh data in seconds
 
         Returns:
-            Current price optimized for order accuracy (Decimal from structured data or float from legacy)
+            Current price optimized for order accuracy
 
         Note:
             This method will sleep for up to max_wait seconds while checking for data.
@@ -384,12 +455,9 @@ class RealTimePriceStore:
         elapsed = 0.0
 
         while elapsed < max_wait:
-            # Check if we have recent data for this symbol
-            if symbol in self._quotes and symbol in self._last_update:
-                # If data is very recent (within 1 second), use it immediately
-                time_since_update = (datetime.now(UTC) - self._last_update[symbol]).total_seconds()
-                if time_since_update < 1.0:
-                    break
+            # If data is very recent (within 1 second), use it immediately
+            if self.has_recent_data(symbol, max_age_seconds=1.0):
+                break
 
             time.sleep(check_interval)
             elapsed += check_interval
@@ -404,12 +472,18 @@ class RealTimePriceStore:
             Dictionary of statistics
 
         """
-        with self._quotes_lock:
-            return {
-                "symbols_tracked": len(self._quotes),
-                "symbols_tracked_structured_prices": len(self._price_data),
-                "symbols_tracked_structured_quotes": len(self._quote_data),
-            }
+        tracked = prices = quotes = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                tracked += len(stripe.slots)
+                for slot in stripe.slots.values():
+                    prices += slot.trade_version > 0
+                    quotes += slot.quote_version > 0
+        return {
+            "symbols_tracked": tracked,
+            "symbols_tracked_structured_prices": prices,
+            "symbols_tracked_structured_quotes": quotes,
+        }
 
     def has_recent_data(self, symbol: str, max_age_seconds: float = 1.0) -> bool:
         """Check if we have recent data for a symbol.
@@ -422,11 +496,43 @@ class RealTimePriceStore:
             True if data is recent
 
         """
-        with self._quotes_lock:
-            if symbol not in self._last_update:
-                return False
-            time_since_update = (datetime.now(UTC) - self._last_update[symbol]).total_seconds()
-            return time_since_update < max_age_seconds
+        slot = self._slot(symbol)
+        if slot is None:
+            return False
+        # A single float read is atomic; no snapshot needed
+        return time.monotonic() - slot.updated_at < max_age_seconds
+
+    def _stripe(self, symbol: str) -> _Stripe:
+        """Return the stripe a symbol is hashed onto."""
+        return self._stripes[hash(symbol) & self._stripe_mask]
+
+    def _slot(self, symbol: str) -> _SymbolSlot | None:
+        """Look up a symbol's record (dict reads need no lock)."""
+        return self._stripe(symbol).slots.get(symbol)
+
+    def _read[T](self, symbol: str, fields: Callable[[_SymbolSlot], T]) -> T | None:
+        """Take a consistent snapshot of a symbol's record, or None if untracked."""
+        slot = self._slot(symbol)
+        if slot is None:
+            return None
+        return self._read_slot(slot, symbol, fields)
+
+    def _read_slot[T](
+        self, slot: _SymbolSlot, symbol: str, fields: Callable[[_SymbolSlot], T]
+    ) -> T:
+        """Seqlock read: retry while a write is in progress or raced the read."""
+        for _ in range(_OPTIMISTIC_READ_ATTEMPTS):
+            seq = slot.seq
+            if seq & 1:
+                # Writer mid-update; let it finish
+                time.sleep(0)
+                continue
+            snapshot = fields(slot)
+            if slot.seq == seq:
+                return snapshot
+        # Persistent contention on this symbol: wait for the writer
+        with self._stripe(symbol).lock:
+            return fields(slot)
 
     def _cleanup_old_quotes(self) -> None:
         """Cleanup old quotes to prevent memory bloat."""
@@ -437,23 +543,57 @@ class RealTimePriceStore:
                 if self._is_connected is None or not self._is_connected():
                     continue
 
-                cutoff_time = datetime.now(UTC) - timedelta(seconds=self._max_quote_age)
-
-                with self._quotes_lock:
-                    symbols_to_remove = [
-                        symbol
-                        for symbol, last_update in self._last_update.items()
-                        if last_update < cutoff_time
-                    ]
-
-                    for symbol in symbols_to_remove:
-                        self._quotes.pop(symbol, None)
-                        self._price_data.pop(symbol, None)
-                        self._quote_data.pop(symbol, None)
-                        self._last_update.pop(symbol, None)
-
-                    if symbols_to_remove:
-                        self.logger.info(f"🧹 Cleaned up {len(symbols_to_remove)} old quotes")
+                cutoff = time.monotonic() - self._max_quote_age
+                removed = 0
+                for stripe in self._stripes:
+                    with stripe.lock:
+                        stale = [
+                            symbol
+                            for symbol, slot in stripe.slots.items()
+                            if slot.updated_at < cutoff
+                        ]
+                        for symbol in stale:
+                            del stripe.slots[symbol]
+                        removed += len(stale)
+
+                if removed:
+                    self.logger.info(f"🧹 Cleaned up {removed} old quotes")
 
             except Exception as e:
                 self.logger.error(f"Error during quote cleanup: {e}")
+
+
+def _quote_fields(
+    slot: _SymbolSlot,
+) -> tuple[int, Decimal | None, Decimal | None, Decimal | None, Decimal | None, datetime | None]:
+    return (
+        slot.quote_version,
+        slot.bid,
+        slot.ask,
+        slot.bid_size,
+        slot.ask_size,
+        slot.quote_timestamp,
+    )
+
+
+def _trade_fields(
+    slot: _SymbolSlot,
+) -> tuple[int, Decimal | None, datetime | None, Decimal | None, Decimal | None, Decimal | None]:
+    return (
+        slot.trade_version,
+        slot.last_price,
+        slot.trade_timestamp,
+        slot.trade_bid,
+        slot.trade_ask,
+        slot.volume,
+    )
+
+
+def _price_fields(slot: _SymbolSlot) -> tuple[Decimal | None, Decimal | None, Decimal | None]:
+    return slot.bid, slot.ask, slot.last_price
+
+
+def _legacy_fields(
+    slot: _SymbolSlot,
+) -> tuple[Decimal | None, Decimal | None, Decimal | None, datetime | None]:
+    return slot.bid, slot.ask, slot.last_price, slot.legacy_timestamp
@@ -387,20 +387,16 @@ class RealTimePricingService:
 
             # Update quote data with validated bid and ask prices
             if bid_price is not None and ask_price is not None:
-                try:
-                    # Use asyncio.to_thread for potentially blocking lock operations
-                    await asyncio.to_thread(
-                        self._price_store.update_quote_data,
-                        symbol,
-                        bid_price,
-                        ask_price,
-                        quote_values.bid_size,
-                        quote_values.ask_size,
-                        timestamp,
-                    )
-                except RuntimeError:
-                    # Event loop executor has shut down - gracefully ignore
-                    return
+                # Inline: a store write only holds its stripe lock for a few
+                # field assignments, far cheaper than a thread-pool hop per tick
+                self._price_store.update_quote_data(
+                    symbol,
+                    bid_price,
+                    ask_price,
+                    quote_values.bid_size,
+                    quote_values.ask_size,
+                    timestamp,
+                )
 
             # Update stats with thread safety
             with self._stats_lock:
@@ -432,18 +428,8 @@ class RealTimePricingService:
             price, volume, timestamp = self._data_processor.extract_trade_values(trade)
 
             if price and price > 0:
-                try:
-                    # Use asyncio.to_thread for potentially blocking lock operations
-                    await asyncio.to_thread(
-                        self._price_store.update_trade_data,
-                        symbol,
-                        price,
-                        timestamp,
-                        volume,
-                    )
-                except RuntimeError:
-                    # Event loop executor has shut down - gracefully ignore
-                    return
+                # Inline for the same reason as quote ticks
+                self._price_store.update_trade_data(symbol, price, timestamp, volume)
 
                 # Update stats with thread safety
                 with self._stats_lock:
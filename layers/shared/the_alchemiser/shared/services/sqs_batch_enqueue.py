@@ -0,0 +1,267 @@
+"""Business Unit: shared | Status: current.
+
+Batched, concurrent enqueue of trade messages to the execution FIFO queue.
+
+Trade messages are packed into ``send_message_batch`` requests of at most
+SQS_MAX_BATCH_ENTRIES entries (and SQS_MAX_BATCH_BYTES of payload), the
+batches are sent concurrently, and only entries SQS reports as failed are
+retried, with exponential backoff. A rebalance with dozens of legs is then
+enqueued in a few round trips rather than one per trade.
+
+Ordering: SQS FIFO preserves order within a message group, and every trade
+of a run has its own group (the symbol), so concurrent batches cannot
+reorder messages that depend on each other. Deduplication is per trade
+(MessageDeduplicationId = trade_id), so a retried entry that actually
+reached the queue is not delivered twice.
+
+Entries failing with a sender fault (malformed request) are not retried.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from the_alchemiser.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# SQS SendMessageBatch limits
+SQS_MAX_BATCH_ENTRIES = 10
+SQS_MAX_BATCH_BYTES = 262_144
+
+# Concurrent SendMessageBatch requests
+DEFAULT_MAX_CONCURRENT_BATCHES = 8
+
+# Send attempts per entry (first try included)
+MAX_ENQUEUE_ATTEMPTS = 3
+BASE_RETRY_SLEEP_SECONDS = 0.2
+
+
+class SQSBatchClient(Protocol):
+    """The part of the boto3 SQS client used here."""
+
+    def send_message_batch(self, *, QueueUrl: str, Entries: list[dict[str, Any]]) -> dict[str, Any]:
+        """Send up to SQS_MAX_BATCH_ENTRIES messages in one request."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class TradeQueueEntry:
+    """One trade message bound for the execution FIFO queue.
+
+    Attributes:
+        trade_id: Trade identifier (batch entry Id and deduplication ID)
+        message_body: Serialized TradeMessage
+        group_id: FIFO message group (the trade's symbol)
+        run_id: Execution run identifier
+        phase: "SELL" or "BUY"
+
+    """
+
+    trade_id: str
+    message_body: str
+    group_id: str
+    run_id: str
+    phase: str
+
+    def to_batch_entry(self) -> dict[str, Any]:
+        """Build the SendMessageBatch request entry."""
+        return {
+            "Id": self.trade_id,
+            "MessageBody": self.message_body,
+            "MessageDeduplicationId": self.trade_id,  # Exactly-once per trade
+            "MessageGroupId": self.group_id,  # Parallel execution across symbols
+            "MessageAttributes": {
+                "RunId": {"DataType": "String", "StringValue": self.run_id},
+                "TradeId": {"DataType": "String", "StringValue": self.trade_id},
+                "Phase": {"DataType": "String", "StringValue": self.phase},
+            },
+        }
+
+    @property
+    def payload_bytes(self) -> int:
+        """Bytes the entry counts against the batch payload limit."""
+        size = len(self.message_body.encode())
+        for name, value in (
+            ("RunId", self.run_id),
+            ("TradeId", self.trade_id),
+            ("Phase", self.phase),
+        ):
+            size += len(name.encode()) + len(b"String") + len(value.encode())
+        return size
+
+
+@dataclass
+class EnqueueResult:
+    """Outcome of enqueue_trade_messages.
+
+    Attributes:
+        enqueued: Trade IDs accepted by SQS, in input order
+        failed: Trade ID -> last error for entries that never got through
+        api_calls: SendMessageBatch requests made (retries included)
+
+    """
+
+    enqueued: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    api_calls: int = 0
+
+
+def pack_batches(entries: Sequence[TradeQueueEntry]) -> list[list[TradeQueueEntry]]:
+    """Split entries into SendMessageBatch-sized groups, keeping input order.
+
+    Args:
+        entries: Entries to pack
+
+    Returns:
+        Batches of at most SQS_MAX_BATCH_ENTRIES entries and
+        SQS_MAX_BATCH_BYTES of payload each
+
+    """
+    batches: list[list[TradeQueueEntry]] = []
+    current: list[TradeQueueEntry] = []
+    current_bytes = 0
+    for entry in entries:
+        size = entry.payload_bytes
+        if current and (
+            len(current) == SQS_MAX_BATCH_ENTRIES or current_bytes + size > SQS_MAX_BATCH_BYTES
+        ):
+            batches.append(current)
+            current, current_bytes = [], 0
+        current.append(entry)
+        current_bytes += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def enqueue_trade_messages(
+    sqs_client: SQSBatchClient,
+    queue_url: str,
+    entries: Sequence[TradeQueueEntry],
+    *,
+    max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+    max_attempts: int = MAX_ENQUEUE_ATTEMPTS,
+) -> EnqueueResult:
+    """Enqueue trade messages with concurrent SendMessageBatch requests.
+
+    Never raises for SQS failures: entries that still fail after
+    max_attempts are reported in ``EnqueueResult.failed`` so callers decide
+    how a partial enqueue affects the run.
+
+    Args:
+        sqs_client: boto3 SQS client or compatible (must be thread-safe)
+        queue_url: FIFO queue URL
+        entries: Trade messages to enqueue (trade IDs must be unique)
+        max_concurrent_batches: Upper bound on in-flight batch requests
+        max_attempts: Send attempts per entry, first try included
+
+    Returns:
+        EnqueueResult with accepted and failed trade IDs
+
+    """
+    result = EnqueueResult()
+    if not entries:
+        return result
+
+    start_time = time.perf_counter()
+    batches = pack_batches(entries)
+    workers = max(1, min(max_concurrent_batches, len(batches)))
+    if workers == 1:
+        outcomes = [_send_batch(sqs_client, queue_url, batch, max_attempts) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sqs-enqueue") as pool:
+            outcomes = list(
+                pool.map(
+                    lambda batch: _send_batch(sqs_client, queue_url, batch, max_attempts),
+                    batches,
+                )
+            )
+
+    accepted: set[str] = set()
+    for batch_accepted, batch_failed, calls in outcomes:
+        accepted.update(batch_accepted)
+        result.failed.update(batch_failed)
+        result.api_calls += calls
+    result.enqueued = [entry.trade_id for entry in entries if entry.trade_id in accepted]
+
+    logger.info(
+        "Enqueued trade messages in batches",
+        extra={
+            "entry_count": len(entries),
+            "batch_count": len(batches),
+            "enqueued_count": len(result.enqueued),
+            "failed_count": len(result.failed),
+            "api_calls": result.api_calls,
+            "duration_ms": round((time.perf_counter() - start_time) * 1000, 2),
+        },
+    )
+    return result
+
+
+def _send_batch(
+    sqs_client: SQSBatchClient,
+    queue_url: str,
+    batch: list[TradeQueueEntry],
+    max_attempts: int,
+) -> tuple[list[str], dict[str, str], int]:
+    """Send one batch, retrying only the entries that failed.
+
+    Returns:
+        (accepted trade IDs, trade ID -> last error, API calls made)
+
+    """
+    pending = {entry.trade_id: entry for entry in batch}
+    accepted: list[str] = []
+    failed: dict[str, str] = {}
+    calls = 0
+
+    for attempt in range(1, max_attempts + 1):
+        calls += 1
+        try:
+            response = sqs_client.send_message_batch(
+                QueueUrl=queue_url,
+                Entries=[entry.to_batch_entry() for entry in pending.values()],
+            )
+        except (ClientError, BotoCoreError) as e:
+            # Whole request failed: every pending entry is retried
+            for trade_id in pending:
+                failed[trade_id] = str(e)
+        else:
+            for success in response.get("Successful", []):
+                trade_id = success["Id"]
+                if pending.pop(trade_id, None) is not None:
+                    accepted.append(trade_id)
+                    failed.pop(trade_id, None)
+            for failure in response.get("Failed", []):
+                trade_id = failure["Id"]
+                failed[trade_id] = f"{failure.get('Code', '')}: {failure.get('Message', '')}"
+                if failure.get("SenderFault", False):
+                    # Malformed entry: retrying cannot help
+                    pending.pop(trade_id, None)
+
+        if not pending:
+            break
+        if attempt < max_attempts:
+            logger.warning(
+                "Retrying failed trade message entries",
+                extra={
+                    "retry_count": len(pending),
+                    "attempt": attempt,
+                    "max_attempts": max_attempts,
+                },
+            )
+            time.sleep(BASE_RETRY_SLEEP_SECONDS * (2 ** (attempt - 1)))
+
+    for trade_id in failed.keys() - set(accepted):
+        logger.error(
+            "Trade message enqueue failed",
+            extra={"trade_id": trade_id, "error": failed[trade_id]},
+        )
+    return accepted, {k: v for k, v in failed.items() if k not in accepted}, calls
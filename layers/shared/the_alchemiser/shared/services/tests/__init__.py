@@ -0,0 +1,4 @@
+"""Business Unit: shared | Status: current.
+
+Test suite for shared services.
+"""
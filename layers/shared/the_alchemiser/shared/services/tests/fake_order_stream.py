@@ -0,0 +1,74 @@
+"""Business Unit: shared | Status: current.
+
+Scripted stand-in for the TradingStream, for order-update dispatcher tests.
+
+ScriptedOrderStream replays ``(delay_seconds, payload)`` pairs into an
+OrderUpdateDispatcher from a background thread, the way the real stream
+delivers updates from its own thread. ``connected`` is what the dispatcher's
+``is_connected`` hook reports.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from the_alchemiser.shared.services.order_update_dispatcher import OrderUpdateDispatcher
+
+
+def trade_update(
+    order_id: str,
+    event: str,
+    *,
+    status: str | None = None,
+    filled_qty: str = "0",
+    filled_avg_price: str | None = None,
+) -> dict[str, Any]:
+    """Build a trade-update payload shaped like the TradingStream's."""
+    return {
+        "event": event,
+        "order": {
+            "id": order_id,
+            "status": status or event,
+            "filled_qty": filled_qty,
+            "filled_avg_price": filled_avg_price,
+        },
+    }
+
+
+class ScriptedOrderStream:
+    """Feeds scripted trade updates to a dispatcher from a background thread."""
+
+    def __init__(self, script: Sequence[tuple[float, dict[str, Any]]] = ()) -> None:
+        """Initialize the stream.
+
+        Args:
+            script: (delay before delivery in seconds, payload) pairs, in order
+
+        """
+        self.script = list(script)
+        self.connected = True
+        self.dispatcher = OrderUpdateDispatcher(is_connected=self.is_connected)
+        self._thread: threading.Thread | None = None
+
+    def is_connected(self) -> bool:
+        """Report the scripted connection state."""
+        return self.connected
+
+    def start(self) -> None:
+        """Start delivering the script."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def join(self, timeout: float = 5.0) -> None:
+        """Wait for the script to finish."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        for delay, payload in self.script:
+            if delay:
+                time.sleep(delay)
+            self.dispatcher.dispatch(payload)
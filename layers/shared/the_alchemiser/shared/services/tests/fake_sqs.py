@@ -0,0 +1,85 @@
+"""Business Unit: shared | Status: current.
+
+In-memory stand-in for the boto3 SQS client, for enqueue tests.
+
+FakeSQS records every message it accepts and counts API calls per
+operation. Failures are scripted per trade ID: ``fail_times`` makes an
+entry fail (as a server-side fault) that many times before succeeding,
+``sender_faults`` makes it fail permanently, and ``raise_on_call`` raises a
+ClientError for whole requests.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+SQS_MAX_BATCH_ENTRIES = 10
+
+
+class FakeSQS:
+    """Thread-safe fake implementing send_message and send_message_batch."""
+
+    def __init__(
+        self,
+        *,
+        fail_times: dict[str, int] | None = None,
+        sender_faults: set[str] | None = None,
+        raise_on_call: set[int] | None = None,
+    ) -> None:
+        """Initialize an empty queue.
+
+        Args:
+            fail_times: Trade ID -> number of attempts that fail before success
+            sender_faults: Trade IDs that always fail with SenderFault
+            raise_on_call: 1-based batch call numbers that raise ClientError
+
+        """
+        self.fail_times = dict(fail_times or {})
+        self.sender_faults = set(sender_faults or ())
+        self.raise_on_call = set(raise_on_call or ())
+        self.calls: Counter[str] = Counter()
+        self.messages: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def send_message(self, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Accept one message."""
+        with self._lock:
+            self.calls["send_message"] += 1
+            self.messages.append({"Id": kwargs["MessageDeduplicationId"], **kwargs})
+        return {"MessageId": kwargs["MessageDeduplicationId"]}
+
+    def send_message_batch(self, *, QueueUrl: str, Entries: list[dict[str, Any]]) -> dict[str, Any]:
+        """Accept a batch, failing entries as scripted."""
+        with self._lock:
+            self.calls["send_message_batch"] += 1
+            call_number = self.calls["send_message_batch"]
+            if call_number in self.raise_on_call:
+                raise ClientError(
+                    {"Error": {"Code": "ServiceUnavailable", "Message": "scripted"}},
+                    "SendMessageBatch",
+                )
+            if len(Entries) > SQS_MAX_BATCH_ENTRIES:
+                raise ClientError(
+                    {"Error": {"Code": "TooManyEntriesInBatchRequest", "Message": "too many"}},
+                    "SendMessageBatch",
+                )
+
+            successful: list[dict[str, Any]] = []
+            failed: list[dict[str, Any]] = []
+            for entry in Entries:
+                entry_id = entry["Id"]
+                if entry_id in self.sender_faults:
+                    failed.append(
+                        {"Id": entry_id, "SenderFault": True, "Code": "InvalidMessageContents"}
+                    )
+                elif self.fail_times.get(entry_id, 0) > 0:
+                    self.fail_times[entry_id] -= 1
+                    failed.append({"Id": entry_id, "SenderFault": False, "Code": "InternalError"})
+                else:
+                    self.messages.append({"QueueUrl": QueueUrl, **entry})
+                    successful.append({"Id": entry_id, "MessageId": entry_id})
+            return {"Successful": successful, "Failed": failed}
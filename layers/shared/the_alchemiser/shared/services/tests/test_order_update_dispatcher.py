@@ -0,0 +1,177 @@
+"""Business Unit: shared | Status: current.
+
+Unit tests for the order-update dispatcher.
+
+Tests:
+- Pushed terminal updates resolve waiters without REST polls
+- Disconnected streams fall back to polling, with one catch-up poll after
+  reconnecting; a connected but quiet stream is never polled
+- Timeouts return the latest partial fill
+- Late non-terminal updates never overwrite a terminal state
+- Many orders awaited concurrently
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from decimal import Decimal
+
+from the_alchemiser.shared.services.order_update_dispatcher import (
+    OrderUpdate,
+    OrderUpdateDispatcher,
+)
+from the_alchemiser.shared.services.tests.fake_order_stream import (
+    ScriptedOrderStream,
+    trade_update,
+)
+
+
+def _poller(status: str, calls: list[str]):  # noqa: ANN202
+    def poll(order_id: str) -> OrderUpdate | None:
+        calls.append(order_id)
+        return OrderUpdate.from_order(
+            {"id": order_id, "status": status, "filled_qty": "5", "filled_avg_price": "10"},
+            "poll",
+        )
+
+    return poll
+
+
+def test_pushed_fill_resolves_without_polling() -> None:
+    stream = ScriptedOrderStream(
+        [
+            (0.0, trade_update("o1", "new")),
+            (0.05, trade_update("o1", "partial_fill", status="partially_filled", filled_qty="2")),
+            (
+                0.05,
+                trade_update("o1", "fill", status="filled", filled_qty="5", filled_avg_price="9.5"),
+            ),
+        ]
+    )
+    polls: list[str] = []
+
+    async def run() -> OrderUpdate | None:
+        stream.start()
+        return await stream.dispatcher.wait_for_terminal("o1", 5.0, poll=_poller("filled", polls))
+
+    started = time.monotonic()
+    update = asyncio.run(run())
+
+    assert update is not None
+    assert update.status == "filled"
+    assert update.filled_qty == Decimal("5")
+    assert update.filled_avg_price == Decimal("9.5")
+    assert polls == []
+    assert time.monotonic() - started < 1.0
+
+
+def test_already_terminal_order_returns_immediately() -> None:
+    dispatcher = OrderUpdateDispatcher()
+    dispatcher.dispatch(trade_update("o1", "fill", status="filled", filled_qty="1"))
+
+    update = asyncio.run(dispatcher.wait_for_terminal("o1", 5.0))
+
+    assert update is not None
+    assert update.is_terminal
+
+
+def test_disconnected_stream_falls_back_to_polling() -> None:
+    stream = ScriptedOrderStream()
+    stream.connected = False
+    stream.dispatcher.poll_interval_seconds = 0.01
+    polls: list[str] = []
+
+    update = asyncio.run(
+        stream.dispatcher.wait_for_terminal("o1", 5.0, poll=_poller("filled", polls))
+    )
+
+    assert update is not None
+    assert update.status == "filled"
+    assert polls == ["o1"]
+    assert stream.dispatcher.polls == 1
+
+
+def test_quiet_connected_stream_does_not_poll() -> None:
+    stream = ScriptedOrderStream()
+    stream.dispatcher.poll_interval_seconds = 0.01
+    polls: list[str] = []
+
+    update = asyncio.run(stream.dispatcher.wait_for_terminal("o1", 0.1, poll=_poller("new", polls)))
+
+    assert update is None
+    assert polls == []
+
+
+def test_reconnected_stream_polls_once_to_catch_up() -> None:
+    stream = ScriptedOrderStream()
+    stream.connected = False
+    stream.dispatcher.poll_interval_seconds = 0.01
+    polls: list[str] = []
+    open_order = _poller("new", polls)
+
+    def poll(order_id: str) -> OrderUpdate | None:
+        stream.connected = True
+        return open_order(order_id)
+
+    update = asyncio.run(stream.dispatcher.wait_for_terminal("o1", 0.1, poll=poll))
+
+    assert update is not None
+    assert update.status == "new"
+    assert polls == ["o1", "o1"]
+
+
+def test_timeout_returns_latest_partial_fill() -> None:
+    stream = ScriptedOrderStream(
+        [(0.0, trade_update("o1", "partial_fill", status="partially_filled", filled_qty="3"))]
+    )
+
+    async def run() -> OrderUpdate | None:
+        stream.start()
+        return await stream.dispatcher.wait_for_terminal("o1", 0.2)
+
+    update = asyncio.run(run())
+
+    assert update is not None
+    assert not update.is_terminal
+    assert update.filled_qty == Decimal("3")
+
+
+def test_late_non_terminal_update_keeps_terminal_state() -> None:
+    dispatcher = OrderUpdateDispatcher()
+    dispatcher.dispatch(trade_update("o1", "fill", status="filled", filled_qty="4"))
+    dispatcher.dispatch(
+        trade_update("o1", "partial_fill", status="partially_filled", filled_qty="2")
+    )
+    dispatcher.publish(OrderUpdate.from_order({"id": "o1", "status": "new"}, "poll"))
+
+    latest = dispatcher.latest("o1")
+
+    assert latest is not None
+    assert latest.status == "filled"
+    assert latest.filled_qty == Decimal("4")
+
+
+def test_many_concurrent_orders_resolve_from_one_stream() -> None:
+    order_ids = [f"o{i}" for i in range(200)]
+    stream = ScriptedOrderStream(
+        [
+            (0.0, trade_update(oid, "fill", status="filled", filled_qty="1"))
+            for oid in reversed(order_ids)
+        ]
+    )
+    polls: list[str] = []
+
+    async def run() -> list[OrderUpdate | None]:
+        waiters = [
+            stream.dispatcher.wait_for_terminal(oid, 5.0, poll=_poller("filled", polls))
+            for oid in order_ids
+        ]
+        stream.start()
+        return await asyncio.gather(*waiters)
+
+    updates = asyncio.run(run())
+
+    assert [u.order_id for u in updates if u is not None] == order_ids
+    assert all(u is not None and u.is_terminal for u in updates)
+    assert stream.dispatcher.stream_events == len(order_ids)
@@ -0,0 +1,146 @@
+"""Business Unit: shared | Status: current.
+
+Unit tests for price snapshots.
+
+Tests:
+- A worker of the same run reuses another worker's shared snapshot until
+  it goes stale; other runs do not see it
+- Symbols whose fetch failed are not cached; shared backend errors fall
+  back to the provider
+- Concurrent callers share one fetch per symbol, while fetches of
+  unrelated symbols do not wait for each other
+- A chunk that fails after retries leaves only its symbols unpriced
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from the_alchemiser.shared.services import market_data_service
+from the_alchemiser.shared.services.market_data_service import MarketDataService
+from the_alchemiser.shared.services.price_snapshot_cache import PriceSnapshotCache, SharedEntry
+
+
+class MemoryBackend:
+    """In-memory PriceSnapshotBackend."""
+
+    def __init__(self) -> None:
+        self.runs: dict[str, dict[str, SharedEntry]] = {}
+
+    def load(self, run_id: str) -> dict[str, SharedEntry]:
+        return dict(self.runs.get(run_id, {}))
+
+    def put(self, run_id: str, entries: Mapping[str, SharedEntry]) -> None:
+        self.runs.setdefault(run_id, {}).update(entries)
+
+
+class BrokenBackend:
+    def load(self, run_id: str) -> dict[str, SharedEntry]:
+        raise OSError("unreachable")
+
+    def put(self, run_id: str, entries: Mapping[str, SharedEntry]) -> None:
+        raise OSError("unreachable")
+
+
+class Fetcher:
+    """Price fetcher recording requested symbols; FAIL is never answered."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def __call__(self, symbols: list[str]) -> dict[str, float | None]:
+        self.calls.append(symbols)
+        return {s: (None if s == "NONE" else 100.0) for s in symbols if s != "FAIL"}
+
+
+def test_workers_of_a_run_share_a_snapshot() -> None:
+    backend = MemoryBackend()
+    now = [1_000.0]
+    first, second, other_run = (
+        PriceSnapshotCache(shared=backend, wall_clock=lambda: now[0]) for _ in range(3)
+    )
+    first_fetch, second_fetch, other_fetch = Fetcher(), Fetcher(), Fetcher()
+
+    first.get_prices(["SPY", "NONE"], first_fetch, run_id="run-1")
+    now[0] += 2
+    prices = second.get_prices(["SPY", "NONE", "QQQ"], second_fetch, run_id="run-1")
+    other_run.get_prices(["SPY"], other_fetch, run_id="run-2")
+    now[0] += 10
+    second.clear()
+    second.get_prices(["SPY"], second_fetch, run_id="run-1")
+
+    assert prices == {"SPY": 100.0, "QQQ": 100.0}
+    assert second_fetch.calls == [["QQQ"], ["SPY"]]
+    assert second.shared_hits == 2
+    assert other_fetch.calls == [["SPY"]]
+
+
+def test_failed_symbols_are_refetched() -> None:
+    fetch = Fetcher()
+    cache = PriceSnapshotCache(shared=BrokenBackend())
+
+    first = cache.get_prices(["SPY", "FAIL"], fetch, run_id="run-1")
+    second = cache.get_prices(["SPY", "FAIL"], fetch, run_id="run-1")
+
+    assert first == second == {"SPY": 100.0}
+    assert fetch.calls == [["SPY", "FAIL"], ["FAIL"]]
+
+
+def test_fetches_are_single_flight_per_symbol() -> None:
+    cache = PriceSnapshotCache()
+    spy_started, qqq_fetched = threading.Event(), threading.Event()
+    calls: list[list[str]] = []
+
+    def fetch(symbols: list[str]) -> dict[str, float | None]:
+        calls.append(symbols)
+        if symbols == ["SPY"]:
+            spy_started.set()
+            # Blocks until an unrelated fetch has gone through
+            assert qqq_fetched.wait(5)
+        else:
+            qqq_fetched.set()
+        return dict.fromkeys(symbols, 100.0)
+
+    results: list[dict[str, float]] = []
+    first = threading.Thread(target=lambda: results.append(cache.get_prices(["SPY"], fetch)))
+    first.start()
+    assert spy_started.wait(5)
+    second = threading.Thread(target=lambda: results.append(cache.get_prices(["SPY"], fetch)))
+    second.start()
+    cache.get_prices(["QQQ"], fetch)
+    first.join(5)
+    second.join(5)
+
+    assert calls == [["SPY"], ["QQQ"]]
+    assert results == [{"SPY": 100.0}, {"SPY": 100.0}]
+
+
+class FailingChunkClient:
+    """Latest quote/trade client whose requests containing BAD fail permanently."""
+
+    def get_stock_latest_quote(self, request: Any) -> dict[str, Any]:  # noqa: ANN401
+        return self._respond(request, bid_price=10.0, ask_price=10.2)
+
+    def get_stock_latest_trade(self, request: Any) -> dict[str, Any]:  # noqa: ANN401
+        return self._respond(request, price=10.1)
+
+    def _respond(self, request: Any, **fields: float) -> dict[str, Any]:  # noqa: ANN401
+        if "BAD" in request.symbol_or_symbols:
+            raise ValueError("invalid symbol: BAD")
+        return {symbol: SimpleNamespace(**fields) for symbol in request.symbol_or_symbols}
+
+
+def test_failed_chunk_leaves_only_its_symbols_unpriced(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(market_data_service, "PRICE_SNAPSHOT_CHUNK_SIZE", 1)
+    repo = SimpleNamespace(get_data_client=FailingChunkClient)
+    service = MarketDataService(repo, price_cache=PriceSnapshotCache())  # type: ignore[arg-type]
+
+    prices = service.get_current_prices(["SPY", "BAD", "QQQ"])
+
+    assert prices == {"SPY": pytest.approx(10.1), "QQQ": pytest.approx(10.1)}
+    assert prices.get("BAD") is None
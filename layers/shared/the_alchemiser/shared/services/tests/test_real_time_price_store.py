@@ -0,0 +1,129 @@
+"""Business Unit: shared | Status: current.
+
+Unit tests for the striped real-time price store.
+
+Tests:
+- Quote and trade ticks surface through the model views
+- Views are cached until the next tick of their kind
+- Best-price priority and spread validation
+- Concurrent writers never expose a torn quote to readers
+"""
+
+from __future__ import annotations
+
+import threading
+import warnings
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+
+from the_alchemiser.shared.services.real_time_price_store import RealTimePriceStore
+
+NOW = datetime(2026, 1, 5, 15, 30, tzinfo=UTC)
+
+
+def test_quote_then_trade_views() -> None:
+    store = RealTimePriceStore()
+    store.update_quote_data("SPY", Decimal("100"), Decimal("100.10"), None, Decimal("3"), NOW)
+    store.update_trade_data("SPY", Decimal("100.05"), NOW, Decimal("250"))
+
+    quote = store.get_quote_data("SPY")
+    price = store.get_price_data("SPY")
+
+    assert quote is not None
+    assert (quote.bid_price, quote.ask_price) == (Decimal("100"), Decimal("100.10"))
+    assert (quote.bid_size, quote.ask_size) == (Decimal("0"), Decimal("3"))
+    assert price is not None
+    assert price.price == Decimal("100.05")
+    assert (price.bid, price.ask, price.volume) == (Decimal("100"), Decimal("100.10"), 250)
+    assert store.get_real_time_price("SPY") == Decimal("100.05")
+    assert store.get_stats() == {
+        "symbols_tracked": 1,
+        "symbols_tracked_structured_prices": 1,
+        "symbols_tracked_structured_quotes": 1,
+    }
+
+
+def test_trade_only_symbol() -> None:
+    store = RealTimePriceStore()
+    store.update_trade_data("QQQ", Decimal("400"), NOW, None)
+
+    assert store.get_quote_data("QQQ") is None
+    assert store.get_bid_ask_spread("QQQ") is None
+    assert store.get_real_time_price("QQQ") == Decimal("400")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        legacy = store.get_real_time_quote("QQQ")
+    assert legacy is not None
+    assert (legacy.bid, legacy.ask, legacy.last_price) == (0.0, 0.0, 400.0)
+
+
+def test_views_are_cached_until_next_tick() -> None:
+    store = RealTimePriceStore()
+    store.update_quote_data("SPY", Decimal("1"), Decimal("2"), None, None, NOW)
+
+    first = store.get_quote_data("SPY")
+    store.update_trade_data("SPY", Decimal("1.5"), NOW, None)
+
+    assert store.get_quote_data("SPY") is first
+
+    store.update_quote_data("SPY", Decimal("1.1"), Decimal("2"), None, None, NOW)
+    refreshed = store.get_quote_data("SPY")
+
+    assert refreshed is not first
+    assert refreshed is not None
+    assert refreshed.bid_price == Decimal("1.1")
+
+
+def test_crossed_quote_has_no_spread() -> None:
+    store = RealTimePriceStore()
+    store.update_quote_data("SPY", Decimal("2"), Decimal("1"), None, None, NOW)
+
+    assert store.get_bid_ask_spread("SPY") is None
+    assert store.get_real_time_price("SPY") == Decimal("1.5")
+
+
+def test_rejects_invalid_ticks() -> None:
+    store = RealTimePriceStore()
+
+    with pytest.raises(ValueError, match="negative"):
+        store.update_quote_data("SPY", Decimal("-1"), Decimal("1"), None, None, NOW)
+    with pytest.raises(ValueError, match="timezone-aware"):
+        store.update_trade_data("SPY", Decimal("1"), datetime(2026, 1, 5), None)  # noqa: DTZ001
+    with pytest.raises(ValueError, match="power of two"):
+        RealTimePriceStore(lock_stripes=3)
+
+
+def test_concurrent_readers_never_see_torn_quotes() -> None:
+    store = RealTimePriceStore(lock_stripes=2)
+    symbols = [f"S{i}" for i in range(8)]
+    stop = threading.Event()
+    torn: list[tuple[Decimal, Decimal]] = []
+
+    def write(offset: int) -> None:
+        tick = offset
+        while not stop.is_set():
+            for symbol in symbols:
+                # Every write keeps ask == bid + 1
+                bid = Decimal(tick)
+                store.update_quote_data(symbol, bid, bid + 1, None, None, NOW)
+                tick += 2
+
+    def read() -> None:
+        while not stop.is_set():
+            for symbol in symbols:
+                quote = store.get_quote_data(symbol)
+                if quote is not None and quote.ask_price - quote.bid_price != 1:
+                    torn.append((quote.bid_price, quote.ask_price))
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(2)]
+    threads += [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    stop.wait(0.5)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert torn == []
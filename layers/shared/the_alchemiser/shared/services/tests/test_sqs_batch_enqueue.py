@@ -0,0 +1,133 @@
+"""Business Unit: shared | Status: current.
+
+Unit tests for batched trade message enqueue.
+
+Tests:
+- Batches of at most 10 entries, one API call per batch
+- Only failed entries are retried
+- Sender faults are not retried; whole-request errors retry the batch
+- Accepted trade IDs keep input order
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from the_alchemiser.shared.services import sqs_batch_enqueue
+from the_alchemiser.shared.services.sqs_batch_enqueue import (
+    SQS_MAX_BATCH_ENTRIES,
+    TradeQueueEntry,
+    enqueue_trade_messages,
+    pack_batches,
+)
+from the_alchemiser.shared.services.tests.fake_sqs import FakeSQS
+
+QUEUE_URL = "https://sqs.local/execution.fifo"
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sqs_batch_enqueue, "BASE_RETRY_SLEEP_SECONDS", 0.0)
+
+
+def _entries(count: int, body: str = "{}") -> list[TradeQueueEntry]:
+    return [
+        TradeQueueEntry(
+            trade_id=f"trade-{i}",
+            message_body=body,
+            group_id=f"SYM{i}",
+            run_id="run-1",
+            phase="SELL",
+        )
+        for i in range(count)
+    ]
+
+
+class TestEnqueueTradeMessages:
+    """Test suite for enqueue_trade_messages."""
+
+    def test_packs_entries_into_batches_of_ten(self) -> None:
+        sqs = FakeSQS()
+        entries = _entries(37)
+
+        result = enqueue_trade_messages(sqs, QUEUE_URL, entries)
+
+        assert sqs.calls == {"send_message_batch": 4}
+        assert result.api_calls == 4
+        assert result.enqueued == [e.trade_id for e in entries]
+        assert not result.failed
+        assert sorted(m["Id"] for m in sqs.messages) == sorted(e.trade_id for e in entries)
+
+    def test_batch_entry_carries_fifo_fields(self) -> None:
+        sqs = FakeSQS()
+
+        enqueue_trade_messages(sqs, QUEUE_URL, _entries(1))
+
+        message = sqs.messages[0]
+        assert message["MessageDeduplicationId"] == "trade-0"
+        assert message["MessageGroupId"] == "SYM0"
+        assert message["MessageAttributes"]["Phase"]["StringValue"] == "SELL"
+        assert message["MessageAttributes"]["RunId"]["StringValue"] == "run-1"
+
+    def test_retries_only_failed_entries(self) -> None:
+        sqs = FakeSQS(fail_times={"trade-3": 1, "trade-12": 2})
+        entries = _entries(20)
+
+        result = enqueue_trade_messages(sqs, QUEUE_URL, entries, max_concurrent_batches=1)
+
+        # Two initial batches, one retry for each failing batch, a second for trade-12
+        assert result.api_calls == 5
+        assert not result.failed
+        assert result.enqueued == [e.trade_id for e in entries]
+        assert len(sqs.messages) == 20
+
+    def test_sender_fault_is_not_retried(self) -> None:
+        sqs = FakeSQS(sender_faults={"trade-1"})
+
+        result = enqueue_trade_messages(sqs, QUEUE_URL, _entries(3))
+
+        assert result.api_calls == 1
+        assert set(result.failed) == {"trade-1"}
+        assert result.enqueued == ["trade-0", "trade-2"]
+
+    def test_exhausted_retries_are_reported(self) -> None:
+        sqs = FakeSQS(fail_times={"trade-0": 10})
+
+        result = enqueue_trade_messages(sqs, QUEUE_URL, _entries(2), max_attempts=3)
+
+        assert result.api_calls == 3
+        assert set(result.failed) == {"trade-0"}
+        assert result.enqueued == ["trade-1"]
+
+    def test_request_error_retries_whole_batch(self) -> None:
+        sqs = FakeSQS(raise_on_call={1})
+
+        result = enqueue_trade_messages(sqs, QUEUE_URL, _entries(5))
+
+        assert result.api_calls == 2
+        assert not result.failed
+        assert len(result.enqueued) == 5
+
+    def test_empty_input_makes_no_calls(self) -> None:
+        sqs = FakeSQS()
+
+        result = enqueue_trade_messages(sqs, QUEUE_URL, [])
+
+        assert result.api_calls == 0
+        assert not sqs.calls
+
+
+class TestPackBatches:
+    """Test suite for pack_batches."""
+
+    def test_splits_on_entry_count(self) -> None:
+        batches = pack_batches(_entries(25))
+
+        assert [len(b) for b in batches] == [SQS_MAX_BATCH_ENTRIES, SQS_MAX_BATCH_ENTRIES, 5]
+
+    def test_splits_on_payload_size(self) -> None:
+        body = "x" * 100_000
+
+        batches = pack_batches(_entries(5, body))
+
+        assert [len(b) for b in batches] == [2, 2, 1]
@@ -17,16 +17,35 @@ from typing import Any
 import boto3
 
 from the_alchemiser.shared.config.config import load_settings
+from the_alchemiser.shared.errors.exceptions import PortfolioError
 from the_alchemiser.shared.logging import get_logger
 from the_alchemiser.shared.schemas.rebalance_plan import RebalancePlan
 from the_alchemiser.shared.schemas.trade_message import TradeMessage
 from the_alchemiser.shared.services.execution_run_service import ExecutionRunService
+from the_alchemiser.shared.services.sqs_batch_enqueue import (
+    TradeQueueEntry,
+    enqueue_trade_messages,
+)
 
 logger = get_logger(__name__)
 
 MODULE_NAME = "shared.services.trade_enqueue_service"
 
 
+def _queue_entries(messages: list[TradeMessage], run_id: str) -> list[TradeQueueEntry]:
+    """Build FIFO queue entries for trade messages."""
+    return [
+        TradeQueueEntry(
+            trade_id=msg.trade_id,
+            message_body=msg.to_sqs_message_body(),
+            group_id=msg.symbol,
+            run_id=run_id,
+            phase=msg.phase,
+        )
+        for msg in messages
+    ]
+
+
 def enqueue_rebalance_trades(
     rebalance_plan: RebalancePlan,
     correlation_id: str,
@@ -44,6 +63,7 @@ def enqueue_rebalance_trades(
     1. Creates TradeMessage for each BUY/SELL item (skips HOLD)
     2. Creates run state entry in DynamoDB (BUY trades stored with status=WAITING)
     3. Enqueues only SELL trades to SQS FIFO queue (MessageGroupId + MessageDeduplicationId)
+       with batched, concurrent SendMessageBatch requests
     4. When last SELL completes, Execution Lambda enqueues BUY trades
     5. Multiple Lambda invocations process BUYs in parallel
 
@@ -60,6 +80,10 @@ def enqueue_rebalance_trades(
     Returns:
         Number of trades enqueued.
 
+    Raises:
+        PortfolioError: If any trade message could not be enqueued (the run
+            is marked FAILED).
+
     """
     run_id = str(uuid.uuid4())
     run_timestamp = datetime.now(UTC)
@@ -168,7 +192,6 @@ def enqueue_rebalance_trades(
     )
 
     sqs_client = boto3.client("sqs")
-    enqueued_count = 0
 
     # Handle edge case: 0 SELLs means go directly to BUY phase
     if len(sell_trades) == 0 and len(buy_trades) > 0:
@@ -182,73 +205,52 @@ def enqueue_rebalance_trades(
         )
         run_service.transition_to_buy_phase(run_id)
 
-        try:
-            for msg in buy_trades:
-                sqs_client.send_message(
-                    QueueUrl=queue_url,
-                    MessageBody=msg.to_sqs_message_body(),
-                    MessageDeduplicationId=msg.trade_id,
-                    MessageGroupId=msg.symbol,
-                    MessageAttributes={
-                        "RunId": {"DataType": "String", "StringValue": run_id},
-                        "TradeId": {"DataType": "String", "StringValue": msg.trade_id},
-                        "Phase": {"DataType": "String", "StringValue": msg.phase},
-                    },
-                )
-                enqueued_count += 1
-
-            run_service.mark_buy_trades_pending(run_id, [t.trade_id for t in buy_trades])
-
-            logger.info(
-                "Enqueued BUY trades directly (0 SELLs scenario)",
-                extra={
-                    "run_id": run_id,
-                    "correlation_id": correlation_id,
-                    "buy_enqueued": len(buy_trades),
-                },
-            )
-            return enqueued_count
-
-        except Exception as enqueue_error:
+        result = enqueue_trade_messages(sqs_client, queue_url, _queue_entries(buy_trades, run_id))
+        if result.failed:
             logger.error(
-                f"SQS enqueue failed for BUY trades: {enqueue_error}",
+                f"SQS enqueue failed for {len(result.failed)}/{len(buy_trades)} BUY messages",
                 extra={
                     "run_id": run_id,
                     "correlation_id": correlation_id,
-                    "enqueued_count": enqueued_count,
+                    "enqueued_count": len(result.enqueued),
                     "total_buys": len(buy_trades),
+                    "failed_trades": result.failed,
                 },
             )
             run_service.update_run_status(run_id, "FAILED")
-            raise
-
-    # Normal two-phase: enqueue SELL trades first
-    try:
-        for msg in sell_trades:
-            sqs_client.send_message(
-                QueueUrl=queue_url,
-                MessageBody=msg.to_sqs_message_body(),
-                MessageDeduplicationId=msg.trade_id,
-                MessageGroupId=msg.symbol,
-                MessageAttributes={
-                    "RunId": {"DataType": "String", "StringValue": run_id},
-                    "TradeId": {"DataType": "String", "StringValue": msg.trade_id},
-                    "Phase": {"DataType": "String", "StringValue": msg.phase},
-                },
+            raise PortfolioError(
+                f"SQS enqueue failed for {len(result.failed)} BUY trades of run {run_id}",
+                module=MODULE_NAME,
+                operation="enqueue_rebalance_trades",
+                correlation_id=correlation_id,
             )
-            enqueued_count += 1
 
-    except Exception as enqueue_error:
+        run_service.mark_buy_trades_pending(run_id, result.enqueued)
+
+        logger.info(
+            "Enqueued BUY trades directly (0 SELLs scenario)",
+            extra={
+                "run_id": run_id,
+                "correlation_id": correlation_id,
+                "buy_enqueued": len(result.enqueued),
+                "api_calls": result.api_calls,
+            },
+        )
+        return len(result.enqueued)
+
+    # Normal two-phase: enqueue SELL trades first
+    result = enqueue_trade_messages(sqs_client, queue_url, _queue_entries(sell_trades, run_id))
+    enqueued_count = len(result.enqueued)
+    if result.failed:
         logger.error(
-            f"SQS enqueue failed after {enqueued_count}/{len(sell_trades)} SELL messages: {enqueue_error}",
+            f"SQS enqueue failed for {len(result.failed)}/{len(sell_trades)} SELL messages",
             extra={
                 "run_id": run_id,
                 "correlation_id": correlation_id,
                 "enqueued_count": enqueued_count,
                 "total_sells": len(sell_trades),
                 "total_buys": len(buy_trades),
-                "error_type": type(enqueue_error).__name__,
-                "error_details": str(enqueue_error),
+                "failed_trades": result.failed,
             },
         )
         try:
@@ -262,7 +264,12 @@ def enqueue_rebalance_trades(
                 f"Failed to mark run as FAILED: {status_error}",
                 extra={"run_id": run_id, "correlation_id": correlation_id},
             )
-        raise
+        raise PortfolioError(
+            f"SQS enqueue failed for {len(result.failed)} SELL trades of run {run_id}",
+            module=MODULE_NAME,
+            operation="enqueue_rebalance_trades",
+            correlation_id=correlation_id,
+        )
 
     logger.info(
         "Enqueued SELL trades for parallel execution (BUYs waiting for SELL completion)",
@@ -272,6 +279,7 @@ def enqueue_rebalance_trades(
             "total_trades": len(trade_messages),
             "sell_enqueued": len(sell_trades),
             "buy_waiting": len(buy_trades),
+            "api_calls": result.api_calls,
             "execution_mode": "two_phase_parallel",
         },
     )
@@ -5,6 +5,8 @@ WebSocket Connection Manager for Alpaca Trading.
 Centralizes ALL WebSocket connections to prevent connection limit exceeded errors
 by ensuring only one connection of each type exists per credentials.
 Manages both StockDataStream (pricing) and TradingStream (order updates).
+Every trade update is also fed to the manager's OrderUpdateDispatcher, so
+any number of waiters can await order states from the one stream.
 
 Thread Safety:
     All public methods are thread-safe. Uses locks to protect shared state.
@@ -25,6 +27,7 @@ from the_alchemiser.shared.errors.exceptions import (
     WebSocketError,
 )
 from the_alchemiser.shared.logging import get_logger
+from the_alchemiser.shared.services.order_update_dispatcher import OrderUpdateDispatcher
 from the_alchemiser.shared.services.real_time_pricing import RealTimePricingService
 
 logger = get_logger(__name__)
@@ -160,6 +163,9 @@ class WebSocketConnectionManager:
         # Shared locks
         self._service_lock = threading.Lock()
         self._trading_lock = threading.Lock()
+
+        # Routes trade updates to per-order waiters
+        self._order_updates = OrderUpdateDispatcher(is_connected=self.is_trading_stream_connected)
         self._initialized: bool = True
 
         logger.debug(
@@ -288,7 +294,7 @@ class WebSocketConnectionManager:
                         self._api_key, self._secret_key, paper=self._paper_trading
                     )
                     self._trading_callback = callback
-                    self._trading_stream.subscribe_trade_updates(callback)
+                    self._trading_stream.subscribe_trade_updates(self._on_trade_update)
 
                     # Extract runner to module level for better testability
                     def _runner() -> None:
@@ -356,6 +362,18 @@ class WebSocketConnectionManager:
             )
             return self._trading_ws_connected
 
+    @property
+    def order_updates(self) -> OrderUpdateDispatcher:
+        """Dispatcher fed by the shared TradingStream."""
+        return self._order_updates
+
+    async def _on_trade_update(self, data: object) -> None:
+        """Fan a trade update out to the dispatcher and the registered callback."""
+        self._order_updates.dispatch(data)
+        callback = self._trading_callback
+        if callback is not None:
+            await callback(data)
+
     def release_trading_service(self, correlation_id: str | None = None) -> None:
         """Release a reference to the trading service.
 
@@ -447,6 +465,20 @@ class WebSocketConnectionManager:
         with self._trading_lock:
             return self._trading_stream is not None and self._trading_ws_connected
 
+    def is_trading_stream_connected(self) -> bool:
+        """Check if the TradingStream websocket is connected and authenticated.
+
+        Unlike is_trading_service_available, this is False while the stream
+        thread is (re)connecting. TradingStream sets ``_running`` once its
+        websocket is authenticated and clears it when the connection drops,
+        including when websocket keepalive pings go unanswered.
+        """
+        with self._trading_lock:
+            stream = self._trading_stream
+            if stream is None or not self._trading_ws_connected:
+                return False
+        return bool(getattr(stream, "_running", False))
+
     def get_service_stats(self) -> dict[str, Any]:
         """Get statistics from both pricing and trading services."""
         stats: dict[str, Any] = {}
@@ -29,15 +29,22 @@ Known Implementations:
     - MarketDataService: Production implementation using Alpaca API
     - HistoricalMarketDataPort: Backtesting implementation using stored data
 
+ColumnarMarketDataPort extends the port with float64 close arrays for
+indicator computation; CachedMarketDataAdapter implements it.
+
 """
 
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+from datetime import date
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 from the_alchemiser.shared.types.market_data import BarModel, QuoteModel
 from the_alchemiser.shared.value_objects.symbol import Symbol
 
+if TYPE_CHECKING:
+    from the_alchemiser.shared.data_v2.columnar_bar_store import CloseArray
+
 
 @runtime_checkable
 class MarketDataPort(Protocol):
@@ -168,3 +175,42 @@ class MarketDataPort(Protocol):
 
         """
         ...
+
+
+@runtime_checkable
+class ColumnarMarketDataPort(MarketDataPort, Protocol):
+    """MarketDataPort extension serving closes as float64 arrays.
+
+    For float-only analytics (technical indicators) that would otherwise
+    materialize a BarModel per bar only to convert each close back to float.
+    Callers needing Decimal precision should keep using get_bars.
+    """
+
+    def get_close_array(
+        self,
+        symbol: Symbol,
+        as_of: date | None = None,
+        period: str = "MAX",
+        tail_rows: int | None = None,
+    ) -> CloseArray | None:
+        """Get daily closes as a float64 array with a timestamp index.
+
+        Args:
+            symbol: Trading symbol
+            as_of: Optional inclusive cutoff on the bar's UTC date, for
+                point-in-time (historical) evaluation
+            period: Lookback period, same format and semantics as get_bars
+                (e.g. "1Y", "90D", "MAX")
+            tail_rows: Optional number of latest bars of the lookback period
+                to return (applied before as_of); implementations may then
+                skip reading older history
+
+        Returns:
+            CloseArray ordered oldest first (possibly empty), or None if no
+            data is available for the symbol
+
+        Raises:
+            ValueError: If symbol or period format is invalid
+
+        """
+        ...
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Business Unit: scripts | Status: current.
+
+Backtest a strategy with the vectorized engine.
+
+Runs ``VectorizedBacktestEngine`` over a date range and prints the equity
+curve summary and evaluation throughput. With ``--verify-every N`` every Nth
+decision date is also evaluated with DslEvaluator (the live signal path) and
+the weights are compared; any mismatch is printed and the script exits
+non-zero, so a backtest is only trusted where the engines agree.
+
+Market data comes from the S3 market data bucket by default, or from
+deterministic synthetic histories with ``--synthetic`` (fully offline, as in
+benchmark_engine.py).
+
+Usage:
+    poetry run python scripts/backtest_strategy.py ftlt/holy_grail
+    poetry run python scripts/backtest_strategy.py defence --start 2024-01-01 --cost-bps 5
+    poetry run python scripts/backtest_strategy.py kmlm_switcher --verify-every 20
+    poetry run python scripts/backtest_strategy.py gold_and_miners --synthetic --weights-csv w.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import os
+import sys
+import tempfile
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+# Set environment variables for S3 market data access
+os.environ.setdefault("MARKET_DATA_BUCKET", "alchemiser-dev-market-data")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+# Add functions/strategy_worker to path for imports
+strategy_worker_path = Path(__file__).parent.parent / "functions" / "strategy_worker"
+sys.path.insert(0, str(strategy_worker_path))
+
+# Add layers/shared to path for shared imports
+shared_layer_path = Path(__file__).parent.parent / "layers" / "shared"
+sys.path.insert(0, str(shared_layer_path))
+
+STRATEGIES_PATH = shared_layer_path / "the_alchemiser" / "shared" / "strategies"
+
+# Trading days of synthetic history per symbol with --synthetic (~4 years)
+SYNTHETIC_HISTORY_DAYS = 1000
+
+# Absolute weight difference tolerated by --verify-every
+VERIFY_TOLERANCE = 1e-9
+
+
+def make_adapter(store: Any = None) -> Any:  # noqa: ANN401
+    """Create a columnar CachedMarketDataAdapter that always serves full history.
+
+    DslEvaluator sizes indicator lookbacks relative to today, so evaluating
+    it as of an old date would otherwise see less history than the backtest
+    (as in debug_strategy_historical.py, the period is ignored).
+    """
+    from the_alchemiser.shared.data_v2.cached_market_data_adapter import CachedMarketDataAdapter
+    from the_alchemiser.shared.data_v2.columnar_bar_store import ColumnarBarStore
+
+    class FullHistoryAdapter(CachedMarketDataAdapter):
+        """CachedMarketDataAdapter reading every bar regardless of period."""
+
+        def get_bars(self, symbol: Any, period: str, timeframe: str) -> Any:  # noqa: ANN401
+            return super().get_bars(symbol, "MAX", timeframe)
+
+        def get_close_array(
+            self,
+            symbol: Any,  # noqa: ANN401
+            as_of: date | None = None,
+            period: str = "MAX",
+            tail_rows: int | None = None,
+        ) -> Any:  # noqa: ANN401
+            return super().get_close_array(symbol, as_of=as_of, period="MAX", tail_rows=tail_rows)
+
+    return FullHistoryAdapter(store, bar_store=ColumnarBarStore())
+
+
+def verify(
+    ast: Any,  # noqa: ANN401
+    adapter: Any,  # noqa: ANN401
+    weights: Any,  # noqa: ANN401
+    every: int,
+) -> list[str]:
+    """Compare backtest weights with DslEvaluator on every Nth decision date.
+
+    A date the evaluator cannot allocate must be invalid in the backtest.
+
+    Returns:
+        One message per mismatching date
+
+    """
+    from engines.dsl.dsl_evaluator import DslEvaluator
+    from engines.dsl.types import DslEvaluationError
+    from indicators.indicator_service import IndicatorService
+
+    service = IndicatorService(adapter)
+    evaluator = DslEvaluator(service)
+    mismatches: list[str] = []
+    for timestamp in weights.index[::every]:
+        day = timestamp.date()
+        service.as_of_date = day
+        try:
+            allocation, _ = evaluator.evaluate(ast, f"backtest-verify-{day}")
+            expected: dict[str, float] | None = {
+                symbol: float(w) for symbol, w in allocation.target_weights.items() if w > 0
+            }
+        except DslEvaluationError:
+            expected = None
+
+        row = weights.loc[timestamp]
+        actual = (
+            None
+            if row.isna().all()
+            else {str(symbol): float(w) for symbol, w in row.items() if w > 0}
+        )
+        if expected is None or actual is None:
+            if expected != actual:
+                mismatches.append(f"{day}: backtest {actual} evaluator {expected}")
+            continue
+        if actual.keys() != expected.keys() or any(
+            not math.isclose(actual[s], w, rel_tol=0.0, abs_tol=VERIFY_TOLERANCE)
+            for s, w in expected.items()
+        ):
+            mismatches.append(f"{day}: backtest {actual} evaluator {expected}")
+    return mismatches
+
+
+def main() -> None:
+    """Run the backtest."""
+    parser = argparse.ArgumentParser(description="Backtest a strategy with the vectorized engine")
+    parser.add_argument("strategy", help="Strategy path under the strategies directory, no .clj")
+    parser.add_argument("--start", type=date.fromisoformat, help="First decision date")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last decision date")
+    parser.add_argument(
+        "--cost-bps", type=float, default=0.0, help="Cost in bps charged on daily turnover"
+    )
+    parser.add_argument("--weights-csv", type=Path, help="Write daily target weights to this CSV")
+    parser.add_argument(
+        "--verify-every",
+        type=int,
+        default=0,
+        help="Check every Nth decision date against DslEvaluator (default: off)",
+    )
+    parser.add_argument(
+        "--synthetic", action="store_true", help="Use synthetic market data (offline)"
+    )
+    args = parser.parse_args()
+
+    # Deeply nested strategies exceed the default recursion limit
+    sys.setrecursionlimit(10000)
+    logging.disable(logging.INFO)
+
+    strategy_file = STRATEGIES_PATH / f"{args.strategy}.clj"
+    if not strategy_file.is_file():
+        print(f"Strategy not found: {strategy_file}")
+        sys.exit(1)
+
+    from engines.backtest import VectorizedBacktestEngine
+    from engines.dsl.sexpr_parser import SexprParser
+
+    ast = SexprParser().parse(strategy_file.read_text(encoding="utf-8"))
+
+    with tempfile.TemporaryDirectory(prefix="dsl-backtest-") as tmp:
+        if args.synthetic:
+            from benchmark_engine import (
+                _AWS_BACKED_ENV,
+                collect_symbols,
+                make_store,
+                write_synthetic_data,
+            )
+
+            for name in _AWS_BACKED_ENV:
+                os.environ.pop(name, None)
+            end = datetime.now(UTC).date() - timedelta(days=1)
+            symbols = collect_symbols([strategy_file])[strategy_file]
+            write_synthetic_data(Path(tmp), symbols, end, SYNTHETIC_HISTORY_DAYS)
+            adapter = make_adapter(make_store(Path(tmp)))
+        else:
+            adapter = make_adapter()
+
+        result = VectorizedBacktestEngine(adapter).run(
+            ast, start=args.start, end=args.end, cost_bps=args.cost_bps
+        )
+        mismatches = (
+            verify(ast, adapter, result.weights, args.verify_every) if args.verify_every else []
+        )
+
+    print(f"\n{args.strategy}: {result.strategy_days} days", end="")
+    if result.strategy_days:
+        first, last = result.weights.index[0].date(), result.weights.index[-1].date()
+        print(f" ({first} to {last})", end="")
+    print(f" in {result.elapsed_seconds:.2f}s ({result.strategy_days_per_second:,.0f} days/s)")
+    for name, value in result.summary().items():
+        print(f"  {name:<22} {value:>10.4f}")
+
+    if args.weights_csv:
+        result.weights.to_csv(args.weights_csv)
+        print(f"\nWeights written to {args.weights_csv}")
+
+    if args.verify_every:
+        checked = len(result.weights.index[:: args.verify_every])
+        print(f"\nVerified {checked} dates against DslEvaluator: {len(mismatches)} mismatches")
+        for message in mismatches:
+            print(f"  {message}")
+        if mismatches:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""Business Unit: scripts | Status: current.
+
+Benchmark the DSL engine over the bundled strategies with synthetic market data.
+
+Runs fully offline. Every symbol referenced by the ``.clj`` files in the shared
+strategies directory gets a deterministic synthetic daily history (seeded from
+the symbol name), written through the real ``MarketDataStore`` into a local
+directory that stands in for the S3 bucket. Strategies then read it through
+the production path: MarketDataStore -> CachedMarketDataAdapter ->
+IndicatorService -> DslEvaluator, including group scoring. The DynamoDB group
+history cache and the shared indicator result store are disabled.
+
+Each strategy runs in a fresh process so peak RSS is per strategy. Per strategy
+this measures:
+
+- parse time (best of ``--repeat``)
+- cold evaluation time (first evaluation, includes parquet decoding)
+- warm evaluation time (best of ``--repeat`` with fresh indicator/evaluator
+  state over already-decoded market data)
+- indicator calls (total and computed) and dispatched operator frames, from
+  one extra profiled evaluation
+- peak RSS of the strategy's process
+- the resulting allocation, so behavioural changes show up next to timing ones
+
+Every run is compared against the committed baseline
+(``benchmarks/dsl_engine.json``, or ``--baseline``): timings beyond
+``--tolerance`` (and ``--min-delta-ms``) count as regressions and exit
+non-zero; changed indicator counts or allocations are reported. Timings are
+only comparable on similar hardware, so the baseline's Python version and
+machine are printed next to the run's. After an intended change (or on new
+hardware), refresh the baseline with ``--save-baseline``.
+
+Usage:
+    poetry run python scripts/benchmark_engine.py
+    poetry run python scripts/benchmark_engine.py --filter ftl --repeat 5
+    poetry run python scripts/benchmark_engine.py --no-baseline --json /tmp/run.json
+    poetry run python scripts/benchmark_engine.py --save-baseline benchmarks/dsl_engine.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import zlib
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from multiprocessing import get_context
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+# Add functions/strategy_worker to path for imports
+strategy_worker_path = Path(__file__).parent.parent / "functions" / "strategy_worker"
+sys.path.insert(0, str(strategy_worker_path))
+
+# Add layers/shared to path for shared imports
+shared_layer_path = Path(__file__).parent.parent / "layers" / "shared"
+sys.path.insert(0, str(shared_layer_path))
+
+STRATEGIES_PATH = shared_layer_path / "the_alchemiser" / "shared" / "strategies"
+
+# Committed baseline every run is compared against
+DEFAULT_BASELINE = Path(__file__).parent.parent / "benchmarks" / "dsl_engine.json"
+
+# Bucket name recorded in the local store (never contacted)
+SYNTHETIC_BUCKET = "synthetic-benchmark"
+
+# Trading days of synthetic history per symbol (~8 years)
+DEFAULT_HISTORY_DAYS = 2000
+
+# Timings compared against the baseline
+TIMING_FIELDS = ("parse_ms", "cold_eval_ms", "eval_ms")
+
+# Environment that would make the benchmark reach AWS
+_AWS_BACKED_ENV = ("GROUP_HISTORY_TABLE", "INDICATOR_RESULTS_TABLE", "INDICATOR_RESULTS_DIR")
+
+
+class _NoSuchKeyError(Exception):
+    """Raised by LocalS3Client for missing keys, like botocore's NoSuchKey."""
+
+
+class LocalS3Client:
+    """Directory-backed stand-in for the S3 calls MarketDataStore makes.
+
+    Keys map to files under ``root``; conditional-write arguments are accepted
+    and ignored (the benchmark is the only writer).
+    """
+
+    exceptions = SimpleNamespace(NoSuchKey=_NoSuchKeyError)
+
+    def __init__(self, root: Path) -> None:
+        """Initialize client over a directory."""
+        self.root = root
+
+    def get_object(self, Bucket: str, Key: str) -> dict[str, Any]:
+        """Return the object body and a content ETag."""
+        path = self.root / Key
+        if not path.is_file():
+            raise _NoSuchKeyError(Key)
+        body = path.read_bytes()
+        return {"Body": io.BytesIO(body), "ETag": f'"{zlib.crc32(body):08x}"'}
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **_: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Write the object body to its file."""
+        path = self.root / Key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(Body)
+        return {"ETag": f'"{zlib.crc32(Body):08x}"'}
+
+
+def make_store(data_dir: Path) -> Any:  # noqa: ANN401
+    """Create a MarketDataStore over the local directory with its own caches."""
+    from the_alchemiser.shared.data_v2.market_data_store import FrameCache, MarketDataStore
+
+    class LocalMarketDataStore(MarketDataStore):
+        """MarketDataStore whose /tmp parquet cache lives beside the local bucket."""
+
+        def _local_cache_path(self, symbol: str) -> Path:
+            cache_dir = data_dir / ".cache"
+            cache_dir.mkdir(exist_ok=True)
+            return cache_dir / f"{self._sanitize_symbol_for_path(symbol)}_daily.parquet"
+
+    return LocalMarketDataStore(
+        bucket_name=SYNTHETIC_BUCKET,
+        s3_client=LocalS3Client(data_dir / "bucket"),  # type: ignore[arg-type]
+        frame_cache=FrameCache(),
+    )
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> tuple[float, Any]:
+    """Run func repeatedly and return (best wall time in seconds, last result)."""
+    best = float("inf")
+    result: Any = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def find_strategies(strategies_dir: Path, name_filter: str | None) -> list[Path]:
+    """Return the .clj strategy files to benchmark, sorted."""
+    return [
+        path
+        for path in sorted(strategies_dir.rglob("*.clj"))
+        if "compiled" not in path.relative_to(strategies_dir).parts
+        and (not name_filter or name_filter in path.as_posix())
+    ]
+
+
+def synthetic_bars(symbol: str, end: date, days: int) -> Any:  # noqa: ANN401
+    """Generate a deterministic daily OHLCV history for a symbol.
+
+    A geometric random walk seeded from the symbol name, so every run (and
+    every machine) sees identical prices for the same ``end`` and ``days``.
+    """
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(zlib.crc32(symbol.encode("utf-8")))
+    sessions = pd.bdate_range(end=end, periods=days, tz="UTC") + pd.Timedelta(hours=5)
+    volatility = rng.uniform(0.005, 0.04)
+    log_returns = rng.normal(0.0003, volatility, size=days)
+    close = rng.uniform(20.0, 300.0) * np.exp(np.cumsum(log_returns))
+    open_ = close * np.exp(rng.normal(0.0, volatility / 4, size=days))
+    spread = np.abs(rng.normal(0.0, volatility / 2, size=days))
+    return pd.DataFrame(
+        {
+            "timestamp": sessions,
+            "open": open_,
+            "high": np.maximum(open_, close) * (1 + spread),
+            "low": np.minimum(open_, close) * (1 - spread),
+            "close": close,
+            "volume": rng.integers(100_000, 10_000_000, size=days),
+        }
+    )
+
+
+def write_synthetic_data(data_dir: Path, symbols: list[str], end: date, days: int) -> None:
+    """Write every symbol's history through MarketDataStore (data, metadata, manifest)."""
+    store = make_store(data_dir)
+    with store.batched_manifest_updates():
+        for symbol in symbols:
+            store.write_symbol_data(symbol, synthetic_bars(symbol, end, days))
+
+
+def collect_symbols(strategy_files: list[Path]) -> dict[Path, list[str]]:
+    """Parse every strategy and return the symbols each one references."""
+    from engines.dsl.sexpr_parser import SexprParser
+    from engines.dsl.symbol_collector import collect_strategy_symbols
+
+    parser = SexprParser()
+    return {
+        path: collect_strategy_symbols(parser.parse(path.read_text(encoding="utf-8")))
+        for path in strategy_files
+    }
+
+
+def peak_rss_mb() -> float:
+    """Return this process's peak resident set size in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    divisor = 1024 * 1024 if platform.system() == "Darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def benchmark_strategy(strategy_file: str, data_dir: str, repeat: int) -> dict[str, Any]:
+    """Benchmark one strategy (run in its own process)."""
+    from engines.dsl.dsl_evaluator import DslEvaluator
+    from engines.dsl.sexpr_parser import SexprParser
+    from indicators.indicator_service import IndicatorService
+
+    from the_alchemiser.shared.data_v2.cached_market_data_adapter import CachedMarketDataAdapter
+    from the_alchemiser.shared.data_v2.columnar_bar_store import ColumnarBarStore
+
+    # Deeply nested strategies exceed the default recursion limit
+    sys.setrecursionlimit(10000)
+    # Parser, indicator and evaluator log at INFO; keep benchmark output readable
+    logging.disable(logging.INFO)
+
+    path = Path(strategy_file)
+    text = path.read_text(encoding="utf-8")
+    parse_time, ast = best_of(repeat, lambda: SexprParser().parse(text))
+
+    adapter = CachedMarketDataAdapter(make_store(Path(data_dir)), bar_store=ColumnarBarStore())
+
+    def evaluate(*, profile: bool = False) -> tuple[Any, DslEvaluator]:
+        evaluator = DslEvaluator(IndicatorService(adapter), profile=profile)
+        allocation, _ = evaluator.evaluate(ast, f"benchmark-{path.stem}")
+        return allocation, evaluator
+
+    result: dict[str, Any] = {"parse_ms": round(parse_time * 1000, 3)}
+    try:
+        cold_time, (allocation, _) = best_of(1, evaluate)
+        eval_time, _ = best_of(repeat, evaluate)
+        _, profiled = evaluate(profile=True)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["peak_rss_mb"] = peak_rss_mb()
+        return result
+
+    profile = profiled.profiler.summary(top_n=0) if profiled.profiler is not None else {}
+    result.update(
+        {
+            "cold_eval_ms": round(cold_time * 1000, 3),
+            "eval_ms": round(eval_time * 1000, 3),
+            "indicator_calls": profile.get("indicator_calls"),
+            "indicator_hit_ratio": profile.get("indicator_hit_ratio"),
+            "indicators_computed": profile.get("indicators_computed"),
+            "frames": profile.get("frames"),
+            "peak_rss_mb": peak_rss_mb(),
+            "allocation": {
+                symbol: str(weight) for symbol, weight in sorted(allocation.target_weights.items())
+            },
+        }
+    )
+    return result
+
+
+def run_isolated(strategy_file: Path, data_dir: Path, repeat: int) -> dict[str, Any]:
+    """Run benchmark_strategy in a fresh spawned process."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(benchmark_strategy, str(strategy_file), str(data_dir), repeat).result()
+
+
+def compare(
+    results: list[dict[str, Any]],
+    baseline: dict[str, Any],
+    tolerance: float,
+    min_delta_ms: float,
+) -> list[str]:
+    """Print a comparison against a baseline run and return regression messages."""
+    previous = {entry["strategy"]: entry for entry in baseline.get("results", [])}
+    regressions: list[str] = []
+
+    print(f"\n{'strategy':<36} {'metric':<13} {'baseline':>10} {'current':>10} {'change':>8}")
+    for result in results:
+        before = previous.get(result["strategy"])
+        if before is None:
+            print(f"{result['strategy']:<36} (not in baseline)")
+            continue
+        for field in TIMING_FIELDS:
+            old, new = before.get(field), result.get(field)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0.0
+            flag = ""
+            if change > tolerance and new - old > min_delta_ms:
+                flag = "  REGRESSION"
+                regressions.append(f"{result['strategy']} {field}: {old:.1f}ms -> {new:.1f}ms")
+            print(
+                f"{result['strategy']:<36} {field:<13} {old:>8.1f}ms {new:>8.1f}ms "
+                f"{change:>+7.1%}{flag}"
+            )
+        if before.get("indicator_calls") != result.get("indicator_calls"):
+            print(
+                f"{result['strategy']:<36} indicator calls changed: "
+                f"{before.get('indicator_calls')} -> {result.get('indicator_calls')}"
+            )
+        if before.get("allocation") != result.get("allocation"):
+            print(f"{result['strategy']:<36} allocation changed")
+
+    return regressions
+
+
+def main() -> None:
+    """Run the engine benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the DSL engine on bundled strategies with synthetic data"
+    )
+    parser.add_argument(
+        "--strategies-dir",
+        type=Path,
+        default=STRATEGIES_PATH,
+        help="Strategies directory (default: shared layer strategies)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best of)")
+    parser.add_argument("--filter", help="Only benchmark strategies whose path contains this")
+    parser.add_argument(
+        "--days", type=int, default=DEFAULT_HISTORY_DAYS, help="Trading days of history"
+    )
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        help="Directory for the synthetic bucket (default: a temporary directory)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run strategies in this process (faster; peak RSS becomes cumulative)",
+    )
+    parser.add_argument("--json", type=Path, help="Write machine-readable results to this file")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Stored result file to compare against (default: benchmarks/dsl_engine.json)",
+    )
+    parser.add_argument(
+        "--no-baseline", action="store_true", help="Skip the comparison against the baseline"
+    )
+    parser.add_argument(
+        "--save-baseline", type=Path, help="Write results to this file as the new baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative slowdown counted as a regression (default: 0.2)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=5.0,
+        help="Ignore slowdowns smaller than this many ms (default: 5)",
+    )
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(10000)
+    logging.disable(logging.INFO)
+    # Read before --save-baseline may overwrite it
+    baseline: dict[str, Any] | None = None
+    if not args.no_baseline:
+        if args.baseline.is_file():
+            baseline = json.loads(args.baseline.read_text())
+        else:
+            print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+    # Keep group scoring and indicator sharing in-process; no AWS access
+    for name in _AWS_BACKED_ENV:
+        os.environ.pop(name, None)
+
+    strategy_files = find_strategies(args.strategies_dir, args.filter)
+    if not strategy_files:
+        print("No strategies matched")
+        sys.exit(1)
+
+    symbols_by_strategy = collect_symbols(strategy_files)
+    symbols = sorted({symbol for found in symbols_by_strategy.values() for symbol in found})
+    # Last completed session, so no bar looks like a partial bar for today
+    end = datetime.now(UTC).date() - timedelta(days=1)
+
+    with tempfile.TemporaryDirectory(prefix="dsl-benchmark-") as tmp:
+        data_dir = args.data_dir or Path(tmp)
+        started = time.perf_counter()
+        write_synthetic_data(data_dir, symbols, end, args.days)
+        print(
+            f"Synthetic data: {len(symbols)} symbols x {args.days} days "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+
+        results: list[dict[str, Any]] = []
+        for path in strategy_files:
+            relative = path.relative_to(args.strategies_dir).as_posix()
+            if args.in_process:
+                measured = benchmark_strategy(str(path), str(data_dir), args.repeat)
+            else:
+                measured = run_isolated(path, data_dir, args.repeat)
+            results.append(
+                {"strategy": relative, "symbols": len(symbols_by_strategy[path]), **measured}
+            )
+
+    print(
+        f"\n{'strategy':<36} {'symbols':>7} {'parse':>9} {'cold':>10} {'eval':>10} "
+        f"{'ind calls':>9} {'computed':>8} {'rss':>8}"
+    )
+    for r in results:
+        if "error" in r:
+            print(f"{r['strategy']:<36} ERROR {r['error']}")
+            continue
+        print(
+            f"{r['strategy']:<36} {r['symbols']:>7} {r['parse_ms']:>7.1f}ms "
+            f"{r['cold_eval_ms']:>8.1f}ms {r['eval_ms']:>8.1f}ms {r['indicator_calls']:>9,} "
+            f"{r['indicators_computed']:>8,} {r['peak_rss_mb']:>6.0f}MB"
+        )
+
+    ok = [r for r in results if "error" not in r]
+    print(
+        f"\nTotal: parse {sum(r['parse_ms'] for r in ok):.1f}ms, "
+        f"cold eval {sum(r['cold_eval_ms'] for r in ok):.1f}ms, "
+        f"warm eval {sum(r['eval_ms'] for r in ok):.1f}ms, "
+        f"{len(results) - len(ok)} failed"
+    )
+
+    report = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": args.repeat,
+        "history_days": args.days,
+        "isolated": not args.in_process,
+        "results": results,
+    }
+    for target in (args.json, args.save_baseline):
+        if target:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(json.dumps(report, indent=2))
+            print(f"Results written to {target}")
+
+    regressions: list[str] = []
+    if baseline is not None:
+        print(
+            f"\nBaseline {args.baseline} ({baseline.get('created_at')}): "
+            f"python {baseline.get('python')} on {baseline.get('machine')}, "
+            f"{baseline.get('history_days')} days; "
+            f"this run: python {report['python']} on {report['machine']}, {args.days} days"
+        )
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print("\nRegressions:")
+            for message in regressions:
+                print(f"  {message}")
+        else:
+            print(f"\nNo regressions beyond {args.tolerance:.0%} against the baseline")
+
+    if regressions or len(ok) != len(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Business Unit: scripts | Status: current.
+
+Benchmark the DSL S-expression parser over the bundled strategies.
+
+For every ``.clj`` file in the shared strategies directory this times:
+
+- tokenization with the sequential (per-pattern) tokenizer
+- tokenization with the single-pass master-regex scanner
+- a full parse (scanner tokenizer + trusted node construction)
+- loading the precompiled AST artifact, when one is present and current
+
+and checks that both tokenizers emit identical token streams and that the
+compiled artifact matches the parsed AST. Each timing is the best of
+``--repeat`` runs so the numbers are stable enough to compare across commits.
+
+Usage:
+    poetry run python scripts/benchmark_parser.py
+    poetry run python scripts/benchmark_parser.py --repeat 10 --filter ftl
+    poetry run python scripts/benchmark_parser.py --json results/parser_benchmark.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Add functions/strategy_worker to path for imports
+strategy_worker_path = Path(__file__).parent.parent / "functions" / "strategy_worker"
+sys.path.insert(0, str(strategy_worker_path))
+
+# Add layers/shared to path for shared imports
+shared_layer_path = Path(__file__).parent.parent / "layers" / "shared"
+sys.path.insert(0, str(shared_layer_path))
+
+STRATEGIES_PATH = shared_layer_path / "the_alchemiser" / "shared" / "strategies"
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> tuple[float, Any]:
+    """Run func repeatedly and return (best wall time in seconds, last result)."""
+    best = float("inf")
+    result: Any = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def count_nodes(ast: Any) -> int:  # noqa: ANN401
+    """Count nodes in an AST without recursing (strategies nest deeply)."""
+    count = 0
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children)
+    return count
+
+
+def benchmark_file(strategies_dir: Path, strategy_file: Path, repeat: int) -> dict[str, Any]:
+    """Benchmark tokenizing, parsing and compiled loading for one strategy file."""
+    from engines.dsl.compiled_ast import compiled_artifact_relpath, deserialize_ast
+    from engines.dsl.sexpr_parser import SexprParser
+
+    content = strategy_file.read_bytes()
+    text = content.decode("utf-8")
+    relative = strategy_file.relative_to(strategies_dir).as_posix()
+
+    sequential = SexprParser(tokenizer_mode="sequential")
+    scanner = SexprParser(tokenizer_mode="scanner")
+
+    sequential_time, sequential_tokens = best_of(repeat, lambda: sequential.tokenize(text))
+    scanner_time, scanner_tokens = best_of(repeat, lambda: scanner.tokenize(text))
+    parse_time, ast = best_of(repeat, lambda: scanner.parse(text))
+
+    result: dict[str, Any] = {
+        "strategy": relative,
+        "bytes": len(content),
+        "tokens": len(scanner_tokens),
+        "nodes": count_nodes(ast),
+        "tokenize_sequential_ms": round(sequential_time * 1000, 3),
+        "tokenize_scanner_ms": round(scanner_time * 1000, 3),
+        "parse_ms": round(parse_time * 1000, 3),
+        "tokens_match": sequential_tokens == scanner_tokens,
+        "compiled_ms": None,
+        "compiled_matches": None,
+    }
+
+    artifact = strategies_dir / compiled_artifact_relpath(relative)
+    if artifact.is_file():
+        data = artifact.read_bytes()
+        compiled_time, compiled = best_of(repeat, lambda: deserialize_ast(data, content))
+        if compiled is not None:
+            result["compiled_ms"] = round(compiled_time * 1000, 3)
+            result["compiled_matches"] = compiled == ast
+
+    return result
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the DSL parser on bundled strategies")
+    parser.add_argument(
+        "--strategies-dir",
+        type=Path,
+        default=STRATEGIES_PATH,
+        help="Strategies directory (default: shared layer strategies)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best of)")
+    parser.add_argument("--filter", help="Only benchmark strategies whose path contains this")
+    parser.add_argument("--json", type=Path, help="Write machine-readable results to this file")
+    args = parser.parse_args()
+
+    # Deeply nested strategies exceed the default recursion limit when parsed
+    sys.setrecursionlimit(10000)
+    # Parser logs every parse at INFO; keep benchmark output readable
+    logging.disable(logging.INFO)
+
+    strategy_files = [
+        path
+        for path in sorted(args.strategies_dir.rglob("*.clj"))
+        if "compiled" not in path.relative_to(args.strategies_dir).parts
+        and (not args.filter or args.filter in path.as_posix())
+    ]
+
+    results = [benchmark_file(args.strategies_dir, path, args.repeat) for path in strategy_files]
+
+    print(
+        f"\n{'strategy':<36} {'tokens':>8} {'seq tok':>9} {'scan tok':>9} "
+        f"{'parse':>9} {'compiled':>9}  parity"
+    )
+    for r in results:
+        compiled = f"{r['compiled_ms']:>7.1f}ms" if r["compiled_ms"] is not None else f"{'-':>9}"
+        parity = r["tokens_match"] and r["compiled_matches"] is not False
+        print(
+            f"{r['strategy']:<36} {r['tokens']:>8,} {r['tokenize_sequential_ms']:>7.1f}ms "
+            f"{r['tokenize_scanner_ms']:>7.1f}ms {r['parse_ms']:>7.1f}ms {compiled}  "
+            f"{'ok' if parity else 'MISMATCH'}"
+        )
+
+    total_sequential = sum(r["tokenize_sequential_ms"] for r in results)
+    total_scanner = sum(r["tokenize_scanner_ms"] for r in results)
+    total_parse = sum(r["parse_ms"] for r in results)
+    print(
+        f"\nTotal: sequential tokenize {total_sequential:.1f}ms, "
+        f"scanner tokenize {total_scanner:.1f}ms "
+        f"({total_sequential / max(total_scanner, 1e-9):.1f}x), parse {total_parse:.1f}ms"
+    )
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"repeat": args.repeat, "results": results}, indent=2))
+        print(f"Results written to {args.json}")
+
+    if not all(r["tokens_match"] and r["compiled_matches"] is not False for r in results):
+        print("\nParity check failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Business Unit: scripts | Status: current.
+
+Multi-threaded throughput benchmark for RealTimePriceStore.
+
+Writer threads feed quote ticks (and a trade every ``--trade-every`` ticks)
+for disjoint slices of ``--symbols`` synthetic symbols, the way the
+WebSocket thread does, while reader threads call ``get_quote_data`` and
+``get_real_time_price`` for random symbols, the way QuoteService does. The
+run reports aggregate write and read throughput.
+
+Usage:
+    poetry run python scripts/benchmark_price_store.py
+    poetry run python scripts/benchmark_price_store.py --symbols 500 --writers 2 --readers 8
+    poetry run python scripts/benchmark_price_store.py --json results/price_store_benchmark.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+# Add layers/shared to path for shared imports
+shared_layer_path = Path(__file__).parent.parent / "layers" / "shared"
+sys.path.insert(0, str(shared_layer_path))
+
+from the_alchemiser.shared.services.real_time_price_store import (  # noqa: E402
+    RealTimePriceStore,
+)
+
+
+def _prices(count: int) -> list[tuple[Decimal, Decimal, Decimal, Decimal]]:
+    """Pre-build (bid, ask, bid_size, ask_size) ticks so the feed itself allocates nothing."""
+    rng = random.Random(7)
+    ticks = []
+    for _ in range(count):
+        bid = Decimal(rng.randrange(1_000, 50_000)) / 100
+        ticks.append((bid, bid + Decimal("0.01"), Decimal(rng.randrange(1, 900)), Decimal(100)))
+    return ticks
+
+
+def run(
+    symbols: int, writers: int, readers: int, seconds: float, trade_every: int
+) -> dict[str, Any]:
+    """Run one timed benchmark and return its measurements."""
+    store = RealTimePriceStore()
+    names = [f"SYM{i:04d}" for i in range(symbols)]
+    ticks = _prices(1024)
+    timestamp = datetime.now(UTC)
+    stop = threading.Event()
+    writes = [0] * writers
+    reads = [0] * readers
+
+    def write(index: int) -> None:
+        mine = names[index::writers]
+        count = 0
+        while not stop.is_set():
+            for symbol in mine:
+                bid, ask, bid_size, ask_size = ticks[count & 1023]
+                store.update_quote_data(symbol, bid, ask, bid_size, ask_size, timestamp)
+                count += 1
+                if count % trade_every == 0:
+                    store.update_trade_data(symbol, ask, timestamp, bid_size)
+        writes[index] = count
+
+    def read(index: int) -> None:
+        rng = random.Random(index)
+        count = 0
+        while not stop.is_set():
+            symbol = names[rng.randrange(symbols)]
+            store.get_quote_data(symbol)
+            store.get_real_time_price(symbol)
+            count += 1
+        reads[index] = count
+
+    # Prime every symbol so readers always find data
+    for symbol in names:
+        bid, ask, bid_size, ask_size = ticks[0]
+        store.update_quote_data(symbol, bid, ask, bid_size, ask_size, timestamp)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "symbols": symbols,
+        "writers": writers,
+        "readers": readers,
+        "seconds": round(elapsed, 3),
+        "quote_updates_per_second": round(sum(writes) / elapsed),
+        "reads_per_second": round(sum(reads) / elapsed),
+    }
+
+
+def main() -> int:
+    """Parse arguments, run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--symbols", type=int, default=300, help="Synthetic symbols (default: 300)")
+    parser.add_argument("--writers", type=int, default=2, help="Writer threads (default: 2)")
+    parser.add_argument("--readers", type=int, default=4, help="Reader threads (default: 4)")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Run time (default: 3)")
+    parser.add_argument(
+        "--trade-every", type=int, default=10, help="Quote ticks per trade tick (default: 10)"
+    )
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    result = run(args.symbols, args.writers, args.readers, args.seconds, args.trade_every)
+    for key, value in result.items():
+        print(f"{key:>26}: {value:,}" if isinstance(value, int) else f"{key:>26}: {value}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(result, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
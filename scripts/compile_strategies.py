@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Business Unit: scripts | Status: current.
+
+Compile DSL strategy files into precompiled AST artifacts.
+
+Parses every ``.clj`` file in the shared strategies directory and writes a
+compact binary AST artifact (keyed by the SHA-256 of the source) to
+``strategies/compiled/``. The artifacts ship in the shared Lambda layer and
+are loaded by ``DslEngine`` instead of re-parsing on every cold start. An
+artifact whose hash no longer matches its .clj file is ignored at runtime,
+so a forgotten recompile only costs parse time, never correctness.
+
+Run before ``sam build`` (the CD workflow does this automatically).
+
+Usage:
+    poetry run python scripts/compile_strategies.py
+    poetry run python scripts/compile_strategies.py --check   # verify artifacts are current
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add functions/strategy_worker to path for imports
+strategy_worker_path = Path(__file__).parent.parent / "functions" / "strategy_worker"
+sys.path.insert(0, str(strategy_worker_path))
+
+# Add layers/shared to path for shared imports
+shared_layer_path = Path(__file__).parent.parent / "layers" / "shared"
+sys.path.insert(0, str(shared_layer_path))
+
+STRATEGIES_PATH = shared_layer_path / "the_alchemiser" / "shared" / "strategies"
+
+
+def check_artifacts(strategies_dir: Path) -> list[str]:
+    """Return strategy files whose compiled artifact is missing or stale.
+
+    Args:
+        strategies_dir: Root strategies directory
+
+    Returns:
+        Relative paths of strategies that need recompiling
+
+    """
+    from engines.dsl.compiled_ast import (
+        COMPILED_AST_DIRNAME,
+        compiled_artifact_relpath,
+        deserialize_ast,
+    )
+
+    stale: list[str] = []
+    compiled_dir = strategies_dir / COMPILED_AST_DIRNAME
+    for strategy_file in sorted(strategies_dir.rglob("*.clj")):
+        if compiled_dir in strategy_file.parents:
+            continue
+        relative = strategy_file.relative_to(strategies_dir).as_posix()
+        artifact = strategies_dir / compiled_artifact_relpath(relative)
+        if not artifact.is_file() or (
+            deserialize_ast(artifact.read_bytes(), strategy_file.read_bytes()) is None
+        ):
+            stale.append(relative)
+    return stale
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Compile .clj strategies to AST artifacts")
+    parser.add_argument(
+        "--strategies-dir",
+        type=Path,
+        default=STRATEGIES_PATH,
+        help="Strategies directory (default: shared layer strategies)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only verify artifacts are present and current; exit 1 otherwise",
+    )
+    args = parser.parse_args()
+
+    # Deeply nested strategies exceed the default recursion limit when parsed
+    sys.setrecursionlimit(10000)
+
+    if args.check:
+        stale = check_artifacts(args.strategies_dir)
+        for relative in stale:
+            print(f"  stale: {relative}")
+        if stale:
+            print(f"\n{len(stale)} compiled AST artifact(s) missing or stale")
+            sys.exit(1)
+        print("All compiled AST artifacts are current")
+        return
+
+    from engines.dsl.compiled_ast import compile_strategies_directory
+
+    start = time.perf_counter()
+    results = compile_strategies_directory(args.strategies_dir)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nCompiled {len(results)} strategies in {elapsed:.2f}s:")
+    for relative, size in results.items():
+        source_size = (args.strategies_dir / relative).stat().st_size
+        print(f"  {relative:<40} {source_size:>10,} B -> {size:>8,} B")
+
+
+if __name__ == "__main__":
+    main()